@@ -13,115 +13,100 @@ Modules:
     - vdot: VDOT calculations and training paces
 """
 
-# Re-export all public functions for convenient access
-from resilio.api.coach import (
-    get_todays_workout,
-    get_weekly_status,
-    get_training_status,
-    CoachError,
-    WeeklyStatus,
-)
+import importlib
 
-from resilio.api.sync import (
-    sync_strava,
-    log_activity,
-    SyncError,
-)
+# Re-export public functions lazily (PEP 562): importing one API module, or
+# the CLI error helpers, should not pull in the Strava client and every schema.
+_EXPORTS: dict[str, str] = {
+    "get_todays_workout": "resilio.api.coach",
+    "get_weekly_status": "resilio.api.coach",
+    "get_training_status": "resilio.api.coach",
+    "CoachError": "resilio.api.coach",
+    "WeeklyStatus": "resilio.api.coach",
+    "sync_strava": "resilio.api.sync",
+    "log_activity": "resilio.api.sync",
+    "SyncError": "resilio.api.sync",
+    "get_current_metrics": "resilio.api.metrics",
+    "get_readiness": "resilio.api.metrics",
+    "get_intensity_distribution": "resilio.api.metrics",
+    "MetricsError": "resilio.api.metrics",
+    "get_current_plan": "resilio.api.plan",
+    "export_plan_structure": "resilio.api.plan",
+    "build_macro_template": "resilio.api.plan",
+    "create_macro_plan": "resilio.api.plan",
+    "regenerate_plan": "resilio.api.plan",
+    "get_plan_weeks": "resilio.api.plan",
+    "get_pending_suggestions": "resilio.api.plan",
+    "accept_suggestion": "resilio.api.plan",
+    "decline_suggestion": "resilio.api.plan",
+    "PlanError": "resilio.api.plan",
+    "AcceptResult": "resilio.api.plan",
+    "DeclineResult": "resilio.api.plan",
+    "PlanWeeksResult": "resilio.api.plan",
+    "calculate_periodization": "resilio.api.plan",
+    "calculate_volume_progression": "resilio.api.plan",
+    "suggest_volume_adjustment": "resilio.api.plan",
+    "create_workout": "resilio.api.plan",
+    "detect_adaptation_triggers": "resilio.api.plan",
+    "assess_override_risk": "resilio.api.plan",
+    "create_profile": "resilio.api.profile",
+    "get_profile": "resilio.api.profile",
+    "update_profile": "resilio.api.profile",
+    "set_goal": "resilio.api.profile",
+    "ProfileError": "resilio.api.profile",
+    "is_error": "resilio.api.helpers",
+    "get_error_message": "resilio.api.helpers",
+    "handle_error": "resilio.api.helpers",
+    "calculate_vdot_from_race": "resilio.api.vdot",
+    "get_training_paces": "resilio.api.vdot",
+    "predict_race_times": "resilio.api.vdot",
+    "apply_six_second_rule_paces": "resilio.api.vdot",
+    "adjust_pace_for_environment": "resilio.api.vdot",
+    "VDOTError": "resilio.api.vdot",
+    "validate_quality_volume": "resilio.api.guardrails",
+    "validate_weekly_progression": "resilio.api.guardrails",
+    "validate_long_run_limits": "resilio.api.guardrails",
+    "calculate_safe_volume_range": "resilio.api.guardrails",
+    "calculate_break_return_plan": "resilio.api.guardrails",
+    "calculate_masters_recovery": "resilio.api.guardrails",
+    "calculate_race_recovery": "resilio.api.guardrails",
+    "generate_illness_recovery_plan": "resilio.api.guardrails",
+    "GuardrailsError": "resilio.api.guardrails",
+    "api_validate_intensity_distribution": "resilio.api.analysis",
+    "api_detect_activity_gaps": "resilio.api.analysis",
+    "api_analyze_load_distribution_by_sport": "resilio.api.analysis",
+    "api_check_weekly_capacity": "resilio.api.analysis",
+    "api_assess_current_risk": "resilio.api.analysis",
+    "api_estimate_recovery_window": "resilio.api.analysis",
+    "api_forecast_training_stress": "resilio.api.analysis",
+    "api_assess_taper_status": "resilio.api.analysis",
+    "AnalysisError": "resilio.api.analysis",
+    "api_validate_interval_structure": "resilio.api.validation",
+    "api_validate_plan_structure": "resilio.api.validation",
+    "api_assess_goal_feasibility": "resilio.api.validation",
+    "ValidationError": "resilio.api.validation",
+    "save_memory": "resilio.core.memory",
+    "load_memories": "resilio.core.memory",
+    "get_memories_by_type": "resilio.core.memory",
+    "get_relevant_memories": "resilio.core.memory",
+    "get_memories_with_tag": "resilio.core.memory",
+    "analyze_memory_patterns": "resilio.core.memory",
+    "RepositoryIO": "resilio.core.repository",
+}
 
-from resilio.api.metrics import (
-    get_current_metrics,
-    get_readiness,
-    get_intensity_distribution,
-    MetricsError,
-)
 
-from resilio.api.plan import (
-    get_current_plan,
-    export_plan_structure,
-    build_macro_template,
-    create_macro_plan,
-    regenerate_plan,
-    get_plan_weeks,
-    get_pending_suggestions,
-    accept_suggestion,
-    decline_suggestion,
-    PlanError,
-    AcceptResult,
-    DeclineResult,
-    PlanWeeksResult,
-    # Toolkit functions
-    calculate_periodization,
-    calculate_volume_progression,
-    suggest_volume_adjustment,
-    create_workout,
-    detect_adaptation_triggers,
-    assess_override_risk,
-)
-
-from resilio.api.profile import (
-    create_profile,
-    get_profile,
-    update_profile,
-    set_goal,
-    ProfileError,
-)
-
-from resilio.api.helpers import (
-    is_error,
-    get_error_message,
-    handle_error,
-)
-
-from resilio.api.vdot import (
-    calculate_vdot_from_race,
-    get_training_paces,
-    predict_race_times,
-    apply_six_second_rule_paces,
-    adjust_pace_for_environment,
-    VDOTError,
-)
-
-from resilio.api.guardrails import (
-    validate_quality_volume,
-    validate_weekly_progression,
-    validate_long_run_limits,
-    calculate_safe_volume_range,
-    calculate_break_return_plan,
-    calculate_masters_recovery,
-    calculate_race_recovery,
-    generate_illness_recovery_plan,
-    GuardrailsError,
-)
-
-from resilio.api.analysis import (
-    api_validate_intensity_distribution,
-    api_detect_activity_gaps,
-    api_analyze_load_distribution_by_sport,
-    api_check_weekly_capacity,
-    api_assess_current_risk,
-    api_estimate_recovery_window,
-    api_forecast_training_stress,
-    api_assess_taper_status,
-    AnalysisError,
-)
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
 
-from resilio.api.validation import (
-    api_validate_interval_structure,
-    api_validate_plan_structure,
-    api_assess_goal_feasibility,
-    ValidationError,
-)
 
-from resilio.core.memory import (
-    save_memory,
-    load_memories,
-    get_memories_by_type,
-    get_relevant_memories,
-    get_memories_with_tag,
-    analyze_memory_patterns,
-)
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
 
-from resilio.core.repository import RepositoryIO
 
 __all__ = [
     # Coach operations
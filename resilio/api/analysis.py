@@ -14,6 +14,7 @@ from resilio.core.analysis import (
     detect_activity_gaps,
     analyze_load_distribution_by_sport,
     check_weekly_capacity,
+    historical_weekly_maxima,
     assess_current_risk,
     estimate_recovery_window,
     forecast_training_stress,
@@ -310,7 +311,7 @@ def api_check_weekly_capacity(
         historical_activities: List of activity dicts with keys:
             - distance_km (float)
             - systemic_load_au (float)
-            - date (str or date)
+            - date (str or date; capacity is the best Monday-Sunday week)
 
     Returns:
         WeeklyCapacityCheck or AnalysisError
@@ -356,12 +357,9 @@ def api_check_weekly_capacity(
                     message=f"Historical activity {i} missing required keys: {missing}",
                 )
 
-        # Calculate historical max values from activities
-        historical_max_volume_km = max(
-            (a.get("distance_km", 0) for a in historical_activities), default=0
-        )
-        historical_max_systemic_load_au = max(
-            (a.get("systemic_load_au", 0) for a in historical_activities), default=0
+        # Calculate historical max weekly values from activities
+        historical_max_volume_km, historical_max_systemic_load_au = historical_weekly_maxima(
+            historical_activities
         )
 
         # Call core function with calculated max values
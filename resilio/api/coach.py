@@ -534,13 +534,5 @@ def _find_latest_metrics_date(repo: RepositoryIO) -> Optional[date]:
     Returns:
         Date of most recent metrics, or None if no metrics exist.
     """
-    # Check last 30 days for metrics files
-    today = date.today()
-    for i in range(30):
-        check_date = today - timedelta(days=i)
-        metrics_path = daily_metrics_path(check_date)
-        resolved_path = repo.resolve_path(metrics_path)
-        if resolved_path.exists():
-            return check_date
-
-    return None
+    # Check last 30 days (one read of the columnar metrics store)
+    return repo.metrics_store().latest_date(date.today(), lookback_days=30)
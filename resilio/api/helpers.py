@@ -5,8 +5,22 @@ Provides utilities to make error checking concise and clear when using
 the Resilio API from coaching scripts.
 """
 
+import sys
 from typing import Optional, Union
 
+# (module, class) pairs recognised by is_error
+_ERROR_TYPES = (
+    ("resilio.api.profile", "ProfileError"),
+    ("resilio.api.sync", "SyncError"),
+    ("resilio.api.coach", "CoachError"),
+    ("resilio.api.metrics", "MetricsError"),
+    ("resilio.api.plan", "PlanError"),
+    ("resilio.api.vdot", "VDOTError"),
+    ("resilio.api.guardrails", "GuardrailsError"),
+    ("resilio.api.analysis", "AnalysisError"),
+    ("resilio.api.validation", "ValidationError"),
+)
+
 
 def is_error(result) -> bool:
     """
@@ -28,31 +42,15 @@ def is_error(result) -> bool:
         ... else:
         ...     print(f"Name: {profile.name}")
     """
-    # Import here to avoid circular dependencies
-    from resilio.api.profile import ProfileError
-    from resilio.api.sync import SyncError
-    from resilio.api.coach import CoachError
-    from resilio.api.metrics import MetricsError
-    from resilio.api.plan import PlanError
-    from resilio.api.vdot import VDOTError
-    from resilio.api.guardrails import GuardrailsError
-    from resilio.api.analysis import AnalysisError
-    from resilio.api.validation import ValidationError
-
-    return isinstance(
-        result,
-        (
-            ProfileError,
-            SyncError,
-            CoachError,
-            MetricsError,
-            PlanError,
-            VDOTError,
-            GuardrailsError,
-            AnalysisError,
-            ValidationError,
-        ),
-    )
+    # A result can only be an instance of an error class whose module is
+    # already loaded, so check those rather than importing the whole API
+    # layer (Strava client included) for every CLI command
+    for module_name, class_name in _ERROR_TYPES:
+        module = sys.modules.get(module_name)
+        error_class = getattr(module, class_name, None) if module is not None else None
+        if error_class is not None and isinstance(result, error_class):
+            return True
+    return False
 
 
 def get_error_message(result) -> Optional[str]:
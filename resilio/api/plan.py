@@ -31,6 +31,7 @@ from resilio.core.plan import (
     append_plan_adaptation,
     initialize_training_log,
     append_weekly_summary,
+    plan_review_log,
 )
 from resilio.core.adaptation import (
     detect_adaptation_triggers,
@@ -1091,30 +1092,22 @@ def _auto_log_plan_change(change_description: str) -> None:
     try:
         repo = RepositoryIO()
         review_path = current_plan_review_path()
-        review_abs_path = repo.resolve_path(review_path)
+        review_log = plan_review_log(repo.resolve_path(review_path))
 
-        if not review_abs_path.exists():
+        if not review_log.exists():
             # No review yet - skip logging (not an error)
             logger.debug("Plan review not found, skipping auto-log")
             return
 
-        # Read existing content
-        with open(review_abs_path, 'r') as f:
-            content = f.read()
+        # Add the Adaptations section at the end if the review has none
+        text = ""
+        if review_log.find("Adaptations") is None:
+            text += "\n\n## Adaptations\n\n"
 
-        # Check if Adaptations section exists
-        if "## Adaptations" not in content:
-            # Add new section at end
-            content += "\n\n## Adaptations\n\n"
-
-        # Append new entry with timestamp
+        # Append new entry with timestamp (the review itself is not rewritten)
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
-        entry = f"### {timestamp}\n{change_description}\n\n"
-        content += entry
-
-        # Write back
-        with open(review_abs_path, 'w') as f:
-            f.write(content)
+        text += f"### {timestamp}\n{change_description}\n\n"
+        review_log.append(text)
 
         logger.info(f"Auto-logged plan change: {change_description}")
 
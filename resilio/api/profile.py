@@ -8,12 +8,14 @@ goals, and constraints.
 from datetime import date, datetime, timedelta
 from typing import Optional, Union, Any, Dict, List
 from dataclasses import dataclass
-from collections import defaultdict, Counter
+from collections import Counter
 import logging
 
+from resilio.core.activity_summary import SPORT_CODES, ActivitySummary, load_activity_summaries, sport_codes
 from resilio.core.paths import athlete_profile_path, get_activities_dir
 from resilio.core.repository import RepositoryIO, ReadOptions
 from resilio.core.strava import DEFAULT_SYNC_LOOKBACK_DAYS
+from resilio.utils.dates import WeekBuckets
 from resilio.schemas.repository import RepoError, RepoErrorType
 from resilio.schemas.profile import (
     AthleteProfile,
@@ -31,7 +33,6 @@ from resilio.schemas.profile import (
     PauseReason,
     PBEntry,
 )
-from resilio.schemas.activity import NormalizedActivity
 
 
 # ============================================================
@@ -647,7 +648,7 @@ def analyze_profile_from_activities() -> Union[ProfileAnalysis, ProfileError]:
         )
 
     # Sort by date
-    activities.sort(key=lambda a: a.date)
+    activities.sort(key=lambda a: a.date_ordinal)
 
     # 1. Synced data window analysis (NOT athlete's full history)
     synced_start = activities[0].date
@@ -704,39 +705,38 @@ def analyze_profile_from_activities() -> Union[ProfileAnalysis, ProfileError]:
     return analysis
 
 
-def _load_all_activities(repo: RepositoryIO) -> List[NormalizedActivity]:
-    """Load all activities from data/activities/**/*.yaml."""
-    pattern = "data/activities/**/*.yaml"
-    activity_files = repo.list_files(pattern)
+# Running sport codes for the profile analysis helpers
+_RUN_SPORT_CODES = sport_codes("run", "trail_run", "treadmill_run")
 
-    activities = []
-    for file_path in activity_files:
-        result = repo.read_yaml(file_path, NormalizedActivity, ReadOptions(should_validate=False))
-        if not isinstance(result, RepoError):
-            activities.append(result)
 
-    return activities
+def _load_all_activities(repo: RepositoryIO) -> List[ActivitySummary]:
+    """
+    Summarize all activities listed in the activity index (oldest first).
+
+    Summaries come from the index alone, so no activity file is opened.
+    """
+    return load_activity_summaries(repo)
 
 
-def _find_activity_gaps(activities: List[NormalizedActivity], min_gap_days: int) -> List[Dict]:
+def _find_activity_gaps(activities: List[ActivitySummary], min_gap_days: int) -> List[Dict]:
     """Find gaps in training > min_gap_days."""
     gaps = []
     for i in range(1, len(activities)):
-        prev_date = activities[i-1].date
-        curr_date = activities[i].date
-        gap_days = (curr_date - prev_date).days
+        prev_ordinal = activities[i-1].date_ordinal
+        curr_ordinal = activities[i].date_ordinal
+        gap_days = curr_ordinal - prev_ordinal
 
         if gap_days > min_gap_days:
             gaps.append({
-                "start_date": prev_date.isoformat(),
-                "end_date": curr_date.isoformat(),
+                "start_date": date.fromordinal(prev_ordinal).isoformat(),
+                "end_date": date.fromordinal(curr_ordinal).isoformat(),
                 "days": gap_days
             })
 
     return gaps
 
 
-def _analyze_heart_rate(activities: List[NormalizedActivity]) -> Dict:
+def _analyze_heart_rate(activities: List[ActivitySummary]) -> Dict:
     """Extract HR insights."""
     hr_values = []
     avg_hr_values = []
@@ -754,19 +754,15 @@ def _analyze_heart_rate(activities: List[NormalizedActivity]) -> Dict:
     }
 
 
-def _analyze_volume(activities: List[NormalizedActivity]) -> Dict:
+def _analyze_volume(activities: List[ActivitySummary]) -> Dict:
     """Analyze running volume patterns."""
-    weekly_km = defaultdict(float)
-    for a in activities:
-        if a.sport_type in ["run", "trail_run", "treadmill_run"] and a.distance_km:
-            week_key = a.date.isocalendar()[:2]  # (year, week)
-            weekly_km[week_key] += a.distance_km
-
-    if not weekly_km:
+    runs = [a for a in activities if a.sport_code in _RUN_SPORT_CODES and a.distance_km]
+    if not runs:
         return {'weekly_avg': None, 'recent_4wk': None}
 
-    weeks = sorted(weekly_km.keys())
-    volumes = [weekly_km[w] for w in weeks]
+    # Weeks with running volume, oldest first (activities are sorted by date)
+    weeks = WeekBuckets.from_activities(runs, runs[0].date, runs[-1].date, values=("distance_km",))
+    volumes = [km for count, km in zip(weeks.counts, weeks.totals["distance_km"]) if count]
 
     return {
         'weekly_avg': sum(volumes) / len(volumes) if volumes else None,
@@ -774,7 +770,7 @@ def _analyze_volume(activities: List[NormalizedActivity]) -> Dict:
     }
 
 
-def _analyze_workout_patterns(activities: List[NormalizedActivity]) -> Dict:
+def _analyze_workout_patterns(activities: List[ActivitySummary]) -> Dict:
     """Compute typical workout distances/durations for profile-aware minimums.
 
     Classifies runs from last N days (matches Strava sync window, DEFAULT_SYNC_LOOKBACK_DAYS):
@@ -787,11 +783,11 @@ def _analyze_workout_patterns(activities: List[NormalizedActivity]) -> Dict:
     Returns averages for each category to set profile-aware minimums.
     """
     # Filter to last N days of running activities (matches Strava sync window)
-    cutoff_date = date.today() - timedelta(days=DEFAULT_SYNC_LOOKBACK_DAYS)
+    cutoff_ordinal = (date.today() - timedelta(days=DEFAULT_SYNC_LOOKBACK_DAYS)).toordinal()
     recent_runs = [
         a for a in activities
-        if a.sport_type in ["run", "trail_run", "treadmill_run"]
-        and a.date >= cutoff_date
+        if a.sport_code in _RUN_SPORT_CODES
+        and a.date_ordinal >= cutoff_ordinal
         and a.distance_km is not None
         and a.distance_km >= 3.0  # Exclude very short shakeout runs
     ]
@@ -844,13 +840,13 @@ def _analyze_workout_patterns(activities: List[NormalizedActivity]) -> Dict:
     }
 
 
-def _analyze_sport_distribution(activities: List[NormalizedActivity]) -> Dict:
+def _analyze_sport_distribution(activities: List[ActivitySummary]) -> Dict:
     """Classify sport participation."""
-    sport_counts = Counter(a.sport_type for a in activities)
+    code_counts = Counter(a.sport_code for a in activities)
+    sport_counts = {SPORT_CODES[code]: count for code, count in code_counts.items()}
     total = len(activities)
 
-    run_types = ["run", "trail_run", "treadmill_run"]
-    run_count = sum(sport_counts.get(s, 0) for s in run_types)
+    run_count = sum(code_counts.get(code, 0) for code in _RUN_SPORT_CODES)
 
     percentages = {sport: (count / total) * 100 for sport, count in sport_counts.items()}
     run_pct = (run_count / total) * 100 if total > 0 else 0
@@ -313,6 +313,7 @@ def adjust_pace_for_environment(
 
 def estimate_current_vdot(
     lookback_days: int = 28,
+    use_cache: bool = True,
 ) -> Union[VDOTEstimate, VDOTError]:
     """
     Estimate current VDOT with training continuity awareness.
@@ -326,11 +327,20 @@ def estimate_current_vdot(
        d. Adjust upward if pace data suggests higher fitness
     3. No race: Use pace analysis only (quality workouts → easy runs → error)
 
+    Estimates are persisted in the VDOT estimate cache, keyed by a fingerprint
+    of the activity store version, personal bests, max HR, latest stored CTL,
+    lookback_days and today's date (see resilio.core.vdot.estimate_cache):
+    repeated calls with unchanged inputs skip the history walk. Errors are
+    never cached.
+
     Args:
         lookback_days: Number of days to look back for pace analysis (default: 28)
+        use_cache: Serve and store the estimate through the cache (False =
+            always recompute and leave the cache untouched)
 
     Returns:
         VDOTEstimate with current VDOT estimate and supporting data
+        (cache = "hit", "miss" or "bypass")
         VDOTError on failure
 
     Example:
@@ -342,38 +352,32 @@ def estimate_current_vdot(
         ...     print(f"Source: {estimate.source}")
     """
     from datetime import date as dt_date, timedelta
-    from pathlib import Path
-    from statistics import median
 
-    from resilio.core.paths import get_activities_dir
-    from resilio.core.repository import RepositoryIO, ReadOptions
-    from resilio.schemas.activity import NormalizedActivity
-    from resilio.core.vdot.continuity import detect_training_breaks, calculate_vdot_decay
-    from resilio.core.vdot.pace_analysis import analyze_recent_paces
+    from resilio.core.activity_summary import summarize_entries
+    from resilio.core.paths import vdot_estimate_cache_path
+    from resilio.core.repository import RepositoryIO
+    from resilio.core.vdot.estimate_cache import VDOTEstimateCache, estimate_fingerprint
     from resilio.api.profile import get_profile, ProfileError
-    from resilio.api.metrics import get_current_metrics, MetricsError
 
     try:
         # Load activities
         repo = RepositoryIO()
-        activities_dir = get_activities_dir()
-        activity_files = list(Path(activities_dir).rglob("*.yaml"))
+        index = repo.activity_index()
+        entries = index.query()
 
-        if not activity_files:
+        if not entries:
             return VDOTError(
                 error_type="not_found",
                 message="No activities found. Run 'resilio sync' to import activities from Strava.",
             )
 
-        # Load all activities (we need full history for break detection)
-        all_activities: list[NormalizedActivity] = []
-        for activity_file in activity_files:
-            result = repo.read_yaml(str(activity_file), NormalizedActivity, ReadOptions())
-            if isinstance(result, NormalizedActivity):
-                if result.sport_type.lower() in ["run", "trail_run", "virtual_run"]:
-                    all_activities.append(result)
+        # All running activities (we need full history for break detection)
+        run_entries = [
+            entry for entry in entries
+            if entry.sport_type.lower() in ["run", "trail_run", "virtual_run"]
+        ]
 
-        if not all_activities:
+        if not run_entries:
             return VDOTError(
                 error_type="not_found",
                 message="No running activities found. Run 'resilio sync' to import activities.",
@@ -395,146 +399,205 @@ def estimate_current_vdot(
         if isinstance(candidate_max_hr, (int, float)) and candidate_max_hr > 0:
             max_hr = int(candidate_max_hr)
 
-        # Step 1: Check for recent PB (<90 days)
-        if profile.personal_bests:
-            pbs_with_dates = [
-                (dist, pb)
-                for dist, pb in profile.personal_bests.items()
-                if pb.vdot and pb.date
-            ]
-
-            if pbs_with_dates:
-                # Sort by date descending (most recent first)
-                pbs_with_dates.sort(key=lambda x: x[1].date, reverse=True)
-                most_recent_dist, most_recent_pb = pbs_with_dates[0]
-                race_date = dt_date.fromisoformat(most_recent_pb.date)
-                days_since_race = (dt_date.today() - race_date).days
-
-                # Recent PB path (<90 days)
-                if days_since_race < 90:
-                    return VDOTEstimate(
-                        estimated_vdot=int(most_recent_pb.vdot),
-                        confidence=ConfidenceLevel.HIGH,
-                        source=f"recent_pb ({most_recent_dist} @ {most_recent_pb.time}, {days_since_race} days ago)",
-                        supporting_data=[]
-                    )
-
-                # Step 2: PB >90 days - apply continuity-aware decay
-                # Detect training breaks
-                break_analysis = detect_training_breaks(
-                    all_activities,
-                    race_date,
-                    lookback_months=18
-                )
+        today = dt_date.today()
+
+        # Serve from the cache when no input changed (query() refreshed the
+        # index, so its version reflects the files on disk)
+        cache = None
+        fingerprint = None
+        if use_cache:
+            # Latest stored metrics, the same 30-day lookup get_current_metrics() makes
+            latest_metrics = repo.metrics_store().read_range(today - timedelta(days=29), today).to_records()
+            latest = latest_metrics[-1] if latest_metrics else {}
+            cache = VDOTEstimateCache(repo.resolve_path(vdot_estimate_cache_path()))
+            fingerprint = estimate_fingerprint(
+                store_id=index.store_id,
+                store_version=index.version,
+                personal_bests=profile.personal_bests or {},
+                max_hr=max_hr,
+                metrics_date=dt_date.fromisoformat(latest["date"]) if latest else None,
+                ctl=latest.get("ctl"),
+                lookback_days=lookback_days,
+                today=today,
+            )
+            cached = cache.get(fingerprint)
+            if cached is not None:
+                return VDOTEstimate.model_validate({**cached, "cache": "hit"})
+
+        # Summarize from the index; only runs inside the pace-analysis window
+        # read their YAML, for the name/description/surface/GPS details
+        all_activities = summarize_entries(
+            repo,
+            run_entries,
+            details_since=today - timedelta(days=lookback_days),
+        )
 
-                # Get CTL for multi-sport adjustment
-                ctl_current = None
-                metrics_result = get_current_metrics()
-                if not isinstance(metrics_result, MetricsError):
-                    ctl_current = metrics_result.ctl.value if hasattr(metrics_result, 'ctl') else None
-
-                # Calculate decay
-                decay_result = calculate_vdot_decay(
-                    base_vdot=most_recent_pb.vdot,
-                    race_date=race_date,
-                    break_analysis=break_analysis,
-                    ctl_at_race=None,  # TODO: Implement historical CTL estimation
-                    ctl_current=ctl_current
-                )
+        result = _estimate_from_activities(all_activities, profile, max_hr, lookback_days, today)
 
-                # Step 2c: Validate with recent pace data
-                pace_analysis = analyze_recent_paces(
-                    all_activities,
-                    lookback_days=lookback_days,
-                    max_hr=max_hr
-                )
+        if isinstance(result, VDOTEstimate):
+            if cache is not None:
+                cache.put(fingerprint, result.model_dump(mode="json", exclude={"cache"}))
+                result.cache = "miss"
+            else:
+                result.cache = "bypass"
+        return result
 
-                # Adjust upward if pace data suggests higher fitness
-                if pace_analysis.implied_vdot_range:
-                    pace_min, pace_max = pace_analysis.implied_vdot_range
-
-                    # If decayed VDOT significantly lower than pace suggests
-                    if decay_result.decayed_vdot < pace_min - 2:
-                        adjusted_vdot = int((decay_result.decayed_vdot + pace_min) / 2)
-                        confidence = ConfidenceLevel.MEDIUM
-                        source = f"race_decay_adjusted ({break_analysis.continuity_score:.0%} continuity, {len(pace_analysis.quality_workouts + pace_analysis.easy_runs)} pace data points)"
-                    else:
-                        adjusted_vdot = decay_result.decayed_vdot
-                        confidence = decay_result.confidence
-                        source = f"race_decay ({break_analysis.continuity_score:.0%} continuity, {int(days_since_race/30.44)} months old)"
-                else:
-                    adjusted_vdot = decay_result.decayed_vdot
-                    confidence = decay_result.confidence
-                    source = f"race_decay ({break_analysis.continuity_score:.0%} continuity, {int(days_since_race/30.44)} months old)"
+    except Exception as e:
+        return VDOTError(error_type="calculation_failed", message=f"VDOT estimation failed: {e}")
 
+
+def _estimate_from_activities(
+    all_activities: list["ActivityLike"],
+    profile: "AthleteProfile",
+    max_hr: Optional[int],
+    lookback_days: int,
+    today: "date",
+) -> Union[VDOTEstimate, VDOTError]:
+    """Uncached estimation steps of estimate_current_vdot()."""
+    from datetime import date as dt_date
+    from statistics import median
+
+    from resilio.core.vdot.continuity import detect_training_breaks, calculate_vdot_decay
+    from resilio.core.vdot.pace_analysis import analyze_recent_paces
+    from resilio.api.metrics import get_current_metrics, MetricsError
+
+    # Step 1: Check for recent PB (<90 days)
+    if profile.personal_bests:
+        pbs_with_dates = [
+            (dist, pb)
+            for dist, pb in profile.personal_bests.items()
+            if pb.vdot and pb.date
+        ]
+
+        if pbs_with_dates:
+            # Sort by date descending (most recent first)
+            pbs_with_dates.sort(key=lambda x: x[1].date, reverse=True)
+            most_recent_dist, most_recent_pb = pbs_with_dates[0]
+            race_date = dt_date.fromisoformat(most_recent_pb.date)
+            days_since_race = (today - race_date).days
+
+            # Recent PB path (<90 days)
+            if days_since_race < 90:
                 return VDOTEstimate(
-                    estimated_vdot=adjusted_vdot,
-                    confidence=confidence,
-                    source=source,
-                    supporting_data=pace_analysis.quality_workouts  # Convert easy_runs if needed
+                    estimated_vdot=int(most_recent_pb.vdot),
+                    confidence=ConfidenceLevel.HIGH,
+                    source=f"recent_pb ({most_recent_dist} @ {most_recent_pb.time}, {days_since_race} days ago)",
+                    supporting_data=[]
                 )
 
-        # Step 3: No race - use pace analysis only
-        pace_analysis = analyze_recent_paces(
-            all_activities,
-            lookback_days=lookback_days,
-            max_hr=max_hr
-        )
+            # Step 2: PB >90 days - apply continuity-aware decay
+            # Detect training breaks
+            break_analysis = detect_training_breaks(
+                all_activities,
+                race_date,
+                lookback_months=18
+            )
 
-        # Quality workouts (best signal)
-        if pace_analysis.quality_workouts:
-            vdots = [w.implied_vdot for w in pace_analysis.quality_workouts]
-            estimated_vdot = int(median(vdots))
-            confidence = ConfidenceLevel.MEDIUM if len(vdots) >= 3 else ConfidenceLevel.LOW
-            source = f"quality_workouts ({len(vdots)} workouts)"
+            # Get CTL for multi-sport adjustment
+            ctl_current = None
+            metrics_result = get_current_metrics()
+            if not isinstance(metrics_result, MetricsError):
+                ctl_current = metrics_result.ctl.value if hasattr(metrics_result, 'ctl') else None
+
+            # Calculate decay
+            decay_result = calculate_vdot_decay(
+                base_vdot=most_recent_pb.vdot,
+                race_date=race_date,
+                break_analysis=break_analysis,
+                ctl_at_race=None,  # TODO: Implement historical CTL estimation
+                ctl_current=ctl_current
+            )
 
-            return VDOTEstimate(
-                estimated_vdot=estimated_vdot,
-                confidence=confidence,
-                source=source,
-                supporting_data=pace_analysis.quality_workouts
+            # Step 2c: Validate with recent pace data
+            pace_analysis = analyze_recent_paces(
+                all_activities,
+                lookback_days=lookback_days,
+                max_hr=max_hr
             )
 
-        # Easy runs (secondary signal)
-        if pace_analysis.easy_runs:
-            vdots = [e.implied_vdot for e in pace_analysis.easy_runs]
-            estimated_vdot = int(median(vdots))
-            confidence = ConfidenceLevel.LOW
-            source = f"easy_pace_analysis ({len(vdots)} easy runs, HR-detected)"
-
-            # Convert EasyPaceData to WorkoutPaceData for supporting_data
-            supporting_data = [
-                WorkoutPaceData(
-                    date=er.date,
-                    workout_type="easy",
-                    pace_sec_per_km=er.pace_sec_per_km,
-                    implied_vdot=er.implied_vdot
-                )
-                for er in pace_analysis.easy_runs
-            ]
+            # Adjust upward if pace data suggests higher fitness
+            if pace_analysis.implied_vdot_range:
+                pace_min, pace_max = pace_analysis.implied_vdot_range
+
+                # If decayed VDOT significantly lower than pace suggests
+                if decay_result.decayed_vdot < pace_min - 2:
+                    adjusted_vdot = int((decay_result.decayed_vdot + pace_min) / 2)
+                    confidence = ConfidenceLevel.MEDIUM
+                    source = f"race_decay_adjusted ({break_analysis.continuity_score:.0%} continuity, {len(pace_analysis.quality_workouts + pace_analysis.easy_runs)} pace data points)"
+                else:
+                    adjusted_vdot = decay_result.decayed_vdot
+                    confidence = decay_result.confidence
+                    source = f"race_decay ({break_analysis.continuity_score:.0%} continuity, {int(days_since_race/30.44)} months old)"
+            else:
+                adjusted_vdot = decay_result.decayed_vdot
+                confidence = decay_result.confidence
+                source = f"race_decay ({break_analysis.continuity_score:.0%} continuity, {int(days_since_race/30.44)} months old)"
 
             return VDOTEstimate(
-                estimated_vdot=estimated_vdot,
+                estimated_vdot=adjusted_vdot,
                 confidence=confidence,
                 source=source,
-                supporting_data=supporting_data
+                supporting_data=pace_analysis.quality_workouts  # Convert easy_runs if needed
             )
 
-        # No data available - require baseline establishment
-        return VDOTError(
-            error_type="not_found",
-            message=(
-                "Insufficient data for VDOT estimation. To establish your baseline:\n\n"
-                "1. Add a PB: 'resilio profile set-pb --distance 10k --time MM:SS --date YYYY-MM-DD'\n"
-                "2. OR run quality workouts with keywords (tempo, threshold, interval)\n"
-                "3. OR run easy runs consistently (requires max HR in profile for detection)\n\n"
-                "Why no CTL-based estimate? CTL measures training volume, not pace capability.\n"
-                "We need actual pace data (PBs or workouts) to estimate your VDOT accurately."
+    # Step 3: No race - use pace analysis only
+    pace_analysis = analyze_recent_paces(
+        all_activities,
+        lookback_days=lookback_days,
+        max_hr=max_hr
+    )
+
+    # Quality workouts (best signal)
+    if pace_analysis.quality_workouts:
+        vdots = [w.implied_vdot for w in pace_analysis.quality_workouts]
+        estimated_vdot = int(median(vdots))
+        confidence = ConfidenceLevel.MEDIUM if len(vdots) >= 3 else ConfidenceLevel.LOW
+        source = f"quality_workouts ({len(vdots)} workouts)"
+
+        return VDOTEstimate(
+            estimated_vdot=estimated_vdot,
+            confidence=confidence,
+            source=source,
+            supporting_data=pace_analysis.quality_workouts
+        )
+
+    # Easy runs (secondary signal)
+    if pace_analysis.easy_runs:
+        vdots = [e.implied_vdot for e in pace_analysis.easy_runs]
+        estimated_vdot = int(median(vdots))
+        confidence = ConfidenceLevel.LOW
+        source = f"easy_pace_analysis ({len(vdots)} easy runs, HR-detected)"
+
+        # Convert EasyPaceData to WorkoutPaceData for supporting_data
+        supporting_data = [
+            WorkoutPaceData(
+                date=er.date,
+                workout_type="easy",
+                pace_sec_per_km=er.pace_sec_per_km,
+                implied_vdot=er.implied_vdot
             )
+            for er in pace_analysis.easy_runs
+        ]
+
+        return VDOTEstimate(
+            estimated_vdot=estimated_vdot,
+            confidence=confidence,
+            source=source,
+            supporting_data=supporting_data
         )
 
-    except Exception as e:
-        return VDOTError(error_type="calculation_failed", message=f"VDOT estimation failed: {e}")
+    # No data available - require baseline establishment
+    return VDOTError(
+        error_type="not_found",
+        message=(
+            "Insufficient data for VDOT estimation. To establish your baseline:\n\n"
+            "1. Add a PB: 'resilio profile set-pb --distance 10k --time MM:SS --date YYYY-MM-DD'\n"
+            "2. OR run quality workouts with keywords (tempo, threshold, interval)\n"
+            "3. OR run easy runs consistently (requires max HR in profile for detection)\n\n"
+            "Why no CTL-based estimate? CTL measures training volume, not pace capability.\n"
+            "We need actual pace data (PBs or workouts) to estimate your VDOT accurately."
+        )
+    )
 
 
 # Moved to resilio.core.vdot.pace_analysis
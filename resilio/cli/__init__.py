@@ -13,17 +13,96 @@ Usage:
     resilio vdot paces                  # Generate training pace zones
     resilio guardrails quality-volume   # Validate T/I/R pace volumes
     resilio guardrails break-return     # Plan return after training break
+    resilio serve                       # Keep a warm process; later calls forward to it
 """
 
+import importlib
 from pathlib import Path
 from typing import Optional
 
+import click
 import typer
+from typer.core import TyperGroup
+
+from resilio.core.model_cache import enable_model_cache
+
+# Command registry: name -> (module, attribute, help).
+# Attributes naming a typer.Typer become command groups; anything else is
+# registered as a single command. Modules are imported only when their
+# command is invoked (or listed by --help), so a short command such as
+# `resilio dates today` does not pay for the Strava client, the API layer
+# or unrelated schemas.
+LAZY_COMMANDS: dict[str, tuple[str, str, str]] = {
+    "init": ("resilio.cli.commands.init_cmd", "init_command", "Initialize data directories and config"),
+    "sync": ("resilio.cli.commands.sync", "sync_command", "Import activities from Strava"),
+    "status": ("resilio.cli.commands.status", "status_command", "Get current training metrics"),
+    "today": ("resilio.cli.commands.today", "today_command", "Get today's workout recommendation"),
+    "week": ("resilio.cli.commands.week", "week_command", "Get weekly training summary"),
+    "auth": ("resilio.cli.commands.auth", "app", "Manage Strava authentication"),
+    "metrics": ("resilio.cli.commands.metrics", "app", "Manage training metrics"),
+    "plan": ("resilio.cli.commands.plan", "app", "Manage training plans"),
+    "profile": ("resilio.cli.commands.profile", "app", "Manage athlete profile"),
+    "goal": ("resilio.cli.commands.goal", "app", "Manage race goals"),
+    "vdot": ("resilio.cli.commands.vdot", "app", "VDOT calculations and training paces"),
+    "guardrails": ("resilio.cli.commands.guardrails", "app", "Volume validation and recovery planning"),
+    "analysis": ("resilio.cli.commands.analysis", "app", "Weekly analysis and risk assessment"),
+    "risk": ("resilio.cli.commands.analysis", "risk_app", "Risk assessment commands"),
+    "memory": ("resilio.cli.commands.memory", "app", "Manage athlete memories and insights"),
+    "activity": ("resilio.cli.commands.activity", "app", "List and search activities"),
+    "dates": ("resilio.cli.commands.dates", "app", "Date utilities for training plan generation"),
+    "performance": ("resilio.cli.commands.performance", "app", "Performance baseline and fitness tracking"),
+    "approvals": ("resilio.cli.commands.approvals", "app", "Manage approval state for planning workflows"),
+    "serve": ("resilio.cli.daemon", "serve_command", "Run a warm daemon that resilio commands forward to"),
+}
+
+
+def load_command(name: str) -> Optional[click.Command]:
+    """Import a registered command module and build its click command.
+
+    Args:
+        name: Command name from LAZY_COMMANDS
+
+    Returns:
+        The click command/group, or None if the name is not registered
+    """
+    entry = LAZY_COMMANDS.get(name)
+    if entry is None:
+        return None
+    module_name, attribute, help_text = entry
+    target = getattr(importlib.import_module(module_name), attribute)
+
+    # Build through a throwaway parent so the result matches what
+    # app.command()/app.add_typer() would have produced eagerly
+    holder = typer.Typer()
+    holder.callback()(lambda: None)
+    if isinstance(target, typer.Typer):
+        holder.add_typer(target, name=name, help=help_text)
+    else:
+        holder.command(name=name, help=help_text)(target)
+    return typer.main.get_command(holder).commands[name]
+
+
+class LazyTyperGroup(TyperGroup):
+    """Root command group that resolves registered commands on first use."""
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        names = super().list_commands(ctx)
+        return names + [name for name in LAZY_COMMANDS if name not in names]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        command = super().get_command(ctx, cmd_name)
+        if command is None:
+            command = load_command(cmd_name)
+            if command is not None:
+                self.add_command(command, cmd_name)
+        return command
+
 
 # Create the main Typer app
 app = typer.Typer(
     name="resilio",
     help="Resilio - AI-powered adaptive running coach (JSON output)",
+    cls=LazyTyperGroup,
     add_completion=False,  # Keep it simple for v0
     no_args_is_help=True,
 )
@@ -54,34 +133,7 @@ def main(
     # Create context object
     ctx.obj = CLIContext(repo_root=repo_root)
 
+    # One invocation re-reads the same YAML files many times (metrics, weekly
+    # summaries); cache validated models for the life of the process
+    enable_model_cache()
 
-# Import and register commands
-from resilio.cli.commands import auth, metrics, plan, profile, vdot, guardrails, analysis, memory, activity, dates, performance, goal, approvals
-from resilio.cli.commands.init_cmd import init_command
-from resilio.cli.commands.status import status_command
-from resilio.cli.commands.sync import sync_command
-from resilio.cli.commands.today import today_command
-from resilio.cli.commands.week import week_command
-
-# Register commands
-app.command(name="init", help="Initialize data directories and config")(init_command)
-app.command(name="sync", help="Import activities from Strava")(sync_command)
-app.command(name="status", help="Get current training metrics")(status_command)
-app.command(name="today", help="Get today's workout recommendation")(today_command)
-app.command(name="week", help="Get weekly training summary")(week_command)
-
-# Register subcommands
-app.add_typer(auth.app, name="auth", help="Manage Strava authentication")
-app.add_typer(metrics.app, name="metrics", help="Manage training metrics")
-app.add_typer(plan.app, name="plan", help="Manage training plans")
-app.add_typer(profile.app, name="profile", help="Manage athlete profile")
-app.add_typer(goal.app, name="goal", help="Manage race goals")
-app.add_typer(vdot.app, name="vdot", help="VDOT calculations and training paces")
-app.add_typer(guardrails.app, name="guardrails", help="Volume validation and recovery planning")
-app.add_typer(analysis.app, name="analysis", help="Weekly analysis and risk assessment")
-app.add_typer(analysis.risk_app, name="risk", help="Risk assessment commands")
-app.add_typer(memory.app, name="memory", help="Manage athlete memories and insights")
-app.add_typer(activity.app, name="activity", help="List and search activities")
-app.add_typer(dates.app, name="dates", help="Date utilities for training plan generation")
-app.add_typer(performance.app, name="performance", help="Performance baseline and fitness tracking")
-app.add_typer(approvals.app, name="approvals", help="Manage approval state for planning workflows")
@@ -65,6 +65,9 @@ def _load_activities_in_range(
 ) -> list[dict]:
     """Load activities from YAML files in date range.
 
+    Uses the activity index to select matching files, so only activities in
+    range (and matching the filters) are parsed.
+
     Args:
         repo: Repository IO instance
         start_date: Start of date range (inclusive)
@@ -77,43 +80,31 @@ def _load_activities_in_range(
     """
     activities = []
 
-    # Find all activity YAML files
-    activity_files = repo.list_files("data/activities/**/*.yaml")
-
-    for file_path in activity_files:
-        # Read activity file
-        result = repo.read_yaml(file_path, NormalizedActivity)
-        if isinstance(result, NormalizedActivity):
-            activity = result
-
-            # Filter by date range
-            if not (start_date <= activity.date <= end_date):
-                continue
-
-            # Filter by sport
-            if sport and activity.sport_type != sport:
-                continue
-
-            # Get notes
-            description = activity.description or ""
-            private_note = activity.private_note or ""
-
-            # Filter by has_notes
-            if has_notes and not (description.strip() or private_note.strip()):
-                continue
-
-            # Build activity dict with relevant fields
-            activities.append({
-                "id": activity.id,
-                "date": activity.date.isoformat(),
-                "sport": activity.sport_type,
-                "name": activity.name,
-                "duration_minutes": activity.duration_minutes,
-                "distance_km": activity.distance_km,
-                "average_hr": activity.average_hr,
-                "description": description,
-                "private_note": private_note,
-            })
+    # Select matching files from the activity index (date range + sport)
+    index = repo.activity_index()
+    entries = index.query(start_date=start_date, end_date=end_date, sport=sport or None)
+
+    # Filter by has_notes before parsing
+    if has_notes:
+        entries = [entry for entry in entries if entry.has_notes]
+
+    for activity in index.load(entries):
+        # Get notes
+        description = activity.description or ""
+        private_note = activity.private_note or ""
+
+        # Build activity dict with relevant fields
+        activities.append({
+            "id": activity.id,
+            "date": activity.date.isoformat(),
+            "sport": activity.sport_type,
+            "name": activity.name,
+            "duration_minutes": activity.duration_minutes,
+            "distance_km": activity.distance_km,
+            "average_hr": activity.average_hr,
+            "description": description,
+            "private_note": private_note,
+        })
 
     # Sort by date descending (most recent first)
     activities.sort(key=lambda x: x["date"], reverse=True)
@@ -121,81 +112,6 @@ def _load_activities_in_range(
     return activities
 
 
-def _search_activities(
-    activities: list[dict],
-    query: str,
-) -> list[dict]:
-    """Search activities by keyword in notes.
-
-    Args:
-        activities: List of activity dicts
-        query: Space-separated keywords (OR match)
-
-    Returns:
-        List of matching activities with match context
-    """
-    # Split query into keywords
-    keywords = query.lower().split()
-
-    matches = []
-    for activity in activities:
-        description = activity["description"].lower()
-        private_note = activity["private_note"].lower()
-
-        # Check for any keyword match (OR)
-        matched_keywords = []
-        matched_field = None
-        matched_text = ""
-
-        for keyword in keywords:
-            if keyword in description:
-                matched_keywords.append(keyword)
-                if not matched_field:
-                    matched_field = "description"
-                    matched_text = activity["description"]
-            if keyword in private_note:
-                matched_keywords.append(keyword)
-                if not matched_field or matched_field == "description":
-                    # Prefer private_note if it has the match
-                    matched_field = "private_note"
-                    matched_text = activity["private_note"]
-
-        if matched_keywords:
-            # Create context snippet around the first match
-            full_note = activity["private_note"] if matched_field == "private_note" else activity["description"]
-
-            # Find the first keyword and extract surrounding context
-            lower_note = full_note.lower()
-            first_keyword = matched_keywords[0]
-            pos = lower_note.find(first_keyword)
-
-            if pos >= 0:
-                # Extract ~50 chars before and after
-                start = max(0, pos - 50)
-                end = min(len(full_note), pos + len(first_keyword) + 50)
-                snippet = full_note[start:end]
-                if start > 0:
-                    snippet = "..." + snippet
-                if end < len(full_note):
-                    snippet = snippet + "..."
-            else:
-                snippet = full_note[:100] + ("..." if len(full_note) > 100 else "")
-
-            matches.append({
-                "id": activity["id"],
-                "date": activity["date"],
-                "sport": activity["sport"],
-                "name": activity["name"],
-                "duration_minutes": activity["duration_minutes"],
-                "matched_field": matched_field,
-                "matched_keywords": list(set(matched_keywords)),
-                "matched_text": snippet,
-                "full_note": full_note,
-            })
-
-    return matches
-
-
 def activity_list_command(
     ctx: typer.Context,
     since: str = typer.Option(
@@ -296,16 +212,30 @@ def activity_search_command(
         "--sport",
         help="Filter by sport type (e.g., 'run', 'climb', 'cycle')",
     ),
+    stem: bool = typer.Option(
+        False,
+        "--stem",
+        help="Also match other word forms (e.g., 'hurting' finds 'hurts')",
+    ),
+    limit: Optional[int] = typer.Option(
+        None,
+        "--limit",
+        min=1,
+        help="Maximum number of matches to return (best first)",
+    ),
 ) -> None:
     """Search activities by text content in notes.
 
-    Searches both description and private_note fields for matching keywords.
+    Searches name, description and private_note fields for matching keywords.
     Multiple keywords are OR-matched (any match returns the activity).
+    Keywords match word starts ("knee" finds "knees"); results are ranked
+    by relevance, then most recent first.
 
     Examples:
         resilio activity search --query "ankle"
         resilio activity search --query "tired fatigue" --since 60d
         resilio activity search --query "pain" --sport run
+        resilio activity search --query "hurting" --stem --limit 5
     """
     try:
         # Parse since parameter
@@ -321,18 +251,31 @@ def activity_search_command(
 
         end_date = date.today()
 
-        # Load activities
+        # Search the notes index (no activity files are parsed)
         repo = RepositoryIO()
-        activities = _load_activities_in_range(
-            repo=repo,
+        hits, activities_searched = repo.activity_index().search_notes(
+            query,
             start_date=start_date,
             end_date=end_date,
-            sport=sport,
-            has_notes=False,  # Search all activities, including those without notes
+            sport=sport or None,
+            use_stemming=stem,
+            limit=limit,
         )
-
-        # Search activities
-        matches = _search_activities(activities, query)
+        matches = [
+            {
+                "id": hit.id,
+                "date": hit.date.isoformat(),
+                "sport": hit.sport_type,
+                "name": hit.name,
+                "duration_minutes": hit.duration_minutes,
+                "score": hit.score,
+                "matched_field": hit.matched_field,
+                "matched_keywords": hit.matched_keywords,
+                "matched_text": hit.snippet,
+                "full_note": hit.full_note,
+            }
+            for hit in hits
+        ]
 
         # Build response
         envelope = create_success_envelope(
@@ -341,13 +284,15 @@ def activity_search_command(
                 "matches": matches,
                 "query": query,
                 "total_matches": len(matches),
-                "activities_searched": len(activities),
+                "activities_searched": activities_searched,
                 "date_range": {
                     "start": start_date.isoformat(),
                     "end": end_date.isoformat(),
                 },
                 "filters": {
                     "sport": sport,
+                    "stem": stem,
+                    "limit": limit,
                 },
             },
         )
@@ -376,30 +321,51 @@ def activity_export_command(
     out: str = typer.Option(
         "/tmp/activities_export.json",
         "--out",
-        help="Output JSON file path",
+        help="Output file path (a '.gz' suffix implies --gzip)",
     ),
     sport: Optional[str] = typer.Option(
         None,
         "--sport",
         help="Filter by sport type (e.g., 'run', 'climb', 'cycle')",
     ),
+    output_format: str = typer.Option(
+        "json",
+        "--format",
+        help="'json' (array, for analysis commands) or 'ndjson' (one activity per line)",
+    ),
+    fields: Optional[str] = typer.Option(
+        None,
+        "--fields",
+        help="Comma-separated activity fields to keep (e.g., 'id,date,distance_km')",
+    ),
+    compress: bool = typer.Option(
+        False,
+        "--gzip",
+        help="gzip-compress the output",
+    ),
 ) -> None:
     """Export activities as JSON for use with analysis commands.
 
     Creates a JSON file that can be passed to resilio analysis commands
-    (intensity, load, gaps, capacity, risk-assess).
+    (intensity, load, gaps, capacity, risk-assess). Activities are streamed
+    to the file one at a time, most recent first, so large histories export
+    in constant memory.
 
     Examples:
         resilio activity export --since 28d --out /tmp/activities.json
         resilio activity export --since 7d --out /tmp/week_activities.json --sport run
+        resilio activity export --since 2020-01-01 --format ndjson --fields id,date,sport_type,distance_km --out /tmp/history.ndjson.gz
         resilio analysis intensity --activities /tmp/activities.json --days 28
     """
-    import json as json_module
+    from resilio.core.activity_export import EXPORT_FORMATS, export_activities, parse_export_fields
 
     try:
-        # Parse since parameter
+        # Parse since, format and field parameters
         try:
             start_date = _parse_since(since)
+            field_names = parse_export_fields(fields)
+            if output_format not in EXPORT_FORMATS:
+                raise ValueError(f"Invalid format: {output_format}. Use 'json' or 'ndjson'.")
         except ValueError as e:
             envelope = create_error_envelope(
                 error_type="validation",
@@ -410,46 +376,33 @@ def activity_export_command(
 
         end_date = date.today()
 
-        # Load activities from YAML files
-        repo = RepositoryIO()
-        activity_files = repo.list_files("data/activities/**/*.yaml")
-
-        exported = []
-        for file_path in activity_files:
-            result = repo.read_yaml(file_path, NormalizedActivity)
-            if isinstance(result, NormalizedActivity):
-                activity = result
-
-                # Filter by date range
-                if not (start_date <= activity.date <= end_date):
-                    continue
-
-                # Filter by sport
-                if sport and activity.sport_type != sport:
-                    continue
-
-                # Serialize to dict using Pydantic
-                exported.append(activity.model_dump(mode="json"))
-
-        # Sort by date
-        exported.sort(key=lambda x: x.get("date", ""), reverse=True)
-
-        # Write JSON file
-        with open(out, "w") as f:
-            json_module.dump(exported, f, indent=2, default=str)
+        # Stream activities in range to the file (selected via activity index)
+        result = export_activities(
+            RepositoryIO(),
+            out,
+            start_date=start_date,
+            end_date=end_date,
+            sport=sport,
+            output_format=output_format,
+            fields=field_names,
+            compress=compress or out.endswith(".gz"),
+        )
 
         # Build response
         envelope = create_success_envelope(
-            message=f"Exported {len(exported)} activities to {out}",
+            message=f"Exported {result.count} activities to {out}",
             data={
-                "count": len(exported),
+                "count": result.count,
                 "output_file": out,
+                "format": result.format,
+                "gzip": result.gzip,
                 "date_range": {
                     "start": start_date.isoformat(),
                     "end": end_date.isoformat(),
                 },
                 "filters": {
                     "sport": sport,
+                    "fields": result.fields,
                 },
             },
         )
@@ -468,6 +421,84 @@ def activity_export_command(
     raise typer.Exit(code=0)
 
 
+def activity_reanalyze_command(
+    ctx: typer.Context,
+    since: Optional[str] = typer.Option(
+        None,
+        "--since",
+        help="Only activities since this period (e.g., '90d' or 'YYYY-MM-DD'; default: all history)",
+    ),
+    workers: Optional[int] = typer.Option(
+        None,
+        "--workers",
+        min=1,
+        help="Worker processes (default: number of CPUs; 1 = no pool)",
+    ),
+) -> None:
+    """Recompute RPE, loads and note flags for stored activities.
+
+    Use after RPE/load heuristics change, or after the athlete's VDOT or
+    max HR changes. Only activities whose result differs are rewritten,
+    then metrics are recomputed once from the earliest changed date.
+
+    Examples:
+        resilio activity reanalyze
+        resilio activity reanalyze --since 90d --workers 4
+    """
+    from resilio.core.reanalysis import reanalyze_activities
+
+    try:
+        start_date = None
+        if since is not None:
+            try:
+                start_date = _parse_since(since)
+            except ValueError as e:
+                envelope = create_error_envelope(
+                    error_type="validation",
+                    message=str(e),
+                )
+                output_json(envelope)
+                raise typer.Exit(code=5)
+
+        repo = RepositoryIO()
+        result = reanalyze_activities(repo, since=start_date, workers=workers)
+
+        envelope = create_success_envelope(
+            message=(
+                f"Reanalyzed {result.activities_scanned} activities: "
+                f"{result.activities_changed} updated, {result.activities_failed} failed"
+            ),
+            data={
+                "activities_scanned": result.activities_scanned,
+                "activities_changed": result.activities_changed,
+                "activities_failed": result.activities_failed,
+                "changed_date_range": {
+                    "start": result.changed_dates[0].isoformat(),
+                    "end": result.changed_dates[-1].isoformat(),
+                } if result.changed_dates else None,
+                "metrics_computed": result.metrics_computed,
+                "workers": result.workers,
+                "errors": result.errors,
+                "filters": {
+                    "since": start_date.isoformat() if start_date else None,
+                },
+            },
+        )
+
+    except typer.Exit:
+        raise
+    except Exception as e:
+        envelope = create_error_envelope(
+            error_type="unknown",
+            message=f"Failed to reanalyze activities: {str(e)}",
+        )
+        output_json(envelope)
+        raise typer.Exit(code=1)
+
+    output_json(envelope)
+    raise typer.Exit(code=0)
+
+
 def activity_laps_command(
     ctx: typer.Context,
     activity_id: str = typer.Argument(..., help="Activity ID (e.g., strava_12345678901)"),
@@ -488,21 +519,13 @@ def activity_laps_command(
     try:
         repo = RepositoryIO()
 
-        # Load activity by searching through all activities
-        # NOTE: This is O(N) linear scan - acceptable for testing phase (<100 activities)
-        # but will become slow as data grows:
-        # - 100 activities: <1s
-        # - 1000 activities: ~5-10s
-        # - 5000+ activities: 30+ seconds
-        # TODO: Build activity index (id -> file_path) for O(1) lookup when scaling
-        activity_files = repo.list_files("data/activities/**/*.yaml")
-
+        # Look up the activity file by id in the activity index
         activity = None
-        for file_path in activity_files:
-            result = repo.read_yaml(file_path, NormalizedActivity)
-            if isinstance(result, NormalizedActivity) and result.id == activity_id:
+        entry = repo.activity_index().get(activity_id)
+        if entry is not None:
+            result = repo.read_yaml(entry.path, NormalizedActivity)
+            if isinstance(result, NormalizedActivity):
                 activity = result
-                break
 
         if not activity:
             envelope = create_error_envelope(
@@ -614,3 +637,4 @@ app.command(name="list", help="List activities in a date range")(activity_list_c
 app.command(name="search", help="Search activities by text content")(activity_search_command)
 app.command(name="export", help="Export activities as JSON for analysis commands")(activity_export_command)
 app.command(name="laps", help="Display lap-by-lap breakdown for a workout")(activity_laps_command)
+app.command(name="reanalyze", help="Recompute loads for stored activities")(activity_reanalyze_command)
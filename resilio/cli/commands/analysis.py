@@ -10,6 +10,9 @@ Commands:
     resilio risk recovery-window    - Estimate recovery timeline
     resilio risk forecast           - Forecast training stress
     resilio risk taper-status       - Verify taper progression
+
+Inputs come from JSON files (e.g. `resilio activity export`) or, with
+--from-store, straight from the activity index and daily metrics store.
 """
 
 import typer
@@ -30,10 +33,48 @@ from resilio.api import (
 
 from resilio.cli.output import create_error_envelope, output_json
 from resilio.cli.errors import api_result_to_envelope, get_exit_code_from_envelope
+from resilio.core.analysis.inputs import (
+    CURRENT_METRICS_LOOKBACK_DAYS,
+    load_activity_inputs,
+    load_current_metrics,
+    load_recent_weeks,
+)
+from resilio.core.repository import RepositoryIO
 
 app = typer.Typer(help="Weekly analysis and risk assessment")
 risk_app = typer.Typer(help="Risk assessment commands")
 
+FROM_STORE_HELP = "Read inputs from the activity index and metrics store instead of JSON files"
+
+
+def _load_json_input(path: Optional[str], option: str):
+    """Load a JSON input file, or exit with invalid_input if it was not given."""
+    if path is None:
+        envelope = create_error_envelope(
+            error_type="invalid_input",
+            message=f"Provide {option} <file.json> or use --from-store",
+        )
+        output_json(envelope)
+        raise typer.Exit(code=get_exit_code_from_envelope(envelope))
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def _load_store_metrics(repo: RepositoryIO) -> dict:
+    """Latest daily metrics from the store, or exit with insufficient_data."""
+    current_metrics = load_current_metrics(repo)
+    if current_metrics is None:
+        envelope = create_error_envelope(
+            error_type="insufficient_data",
+            message=(
+                f"No daily metrics in the last {CURRENT_METRICS_LOOKBACK_DAYS} days. "
+                "Run 'resilio sync' first."
+            ),
+        )
+        output_json(envelope)
+        raise typer.Exit(code=get_exit_code_from_envelope(envelope))
+    return current_metrics
+
 
 # ============================================================
 # WEEKLY ANALYSIS COMMANDS
@@ -44,8 +85,9 @@ risk_app = typer.Typer(help="Risk assessment commands")
 @app.command(name="intensity")
 def intensity_command(
     ctx: typer.Context,
-    activities_json: str = typer.Option(..., "--activities", help="JSON file with activities"),
+    activities_json: Optional[str] = typer.Option(None, "--activities", help="JSON file with activities"),
     days: int = typer.Option(28, "--days", help="Rolling window in days (default 28)"),
+    from_store: bool = typer.Option(False, "--from-store", help=FROM_STORE_HELP),
 ) -> None:
     """
     Validate 80/20 intensity distribution compliance.
@@ -53,13 +95,16 @@ def intensity_command(
     Checks if training follows the 80/20 rule (80% low-intensity, 20% high-intensity)
     and identifies moderate-intensity "gray zone" violations.
 
-    Example:
+    Examples:
         resilio analysis intensity --activities activities_28d.json --days 28
+        resilio analysis intensity --from-store --days 28
     """
     try:
         # Load activities
-        with open(activities_json, "r") as f:
-            activities = json.load(f)
+        if from_store:
+            activities = load_activity_inputs(RepositoryIO(), days=days)
+        else:
+            activities = _load_json_input(activities_json, "--activities")
 
         result = api_validate_intensity_distribution(
             activities=activities,
@@ -92,8 +137,10 @@ def intensity_command(
 @app.command(name="gaps")
 def gaps_command(
     ctx: typer.Context,
-    activities_json: str = typer.Option(..., "--activities", help="JSON file with activities"),
+    activities_json: Optional[str] = typer.Option(None, "--activities", help="JSON file with activities"),
     min_days: int = typer.Option(7, "--min-days", help="Minimum gap duration to report (default 7)"),
+    from_store: bool = typer.Option(False, "--from-store", help=FROM_STORE_HELP),
+    days: Optional[int] = typer.Option(None, "--days", help="With --from-store: look back N days (default: all history)"),
 ) -> None:
     """
     Detect training breaks/gaps with context.
@@ -101,13 +148,17 @@ def gaps_command(
     Identifies periods without training, analyzes CTL impact, and detects
     potential causes (injury, illness) from activity notes.
 
-    Example:
+    Examples:
         resilio analysis gaps --activities all_activities.json --min-days 7
+        resilio analysis gaps --from-store --days 365
     """
     try:
-        # Load activities
-        with open(activities_json, "r") as f:
-            activities = json.load(f)
+        # Load activities (store mode attaches each day's CTL for impact analysis
+        # and the notes that gap cause detection matches)
+        if from_store:
+            activities = load_activity_inputs(RepositoryIO(), days=days, include_ctl=True, include_notes=True)
+        else:
+            activities = _load_json_input(activities_json, "--activities")
 
         result = api_detect_activity_gaps(
             activities=activities,
@@ -140,9 +191,10 @@ def gaps_command(
 @app.command(name="load")
 def load_command(
     ctx: typer.Context,
-    activities_json: str = typer.Option(..., "--activities", help="JSON file with activities"),
+    activities_json: Optional[str] = typer.Option(None, "--activities", help="JSON file with activities"),
     days: int = typer.Option(7, "--days", help="Analysis window in days (default 7)"),
     priority: str = typer.Option("equal", "--priority", help="Sport priority: running_primary, equal, other_primary"),
+    from_store: bool = typer.Option(False, "--from-store", help=FROM_STORE_HELP),
 ) -> None:
     """
     Analyze multi-sport load distribution.
@@ -150,9 +202,10 @@ def load_command(
     Breaks down systemic and lower-body load by sport, checks adherence to
     sport priorities, and identifies fatigue risk from sport conflicts.
 
-    Example:
+    Examples:
         resilio analysis load --activities week_activities.json \\
             --days 7 --priority equal
+        resilio analysis load --from-store --days 7 --priority equal
     """
     try:
         # Validate priority
@@ -166,8 +219,10 @@ def load_command(
             raise typer.Exit(code=get_exit_code_from_envelope(envelope))
 
         # Load activities
-        with open(activities_json, "r") as f:
-            activities = json.load(f)
+        if from_store:
+            activities = load_activity_inputs(RepositoryIO(), days=days)
+        else:
+            activities = _load_json_input(activities_json, "--activities")
 
         result = api_analyze_load_distribution_by_sport(
             activities=activities,
@@ -204,7 +259,9 @@ def capacity_command(
     week_number: int = typer.Option(..., "--week", help="Week number in plan"),
     planned_volume: float = typer.Option(..., "--volume", help="Planned weekly volume (km)"),
     planned_load: float = typer.Option(..., "--load", help="Planned systemic load (AU)"),
-    historical_json: str = typer.Option(..., "--historical", help="JSON file with historical activities"),
+    historical_json: Optional[str] = typer.Option(None, "--historical", help="JSON file with historical activities"),
+    from_store: bool = typer.Option(False, "--from-store", help=FROM_STORE_HELP),
+    days: Optional[int] = typer.Option(None, "--days", help="With --from-store: look back N days (default: all history)"),
 ) -> None:
     """
     Validate planned volume against proven capacity.
@@ -212,14 +269,17 @@ def capacity_command(
     Checks if planned volume exceeds historical maximum and assesses risk
     of attempting unproven training volumes.
 
-    Example:
+    Examples:
         resilio analysis capacity --week 15 --volume 60.0 --load 550.0 \\
             --historical all_activities.json
+        resilio analysis capacity --week 15 --volume 60.0 --load 550.0 --from-store
     """
     try:
         # Load historical activities
-        with open(historical_json, "r") as f:
-            historical_activities = json.load(f)
+        if from_store:
+            historical_activities = load_activity_inputs(RepositoryIO(), days=days)
+        else:
+            historical_activities = _load_json_input(historical_json, "--historical")
 
         result = api_check_weekly_capacity(
             week_number=week_number,
@@ -259,9 +319,11 @@ def capacity_command(
 @risk_app.command(name="assess")
 def risk_assess_command(
     ctx: typer.Context,
-    metrics_json: str = typer.Option(..., "--metrics", help="JSON file with current metrics"),
-    activities_json: str = typer.Option(..., "--recent", help="JSON file with recent activities"),
+    metrics_json: Optional[str] = typer.Option(None, "--metrics", help="JSON file with current metrics"),
+    activities_json: Optional[str] = typer.Option(None, "--recent", help="JSON file with recent activities"),
     workout_json: Optional[str] = typer.Option(None, "--planned", help="JSON file with planned workout (optional)"),
+    from_store: bool = typer.Option(False, "--from-store", help=FROM_STORE_HELP),
+    days: int = typer.Option(7, "--days", help="With --from-store: recent activity window in days (default 7)"),
 ) -> None:
     """
     Assess current training risk holistically.
@@ -269,19 +331,21 @@ def risk_assess_command(
     Combines ACWR, readiness, TSB, and recent load to calculate a heuristic
     risk index and provide actionable risk mitigation options.
 
-    Example:
+    Examples:
         resilio risk assess --metrics current_metrics.json \\
             --recent last_7d_activities.json \\
             --planned today_workout.json
+        resilio risk assess --from-store --days 7 --planned today_workout.json
     """
     try:
-        # Load current metrics
-        with open(metrics_json, "r") as f:
-            current_metrics = json.load(f)
-
-        # Load recent activities
-        with open(activities_json, "r") as f:
-            recent_activities = json.load(f)
+        # Load current metrics and recent activities
+        if from_store:
+            repo = RepositoryIO()
+            current_metrics = _load_store_metrics(repo)
+            recent_activities = load_activity_inputs(repo, days=days)
+        else:
+            current_metrics = _load_json_input(metrics_json, "--metrics")
+            recent_activities = _load_json_input(activities_json, "--recent")
 
         # Load planned workout (optional)
         planned_workout = None
@@ -361,8 +425,9 @@ def recovery_window_command(
 def forecast_command(
     ctx: typer.Context,
     weeks: int = typer.Option(..., "--weeks", help="Number of weeks to forecast (1-4)"),
-    metrics_json: str = typer.Option(..., "--metrics", help="JSON file with current metrics"),
+    metrics_json: Optional[str] = typer.Option(None, "--metrics", help="JSON file with current metrics"),
     plan_json: str = typer.Option(..., "--plan", help="JSON file with planned weeks"),
+    from_store: bool = typer.Option(False, "--from-store", help="Read current metrics from the metrics store instead of --metrics"),
 ) -> None:
     """
     Forecast future training stress (CTL/ATL/TSB/ACWR).
@@ -370,15 +435,18 @@ def forecast_command(
     Projects metrics 1-4 weeks ahead to identify risk windows and suggest
     proactive plan adjustments.
 
-    Example:
+    Examples:
         resilio risk forecast --weeks 3 \\
             --metrics current_metrics.json \\
             --plan planned_weeks.json
+        resilio risk forecast --weeks 3 --from-store --plan planned_weeks.json
     """
     try:
         # Load current metrics
-        with open(metrics_json, "r") as f:
-            current_metrics = json.load(f)
+        if from_store:
+            current_metrics = _load_store_metrics(RepositoryIO())
+        else:
+            current_metrics = _load_json_input(metrics_json, "--metrics")
 
         # Load planned weeks
         with open(plan_json, "r") as f:
@@ -417,8 +485,10 @@ def forecast_command(
 def taper_status_command(
     ctx: typer.Context,
     race_date: str = typer.Option(..., "--race-date", help="Race date (YYYY-MM-DD)"),
-    metrics_json: str = typer.Option(..., "--metrics", help="JSON file with current metrics"),
-    weeks_json: str = typer.Option(..., "--recent-weeks", help="JSON file with recent weeks"),
+    metrics_json: Optional[str] = typer.Option(None, "--metrics", help="JSON file with current metrics"),
+    weeks_json: Optional[str] = typer.Option(None, "--recent-weeks", help="JSON file with recent weeks"),
+    from_store: bool = typer.Option(False, "--from-store", help=FROM_STORE_HELP),
+    days: int = typer.Option(28, "--days", help="With --from-store: recent weeks to summarize, in days (default 28)"),
 ) -> None:
     """
     Verify taper progression toward race.
@@ -426,23 +496,25 @@ def taper_status_command(
     Checks volume reduction, TSB trajectory, and readiness trend to ensure
     taper is on track for race day freshness.
 
-    Example:
+    Examples:
         resilio risk taper-status --race-date 2026-03-15 \\
             --metrics current_metrics.json \\
             --recent-weeks last_3_weeks.json
+        resilio risk taper-status --race-date 2026-03-15 --from-store --days 28
     """
     try:
         # Parse race date
         from datetime import datetime
         race_date_obj = datetime.strptime(race_date, "%Y-%m-%d").date()
 
-        # Load current metrics
-        with open(metrics_json, "r") as f:
-            current_metrics = json.load(f)
-
-        # Load recent weeks
-        with open(weeks_json, "r") as f:
-            recent_weeks = json.load(f)
+        # Load current metrics and recent weeks
+        if from_store:
+            repo = RepositoryIO()
+            current_metrics = _load_store_metrics(repo)
+            recent_weeks = load_recent_weeks(repo, weeks=max(1, days // 7))
+        else:
+            current_metrics = _load_json_input(metrics_json, "--metrics")
+            recent_weeks = _load_json_input(weeks_json, "--recent-weeks")
 
         result = api_assess_taper_status(
             race_date=race_date_obj,
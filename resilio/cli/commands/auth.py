@@ -9,9 +9,9 @@ from pathlib import Path
 from typing import Optional
 
 import typer
-import yaml
 
 from resilio.core.config import load_config
+from resilio.core.serialization import dump_yaml, load_yaml
 from resilio.core.strava import (
     StravaAuthError,
     exchange_code_for_tokens,
@@ -58,7 +58,7 @@ def auth_url_command(ctx: typer.Context) -> None:
     secrets_path = repo_root / "config" / "secrets.local.yaml"
     try:
         with open(secrets_path) as f:
-            secrets = yaml.safe_load(f)
+            secrets = load_yaml(f)
         client_id = secrets.get("strava", {}).get("client_id")
 
         if not client_id or client_id == "YOUR_CLIENT_ID":
@@ -137,7 +137,7 @@ def auth_exchange_command(
     secrets_path = repo_root / "config" / "secrets.local.yaml"
     try:
         with open(secrets_path) as f:
-            secrets = yaml.safe_load(f)
+            secrets = load_yaml(f)
 
         client_id = secrets.get("strava", {}).get("client_id")
         client_secret = secrets.get("strava", {}).get("client_secret")
@@ -193,7 +193,7 @@ def auth_exchange_command(
     secrets["strava"]["token_expires_at"] = tokens["expires_at"]
 
     with open(secrets_path, "w") as f:
-        yaml.safe_dump(secrets, f, default_flow_style=False)
+        dump_yaml(secrets, f, sort_keys=True)
 
     # Return success envelope (with tokens redacted)
     expires_dt = datetime.fromtimestamp(tokens["expires_at"])
@@ -224,7 +224,7 @@ def auth_status_command(ctx: typer.Context) -> None:
     secrets_path = repo_root / "config" / "secrets.local.yaml"
     try:
         with open(secrets_path) as f:
-            secrets = yaml.safe_load(f)
+            secrets = load_yaml(f)
 
         access_token = secrets.get("strava", {}).get("access_token")
         expires_at = secrets.get("strava", {}).get("token_expires_at")
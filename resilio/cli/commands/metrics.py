@@ -4,7 +4,7 @@ resilio metrics - Manage training metrics.
 Commands for recomputing metrics from local activity files without syncing from Strava.
 """
 
-from datetime import datetime
+from datetime import date, datetime, timedelta
 from typing import Optional
 
 import typer
@@ -113,3 +113,64 @@ def recompute_metrics(
         )
         output_json(envelope)
         raise typer.Exit(code=1)
+
+
+@app.command("series")
+def metrics_series(
+    ctx: typer.Context,
+    days: int = typer.Option(
+        90,
+        "--days",
+        min=1,
+        help="Number of days to return (ending at --end)",
+    ),
+    end_date: Optional[str] = typer.Option(
+        None,
+        "--end",
+        help="Last date (YYYY-MM-DD, default: today)",
+    ),
+):
+    """
+    Daily metric time series (loads, CTL, ATL, TSB, ACWR, readiness).
+
+    Reads the columnar metrics store in one pass instead of parsing one
+    daily metrics file per day. Full per-day detail (readiness components,
+    activity summaries, flags) stays in data/metrics/daily/*.yaml.
+
+    Examples:
+        resilio metrics series                      # Last 90 days
+        resilio metrics series --days 28 --end 2026-01-14
+    """
+    repo = RepositoryIO()
+
+    end = date.today()
+    if end_date:
+        try:
+            end = datetime.fromisoformat(end_date).date()
+        except ValueError:
+            envelope = OutputEnvelope(
+                schema_version="1.0",
+                ok=False,
+                error_type="invalid_input",
+                message=f"Invalid end date: {end_date}. Use YYYY-MM-DD format.",
+                data=None,
+            )
+            output_json(envelope)
+            raise typer.Exit(code=5)
+
+    start = end - timedelta(days=days - 1)
+    series = repo.metrics_store().read_range(start, end)
+    records = series.to_records()
+
+    envelope = OutputEnvelope(
+        schema_version="1.0",
+        ok=True,
+        error_type=None,
+        message=f"{len(records)} days of metrics between {start} and {end}",
+        data={
+            "start_date": start.isoformat(),
+            "end_date": end.isoformat(),
+            "days": records,
+        },
+    )
+    output_json(envelope)
@@ -49,6 +49,11 @@ def plan_show_command(
         None,
         "--last-weeks",
         help="For log type: show only last N weeks (default: all)"
+    ),
+    week: Optional[int] = typer.Option(
+        None,
+        "--week",
+        help="For log type: show only this week's summary"
     )
 ) -> None:
     """Show training plan, review, or log (consolidated command).
@@ -76,6 +81,7 @@ def plan_show_command(
         resilio plan show --type review        # Show plan review
         resilio plan show --type log           # Show training log
         resilio plan show --type log --last-weeks 4  # Show last 4 weeks of log
+        resilio plan show --type log --week 3  # Show week 3 of log
     """
     if type == "plan":
         # Original show command behavior
@@ -97,13 +103,14 @@ def plan_show_command(
     elif type == "review":
         # show-review behavior
         from resilio.core.paths import current_plan_review_path
+        from resilio.core.plan import plan_review_log
         from resilio.core.repository import RepositoryIO
 
         repo = RepositoryIO()
         review_path = current_plan_review_path()
-        review_abs_path = repo.resolve_path(review_path)
+        review_log = plan_review_log(repo.resolve_path(review_path))
 
-        if not review_abs_path.exists():
+        if not review_log.exists():
             envelope = create_error_envelope(
                 error_type="not_found",
                 message="Plan review not found. Generate and save a plan first.",
@@ -113,8 +120,7 @@ def plan_show_command(
             raise typer.Exit(code=2)
 
         # Read and return markdown content
-        with open(review_abs_path, 'r') as f:
-            content = f.read()
+        content = review_log.render()
 
         envelope = create_success_envelope(
             message="Plan review retrieved",
@@ -130,13 +136,14 @@ def plan_show_command(
     elif type == "log":
         # show-log behavior
         from resilio.core.paths import current_training_log_path
+        from resilio.core.plan import training_log
         from resilio.core.repository import RepositoryIO
 
         repo = RepositoryIO()
         log_path = current_training_log_path()
-        log_abs_path = repo.resolve_path(log_path)
+        log = training_log(repo.resolve_path(log_path))
 
-        if not log_abs_path.exists():
+        if not log.exists():
             envelope = create_error_envelope(
                 error_type="not_found",
                 message="Training log not found. Initialize it with: resilio plan init-log",
@@ -145,28 +152,35 @@ def plan_show_command(
             output_json(envelope)
             raise typer.Exit(code=2)
 
-        # Read markdown content
-        with open(log_abs_path, 'r') as f:
-            content = f.read()
+        if week is not None:
+            # One week: header + that week's section, located via the log index
+            entry = log.find(str(week))
+            if entry is None:
+                envelope = create_error_envelope(
+                    error_type="not_found",
+                    message=f"Week {week} not found in training log",
+                    data={"path": log_path, "week": week}
+                )
+                output_json(envelope)
+                raise typer.Exit(code=2)
+
+            envelope = create_success_envelope(
+                message=f"Training log retrieved (week {week})",
+                data={
+                    "path": log_path,
+                    "content": log.render([entry]),
+                    "weeks_shown": [week],
+                },
+            )
+            output_json(envelope)
+            raise typer.Exit(code=0)
 
-        # If last_weeks specified, filter content
+        # Header + last N weeks (sections start at "## Week N:"); only the
+        # selected sections are read
         if last_weeks is not None:
-            # Split by week markers (## Week N:)
-            import re
-            weeks = re.split(r'(## Week \d+:)', content)
-
-            # Reconstruct with header and last N weeks
-            if len(weeks) > 1:
-                # First element is the header before first week
-                header = weeks[0]
-                # Remaining elements alternate: [marker, content, marker, content, ...]
-                week_pairs = [(weeks[i], weeks[i+1]) for i in range(1, len(weeks)-1, 2)]
-
-                # Take last N weeks
-                selected_weeks = week_pairs[-last_weeks:] if last_weeks < len(week_pairs) else week_pairs
-
-                # Reconstruct content
-                content = header + ''.join([marker + text for marker, text in selected_weeks])
+            content = log.render(log.entries()[-last_weeks:])
+        else:
+            content = log.render()
 
         envelope = create_success_envelope(
             message=f"Training log retrieved{' (last ' + str(last_weeks) + ' weeks)' if last_weeks else ''}",
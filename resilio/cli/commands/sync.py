@@ -12,6 +12,7 @@ from resilio.api import sync_strava
 from resilio.cli.errors import api_result_to_envelope, get_exit_code_from_envelope
 from resilio.cli.output import output_json
 from resilio.core.repository import RepositoryIO
+from resilio.core.sync_journal import replay_sync_journal
 from resilio.core.sync_state import read_resume_state
 from resilio.core.strava import DEFAULT_SYNC_LOOKBACK_DAYS
 from resilio.schemas.repository import RepoError
@@ -25,7 +26,6 @@ from resilio.schemas.sync import (
 
 
 WORKFLOW_LOCK_FILE = "config/.workflow_lock"
-SYNC_PROGRESS_FILE = "config/.sync_progress.json"
 LOCK_STALE_SECONDS = 300
 
 
@@ -115,15 +115,10 @@ def _build_lock_status(repo: RepositoryIO) -> Optional[SyncLockStatus]:
 
 
 def _build_progress_status(repo: RepositoryIO) -> Optional[SyncProgress]:
-    raw = repo.read_json(SYNC_PROGRESS_FILE)
-    if raw is None or isinstance(raw, RepoError):
-        return None
-    if not isinstance(raw, dict):
-        return None
-    try:
-        return SyncProgress.model_validate(raw)
-    except Exception:
+    journal = replay_sync_journal(repo)
+    if journal is None:
         return None
+    return journal.to_progress()
 
 
 def _build_sync_status(repo: RepositoryIO) -> SyncStatusSnapshot:
@@ -300,6 +300,11 @@ def vdot_estimate_current_command(
         "--lookback-days",
         help="Number of days to look back for pace analysis"
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Recompute the estimate without reading or updating the estimate cache"
+    ),
 ) -> None:
     """Estimate current VDOT with training continuity awareness.
 
@@ -323,6 +328,12 @@ def vdot_estimate_current_command(
     Examples:
         resilio vdot estimate-current
         resilio vdot estimate-current --lookback-days 90
+        resilio vdot estimate-current --no-cache
+
+    Caching:
+        The estimate is cached under data/state/ and reused until synced
+        activities, personal bests, max HR, --lookback-days or the date
+        change. data.cache reports "hit", "miss" or "bypass" (--no-cache).
 
     Confidence levels:
         - HIGH: Recent race (<90 days) or 3+ quality workouts
@@ -335,7 +346,7 @@ def vdot_estimate_current_command(
         3. Compare current VDOT to peak VDOT from personal bests
     """
     # Call API
-    result = estimate_current_vdot(lookback_days=lookback_days)
+    result = estimate_current_vdot(lookback_days=lookback_days, use_cache=not no_cache)
 
     # Build success message
     if hasattr(result, 'estimated_vdot'):
@@ -0,0 +1,261 @@
+"""
+resilio serve - Warm-process daemon for the CLI.
+
+Keeps one interpreter alive behind a Unix socket so coach sessions that run
+dozens of short commands stop paying for imports, schema builds and
+config/profile/plan parsing on every call. The thin client in
+resilio/client.py forwards argv and the working directory; the daemon runs
+the normal Typer app in-process and returns captured stdout/stderr and the
+exit code.
+
+Warm state is limited to caches that validate themselves against files:
+- Imported modules and built click commands
+- The read_yaml model cache and load_config's settings/secrets (keyed by
+  file (mtime_ns, size) stamps, so edits on disk are never served stale)
+- The activity index and metrics store, which refresh from file stamps
+
+Requests are handled one at a time: commands chdir to the caller's
+directory and write to the process stdout, which are process-global.
+"""
+
+import io
+import json
+import logging
+import os
+import signal
+import socket
+import socketserver
+import sys
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import Optional
+
+import click
+import typer
+
+from resilio.cli.output import create_error_envelope, create_success_envelope, output_json
+from resilio.client import PROTOCOL_VERSION, default_socket_path, ensure_socket_dir
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_IDLE_TIMEOUT_SECONDS = 1800
+MAX_REQUEST_BYTES = 1024 * 1024
+
+
+def run_request(argv: list[str], cwd: str) -> dict:
+    """
+    Run one CLI invocation in this process, capturing its output.
+
+    Args:
+        argv: Arguments after the program name
+        cwd: Directory to run in (repo root detection walks up from here)
+
+    Returns:
+        Response dict with exit_code, stdout and stderr
+    """
+    stdout, stderr = io.StringIO(), io.StringIO()
+    previous_cwd = os.getcwd()
+    previous_stdin = sys.stdin
+    try:
+        os.chdir(cwd)
+        # No terminal behind a forwarded call
+        sys.stdin = io.StringIO()
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            exit_code = _invoke(_root_command(), argv)
+    except OSError as e:
+        stderr.write(f"resilio serve: cannot run in {cwd}: {e}\n")
+        exit_code = 1
+    finally:
+        sys.stdin = previous_stdin
+        os.chdir(previous_cwd)
+
+    return {
+        "protocol": PROTOCOL_VERSION,
+        "exit_code": exit_code,
+        "stdout": stdout.getvalue(),
+        "stderr": stderr.getvalue(),
+    }
+
+
+_root: Optional[click.Command] = None
+
+
+def _root_command() -> click.Command:
+    """Root click group, built once so resolved lazy commands stay loaded."""
+    global _root
+    if _root is None:
+        from resilio.cli import app
+
+        _root = typer.main.get_command(app)
+    return _root
+
+
+def _invoke(command: click.Command, argv: list[str]) -> int:
+    """Mirror click's standalone-mode exit handling without exiting."""
+    try:
+        result = command.main(args=argv, prog_name="resilio", standalone_mode=False)
+    except click.ClickException as e:
+        e.show()
+        return e.exit_code
+    except click.Abort:
+        click.echo("Aborted!", err=True)
+        return 1
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    except Exception:
+        traceback.print_exc()
+        return 1
+    # standalone_mode=False returns typer.Exit codes; commands return None
+    return result if isinstance(result, int) else 0
+
+
+class DaemonServer(socketserver.UnixStreamServer):
+    """Single-threaded Unix socket server running CLI requests in order."""
+
+    def __init__(self, socket_path: Path, idle_timeout: Optional[float] = DEFAULT_IDLE_TIMEOUT_SECONDS):
+        self.socket_path = socket_path
+        # handle_request() waits at most this long, then handle_timeout() stops
+        self.timeout = idle_timeout or None
+        self.stopped = False
+        self.requests_handled = 0
+        previous_umask = os.umask(0o077)  # Socket usable by this user only
+        try:
+            super().__init__(str(socket_path), _RequestHandler)
+        finally:
+            os.umask(previous_umask)
+
+    def serve_until_idle(self) -> None:
+        """Handle requests until stopped or idle for `timeout` seconds."""
+        while not self.stopped:
+            self.handle_request()
+
+    def handle_timeout(self) -> None:
+        logger.info("resilio serve: idle timeout, exiting")
+        self.stopped = True
+
+    def server_close(self) -> None:
+        super().server_close()
+        try:
+            self.socket_path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        try:
+            request = json.loads(self.rfile.readline(MAX_REQUEST_BYTES))
+        except ValueError:
+            return
+        if request.get("protocol") != PROTOCOL_VERSION:
+            # Client falls back to in-process execution
+            response = {"protocol": PROTOCOL_VERSION}
+        else:
+            response = run_request(list(request.get("argv", [])), request.get("cwd") or os.getcwd())
+        self.server.requests_handled += 1
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+
+def daemon_running(socket_path: Path) -> bool:
+    """True if something accepts connections on the socket."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(socket_path))
+        except OSError:
+            return False
+    return True
+
+
+def prewarm() -> None:
+    """Import every command and load config, profile and plan (best effort)."""
+    from resilio.cli import LAZY_COMMANDS, load_command
+
+    for name in LAZY_COMMANDS:
+        load_command(name)
+
+    from resilio.core.config import load_config
+    from resilio.core.paths import athlete_profile_path, current_plan_path
+    from resilio.core.repository import RepositoryIO, enable_model_cache
+    from resilio.schemas.plan import MasterPlan
+    from resilio.schemas.profile import AthleteProfile
+    from resilio.schemas.repository import ReadOptions
+
+    enable_model_cache()
+    try:
+        repo = RepositoryIO()
+    except FileNotFoundError:
+        return  # Not started inside a repository; requests warm up lazily
+    load_config(repo.repo_root)
+    options = ReadOptions(allow_missing=True)
+    repo.read_yaml(athlete_profile_path(), AthleteProfile, options)
+    repo.read_yaml(current_plan_path(), MasterPlan, options)
+    repo.activity_index().refresh()
+
+
+def serve_command(
+    socket_path: Optional[Path] = typer.Option(
+        None,
+        "--socket",
+        help="Unix socket path (default: $RESILIO_SOCKET, else per-user runtime dir or 0700 tmp dir)",
+    ),
+    idle_timeout: int = typer.Option(
+        DEFAULT_IDLE_TIMEOUT_SECONDS,
+        "--idle-timeout",
+        help="Exit after this many seconds without requests (0 = never)",
+    ),
+) -> None:
+    """Run a warm CLI daemon; `resilio` commands forward to it when running.
+
+    Blocks until idle timeout, SIGTERM or Ctrl-C. Set RESILIO_NO_DAEMON=1 to
+    bypass a running daemon.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        envelope = create_error_envelope(
+            error_type="config",
+            message="resilio serve requires Unix domain sockets",
+        )
+        output_json(envelope)
+        raise typer.Exit(code=1)
+
+    socket_path = socket_path or default_socket_path()
+    if not ensure_socket_dir(socket_path):
+        envelope = create_error_envelope(
+            error_type="config",
+            message=f"Socket directory {socket_path.parent} must be owned by you and not writable by others",
+            data={"socket": str(socket_path)},
+        )
+        output_json(envelope)
+        raise typer.Exit(code=1)
+    if socket_path.exists():
+        if daemon_running(socket_path):
+            envelope = create_error_envelope(
+                error_type="config",
+                message=f"A daemon is already listening on {socket_path}",
+                data={"socket": str(socket_path)},
+            )
+            output_json(envelope)
+            raise typer.Exit(code=1)
+        socket_path.unlink()  # Left behind by a killed daemon
+
+    try:
+        prewarm()
+    except Exception as e:
+        logger.warning(f"resilio serve: prewarm failed: {e}")
+
+    server = DaemonServer(socket_path, idle_timeout=idle_timeout)
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    output_json(
+        create_success_envelope(
+            message=f"Serving on {socket_path}",
+            data={"socket": str(socket_path), "pid": os.getpid(), "idle_timeout": idle_timeout},
+        )
+    )
+    sys.stdout.flush()
+    try:
+        server.serve_until_idle()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
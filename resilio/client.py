@@ -0,0 +1,191 @@
+"""
+Thin `resilio` entry point that forwards to a warm `resilio serve` daemon.
+
+Each CLI call is normally a fresh Python process that re-imports Pydantic,
+rebuilds schema validators and re-reads config, profile and plan. When a
+daemon started with `resilio serve` is listening on the Unix socket, this
+entry point sends it argv and the working directory and writes back exactly
+what the command printed (the same JSON envelope as resilio/cli/output.py),
+exiting with the same code.
+
+If no daemon is running (no socket, stale socket, protocol mismatch), or the
+command needs the local terminal, the CLI runs in-process as before.
+
+The socket must be one this user's daemon created: it has to live in a
+directory owned by the user and not writable by others (the tmp fallback is a
+0700 per-user directory), be owned by the user, and (where SO_PEERCRED is
+available) be served by a process of the same user. Otherwise the command
+runs in-process rather than sending argv to someone else's socket.
+
+Deliberately imports only the standard library: forwarding a command must
+not pay for Typer or the API layer.
+"""
+
+import json
+import os
+import socket
+import stat
+import struct
+import sys
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+# Bump when the request/response format changes; mismatches run in-process
+PROTOCOL_VERSION = 1
+
+SOCKET_ENV = "RESILIO_SOCKET"
+DISABLE_ENV = "RESILIO_NO_DAEMON"
+
+CONNECT_TIMEOUT_SECONDS = 0.5
+
+# Commands that need the caller's terminal or must not recurse into a daemon
+LOCAL_COMMANDS = {("serve",), ("profile", "edit")}
+
+
+def default_socket_path() -> Path:
+    """Socket path: $RESILIO_SOCKET, else per-user in $XDG_RUNTIME_DIR or a 0700 tmp dir."""
+    override = os.environ.get(SOCKET_ENV)
+    if override:
+        return Path(override)
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "resilio.sock"
+    return Path(tempfile.gettempdir()) / f"resilio-{os.getuid()}" / "resilio.sock"
+
+
+def ensure_socket_dir(socket_path: Path) -> bool:
+    """
+    Create the socket's directory (mode 0700) if missing and check it is private.
+
+    Returns:
+        True if the directory is a real directory owned by this user and not
+        writable by group or others
+    """
+    directory = socket_path.parent
+    try:
+        directory.mkdir(mode=0o700, parents=True)
+    except FileExistsError:
+        pass
+    except OSError:
+        return False
+    return _is_private_dir(directory)
+
+
+def socket_is_trusted(socket_path: Path) -> bool:
+    """True if socket_path is a socket owned by this user, in a private directory."""
+    try:
+        info = os.lstat(socket_path)
+    except OSError:
+        return False
+    return (
+        stat.S_ISSOCK(info.st_mode)
+        and info.st_uid == os.getuid()
+        and _is_private_dir(socket_path.parent)
+    )
+
+
+def _is_private_dir(directory: Path) -> bool:
+    try:
+        info = os.lstat(directory)
+    except OSError:
+        return False
+    return (
+        stat.S_ISDIR(info.st_mode)
+        and info.st_uid == os.getuid()
+        and info.st_mode & (stat.S_IWGRP | stat.S_IWOTH) == 0
+    )
+
+
+def _peer_is_same_user(sock: socket.socket) -> bool:
+    """Check the listening process's uid where the platform reports it."""
+    if not hasattr(socket, "SO_PEERCRED"):
+        return True  # Owner/mode checks on the socket file still apply
+    creds = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+    _pid, uid, _gid = struct.unpack("3i", creds)
+    return uid == os.getuid()
+
+
+def requires_local(argv: list[str]) -> bool:
+    """True if the command must run in this process (see LOCAL_COMMANDS)."""
+    words = []
+    args = iter(argv)
+    for arg in args:
+        if arg == "--repo-root":
+            next(args, None)
+        elif not arg.startswith("-"):
+            words.append(arg)
+    return any(tuple(words[: len(command)]) == command for command in LOCAL_COMMANDS)
+
+
+def forward(
+    argv: list[str],
+    socket_path: Optional[Path] = None,
+    cwd: Optional[str] = None,
+) -> Optional[dict]:
+    """
+    Run a CLI command in the daemon.
+
+    Args:
+        argv: Arguments after the program name
+        socket_path: Daemon socket (default_socket_path() if None)
+        cwd: Working directory for the command (current directory if None)
+
+    Returns:
+        Response dict with exit_code, stdout and stderr, or None if no
+        compatible daemon accepted the request (caller should run in-process)
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    socket_path = socket_path or default_socket_path()
+    if not socket_is_trusted(socket_path):
+        # Missing, or not created by this user's daemon
+        return None
+
+    request = {"protocol": PROTOCOL_VERSION, "argv": argv, "cwd": cwd or os.getcwd()}
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.settimeout(CONNECT_TIMEOUT_SECONDS)
+            sock.connect(str(socket_path))
+            if not _peer_is_same_user(sock):
+                return None
+        except OSError:
+            # Stale socket file or daemon gone
+            return None
+
+        # Once the request is sent the daemon may already be running the
+        # command, so failures from here on are reported, never retried
+        # in-process (a second `resilio sync` is not harmless)
+        try:
+            # Commands such as sync legitimately run for minutes
+            sock.settimeout(None)
+            sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as stream:
+                response = json.loads(stream.readline())
+        except (OSError, ValueError) as e:
+            return _failure(f"resilio serve: lost connection to daemon ({e})")
+
+    if response.get("protocol") != PROTOCOL_VERSION:
+        # Rejected before running anything
+        return None
+    return response
+
+
+def _failure(message: str) -> dict:
+    return {"protocol": PROTOCOL_VERSION, "exit_code": 1, "stdout": "", "stderr": message + "\n"}
+
+
+def main() -> None:
+    """Console entry point: forward to the daemon, else run in-process."""
+    argv = sys.argv[1:]
+    if not os.environ.get(DISABLE_ENV) and not requires_local(argv):
+        response = forward(argv)
+        if response is not None:
+            sys.stdout.write(response["stdout"])
+            sys.stderr.write(response["stderr"])
+            sys.stdout.flush()
+            sys.exit(response["exit_code"])
+
+    from resilio.cli import app
+
+    app()
@@ -0,0 +1,140 @@
+"""
+Activity export - Stream stored activities to a JSON or NDJSON file.
+
+Activities are selected through the activity index, which already returns
+them in date order, then parsed, serialized and written one at a time: memory
+use does not grow with the number of activities exported.
+
+Formats:
+- json: a JSON array (indent=2), the input format of the analysis commands
+- ndjson: one compact JSON object per line, for external tools
+
+Either can be gzip-compressed and projected to a subset of top-level fields.
+"""
+
+import gzip
+import json
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Iterable, Optional, TextIO, Union
+
+from resilio.core.repository import RepositoryIO
+from resilio.schemas.activity import NormalizedActivity
+
+EXPORT_FORMATS = ("json", "ndjson")
+
+
+@dataclass
+class ExportResult:
+    """Result from export_activities."""
+
+    count: int
+    output_file: str
+    format: str
+    gzip: bool
+    fields: Optional[list[str]] = None
+
+
+def parse_export_fields(fields: Optional[str]) -> Optional[list[str]]:
+    """
+    Parse a comma-separated --fields value.
+
+    Args:
+        fields: e.g. "id,date,distance_km" (None/empty = all fields)
+
+    Returns:
+        Field names in the given order, or None for all fields
+
+    Raises:
+        ValueError: If a name is not a NormalizedActivity field
+    """
+    if not fields:
+        return None
+    names = list(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+    unknown = [name for name in names if name not in NormalizedActivity.model_fields]
+    if unknown:
+        raise ValueError(
+            f"Unknown activity field(s): {', '.join(unknown)}. "
+            f"Valid fields: {', '.join(NormalizedActivity.model_fields)}"
+        )
+    return names or None
+
+
+def export_activities(
+    repo: RepositoryIO,
+    out: Union[str, Path],
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    sport: Optional[str] = None,
+    output_format: str = "json",
+    fields: Optional[list[str]] = None,
+    compress: bool = False,
+) -> ExportResult:
+    """
+    Write activities in a date range to a file, most recent first.
+
+    Args:
+        repo: Repository
+        out: Output file path
+        start_date: Inclusive lower bound (None = all history)
+        end_date: Inclusive upper bound (None = no bound)
+        sport: Only this sport type (e.g. 'run')
+        output_format: "json" (array) or "ndjson" (one object per line)
+        fields: Top-level fields to keep, in output order (None = all)
+        compress: gzip the output
+
+    Returns:
+        ExportResult with the number of activities written
+
+    Raises:
+        ValueError: If format is unknown
+        OSError: If the output file cannot be written
+    """
+    if output_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {output_format}. Use one of: {', '.join(EXPORT_FORMATS)}")
+
+    index = repo.activity_index()
+    entries = index.query(start_date=start_date, end_date=end_date, sport=sport or None, newest_first=True)
+    records = (_project(activity, fields) for activity in index.iter_load(entries))
+
+    with _open_output(out, compress) as f:
+        if output_format == "ndjson":
+            count = _write_ndjson(f, records)
+        else:
+            count = _write_json_array(f, records)
+
+    return ExportResult(count=count, output_file=str(out), format=output_format, gzip=compress, fields=fields)
+
+
+def _project(activity: NormalizedActivity, fields: Optional[list[str]]) -> dict:
+    if fields is None:
+        return activity.model_dump(mode="json")
+    record = activity.model_dump(mode="json", include=set(fields))
+    return {name: record[name] for name in fields}
+
+
+def _open_output(out: Union[str, Path], compress: bool) -> TextIO:
+    if compress:
+        return gzip.open(out, "wt", encoding="utf-8")
+    return open(out, "w", encoding="utf-8")
+
+
+def _write_ndjson(f: TextIO, records: Iterable[dict]) -> int:
+    count = 0
+    for record in records:
+        f.write(json.dumps(record, default=str, separators=(",", ":")))
+        f.write("\n")
+        count += 1
+    return count
+
+
+def _write_json_array(f: TextIO, records: Iterable[dict]) -> int:
+    """Same bytes as json.dump(list(records), f, indent=2), one record at a time."""
+    count = 0
+    for record in records:
+        f.write("[\n  " if count == 0 else ",\n  ")
+        f.write(json.dumps(record, indent=2, default=str).replace("\n", "\n  "))
+        count += 1
+    f.write("\n]" if count else "[]")
+    return count
@@ -0,0 +1,785 @@
+"""
+Activity Index - Persistent catalog of stored activities.
+
+Keeps a small SQLite table (one row per activity file) with the fields that
+whole-history features filter on: date, sport, start time, duration, distance,
+HR, session type, loads, file path and the file's (mtime_ns, size) stamp.
+
+Alongside it, an inverted index over activity names, descriptions and private
+notes (term -> activity postings with date and per-field term frequency, plus
+the note texts for snippets) answers `resilio activity search` without
+opening any YAML. See search_notes().
+
+The YAML files under data/activities/ remain the source of truth. The index is
+a derived cache:
+- RepositoryIO.write_yaml/delete_file keep it up to date incrementally
+- refresh() re-parses only files whose (mtime_ns, size) changed, so edits made
+  outside RepositoryIO (git checkout, manual edits) are picked up on next use
+- Deleting the index file is always safe; it is rebuilt on demand
+
+Because it can always be rebuilt, the database is opened with
+synchronous=OFF: a crash can at worst lose recent index rows, which the
+next refresh() restores from the files.
+"""
+
+import logging
+import os
+import sqlite3
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Union
+
+from resilio.core.repository import RepositoryIO
+from resilio.core.text_search import bm25_term_score, snippet, stem, tokenize
+from resilio.schemas.activity import NormalizedActivity
+from resilio.schemas.repository import RepoError
+
+logger = logging.getLogger(__name__)
+
+
+# Bump when the table layout, extracted fields or stemmer change (forces a rebuild)
+INDEX_SCHEMA_VERSION = 3
+
+# Indexed note fields and their weight in ranking. When several fields match,
+# the snippet comes from the first one listed (private notes are the most
+# candid, then the description, then the title).
+NOTE_FIELDS = {"private_note": 1.0, "description": 1.0, "name": 0.5}
+
+_COLUMNS = (
+    "path",
+    "bucket",
+    "mtime_ns",
+    "size",
+    "id",
+    "date",
+    "sport_type",
+    "start_time",
+    "duration_seconds",
+    "duration_minutes",
+    "distance_km",
+    "average_hr",
+    "max_hr",
+    "session_type",
+    "systemic_load_au",
+    "lower_body_load_au",
+    "has_notes",
+)
+
+
+@dataclass(frozen=True)
+class NoteSearchHit:
+    """One ranked activity returned by ActivityIndex.search_notes()."""
+
+    id: str
+    date: date
+    sport_type: str
+    name: Optional[str]
+    duration_minutes: Optional[int]
+    path: str
+    score: float
+    matched_field: str  # Field the snippet comes from (see NOTE_FIELDS)
+    matched_keywords: list[str]  # Query keywords found in this activity
+    snippet: str
+    full_note: str  # Full text of matched_field
+
+
+@dataclass(frozen=True)
+class ActivityIndexEntry:
+    """
+    One indexed activity.
+
+    Exposes the same attribute names as NormalizedActivity for the fields it
+    carries, so code that only needs those fields (e.g. duplicate detection)
+    can use entries in place of fully loaded activities.
+    """
+
+    id: str
+    date: date
+    sport_type: str
+    start_time: Optional[datetime]
+    duration_seconds: int
+    duration_minutes: int
+    distance_km: Optional[float]
+    average_hr: Optional[float]
+    max_hr: Optional[float]
+    session_type: Optional[str]
+    systemic_load_au: Optional[float]
+    lower_body_load_au: Optional[float]
+    has_notes: bool
+    path: str  # Relative to repo root
+    mtime_ns: int
+    size: int
+
+
+class ActivityIndex:
+    """SQLite-backed catalog of activity files, keyed by file path and activity id."""
+
+    def __init__(self, repo: RepositoryIO, index_path: Optional[Union[str, Path]] = None):
+        """
+        Open (or create) the activity index for a repository.
+
+        Args:
+            repo: Repository I/O instance
+            index_path: Override index location (default: state_dir/activity_index.sqlite)
+        """
+        from resilio.core.paths import activity_index_path, get_activities_dir
+
+        self.repo = repo
+        self.activities_dir = get_activities_dir()
+        self.index_path = repo.resolve_path(index_path or activity_index_path())
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(str(self.index_path))
+        self._conn.execute("PRAGMA synchronous=OFF")
+        self._ensure_schema()
+
+    # ============================================================
+    # LIFECYCLE
+    # ============================================================
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+    def __enter__(self) -> "ActivityIndex":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def _ensure_schema(self) -> None:
+        """Create tables, or drop and recreate them if the layout is outdated."""
+        conn = self._conn
+        conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        row = conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+        if row is not None and int(row[0]) == INDEX_SCHEMA_VERSION:
+            return
+
+        with conn:
+            conn.execute("DROP TABLE IF EXISTS activities")
+            conn.execute("DROP TABLE IF EXISTS notes")
+            conn.execute("DROP TABLE IF EXISTS postings")
+            conn.execute(
+                """
+                CREATE TABLE activities (
+                    path TEXT PRIMARY KEY,
+                    bucket TEXT NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    id TEXT,
+                    date TEXT,
+                    sport_type TEXT,
+                    start_time TEXT,
+                    duration_seconds INTEGER,
+                    duration_minutes INTEGER,
+                    distance_km REAL,
+                    average_hr REAL,
+                    max_hr REAL,
+                    session_type TEXT,
+                    systemic_load_au REAL,
+                    lower_body_load_au REAL,
+                    has_notes INTEGER
+                )
+                """
+            )
+            conn.execute("CREATE INDEX idx_activities_id ON activities (id)")
+            conn.execute("CREATE INDEX idx_activities_date ON activities (date)")
+            conn.execute("CREATE INDEX idx_activities_bucket ON activities (bucket)")
+            conn.execute(
+                """
+                CREATE TABLE notes (
+                    path TEXT PRIMARY KEY,
+                    name TEXT,
+                    description TEXT,
+                    private_note TEXT,
+                    length INTEGER NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE postings (
+                    term TEXT NOT NULL,
+                    stem TEXT NOT NULL,
+                    path TEXT NOT NULL,
+                    date TEXT NOT NULL,
+                    field TEXT NOT NULL,
+                    tf INTEGER NOT NULL,
+                    PRIMARY KEY (term, path, field)
+                ) WITHOUT ROWID
+                """
+            )
+            conn.execute("CREATE INDEX idx_postings_stem ON postings (stem)")
+            conn.execute("CREATE INDEX idx_postings_path ON postings (path)")
+            conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('schema_version', ?)",
+                (str(INDEX_SCHEMA_VERSION),),
+            )
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('version', '0')")
+            conn.execute("DELETE FROM meta WHERE key = 'store_id'")
+
+    # ============================================================
+    # MAINTENANCE
+    # ============================================================
+
+    @property
+    def version(self) -> int:
+        """Monotonic counter bumped whenever the indexed contents change."""
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        return int(row[0]) if row else 0
+
+    @property
+    def store_id(self) -> str:
+        """
+        Random id of this index database, renewed whenever it is recreated.
+
+        version restarts at 0 when the index file is deleted or its schema
+        upgraded, so (store_id, version) is what identifies indexed contents.
+        """
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'store_id'").fetchone()
+        if row is not None:
+            return row[0]
+        store_id = uuid.uuid4().hex
+        with self._conn:
+            self._conn.execute("INSERT INTO meta (key, value) VALUES ('store_id', ?)", (store_id,))
+        return store_id
+
+    def _bump_version(self) -> None:
+        self._conn.execute(
+            "UPDATE meta SET value = CAST(CAST(value AS INTEGER) + 1 AS TEXT) WHERE key = 'version'"
+        )
+
+    def refresh(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> int:
+        """
+        Re-sync the index with the activity files on disk.
+
+        Only stats files; YAML is parsed only for new or changed files. When a
+        date range is given, only month directories overlapping it are checked.
+
+        Args:
+            start_date: Only check month directories on/after this date's month
+            end_date: Only check month directories on/before this date's month
+
+        Returns:
+            Number of rows added, updated or removed
+        """
+        root = self.repo.resolve_path(self.activities_dir)
+        if not root.is_dir():
+            with self._conn:
+                removed = self._conn.execute("DELETE FROM activities").rowcount
+                self._conn.execute("DELETE FROM notes")
+                self._conn.execute("DELETE FROM postings")
+                if removed:
+                    self._bump_version()
+            return removed
+
+        on_disk: dict[str, tuple[int, int]] = {}
+        buckets: list[str] = []
+        for bucket, bucket_dir in self._buckets(root):
+            if not _bucket_in_range(bucket, start_date, end_date):
+                continue
+            buckets.append(bucket)
+            for file_path in self._yaml_files(bucket, bucket_dir):
+                stat = file_path.stat()
+                on_disk[self._relative(file_path)] = (stat.st_mtime_ns, stat.st_size)
+
+        stored: dict[str, tuple[int, int]] = {}
+        if start_date is None and end_date is None:
+            rows = self._conn.execute("SELECT path, mtime_ns, size FROM activities")
+            stored = {path: (mtime_ns, size) for path, mtime_ns, size in rows}
+        else:
+            stored_buckets = {
+                bucket
+                for (bucket,) in self._conn.execute("SELECT DISTINCT bucket FROM activities")
+                if _bucket_in_range(bucket, start_date, end_date)
+            }
+            for bucket in stored_buckets.union(buckets):
+                rows = self._conn.execute(
+                    "SELECT path, mtime_ns, size FROM activities WHERE bucket = ?", (bucket,)
+                )
+                stored.update({path: (mtime_ns, size) for path, mtime_ns, size in rows})
+
+        changed = [path for path, stamp in on_disk.items() if stored.get(path) != stamp]
+        removed = [path for path in stored if path not in on_disk]
+        if not changed and not removed:
+            return 0
+
+        with self._conn:
+            for path in removed:
+                self._delete_row(path)
+            for path in changed:
+                activity = self.repo.read_yaml(path, NormalizedActivity)
+                mtime_ns, size = on_disk[path]
+                self._upsert_row(path, mtime_ns, size, activity)
+            self._bump_version()
+
+        return len(changed) + len(removed)
+
+    def record_write(self, path: Union[str, Path], activity: NormalizedActivity) -> None:
+        """
+        Record that an activity file was just written.
+
+        Args:
+            path: Path of the written file (absolute or relative to repo root)
+            activity: The activity that was written
+        """
+        resolved = self.repo.resolve_path(path)
+        stat = resolved.stat()
+        with self._conn:
+            self._upsert_row(self._relative(resolved), stat.st_mtime_ns, stat.st_size, activity)
+            self._bump_version()
+
+    def record_delete(self, path: Union[str, Path]) -> None:
+        """
+        Record that an activity file was deleted.
+
+        Args:
+            path: Path of the deleted file (absolute or relative to repo root)
+        """
+        relative = self._relative(self.repo.resolve_path(path))
+        with self._conn:
+            if self._delete_row(relative):
+                self._bump_version()
+
+    def _delete_row(self, path: str) -> bool:
+        """Delete one file's row and note postings. Returns True if it was indexed."""
+        self._conn.execute("DELETE FROM notes WHERE path = ?", (path,))
+        self._conn.execute("DELETE FROM postings WHERE path = ?", (path,))
+        return self._conn.execute("DELETE FROM activities WHERE path = ?", (path,)).rowcount > 0
+
+    def _upsert_row(
+        self,
+        path: str,
+        mtime_ns: int,
+        size: int,
+        activity: Union[NormalizedActivity, RepoError, None],
+    ) -> None:
+        """Insert or replace one row. Unreadable files are kept with a NULL id."""
+        try:
+            parts = Path(path).relative_to(self.activities_dir).parts
+        except ValueError:
+            parts = ()
+        bucket = parts[0] if len(parts) > 1 else ""
+
+        values: dict = {key: None for key in _COLUMNS}
+        values.update(path=path, bucket=bucket, mtime_ns=mtime_ns, size=size)
+
+        if isinstance(activity, NormalizedActivity):
+            calculated = activity.calculated
+            session_type = calculated.session_type if calculated else None
+            values.update(
+                id=activity.id,
+                date=activity.date.isoformat(),
+                sport_type=_enum_value(activity.sport_type),
+                start_time=activity.start_time.isoformat() if activity.start_time else None,
+                duration_seconds=activity.duration_seconds,
+                duration_minutes=activity.duration_minutes,
+                distance_km=activity.distance_km,
+                average_hr=activity.average_hr,
+                max_hr=activity.max_hr,
+                session_type=_enum_value(session_type) if session_type else None,
+                systemic_load_au=calculated.systemic_load_au if calculated else None,
+                lower_body_load_au=calculated.lower_body_load_au if calculated else None,
+                has_notes=int(
+                    bool((activity.description or "").strip() or (activity.private_note or "").strip())
+                ),
+            )
+
+        placeholders = ", ".join("?" for _ in _COLUMNS)
+        self._conn.execute(
+            f"INSERT OR REPLACE INTO activities ({', '.join(_COLUMNS)}) VALUES ({placeholders})",
+            tuple(values[key] for key in _COLUMNS),
+        )
+        self._index_notes(path, activity if isinstance(activity, NormalizedActivity) else None)
+
+    def _index_notes(self, path: str, activity: Optional[NormalizedActivity]) -> None:
+        """Replace the note postings for one file."""
+        self._conn.execute("DELETE FROM notes WHERE path = ?", (path,))
+        self._conn.execute("DELETE FROM postings WHERE path = ?", (path,))
+        if activity is None:
+            return
+
+        texts = {field: getattr(activity, field) or "" for field in NOTE_FIELDS}
+        postings = []
+        length = 0
+        for field, text in texts.items():
+            counts: dict[str, int] = {}
+            for token in tokenize(text):
+                counts[token] = counts.get(token, 0) + 1
+            length += sum(counts.values())
+            postings.extend(
+                (term, stem(term), path, activity.date.isoformat(), field, tf)
+                for term, tf in counts.items()
+            )
+
+        self._conn.execute(
+            "INSERT INTO notes (path, name, description, private_note, length) VALUES (?, ?, ?, ?, ?)",
+            (path, texts["name"], texts["description"], texts["private_note"], length),
+        )
+        self._conn.executemany(
+            "INSERT INTO postings (term, stem, path, date, field, tf) VALUES (?, ?, ?, ?, ?, ?)",
+            postings,
+        )
+
+    # ============================================================
+    # QUERIES
+    # ============================================================
+
+    def query(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        sport: Optional[str] = None,
+        refresh: bool = True,
+        newest_first: bool = False,
+    ) -> list[ActivityIndexEntry]:
+        """
+        List indexed activities, oldest first.
+
+        Args:
+            start_date: Inclusive lower bound on activity date
+            end_date: Inclusive upper bound on activity date
+            sport: Only return this sport type (e.g. 'run')
+            refresh: Re-sync the affected month directories first (default: True)
+            newest_first: Order dates descending (activities on the same day
+                keep their start-time order)
+
+        Returns:
+            Matching entries sorted by (date, start_time, path)
+        """
+        if refresh:
+            self.refresh(start_date, end_date)
+
+        clauses = ["id IS NOT NULL"]
+        params: list = []
+        if start_date is not None:
+            clauses.append("date >= ?")
+            params.append(start_date.isoformat())
+        if end_date is not None:
+            clauses.append("date <= ?")
+            params.append(end_date.isoformat())
+        if sport is not None:
+            clauses.append("sport_type = ?")
+            params.append(_enum_value(sport))
+
+        rows = self._conn.execute(
+            f"SELECT {', '.join(_COLUMNS)} FROM activities WHERE {' AND '.join(clauses)} "
+            f"ORDER BY date{' DESC' if newest_first else ''}, start_time, path",
+            params,
+        )
+        return [_row_to_entry(row) for row in rows]
+
+    def get(self, activity_id: str, refresh: bool = True) -> Optional[ActivityIndexEntry]:
+        """
+        Look up an activity by id.
+
+        A hit is verified against the file's current stamp; on a miss (or a
+        stale hit) the whole index is refreshed once and the lookup retried.
+
+        Args:
+            activity_id: Activity id (e.g. 'strava_12345')
+            refresh: Refresh the index on miss or stale hit (default: True)
+
+        Returns:
+            Matching entry, or None if no such activity exists
+        """
+        entry = self._get(activity_id)
+        if not refresh or (entry is not None and self._is_current(entry)):
+            return entry
+
+        self.refresh()
+        return self._get(activity_id)
+
+    def _get(self, activity_id: str) -> Optional[ActivityIndexEntry]:
+        row = self._conn.execute(
+            f"SELECT {', '.join(_COLUMNS)} FROM activities WHERE id = ? ORDER BY path LIMIT 1",
+            (activity_id,),
+        ).fetchone()
+        return _row_to_entry(row) if row else None
+
+    def _is_current(self, entry: ActivityIndexEntry) -> bool:
+        try:
+            stat = self.repo.resolve_path(entry.path).stat()
+        except OSError:
+            return False
+        return (stat.st_mtime_ns, stat.st_size) == (entry.mtime_ns, entry.size)
+
+    def ids(self, start_date: Optional[date] = None, refresh: bool = True) -> set[str]:
+        """
+        Get the set of indexed activity ids.
+
+        Args:
+            start_date: Only include activities on/after this date
+            refresh: Re-sync the affected month directories first (default: True)
+
+        Returns:
+            Set of activity ids
+        """
+        if refresh:
+            self.refresh(start_date, None)
+        if start_date is None:
+            rows = self._conn.execute("SELECT id FROM activities WHERE id IS NOT NULL")
+        else:
+            rows = self._conn.execute(
+                "SELECT id FROM activities WHERE id IS NOT NULL AND date >= ?",
+                (start_date.isoformat(),),
+            )
+        return {row[0] for row in rows}
+
+    def earliest_date(self, refresh: bool = True) -> Optional[date]:
+        """
+        Get the earliest indexed activity date.
+
+        Args:
+            refresh: Re-sync the index first (default: True)
+
+        Returns:
+            Earliest activity date, or None if there are no activities
+        """
+        if refresh:
+            self.refresh()
+        row = self._conn.execute(
+            "SELECT MIN(date) FROM activities WHERE id IS NOT NULL"
+        ).fetchone()
+        return date.fromisoformat(row[0]) if row and row[0] else None
+
+    def count(self, refresh: bool = True) -> int:
+        """Number of indexed (readable) activities."""
+        if refresh:
+            self.refresh()
+        return self._conn.execute(
+            "SELECT COUNT(*) FROM activities WHERE id IS NOT NULL"
+        ).fetchone()[0]
+
+    def search_notes(
+        self,
+        query: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        sport: Optional[str] = None,
+        use_stemming: bool = False,
+        limit: Optional[int] = None,
+        refresh: bool = True,
+    ) -> tuple[list[NoteSearchHit], int]:
+        """
+        Ranked keyword search over activity names, descriptions and private notes.
+
+        Keywords are OR-matched. Each keyword matches indexed words that start
+        with it ("knee" finds "knees", "kneecap"); with use_stemming it also
+        matches words sharing its light stem ("hurting" finds "hurts").
+        Results are ranked by BM25 over the weighted fields (NOTE_FIELDS),
+        then most recent first.
+
+        Args:
+            query: Space-separated keywords
+            start_date: Inclusive lower bound on activity date
+            end_date: Inclusive upper bound on activity date
+            sport: Only search this sport type
+            use_stemming: Also match on stems (default: prefix match only)
+            limit: Maximum number of hits (None = all)
+            refresh: Re-sync the affected month directories first (default: True)
+
+        Returns:
+            (hits, activities_searched) where activities_searched counts the
+            activities in the date/sport window
+        """
+        if refresh:
+            self.refresh(start_date, end_date)
+
+        # The same window applies to activities (a.date) and postings (p.date)
+        window = {"a": ["a.id IS NOT NULL"], "p": []}
+        window_params: list = []
+        for bound, op in ((start_date, ">="), (end_date, "<=")):
+            if bound is not None:
+                window["a"].append(f"a.date {op} ?")
+                window["p"].append(f"p.date {op} ?")
+                window_params.append(bound.isoformat())
+        sport_sql = " AND a.sport_type = ?" if sport is not None else ""
+        sport_params = [_enum_value(sport)] if sport is not None else []
+
+        doc_count, avg_length = self._conn.execute(
+            "SELECT COUNT(*), AVG(n.length) FROM activities a JOIN notes n ON n.path = a.path "
+            f"WHERE {' AND '.join(window['a'])}{sport_sql}",
+            window_params + sport_params,
+        ).fetchone()
+        keywords = list(dict.fromkeys(tokenize(query)))
+        if not keywords or not doc_count:
+            return [], doc_count or 0
+
+        # path -> keyword -> weighted tf, and path -> field -> matched keywords
+        weighted_tf: dict[str, dict[str, float]] = {}
+        fields_by_path: dict[str, dict[str, list[str]]] = {}
+        for keyword in keywords:
+            match_sql = "(p.term >= ? AND p.term < ?)"
+            match_params: list = [keyword, keyword + "\U0010ffff"]
+            if use_stemming:
+                match_sql = f"({match_sql} OR p.stem = ?)"
+                match_params.append(stem(keyword))
+            rows = self._conn.execute(
+                "SELECT p.path, p.field, SUM(p.tf) FROM postings p JOIN activities a ON a.path = p.path "
+                f"WHERE {' AND '.join([match_sql] + window['p'])}{sport_sql} "
+                "GROUP BY p.path, p.field",
+                match_params + window_params + sport_params,
+            )
+            for path, field, tf in rows:
+                per_keyword = weighted_tf.setdefault(path, {})
+                per_keyword[keyword] = per_keyword.get(keyword, 0.0) + NOTE_FIELDS[field] * tf
+                fields_by_path.setdefault(path, {}).setdefault(field, []).append(keyword)
+
+        if not weighted_tf:
+            return [], doc_count
+
+        def snippet_keywords(matched: list[str]) -> list[str]:
+            # A stem match may not contain the keyword itself ("hurts" -> "hurting")
+            return matched + [stem(keyword) for keyword in matched] if use_stemming else matched
+
+        doc_freq = {keyword: 0 for keyword in keywords}
+        for per_keyword in weighted_tf.values():
+            for keyword in per_keyword:
+                doc_freq[keyword] += 1
+
+        hits = []
+        paths = list(weighted_tf)
+        for chunk_start in range(0, len(paths), 500):
+            chunk = paths[chunk_start : chunk_start + 500]
+            rows = self._conn.execute(
+                "SELECT a.path, a.id, a.date, a.sport_type, a.duration_minutes, "
+                "n.name, n.description, n.private_note, n.length "
+                f"FROM activities a JOIN notes n ON n.path = a.path "
+                f"WHERE a.path IN ({', '.join('?' for _ in chunk)})",
+                chunk,
+            )
+            for path, activity_id, day, sport_type, duration, name, description, note, length in rows:
+                per_keyword = weighted_tf[path]
+                score = sum(
+                    bm25_term_score(tf, doc_freq[keyword], doc_count, length, avg_length)
+                    for keyword, tf in per_keyword.items()
+                )
+                texts = {"name": name, "description": description, "private_note": note}
+                matched_field = next(field for field in NOTE_FIELDS if field in fields_by_path[path])
+                full_note = texts[matched_field] or ""
+                hits.append(
+                    NoteSearchHit(
+                        id=activity_id,
+                        date=date.fromisoformat(day),
+                        sport_type=sport_type,
+                        name=name,
+                        duration_minutes=duration,
+                        path=path,
+                        score=round(score, 4),
+                        matched_field=matched_field,
+                        matched_keywords=[keyword for keyword in keywords if keyword in per_keyword],
+                        snippet=snippet(full_note, snippet_keywords(fields_by_path[path][matched_field])),
+                        full_note=full_note,
+                    )
+                )
+
+        hits.sort(key=lambda hit: (-hit.score, -hit.date.toordinal(), hit.path))
+        return (hits[:limit] if limit is not None else hits), doc_count
+
+    def load(self, entries: Iterable[ActivityIndexEntry]) -> list[NormalizedActivity]:
+        """
+        Load full activities for index entries, skipping unreadable files.
+
+        Args:
+            entries: Entries returned by query()/get()
+
+        Returns:
+            Validated activities in the same order as entries
+        """
+        return list(self.iter_load(entries))
+
+    def iter_load(self, entries: Iterable[ActivityIndexEntry]) -> Iterator[NormalizedActivity]:
+        """
+        Like load(), but parses each file only when the caller asks for it.
+
+        Keeps one activity in memory at a time (streaming exports).
+        """
+        for entry in entries:
+            result = self.repo.read_yaml(entry.path, NormalizedActivity)
+            if isinstance(result, NormalizedActivity):
+                yield result
+
+    # ============================================================
+    # INTERNAL HELPERS
+    # ============================================================
+
+    def _buckets(self, root: Path) -> list[tuple[str, Path]]:
+        """Top-level month directories, plus '' for files directly under root."""
+        buckets = [("", root)]
+        with os.scandir(root) as it:
+            for entry in it:
+                if entry.is_dir() and not entry.name.startswith("."):
+                    buckets.append((entry.name, Path(entry.path)))
+        return buckets
+
+    @staticmethod
+    def _yaml_files(bucket: str, bucket_dir: Path) -> Iterable[Path]:
+        files = bucket_dir.glob("*.yaml") if bucket == "" else bucket_dir.rglob("*.yaml")
+        return (path for path in files if not path.name.startswith("."))
+
+    def _relative(self, path: Path) -> str:
+        try:
+            return path.relative_to(self.repo.repo_root).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+
+def _bucket_in_range(bucket: str, start_date: Optional[date], end_date: Optional[date]) -> bool:
+    """Check whether a YYYY-MM bucket can contain dates in [start_date, end_date]."""
+    try:
+        year, month = (int(part) for part in bucket.split("-"))
+    except ValueError:
+        return True  # Unknown layout: always check
+    if start_date is not None and (year, month) < (start_date.year, start_date.month):
+        return False
+    if end_date is not None and (year, month) > (end_date.year, end_date.month):
+        return False
+    return True
+
+
+def _enum_value(value) -> str:
+    return value.value if hasattr(value, "value") else str(value)
+
+
+def _row_to_entry(row: tuple) -> ActivityIndexEntry:
+    data = dict(zip(_COLUMNS, row))
+    return ActivityIndexEntry(
+        id=data["id"],
+        date=date.fromisoformat(data["date"]),
+        sport_type=data["sport_type"],
+        start_time=datetime.fromisoformat(data["start_time"]) if data["start_time"] else None,
+        duration_seconds=data["duration_seconds"],
+        duration_minutes=data["duration_minutes"],
+        distance_km=data["distance_km"],
+        average_hr=data["average_hr"],
+        max_hr=data["max_hr"],
+        session_type=data["session_type"],
+        systemic_load_au=data["systemic_load_au"],
+        lower_body_load_au=data["lower_body_load_au"],
+        has_notes=bool(data["has_notes"]),
+        path=data["path"],
+        mtime_ns=data["mtime_ns"],
+        size=data["size"],
+    )
+
+
+def is_activity_path(repo: RepositoryIO, path: Union[str, Path]) -> bool:
+    """Check whether a path is an activity YAML file under the activities directory."""
+    from resilio.core.paths import get_activities_dir
+
+    resolved = repo.resolve_path(path)
+    if resolved.suffix != ".yaml" or resolved.name.startswith("."):
+        return False
+    root = repo.resolve_path(get_activities_dir())
+    try:
+        resolved.relative_to(root)
+    except ValueError:
+        return False
+    return True
@@ -0,0 +1,226 @@
+"""
+Activity summaries - Compact records for whole-history analytics.
+
+Profile analysis, VDOT estimation and training-break detection look at every
+activity ever synced, but only at a few numbers per activity. ActivitySummary
+holds those numbers in __slots__ (no per-instance dict, no laps, notes,
+timestamps or nested models):
+
+- date as a proleptic ordinal (date.toordinal()), sport as a small int code
+- durations, distance, average/max HR, systemic and lower-body load
+- session type
+
+It exposes `date` and `sport_type` as properties, so code written against
+NormalizedActivity reads summaries unchanged, while hot filters can compare
+the int fields directly.
+
+Summaries are built from the activity index (no YAML parsed). The fields pace
+analysis needs beyond that (name, description, surface, GPS) are projected
+from the YAML only for the activities that need them (details_since).
+"""
+
+import sys
+from datetime import date
+from typing import Iterable, Optional, Union
+
+from resilio.core.activity_index import ActivityIndexEntry
+from resilio.core.repository import RepositoryIO
+from resilio.schemas.activity import NormalizedActivity, SportType
+from resilio.schemas.repository import RepoError
+
+# Sport code -> sport type value (codes are positions, stable within a process)
+SPORT_CODES: tuple[str, ...] = tuple(sport.value for sport in SportType)
+_CODE_BY_SPORT: dict[str, int] = {sport: code for code, sport in enumerate(SPORT_CODES)}
+OTHER_SPORT_CODE = _CODE_BY_SPORT[SportType.OTHER.value]
+
+# Either record; analytics read only the attributes both expose
+ActivityLike = Union["ActivitySummary", NormalizedActivity]
+
+# Fields projected from YAML for activities on or after details_since
+DETAIL_FIELDS = ("name", "description", "surface_type", "has_gps_data")
+
+
+def sport_code(sport_type: str) -> int:
+    """Code of a sport type value (unknown sports map to 'other')."""
+    return _CODE_BY_SPORT.get(str(sport_type).lower(), OTHER_SPORT_CODE)
+
+
+def sport_codes(*sport_types: Union[str, SportType]) -> frozenset[int]:
+    """Codes of several sport types, for membership filters."""
+    return frozenset(sport_code(getattr(sport, "value", sport)) for sport in sport_types)
+
+
+class ActivitySummary:
+    """
+    Numbers of one activity needed by whole-history analytics.
+
+    Detail fields (name, description, surface_type, has_gps_data) are None /
+    False unless loaded with details_since.
+    """
+
+    __slots__ = (
+        "id",
+        "date_ordinal",
+        "sport_code",
+        "duration_seconds",
+        "duration_minutes",
+        "distance_km",
+        "average_hr",
+        "max_hr",
+        "systemic_load_au",
+        "lower_body_load_au",
+        "session_type",
+        "name",
+        "description",
+        "surface_type",
+        "has_gps_data",
+    )
+
+    def __init__(
+        self,
+        id: str,
+        date_ordinal: int,
+        sport_code: int,
+        duration_seconds: int,
+        duration_minutes: int,
+        distance_km: Optional[float] = None,
+        average_hr: Optional[float] = None,
+        max_hr: Optional[float] = None,
+        systemic_load_au: Optional[float] = None,
+        lower_body_load_au: Optional[float] = None,
+        session_type: Optional[str] = None,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+        surface_type: Optional[str] = None,
+        has_gps_data: bool = False,
+    ):
+        self.id = id
+        self.date_ordinal = date_ordinal
+        self.sport_code = sport_code
+        self.duration_seconds = duration_seconds
+        self.duration_minutes = duration_minutes
+        self.distance_km = distance_km
+        self.average_hr = average_hr
+        self.max_hr = max_hr
+        self.systemic_load_au = systemic_load_au
+        self.lower_body_load_au = lower_body_load_au
+        self.session_type = session_type
+        self.name = name
+        self.description = description
+        self.surface_type = surface_type
+        self.has_gps_data = has_gps_data
+
+    @property
+    def date(self) -> date:
+        return date.fromordinal(self.date_ordinal)
+
+    @property
+    def sport_type(self) -> str:
+        return SPORT_CODES[self.sport_code]
+
+    def __repr__(self) -> str:
+        return f"ActivitySummary(id={self.id!r}, date={self.date.isoformat()}, sport_type={self.sport_type!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ActivitySummary):
+            return NotImplemented
+        return all(getattr(self, slot) == getattr(other, slot) for slot in self.__slots__)
+
+    # ============================================================
+    # CONVERTERS
+    # ============================================================
+
+    @classmethod
+    def from_entry(cls, entry: ActivityIndexEntry) -> "ActivitySummary":
+        """Summary of an activity index entry (detail fields unset)."""
+        return cls(
+            id=entry.id,
+            date_ordinal=entry.date.toordinal(),
+            sport_code=sport_code(entry.sport_type),
+            duration_seconds=entry.duration_seconds,
+            duration_minutes=entry.duration_minutes,
+            distance_km=entry.distance_km,
+            average_hr=entry.average_hr,
+            max_hr=entry.max_hr,
+            systemic_load_au=entry.systemic_load_au,
+            lower_body_load_au=entry.lower_body_load_au,
+            session_type=sys.intern(entry.session_type) if entry.session_type else None,
+        )
+
+    @classmethod
+    def from_activity(cls, activity: NormalizedActivity) -> "ActivitySummary":
+        """Summary of a full activity, detail fields included."""
+        calculated = activity.calculated
+        session_type = getattr(calculated.session_type, "value", calculated.session_type) if calculated else None
+        return cls(
+            id=activity.id,
+            date_ordinal=activity.date.toordinal(),
+            sport_code=sport_code(activity.sport_type),
+            duration_seconds=activity.duration_seconds,
+            duration_minutes=activity.duration_minutes,
+            distance_km=activity.distance_km,
+            average_hr=activity.average_hr,
+            max_hr=activity.max_hr,
+            systemic_load_au=calculated.systemic_load_au if calculated else None,
+            lower_body_load_au=calculated.lower_body_load_au if calculated else None,
+            session_type=session_type,
+            name=activity.name,
+            description=activity.description,
+            surface_type=getattr(activity.surface_type, "value", activity.surface_type),
+            has_gps_data=activity.has_gps_data,
+        )
+
+
+def summarize_entries(
+    repo: RepositoryIO,
+    entries: Iterable[ActivityIndexEntry],
+    details_since: Optional[date] = None,
+) -> list[ActivitySummary]:
+    """
+    Summaries of index entries, in the same order.
+
+    Args:
+        repo: Repository (only read for detail fields)
+        entries: Entries returned by ActivityIndex.query()
+        details_since: Also load DETAIL_FIELDS from the YAML of activities on
+            or after this date (None = no file is read)
+
+    Returns:
+        Summaries; an activity whose details cannot be read keeps them unset
+    """
+    summaries = []
+    for entry in entries:
+        summary = ActivitySummary.from_entry(entry)
+        if details_since is not None and entry.date >= details_since:
+            details = repo.read_projection(entry.path, NormalizedActivity, DETAIL_FIELDS)
+            if not isinstance(details, RepoError):
+                summary.name = details.name
+                summary.description = details.description
+                summary.surface_type = details.surface_type
+                summary.has_gps_data = details.has_gps_data
+        summaries.append(summary)
+    return summaries
+
+
+def load_activity_summaries(
+    repo: RepositoryIO,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    sport: Optional[str] = None,
+    details_since: Optional[date] = None,
+) -> list[ActivitySummary]:
+    """
+    Summaries of stored activities, oldest first.
+
+    Args:
+        repo: Repository
+        start_date: Inclusive lower bound (None = all history)
+        end_date: Inclusive upper bound (None = no bound)
+        sport: Only this sport type
+        details_since: See summarize_entries()
+
+    Returns:
+        ActivitySummary list ordered by date and start time
+    """
+    entries = repo.activity_index().query(start_date=start_date, end_date=end_date, sport=sport)
+    return summarize_entries(repo, entries, details_since=details_since)
@@ -12,6 +12,7 @@ from resilio.core.analysis.weekly import (
     detect_activity_gaps,
     analyze_load_distribution_by_sport,
     check_weekly_capacity,
+    historical_weekly_maxima,
 )
 
 from resilio.core.analysis.risk import (
@@ -27,6 +28,7 @@ __all__ = [
     "detect_activity_gaps",
     "analyze_load_distribution_by_sport",
     "check_weekly_capacity",
+    "historical_weekly_maxima",
     # Risk assessment
     "assess_current_risk",
     "estimate_recovery_window",
@@ -0,0 +1,182 @@
+"""
+Store-backed inputs for analysis commands.
+
+Builds the dicts the analysis API functions take (activities, current
+metrics, recent weeks) directly from the activity index and the daily
+metrics store, instead of a `resilio activity export` JSON round trip.
+Only the projected fields are read: no activity YAML (laps, streams) is
+parsed, except for the note fields of annotated activities when the caller
+asks for them (a projection read, see core/projection.py).
+
+Activity dicts carry each field both at the top level and under
+`calculated`, matching what the different API functions look up.
+"""
+
+from datetime import date, timedelta
+from typing import Optional
+
+from resilio.core.activity_index import ActivityIndexEntry
+from resilio.core.activity_summary import load_activity_summaries, sport_codes
+from resilio.core.metrics import RUNNING_SPORT_TYPES
+from resilio.core.repository import RepositoryIO
+from resilio.utils.dates import WeekBuckets
+from resilio.schemas.activity import NormalizedActivity
+from resilio.schemas.repository import RepoError
+
+# How far back to look for the latest daily metrics
+CURRENT_METRICS_LOOKBACK_DAYS = 30
+
+_RUNNING_SPORT_CODES = sport_codes(*RUNNING_SPORT_TYPES)
+
+# Activity fields read from YAML for include_notes (gap cause detection)
+NOTE_INPUT_FIELDS = ("note_flags", "description", "private_note")
+
+# Metrics store column -> key expected by the analysis API
+_METRIC_KEYS = {
+    "ctl": "ctl",
+    "atl": "atl",
+    "tsb": "tsb",
+    "acwr": "acwr",
+    "readiness_score": "readiness",
+}
+
+
+def load_activity_inputs(
+    repo: RepositoryIO,
+    days: Optional[int] = None,
+    end_date: Optional[date] = None,
+    sport: Optional[str] = None,
+    include_ctl: bool = False,
+    include_notes: bool = False,
+) -> list[dict]:
+    """
+    Project indexed activities into analysis input dicts.
+
+    Args:
+        repo: Repository
+        days: Window ending at end_date, same as `activity export --since
+              {days}d` (None = all history)
+        end_date: Last date included (default: today)
+        sport: Only this sport type
+        include_ctl: Attach each activity date's CTL from the metrics store
+        include_notes: Attach note_flags, description and private_note of
+              activities that have notes
+
+    Returns:
+        Activity dicts, oldest first, with keys: id, date, sport_type,
+        duration_minutes, distance_km, systemic_load_au, lower_body_load_au,
+        calculated{session_type, systemic_load_au, lower_body_load_au} and,
+        if requested, ctl and the note fields
+    """
+    end_date = end_date or date.today()
+    start_date = end_date - timedelta(days=days) if days is not None else None
+    entries = repo.activity_index().query(start_date=start_date, end_date=end_date, sport=sport)
+
+    ctl_by_date: dict[date, Optional[float]] = {}
+    if include_ctl and entries:
+        series = repo.metrics_store().read_range(entries[0].date, entries[-1].date)
+        ctl_by_date = dict(zip(series.dates(), series.columns["ctl"]))
+
+    activities = [_project(entry) for entry in entries]
+    if include_ctl:
+        for activity, entry in zip(activities, entries):
+            activity["ctl"] = ctl_by_date.get(entry.date)
+    if include_notes:
+        for activity, entry in zip(activities, entries):
+            if not entry.has_notes:
+                continue
+            notes = repo.read_projection(entry.path, NormalizedActivity, NOTE_INPUT_FIELDS)
+            if not isinstance(notes, RepoError):
+                activity.update(notes.model_dump(mode="json"))
+    return activities
+
+
+def load_current_metrics(repo: RepositoryIO, on_or_before: Optional[date] = None) -> Optional[dict]:
+    """
+    Latest stored daily metrics as an analysis `current_metrics` dict.
+
+    Args:
+        repo: Repository
+        on_or_before: Latest date to consider (default: today)
+
+    Returns:
+        Dict with date plus whichever of ctl, atl, tsb, acwr and readiness
+        are known (missing values are omitted so the API reports them), or
+        None if no metrics exist in the last CURRENT_METRICS_LOOKBACK_DAYS
+    """
+    store = repo.metrics_store()
+    latest = store.latest_date(on_or_before or date.today(), lookback_days=CURRENT_METRICS_LOOKBACK_DAYS)
+    if latest is None:
+        return None
+
+    series = store.read_range(latest, latest)
+    metrics: dict = {"date": latest.isoformat()}
+    for column, key in _METRIC_KEYS.items():
+        value = series.columns[column][0]
+        if value is not None:
+            metrics[key] = value
+    return metrics
+
+
+def load_recent_weeks(repo: RepositoryIO, weeks: int, end_date: Optional[date] = None) -> list[dict]:
+    """
+    Summarize the last Monday-Sunday weeks for taper assessment.
+
+    Args:
+        repo: Repository
+        weeks: Number of weeks, the last one being the week containing end_date
+        end_date: Reference date (default: today)
+
+    Returns:
+        Week dicts, oldest first, with keys: week_number (1 = oldest),
+        start_date, end_date, actual_volume_km (running distance) and
+        avg_readiness (omitted when no readiness was recorded)
+    """
+    end_date = end_date or date.today()
+    current_monday = end_date - timedelta(days=end_date.weekday())
+    first_monday = current_monday - timedelta(weeks=weeks - 1)
+    last_sunday = current_monday + timedelta(days=6)
+
+    runs = [
+        activity
+        for activity in load_activity_summaries(repo, start_date=first_monday, end_date=last_sunday)
+        if activity.sport_code in _RUNNING_SPORT_CODES
+    ]
+    weekly_volume = WeekBuckets.from_activities(runs, first_monday, last_sunday, values=("distance_km",))
+
+    series = repo.metrics_store().read_range(first_monday, last_sunday)
+    readiness = series.columns["readiness_score"]
+
+    recent_weeks = []
+    for week in range(weeks):
+        week_start = first_monday + timedelta(weeks=week)
+        week_end = week_start + timedelta(days=6)
+        volume = weekly_volume.totals["distance_km"][week]
+        summary = {
+            "week_number": week + 1,
+            "start_date": week_start.isoformat(),
+            "end_date": week_end.isoformat(),
+            "actual_volume_km": round(volume, 2),
+        }
+        week_readiness = [value for value in readiness[week * 7 : week * 7 + 7] if value is not None]
+        if week_readiness:
+            summary["avg_readiness"] = round(sum(week_readiness) / len(week_readiness), 1)
+        recent_weeks.append(summary)
+    return recent_weeks
+
+
+def _project(entry: ActivityIndexEntry) -> dict:
+    return {
+        "id": entry.id,
+        "date": entry.date.isoformat(),
+        "sport_type": entry.sport_type,
+        "duration_minutes": entry.duration_minutes,
+        "distance_km": entry.distance_km or 0.0,
+        "systemic_load_au": entry.systemic_load_au,
+        "lower_body_load_au": entry.lower_body_load_au,
+        "calculated": {
+            "session_type": entry.session_type,
+            "systemic_load_au": entry.systemic_load_au,
+            "lower_body_load_au": entry.lower_body_load_au,
+        },
+    }
@@ -8,10 +8,13 @@ Note: These functions provide the computational analysis logic. The API layer
 handles data retrieval and integration with the persistence layer.
 """
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from datetime import date, timedelta
 from collections import defaultdict
 
+from resilio.core.keywords import match_note_flags
+from resilio.utils.dates import WeekBuckets
+from resilio.schemas.activity import NoteFlags
 from resilio.schemas.analysis import (
     IntensityDistributionAnalysis,
     ActivityGapAnalysis,
@@ -164,7 +167,8 @@ def detect_activity_gaps(
     causes, CTL impact, and recovery status.
 
     Args:
-        activities: List of activity dicts with date, notes, etc.
+        activities: List of activity dicts with date, ctl and note_flags (as
+            stored on activities) or note text (notes/description/private_note)
         min_gap_days: Minimum gap duration to detect (default 7 days)
 
     Returns:
@@ -210,14 +214,14 @@ def detect_activity_gaps(
             # Detect potential cause from notes
             potential_cause = None
             evidence = []
-            notes_text = (current.get("notes", "") + " " + next_activity.get("notes", "")).lower()
-            if "injury" in notes_text or "injured" in notes_text or "pain" in notes_text:
+            flags = [_gap_note_flags(current), _gap_note_flags(next_activity)]
+            if any(f.injury for f in flags):
                 potential_cause = "injury"
                 evidence.append("Injury-related keywords in notes")
-            elif "sick" in notes_text or "ill" in notes_text or "flu" in notes_text:
+            elif any(f.illness for f in flags):
                 potential_cause = "illness"
                 evidence.append("Illness-related keywords in notes")
-            elif "travel" in notes_text or "vacation" in notes_text:
+            elif any(f.travel for f in flags):
                 potential_cause = "planned_break"
                 evidence.append("Travel/vacation keywords in notes")
 
@@ -262,6 +266,15 @@ def detect_activity_gaps(
     )
 
 
+def _gap_note_flags(activity: Dict) -> NoteFlags:
+    """Stored note flags of an activity dict, or its notes matched now."""
+    if activity.get("note_flags") is not None:
+        return NoteFlags.model_validate(activity["note_flags"])
+    return match_note_flags(
+        activity.get("notes"), activity.get("description"), activity.get("private_note")
+    )
+
+
 # ============================================================
 # LOAD DISTRIBUTION BY SPORT
 # ============================================================
@@ -385,6 +398,58 @@ def analyze_load_distribution_by_sport(
 # ============================================================
 
 
+def historical_weekly_maxima(activities: List[Dict]) -> Tuple[float, float]:
+    """
+    Largest Monday-Sunday weekly distance and systemic load in a history.
+
+    Activities are bucketed by week in one pass (see WeekBuckets). An
+    activity without a usable date counts as a week on its own.
+
+    Args:
+        activities: Activity dicts with distance_km, systemic_load_au and
+            date (ISO string or date)
+
+    Returns:
+        (max weekly volume km, max weekly systemic load AU)
+    """
+    dated: List[Tuple[int, float, float]] = []
+    undated_max_km = 0.0
+    undated_max_load = 0.0
+    for activity in activities:
+        distance = activity.get("distance_km") or 0.0
+        load = activity.get("systemic_load_au") or 0.0
+        ordinal = _date_ordinal(activity.get("date"))
+        if ordinal is None:
+            undated_max_km = max(undated_max_km, distance)
+            undated_max_load = max(undated_max_load, load)
+        else:
+            dated.append((ordinal, distance, load))
+
+    if not dated:
+        return undated_max_km, undated_max_load
+
+    first = date.fromordinal(min(ordinal for ordinal, _, _ in dated))
+    last = date.fromordinal(max(ordinal for ordinal, _, _ in dated))
+    weeks = WeekBuckets(first, last)
+    for ordinal, distance, load in dated:
+        weeks.add(ordinal, distance_km=distance, systemic_load_au=load)
+    return (
+        max(weeks.max_total("distance_km"), undated_max_km),
+        max(weeks.max_total("systemic_load_au"), undated_max_load),
+    )
+
+
+def _date_ordinal(value) -> Optional[int]:
+    if isinstance(value, date):
+        return value.toordinal()
+    if isinstance(value, str):
+        try:
+            return date.fromisoformat(value[:10]).toordinal()
+        except ValueError:
+            return None
+    return None
+
+
 def check_weekly_capacity(
     week_number: int,
     planned_volume_km: float,
@@ -5,11 +5,12 @@ Load configuration from settings.yaml and secrets from secrets.local.yaml.
 Validate required keys and provide explicit error messages for missing secrets.
 """
 
-import yaml
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Union
+from typing import Optional, TypeVar, Union
 
+from resilio.core.model_cache import get_model_cache
+from resilio.core.serialization import YAMLError, load_yaml
 from resilio.schemas.config import (
     Config,
     ConfigErrorType,
@@ -36,6 +37,8 @@ class ConfigError:
 
 ConfigResult = Union[Config, ConfigError]
 
+T = TypeVar("T", Settings, Secrets)
+
 
 # ============================================================
 # REPOSITORY ROOT DETECTION
@@ -98,6 +101,9 @@ def load_config(repo_root: Optional[Path] = None) -> ConfigResult:
         1. Load settings.yaml (fail if missing)
         2. Load secrets.local.yaml (fail if missing)
         3. Validate all required fields
+
+    When the process-level model cache is enabled (CLI, `resilio serve`),
+    validated settings/secrets are reused until either file changes.
     """
     if repo_root is None:
         repo_root = get_repo_root()
@@ -113,24 +119,28 @@ def load_config(repo_root: Optional[Path] = None) -> ConfigResult:
             path=str(settings_path),
         )
 
-    try:
-        with open(settings_path) as f:
-            settings_data = yaml.safe_load(f) or {}
-    except yaml.YAMLError as e:
-        return ConfigError(
-            error_type=ConfigErrorType.PARSE_ERROR,
-            message=str(e),
-            path=str(settings_path),
-        )
+    settings_stamp = _file_stamp(settings_path)
+    settings = _cached_model(settings_path, Settings, settings_stamp)
+    if settings is None:
+        try:
+            with open(settings_path) as f:
+                settings_data = load_yaml(f) or {}
+        except YAMLError as e:
+            return ConfigError(
+                error_type=ConfigErrorType.PARSE_ERROR,
+                message=str(e),
+                path=str(settings_path),
+            )
 
-    # Validate settings
-    try:
-        settings = Settings.model_validate(settings_data)
-    except Exception as e:
-        return ConfigError(
-            error_type=ConfigErrorType.VALIDATION_ERROR,
-            message=f"Settings validation failed: {e}",
-        )
+        # Validate settings
+        try:
+            settings = Settings.model_validate(settings_data)
+        except Exception as e:
+            return ConfigError(
+                error_type=ConfigErrorType.VALIDATION_ERROR,
+                message=f"Settings validation failed: {e}",
+            )
+        _cache_model(settings_path, settings_stamp, settings)
 
     # Load secrets
     secrets_path = config_dir / "secrets.local.yaml"
@@ -141,22 +151,46 @@ def load_config(repo_root: Optional[Path] = None) -> ConfigResult:
             path=str(secrets_path),
         )
 
-    try:
-        with open(secrets_path) as f:
-            secrets_data = yaml.safe_load(f) or {}
-    except yaml.YAMLError as e:
-        return ConfigError(
-            error_type=ConfigErrorType.PARSE_ERROR,
-            message=str(e),
-            path=str(secrets_path),
-        )
+    secrets_stamp = _file_stamp(secrets_path)
+    secrets = _cached_model(secrets_path, Secrets, secrets_stamp)
+    if secrets is None:
+        try:
+            with open(secrets_path) as f:
+                secrets_data = load_yaml(f) or {}
+        except YAMLError as e:
+            return ConfigError(
+                error_type=ConfigErrorType.PARSE_ERROR,
+                message=str(e),
+                path=str(secrets_path),
+            )
 
-    try:
-        secrets = Secrets.model_validate(secrets_data)
-    except Exception as e:
-        return ConfigError(
-            error_type=ConfigErrorType.VALIDATION_ERROR,
-            message=f"Secrets validation failed: {e}",
-        )
+        try:
+            secrets = Secrets.model_validate(secrets_data)
+        except Exception as e:
+            return ConfigError(
+                error_type=ConfigErrorType.VALIDATION_ERROR,
+                message=f"Secrets validation failed: {e}",
+            )
+        _cache_model(secrets_path, secrets_stamp, secrets)
 
     return Config(settings=settings, secrets=secrets, loaded_at=datetime.now())
+
+
+def _file_stamp(path: Path) -> tuple[int, int]:
+    stat = path.stat()
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _cached_model(path: Path, schema: type[T], stamp: tuple[int, int]) -> Optional[T]:
+    """Return a cached validated config model if the file is unchanged."""
+    cache = get_model_cache()
+    if cache is None:
+        return None
+    return cache.get(path.resolve(), schema, stamp)
+
+
+def _cache_model(path: Path, stamp: tuple[int, int], model: Union[Settings, Secrets]) -> None:
+    # Stamp taken before reading, so a concurrent edit is a miss next time
+    cache = get_model_cache()
+    if cache is not None:
+        cache.put(path.resolve(), type(model), stamp, model)
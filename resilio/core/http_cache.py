@@ -0,0 +1,258 @@
+"""
+HTTP Response Cache - On-disk cache for Strava API responses.
+
+Stores response bodies for activity-list pages and activity detail/lap
+payloads under data/state/strava_cache/ so resumed or repeated syncs do not
+spend rate-limit quota on data the client has already seen.
+
+Each entry is one JSON file keyed by request (URL + sorted query params) and
+records:
+- the response body
+- ETag / Last-Modified validators (for conditional revalidation)
+- stored_at (for TTL freshness)
+- an optional caller-defined tag (e.g. a fingerprint of the activity summary
+  the detail was fetched for); a matching tag proves the entry still current
+
+Eviction: when the cache grows past max_bytes, the oldest entries (by file
+mtime) are deleted until it is back under 90% of the budget.
+
+The cache is a pure optimization: unreadable entries are treated as misses
+and deleting the directory is always safe.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Union
+from urllib.parse import urlencode
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_TTL_SECONDS = 30 * 60
+DEFAULT_MAX_BYTES = 100 * 1024 * 1024
+
+# After eviction the cache is trimmed to this fraction of max_bytes
+_EVICTION_TARGET_RATIO = 0.9
+
+
+@dataclass
+class CachedResponse:
+    """A cached response body with its validators."""
+
+    key: str
+    url: str
+    body: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    stored_at: float = 0.0
+    tag: Optional[str] = None
+
+    def to_response(self) -> httpx.Response:
+        """Rebuild a 200 response from the cached body."""
+        return httpx.Response(
+            200,
+            content=self.body.encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+        )
+
+
+class ResponseCache:
+    """
+    Thread-safe on-disk response cache with TTL and size-based eviction.
+
+    Usage:
+        cache = ResponseCache(repo.resolve_path(strava_cache_dir()))
+        key = cache.make_key(url, params)
+        entry = cache.get(key)
+        if entry is not None and cache.is_fresh(entry):
+            body = entry.body
+    """
+
+    def __init__(
+        self,
+        root: Union[str, Path],
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        """
+        Args:
+            root: Cache directory (created on first write)
+            ttl_seconds: Age below which entries are served without a request
+            max_bytes: Size budget for all entries
+        """
+        self.root = Path(root)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self._lock = threading.Lock()
+        self._total_bytes: Optional[int] = None  # Computed lazily on first write
+
+    @staticmethod
+    def make_key(url: str, params: Optional[dict] = None) -> str:
+        """Cache key for a GET request (URL plus sorted query params)."""
+        query = urlencode(sorted((params or {}).items()))
+        return hashlib.sha256(f"GET {url}?{query}".encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """
+        Read an entry.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            CachedResponse, or None if missing or unreadable
+        """
+        path = self._entry_path(key)
+        try:
+            with open(path, encoding="utf-8") as handle:
+                data = json.load(handle)
+            return CachedResponse(key=key, **data)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError):
+            logger.debug("Ignoring unreadable cache entry %s", path, exc_info=True)
+            return None
+
+    def is_fresh(self, entry: CachedResponse, max_age: Optional[float] = None) -> bool:
+        """
+        Whether an entry can be served without contacting the server.
+
+        Args:
+            entry: Cached entry
+            max_age: Override for ttl_seconds (0 = always revalidate)
+        """
+        ttl = self.ttl_seconds if max_age is None else max_age
+        return time.time() - entry.stored_at < ttl
+
+    def put(
+        self,
+        key: str,
+        url: str,
+        body: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        tag: Optional[str] = None,
+    ) -> None:
+        """
+        Store (or replace) an entry, evicting old entries if over budget.
+
+        Args:
+            key: Cache key from make_key()
+            url: Request URL (kept for debugging)
+            body: Response body text
+            etag: ETag response header
+            last_modified: Last-Modified response header
+            tag: Caller-defined validator stored with the entry
+        """
+        entry = {
+            "url": url,
+            "body": body,
+            "etag": etag,
+            "last_modified": last_modified,
+            "stored_at": time.time(),
+            "tag": tag,
+        }
+        path = self._entry_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            old_size = path.stat().st_size if path.exists() else 0
+            tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as handle:
+                json.dump(entry, handle)
+            os.replace(tmp_path, path)
+            new_size = path.stat().st_size
+        except OSError:
+            logger.debug("Failed to write cache entry %s", path, exc_info=True)
+            return
+
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_size()
+            else:
+                self._total_bytes += new_size - old_size
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def record_hit(self) -> None:
+        """Count a request served from the cache (callable from any thread)."""
+        with self._lock:
+            self.hits += 1
+
+    def record_miss(self) -> None:
+        """Count a request that had to contact the server."""
+        with self._lock:
+            self.misses += 1
+
+    def touch(self, entry: CachedResponse) -> None:
+        """Mark an entry as just revalidated (restarts its TTL)."""
+        with self._lock:
+            self.revalidations += 1
+        self.put(
+            entry.key,
+            entry.url,
+            entry.body,
+            etag=entry.etag,
+            last_modified=entry.last_modified,
+            tag=entry.tag,
+        )
+
+    def clear(self) -> None:
+        """Delete all entries."""
+        with self._lock:
+            for path in self._entry_files():
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+            self._total_bytes = 0
+
+    def _entry_path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def _entry_files(self) -> list[Path]:
+        if not self.root.is_dir():
+            return []
+        return list(self.root.glob("*/*.json"))
+
+    def _scan_size(self) -> int:
+        total = 0
+        for path in self._entry_files():
+            try:
+                total += path.stat().st_size
+            except OSError:
+                pass
+        return total
+
+    def _evict(self) -> None:
+        """Delete oldest entries until under the eviction target (lock held)."""
+        entries = []
+        for path in self._entry_files():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        entries.sort()
+
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * _EVICTION_TARGET_RATIO
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                path.unlink()
+                total -= size
+            except OSError:
+                pass
+        self._total_bytes = total
@@ -0,0 +1,138 @@
+"""
+Ingest - Background file writer for batched activity import.
+
+Sync turns each fetched activity into a NormalizedActivity in memory
+(normalize -> analyze -> compute_load) and hands it to a BackgroundWriter.
+The caller's thread serializes the model; a single writer thread does the
+file-system work (mkdir, atomic temp-file write, rename), so disk latency
+overlaps with processing the next activity.
+
+Model-cache and activity-index updates (RepositoryIO.record_written) are
+applied back on the caller's thread, because the index's SQLite connection
+belongs to it. They happen whenever the caller submits, flushes or closes.
+
+flush() is the durability point: once it returns, every submitted file is on
+disk and indexed. Sync flushes before each progress checkpoint, before
+metrics and before persisting its resume cursor, so a crash never leaves a
+checkpoint ahead of the files it describes.
+"""
+
+import logging
+import queue
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Union
+
+from pydantic import BaseModel
+
+from resilio.core.repository import RepositoryIO
+from resilio.schemas.repository import RepoError, RepoErrorType
+
+logger = logging.getLogger(__name__)
+
+# Bound on files queued for the writer thread; submit() blocks beyond this
+DEFAULT_MAX_PENDING_WRITES = 64
+
+_STOP = object()
+
+
+@dataclass
+class WriteFailure:
+    """A submitted file that could not be written."""
+
+    path: Path
+    data: Union[BaseModel, dict, list]
+    error: RepoError
+
+
+class BackgroundWriter:
+    """
+    Writes serialized files on one background thread.
+
+    Usage:
+        with BackgroundWriter(repo) as writer:
+            for activity in activities:
+                writer.submit(path_for(activity), activity)
+            failures = writer.flush()
+    """
+
+    def __init__(self, repo: RepositoryIO, max_pending: int = DEFAULT_MAX_PENDING_WRITES):
+        self.repo = repo
+        self._pending: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._completed: queue.Queue = queue.Queue()
+        self._failures: list[WriteFailure] = []
+        self._thread = threading.Thread(target=self._run, name="resilio-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, path: Union[str, Path], data: Union[BaseModel, dict, list]) -> Optional[RepoError]:
+        """
+        Serialize data and queue it for writing.
+
+        Args:
+            path: Target path (relative to repo root)
+            data: Pydantic model, dict, or list (same as write_yaml)
+
+        Returns:
+            RepoError if serialization failed (nothing is queued), else None.
+            Write errors are reported by flush().
+        """
+        content = self.repo.serialize_for_write(data)
+        if isinstance(content, RepoError):
+            return content
+        self._pending.put((self.repo.resolve_path(path), content, data))
+        self._apply_completed()
+        return None
+
+    def flush(self) -> list[WriteFailure]:
+        """
+        Wait until every submitted file is written and indexed.
+
+        Returns:
+            Writes that failed since the last flush()
+        """
+        self._pending.join()
+        self._apply_completed()
+        failures, self._failures = self._failures, []
+        return failures
+
+    def close(self) -> list[WriteFailure]:
+        """Flush and stop the writer thread. Returns failures like flush()."""
+        failures = self.flush()
+        if self._thread.is_alive():
+            self._pending.put(_STOP)
+            self._thread.join()
+        return failures
+
+    def __enter__(self) -> "BackgroundWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        failures = self.close()
+        for failure in failures:
+            logger.warning("Background write failed for %s: %s", failure.path, failure.error.message)
+
+    def _apply_completed(self) -> None:
+        while True:
+            try:
+                path, data, error = self._completed.get_nowait()
+            except queue.Empty:
+                return
+            self.repo.record_written(path, data if error is None else None)
+            if error is not None:
+                self._failures.append(WriteFailure(path=path, data=data, error=error))
+
+    def _run(self) -> None:
+        while True:
+            item = self._pending.get()
+            try:
+                if item is _STOP:
+                    return
+                path, content, data = item
+                try:
+                    error = self.repo.write_serialized(path, content)
+                except Exception as e:  # write_serialized reports errors; be defensive
+                    error = RepoError(error_type=RepoErrorType.WRITE_ERROR, message=str(e), path=str(path))
+                self._completed.put((path, data, error))
+            finally:
+                self._pending.task_done()
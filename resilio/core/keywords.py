@@ -0,0 +1,230 @@
+"""
+Keywords - Precompiled keyword matching for activity notes.
+
+One KeywordMatcher compiles the stems of every phrase of its vocabularies
+into a single regex, so a note is scanned once whatever the number of
+keywords. Words match on their light stem (text_search.stem), so inflected
+forms count ("knees" matches "knee", "injuries" "injury", "painful" "pain")
+while other words sharing the letters do not ("ill" does not match "hill" or
+"will"). Matches are case- and accent-insensitive and skip negated mentions
+("no pain", "not sick", "pain-free").
+
+The injury/illness/travel vocabulary is matched once when an activity is
+imported (normalize_activity) and the result is stored on the activity as
+note_flags, so metrics recomputes and gap analysis read the flags instead of
+rescanning note text.
+"""
+
+import re
+from typing import Iterable, Mapping, Optional
+
+from resilio.core.text_search import fold, stem, tokenize
+from resilio.schemas.activity import NormalizedActivity, NoteFlags
+
+# ============================================================
+# VOCABULARIES
+# ============================================================
+
+# Injury keywords - clear pain/injury signals
+INJURY_KEYWORDS = frozenset({
+    "pain", "ache", "aching", "hurt", "hurting", "hurts",
+    "sore", "soreness", "tender", "tenderness",
+    "injury", "injured", "strain", "strained", "sprain", "sprained",
+    "tear", "torn", "tweak", "tweaked",
+    "limp", "limping", "limped",
+    "sharp", "stabbing", "shooting",  # Pain descriptors
+    "tight", "tightness",  # Can indicate injury
+    "swollen", "swelling", "inflamed", "inflammation",
+})
+
+# Illness keywords - systemic illness
+ILLNESS_KEYWORDS = frozenset({
+    "sick", "ill", "illness",
+    "fever", "feverish", "temperature",
+    "flu", "influenza", "cold",
+    "covid", "coronavirus", "virus", "viral",
+    "nauseous", "nausea", "vomiting", "vomit", "threw up",
+    "diarrhea", "stomach",
+    "congested", "congestion", "cough", "coughing",
+    "chills", "shivering",
+    "headache", "migraine",  # Can indicate illness
+})
+
+# Travel keywords - planned breaks
+TRAVEL_KEYWORDS = frozenset({"travel", "travelling", "traveling", "vacation", "holiday", "holidays", "trip"})
+
+# Vocabulary behind NoteFlags (category name = NoteFlags field)
+NOTE_FLAG_VOCABULARY = {
+    "injury": INJURY_KEYWORDS,
+    "illness": ILLNESS_KEYWORDS,
+    "travel": TRAVEL_KEYWORDS,
+}
+
+# ============================================================
+# NEGATION
+# ============================================================
+
+# Words that negate a keyword appearing shortly after them ("no pain")
+NEGATION_CUES = frozenset({"no", "not", "without", "never", "zero", "nor", "neither"})
+
+# Words that negate a keyword right before them ("pain free")
+POST_NEGATION_CUES = frozenset({"free"})
+
+# Words that end a negation's scope ("no pain but knee sore")
+SCOPE_BREAKERS = frozenset({"but", "although", "though", "except", "however", "yet"})
+
+# How many words before a keyword a negation cue can be
+NEGATION_WINDOW = 3
+
+# Punctuation that ends a negation's scope ("no pain, knee sore")
+_CLAUSE_BREAKS = ".,;:!?()\n"
+_CLAUSE_BREAK_RE = re.compile(f"[{re.escape(_CLAUSE_BREAKS)}]")
+
+# Next word of a multi-word phrase
+_NEXT_WORD_RE = re.compile(r"\s+([^\W_]+)")
+
+
+class KeywordMatcher:
+    """
+    Multi-vocabulary keyword matcher compiled into a single regex.
+
+    The regex finds words starting with a keyword's stem; a word (or phrase)
+    matches when its stems equal the keyword's.
+
+    Example:
+        >>> matcher = KeywordMatcher({"injury": {"pain", "sore"}})
+        >>> matcher.match("No pain today, calves a bit sore")
+        {'injury': ['sore']}
+        >>> matcher.match("Painful calves")
+        {'injury': ['pain']}
+    """
+
+    def __init__(self, vocabularies: Mapping[str, Iterable[str]], negation: bool = True):
+        """
+        Args:
+            vocabularies: Category name -> keywords or multi-word phrases
+            negation: Skip negated mentions (default: True)
+        """
+        self.categories = list(vocabularies)
+        self.negation = negation
+        # Stemmed phrase -> keywords with those stems and their categories
+        self._keywords_of: dict[tuple[str, ...], set[str]] = {}
+        self._categories_of: dict[tuple[str, ...], set[str]] = {}
+        for category, keywords in vocabularies.items():
+            for keyword in keywords:
+                words = tokenize(keyword)
+                if words:
+                    stems = tuple(stem(word) for word in words)
+                    self._keywords_of.setdefault(stems, set()).add(" ".join(words))
+                    self._categories_of.setdefault(stems, set()).add(category)
+
+        # Longest first so "threw up" wins over a shorter overlapping phrase
+        self._phrases_by_first_stem: dict[str, list[tuple[str, ...]]] = {}
+        for stems in sorted(self._keywords_of, key=len, reverse=True):
+            self._phrases_by_first_stem.setdefault(stems[0], []).append(stems)
+
+        # Every inflection of a word starts with its stem ("ies" -> "y" aside)
+        prefixes = {first[:-1] if first.endswith("y") else first for first in self._phrases_by_first_stem}
+        alternation = "|".join(re.escape(prefix) for prefix in sorted(prefixes, key=len, reverse=True))
+        self._pattern = re.compile(rf"(?<![^\W_])(?:{alternation})[^\W_]*") if alternation else None
+
+    def match(self, *texts: Optional[str]) -> dict[str, list[str]]:
+        """
+        Find the keywords of each category in texts.
+
+        Args:
+            texts: Texts to scan (None/empty are skipped)
+
+        Returns:
+            Category -> sorted unique keywords found (every category present,
+            empty when nothing matched). An inflected form is reported as the
+            vocabulary keyword it matched ("knees" -> "knee").
+        """
+        found: dict[str, set[str]] = {category: set() for category in self.categories}
+        if self._pattern is None:
+            return {category: [] for category in self.categories}
+
+        for text in texts:
+            if not text:
+                continue
+            folded = fold(text)
+            resume_at = 0
+            for candidate in self._pattern.finditer(folded):
+                if candidate.start() < resume_at:
+                    continue  # Inside a phrase already matched
+                matched = self._match_phrase(folded, candidate)
+                if matched is None:
+                    continue
+                words, stems, end = matched
+                resume_at = end
+                if self.negation and self._is_negated(folded, candidate.start(), end):
+                    continue
+                keywords = self._keywords_of[stems]
+                phrase = " ".join(words)
+                keyword = phrase if phrase in keywords else min(keywords, key=lambda k: (len(k), k))
+                for category in self._categories_of[stems]:
+                    found[category].add(keyword)
+
+        return {category: sorted(keywords) for category, keywords in found.items()}
+
+    def _match_phrase(
+        self, folded: str, candidate: re.Match
+    ) -> Optional[tuple[list[str], tuple[str, ...], int]]:
+        """Longest keyword phrase starting at candidate: (words, stems, end offset)."""
+        phrases = self._phrases_by_first_stem.get(stem(candidate.group()))
+        if not phrases:
+            return None
+        words = [candidate.group()]
+        ends = [candidate.end()]
+        for stems in phrases:  # Longest first
+            while len(words) < len(stems):
+                next_word = _NEXT_WORD_RE.match(folded, ends[-1])
+                if next_word is None:
+                    break
+                words.append(next_word.group(1))
+                ends.append(next_word.end())
+            if len(words) >= len(stems) and tuple(stem(word) for word in words[: len(stems)]) == stems:
+                return words[: len(stems)], stems, ends[len(stems) - 1]
+        return None
+
+    @staticmethod
+    def _is_negated(folded: str, start: int, end: int) -> bool:
+        # Negation scope is the clause around the keyword
+        clause_start = max(folded.rfind(char, 0, start) for char in _CLAUSE_BREAKS) + 1
+        for word in reversed(tokenize(folded[clause_start:start])[-NEGATION_WINDOW:]):
+            if word in SCOPE_BREAKERS:
+                break
+            if word in NEGATION_CUES or word.endswith("n't"):
+                return True
+
+        clause_end = _CLAUSE_BREAK_RE.search(folded, end)
+        following = tokenize(folded[end : clause_end.start() if clause_end else len(folded)])
+        return bool(following) and following[0] in POST_NEGATION_CUES
+
+
+_note_flag_matcher: Optional[KeywordMatcher] = None
+
+
+def note_flag_matcher() -> KeywordMatcher:
+    """Shared matcher for NOTE_FLAG_VOCABULARY (compiled on first use)."""
+    global _note_flag_matcher
+    if _note_flag_matcher is None:
+        _note_flag_matcher = KeywordMatcher(NOTE_FLAG_VOCABULARY)
+    return _note_flag_matcher
+
+
+def match_note_flags(*texts: Optional[str]) -> NoteFlags:
+    """Injury/illness/travel keywords found in note texts."""
+    return NoteFlags(**note_flag_matcher().match(*texts))
+
+
+def activity_note_flags(activity: NormalizedActivity) -> NoteFlags:
+    """
+    Stored note flags of an activity.
+
+    Falls back to scanning the notes for activities saved before note flags
+    existed (without modifying the activity).
+    """
+    if activity.note_flags is not None:
+        return activity.note_flags
+    return match_note_flags(activity.description, activity.private_note)
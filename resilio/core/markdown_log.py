@@ -0,0 +1,224 @@
+"""
+Markdown log - Append-only markdown files with an entry index.
+
+The training log and the plan review grow by one section per week or
+adaptation. Instead of reading the whole file and rewriting it, MarkdownLog
+appends each section with O_APPEND and fsyncs it, so an append costs the size
+of the section and a crash can at worst leave a torn last section, never a
+truncated log.
+
+Entries are the sections starting with a heading matching the log's pattern
+(e.g. "## Week 3:"). A hidden sidecar next to the markdown
+(.current_training_log.md.idx) records, one JSON line per append:
+
+    {"entries": [[4310, "3"]], "stamp": [5120, 1768500000123456789]}
+
+- entries: byte offset and key (first regex group, else the heading line) of
+  the sections the append added
+- stamp: the markdown's (size, mtime_ns) after the append
+
+With it, the last N entries or one entry are read by seeking to their
+offsets; the full markdown is only read when it is requested (render()).
+
+The markdown stays the source of truth and a plain file that humans and
+other tools may edit. If the last stamp does not match the file (edited out
+of band, or a crash between the two writes), the index is rebuilt by
+scanning the markdown once. Deleting the sidecar is always safe.
+"""
+
+import json
+import logging
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional, Pattern, Union
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class LogEntry:
+    """One indexed section: bytes [offset, end) of the markdown."""
+
+    key: str
+    offset: int
+    end: int
+
+
+class MarkdownLog:
+    """
+    Append-only markdown file with an index of its sections.
+
+    Usage:
+        log = MarkdownLog(repo.resolve_path(current_training_log_path()), r"^## Week (\\d+):")
+        log.write(header)                      # start a new log
+        log.append("\\n## Week 1: Base ...")   # O(section) append + fsync
+        log.render(log.entries()[-4:])         # header + last 4 weeks
+    """
+
+    def __init__(self, path: Union[str, Path], heading: Union[str, Pattern]):
+        """
+        Args:
+            path: Markdown file
+            heading: Regex matching an entry heading line (MULTILINE is added)
+        """
+        self.path = Path(path)
+        self.index_path = self.path.with_name(f".{self.path.name}.idx")
+        self.heading = re.compile(heading.pattern if isinstance(heading, re.Pattern) else heading, re.MULTILINE)
+
+    def exists(self) -> bool:
+        """Whether the markdown file exists."""
+        return self.path.exists()
+
+    # ============================================================
+    # WRITES
+    # ============================================================
+
+    def write(self, content: str) -> None:
+        """Replace the whole file atomically (fsynced) and reindex it."""
+        data = content.encode("utf-8")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f".{self.path.name}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        self._write_index(self._scan(data, 0), self._stamp())
+
+    def append(self, text: str) -> list[LogEntry]:
+        """
+        Append text with O_APPEND and fsync it.
+
+        Args:
+            text: Markdown to add at the end of the file
+
+        Returns:
+            Entries whose headings are in text
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        self._load_index()  # Rebuilds a stale index before it is extended
+        data = text.encode("utf-8")
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND)
+        try:
+            start = os.fstat(fd).st_size
+            view = memoryview(data)
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+        added = self._scan(data, start)
+        record = {"entries": [[offset, key] for offset, key in added], "stamp": list(self._stamp())}
+        with open(self.index_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+        end = start + len(data)
+        return [
+            LogEntry(key=key, offset=offset, end=added[i + 1][0] if i + 1 < len(added) else end)
+            for i, (offset, key) in enumerate(added)
+        ]
+
+    # ============================================================
+    # READS
+    # ============================================================
+
+    def entries(self) -> list[LogEntry]:
+        """
+        All entries in file order (reads only the index when it is current).
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        offsets, size = self._load_index()
+        return [
+            LogEntry(key=key, offset=offset, end=offsets[i + 1][0] if i + 1 < len(offsets) else size)
+            for i, (offset, key) in enumerate(offsets)
+        ]
+
+    def find(self, key: str) -> Optional[LogEntry]:
+        """Last entry with this key (e.g. a week number), or None."""
+        return next((entry for entry in reversed(self.entries()) if entry.key == key), None)
+
+    def header(self) -> str:
+        """Text before the first entry (the whole file if there is none)."""
+        entries = self.entries()
+        end = entries[0].offset if entries else self.path.stat().st_size
+        return self._read_range(0, end)
+
+    def read(self, entry: LogEntry) -> str:
+        """Text of one entry."""
+        return self._read_range(entry.offset, entry.end)
+
+    def render(self, entries: Optional[Iterable[LogEntry]] = None) -> str:
+        """
+        Markdown to show.
+
+        Args:
+            entries: Entries to include after the header (None = whole file)
+        """
+        if entries is None:
+            return self.path.read_text(encoding="utf-8")
+        return self.header() + "".join(self.read(entry) for entry in entries)
+
+    # ============================================================
+    # INDEX
+    # ============================================================
+
+    def _stamp(self) -> tuple[int, int]:
+        stat = self.path.stat()
+        return stat.st_size, stat.st_mtime_ns
+
+    def _scan(self, data: bytes, base: int) -> list[tuple[int, str]]:
+        """(offset, key) of the headings in data, offsets shifted by base."""
+        text = data.decode("utf-8")
+        found = []
+        for match in self.heading.finditer(text):
+            key = match.group(1) if match.re.groups else match.group(0)
+            found.append((base + len(text[: match.start()].encode("utf-8")), key.strip()))
+        return found
+
+    def _load_index(self) -> tuple[list[tuple[int, str]], int]:
+        """Indexed (offset, key) pairs and file size, rebuilding a stale index."""
+        stamp = self._stamp()
+        offsets: list[tuple[int, str]] = []
+        last_stamp = None
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                        offsets.extend((int(offset), str(key)) for offset, key in record["entries"])
+                        last_stamp = tuple(record["stamp"])
+                    except (ValueError, KeyError, TypeError):
+                        continue  # Torn line from a crash; the stamp check decides
+        except FileNotFoundError:
+            pass
+        except OSError:
+            logger.debug("Ignoring unreadable log index %s", self.index_path, exc_info=True)
+
+        if last_stamp != stamp:
+            logger.debug("Rebuilding log index %s", self.index_path)
+            offsets = self._scan(self.path.read_bytes(), 0)
+            stamp = self._stamp()
+            try:
+                self._write_index(offsets, stamp)
+            except OSError:
+                logger.debug("Failed to write log index %s", self.index_path, exc_info=True)
+        return offsets, stamp[0]
+
+    def _write_index(self, offsets: list[tuple[int, str]], stamp: tuple[int, int]) -> None:
+        record = {"entries": [[offset, key] for offset, key in offsets], "stamp": list(stamp)}
+        tmp_path = self.index_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+        os.replace(tmp_path, self.index_path)
+
+    def _read_range(self, start: int, end: int) -> str:
+        with open(self.path, "rb") as f:
+            f.seek(start)
+            return f.read(end - start).decode("utf-8")
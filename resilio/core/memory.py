@@ -17,13 +17,13 @@ Key Features:
 """
 
 import re
-import yaml
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
 from resilio.core.paths import athlete_memories_path
 from resilio.core.repository import RepositoryIO
+from resilio.core.serialization import dump_yaml, load_yaml
 from resilio.schemas.memory import (
     ArchivedMemory,
     Memory,
@@ -58,7 +58,7 @@ def _read_memories_yaml(repo: RepositoryIO) -> dict:
         }
 
     with open(path) as f:
-        return yaml.safe_load(f) or {}
+        return load_yaml(f) or {}
 
 
 def _write_memories_yaml(repo: RepositoryIO, data: dict) -> None:
@@ -74,7 +74,7 @@ def _write_memories_yaml(repo: RepositoryIO, data: dict) -> None:
     temp_path = path.with_suffix(".tmp")
     try:
         with open(temp_path, "w") as f:
-            yaml.safe_dump(data, f, default_flow_style=False, sort_keys=False)
+            dump_yaml(data, f)
         temp_path.replace(path)
     except Exception:
         if temp_path.exists():
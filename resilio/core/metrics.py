@@ -18,14 +18,18 @@ from unrelated activities like climbing or upper-body work.
 
 import logging
 from datetime import date, datetime, timedelta
-from typing import Optional
+from typing import Callable, Iterable, Optional
 
+from resilio.core.keywords import activity_note_flags
 from resilio.core.paths import (
     activities_month_dir,
     daily_metrics_path,
+    get_metrics_dir,
     weekly_metrics_summary_path,
 )
 from resilio.core.repository import RepositoryIO
+from resilio.core.serialization import serialize
+from resilio.schemas.repository import RepoError
 from resilio.schemas.activity import (
     NormalizedActivity,
     SessionType,
@@ -86,6 +90,22 @@ ATL_ALPHA = 1 - ATL_DECAY  # 0.1429 (1/7)
 # Data sufficiency thresholds
 BASELINE_DAYS_THRESHOLD = 14  # Days before baseline_established = True
 ACWR_MINIMUM_DAYS = 28  # Minimum days before ACWR can be calculated
+HISTORY_LOOKBACK_DAYS = 60  # Window for counting available data days
+
+# Daily metrics files are machine-only: store them as JSON (valid YAML, so they
+# keep the .yaml path, and read_yaml parses them much faster)
+DAILY_METRICS_FILE_FORMAT = "json"
+
+# Incremental updates stop once recomputed CTL/ATL are within this distance of
+# the stored values (the 42-day CTL chain otherwise takes months to settle).
+# Stored values are rounded to 0.1, so any tolerance below 0.1 reproduces a
+# full recompute exactly.
+INCREMENTAL_TOLERANCE = 0.5
+
+# Trailing windows a changed day feeds into (the 28-day ACWR window also
+# covers the 7-day load trend)
+ACWR_WINDOW_DAYS = 28
+CTL_CHANGE_WINDOW_DAYS = 7
 
 # Readiness weights (objective-only in v0)
 READINESS_WEIGHTS_OBJECTIVE_ONLY = {
@@ -104,6 +124,143 @@ RUNNING_SPORT_TYPES = {
     SportType.TRACK_RUN,
 }
 
+# Activity fields read by compute_weekly_summary (no laps or notes)
+WEEKLY_SUMMARY_FIELDS = ("date", "sport_type", "duration_minutes", "calculated")
+
+
+# ============================================================
+# DAILY LOAD SERIES
+# ============================================================
+
+
+class DailyLoadSeries:
+    """
+    Daily systemic loads over contiguous dates, with a presence mask.
+
+    Backs every trailing-window query of the metrics engine (ACWR, load
+    trend, 7-day CTL change, data-days count). Days are stored in dense
+    arrays indexed by offset from `origin`. Present-day counts use a prefix
+    sum (O(1)); load sums add the window's values directly (windows are at
+    most 28 days), so a window's sum is exactly the same float however much
+    history lies before it.
+
+    A day is "present" when a daily metrics record exists for it; missing
+    days count as 0 load. Dates outside the series are treated as missing.
+
+    Usage:
+        series = DailyLoadSeries.from_metrics(start, end, repo)
+        acwr = calculate_acwr(target_date, series=series, today_load=load)
+    """
+
+    def __init__(self, origin: date):
+        """
+        Args:
+            origin: Date of the first day (days are appended from there)
+        """
+        self.origin = origin
+        self._loads: list[float] = []
+        self._ctls: list[Optional[float]] = []
+        self._present_prefix: list[int] = [0]  # _present_prefix[i] = present days in [0, i)
+
+    @classmethod
+    def from_metrics(
+        cls,
+        start_date: date,
+        end_date: date,
+        repo: RepositoryIO,
+    ) -> "DailyLoadSeries":
+        """
+        Build a series from stored daily metrics (inclusive range).
+
+        Read from the columnar metrics store, which re-reads any day whose
+        YAML file changed. Days without a metrics file are missing.
+        """
+        stored = repo.metrics_store().read_range(start_date, end_date)
+        loads = stored.columns["systemic_load_au"]
+        ctls = stored.columns["ctl"]
+
+        series = cls(start_date)
+        for i, present in enumerate(stored.present):
+            if present and loads[i] is not None:
+                series.append(loads[i], ctls[i])
+            else:
+                series.append(None)
+        return series
+
+    @classmethod
+    def from_activity_index(
+        cls,
+        start_date: date,
+        end_date: date,
+        repo: RepositoryIO,
+    ) -> "DailyLoadSeries":
+        """
+        Build a series of summed activity loads from the activity index (inclusive range).
+
+        Every day in the range is present (rest days have 0 load). No YAML is
+        parsed and no CTL values are available.
+        """
+        loads: dict[date, float] = {}
+        for entry in repo.activity_index().query(start_date, end_date):
+            loads[entry.date] = loads.get(entry.date, 0.0) + (entry.systemic_load_au or 0.0)
+
+        series = cls(start_date)
+        current_date = start_date
+        while current_date <= end_date:
+            series.append(loads.get(current_date, 0.0))
+            current_date += timedelta(days=1)
+        return series
+
+    @property
+    def end_date(self) -> date:
+        """Day after the last day in the series (where append() writes next)."""
+        return self.origin + timedelta(days=len(self._loads))
+
+    def append(self, load: Optional[float], ctl: Optional[float] = None) -> None:
+        """
+        Append the next day.
+
+        Args:
+            load: Systemic load in AU, or None if the day is missing
+            ctl: Stored CTL for the day, if known
+        """
+        present = load is not None
+        self._loads.append(load if present else 0.0)
+        self._ctls.append(ctl if present else None)
+        self._present_prefix.append(self._present_prefix[-1] + (1 if present else 0))
+
+    def _span(self, last_day: date, days: int) -> tuple[int, int]:
+        """Clamp the window of `days` days ending at last_day to array bounds."""
+        hi = (last_day - self.origin).days + 1
+        lo = hi - days
+        size = len(self._loads)
+        return min(max(lo, 0), size), min(max(hi, 0), size)
+
+    def is_present(self, day: date) -> bool:
+        """Whether `day` has data."""
+        return self.present_count(day, 1) == 1
+
+    def present_count(self, last_day: date, days: int) -> int:
+        """Number of present days in the `days` days ending at last_day (inclusive)."""
+        lo, hi = self._span(last_day, days)
+        return self._present_prefix[hi] - self._present_prefix[lo]
+
+    def load_sum(self, last_day: date, days: int) -> float:
+        """Sum of loads in the `days` days ending at last_day (missing days count as 0)."""
+        lo, hi = self._span(last_day, days)
+        return sum(self._loads[lo:hi])
+
+    def load_average(self, last_day: date, days: int) -> float:
+        """Average load over the `days` days ending at last_day."""
+        return self.load_sum(last_day, days) / days
+
+    def ctl_on(self, day: date) -> Optional[float]:
+        """Stored CTL for `day`, or None if missing or unknown."""
+        i = (day - self.origin).days
+        if 0 <= i < len(self._ctls):
+            return self._ctls[i]
+        return None
+
 
 # ============================================================
 # MAIN FUNCTIONS
@@ -138,18 +295,13 @@ def estimate_baseline_ctl_atl(
         If athlete averaged 60 TSS/day for first 14 days,
         estimate initial CTL = 60, ATL = 60 (steady state)
     """
-    # Read next lookback_days of data (forward from target_date)
-    daily_loads = []
-    for i in range(lookback_days):
-        check_date = target_date + timedelta(days=i)
-        day_load = aggregate_daily_load(check_date, repo)
-        daily_loads.append(day_load.systemic_load_au)
-
-    # Calculate average
-    if not daily_loads:
+    if lookback_days <= 0:
         return 0.0, 0.0  # No data, use zero baseline
 
-    avg_daily_load = sum(daily_loads) / len(daily_loads)
+    # Loads of the next lookback_days (forward from target_date), from the index
+    last_day = target_date + timedelta(days=lookback_days - 1)
+    series = DailyLoadSeries.from_activity_index(target_date, last_day, repo)
+    avg_daily_load = series.load_average(last_day, lookback_days)
 
     # At steady state, CTL = ATL = average daily load
     # This is mathematically exact for EWMA at equilibrium
@@ -200,70 +352,51 @@ def compute_daily_metrics(
         # This prevents CTL starting at 0 and taking 42 days to stabilize
         previous_ctl, previous_atl = estimate_baseline_ctl_atl(target_date, repo)
 
+    # Trailing history for all window queries, read once
+    series = DailyLoadSeries.from_metrics(
+        target_date - timedelta(days=HISTORY_LOOKBACK_DAYS), prev_date, repo
+    )
+
     # Step 3: Calculate CTL/ATL/TSB
     ctl_atl = calculate_ctl_atl(
         daily_load.systemic_load_au,
         previous_ctl,
         previous_atl,
-        repo,
-        target_date,
+        target_date=target_date,
+        series=series,
     )
 
     # Step 4: Calculate ACWR (if >= 28 days data)
-    acwr = calculate_acwr(target_date, repo, today_load=daily_load.systemic_load_au)
-    acwr_available = acwr is not None
+    acwr = calculate_acwr(target_date, today_load=daily_load.systemic_load_au, series=series)
 
     # Step 5: Compute readiness score
     load_trend = compute_load_trend(
         target_date,
-        repo,
         today_load=daily_load.systemic_load_au,
+        series=series,
     )
-    data_days = _count_historical_days(target_date, repo)
+    data_days = _count_historical_days(target_date, series=series)
 
     # Extract injury/illness flags from today's activities
     injury_flags, illness_flags = _extract_activity_flags(target_date, repo)
-    flags_list = injury_flags + illness_flags
-
-    readiness = compute_readiness(
-        tsb=ctl_atl.tsb,
-        load_trend=load_trend,
-        injury_flags=injury_flags,
-        illness_flags=illness_flags,
-    )
 
     # Step 6: Build DailyMetrics object
-    baseline_established = data_days >= BASELINE_DAYS_THRESHOLD
-
-    # Determine initialization method for transparency
-    if prev_metrics:
-        ctl_init_method = "chained"
-        estimated_days = None
-    elif previous_ctl > 0:
-        ctl_init_method = "estimated"
-        estimated_days = 14
-    else:
-        ctl_init_method = "zero_start"
-        estimated_days = None
-
-    daily_metrics = DailyMetrics(
-        date=target_date,
-        calculated_at=datetime.now(),
+    daily_metrics = _assemble_daily_metrics(
+        target_date=target_date,
         daily_load=daily_load,
         ctl_atl=ctl_atl,
         acwr=acwr,
-        readiness=readiness,
-        baseline_established=baseline_established,
-        acwr_available=acwr_available,
-        data_days_available=data_days,
-        ctl_initialization_method=ctl_init_method,
-        estimated_baseline_days=estimated_days,
-        flags=flags_list,
+        load_trend=load_trend,
+        data_days=data_days,
+        injury_flags=injury_flags,
+        illness_flags=illness_flags,
+        chained=prev_metrics is not None,
+        previous_ctl=previous_ctl,
     )
 
     # Step 7: Persist to disk
     metrics_path = daily_metrics_path(target_date)
-    result = repo.write_yaml(metrics_path, daily_metrics)
+    result = repo.write_yaml(metrics_path, daily_metrics, file_format=DAILY_METRICS_FILE_FORMAT)
 
     if result is not None:
         raise MetricsCalculationError(
@@ -320,7 +453,7 @@ def compute_weekly_summary(
     current_date = week_start
     while current_date <= week_end:
         # Read activities for this day
-        day_activities = _read_activities_for_date(current_date, repo)
+        day_activities = _read_activities_for_date(current_date, repo, WEEKLY_SUMMARY_FIELDS)
         activities.extend(day_activities)
 
         # Aggregate loads
@@ -425,15 +558,19 @@ def aggregate_daily_load(
 
     # Find all matching activity files
     activity_files = repo.list_files(pattern)
+    activities = [repo.read_yaml(file_path, NormalizedActivity) for file_path in activity_files]
 
+    return _summarize_daily_load(target_date, activities)
+
+
+def _summarize_daily_load(target_date: date, activities: list) -> DailyLoad:
+    """Sum systemic and lower-body loads of already-loaded activities for one day."""
     systemic_total = 0.0
     lower_body_total = 0.0
     activity_count = 0
     activities_summary = []
 
-    for file_path in activity_files:
-        activity = repo.read_yaml(file_path, NormalizedActivity)
-
+    for activity in activities:
         if activity is None:
             continue  # Skip if read failed
 
@@ -470,6 +607,8 @@ def calculate_ctl_atl(
     previous_atl: float = 0.0,
     repo: Optional[RepositoryIO] = None,
     target_date: Optional[date] = None,
+    ctl_7d_ago: Optional[float] = None,
+    series: Optional[DailyLoadSeries] = None,
 ) -> CTLATLMetrics:
     """
     Calculate CTL/ATL/TSB using Exponentially Weighted Moving Average (EWMA).
@@ -489,6 +628,10 @@ def calculate_ctl_atl(
         previous_atl: ATL value from previous day (default 0 for cold start)
         repo: Optional repository for historical trend calculation
         target_date: Optional target date for trend calculation
+        ctl_7d_ago: Optional stored CTL from 7 days ago (used instead of reading
+                    it from disk when repo/target_date are not given)
+        series: Optional preloaded history; with target_date, the CTL 7 days
+                ago is looked up there instead of on disk
 
     Returns:
         CTLATLMetrics with computed values and zone classifications
@@ -506,20 +649,23 @@ def calculate_ctl_atl(
     ctl_trend = None
     ctl_change_7d = None
 
-    if repo and target_date:
-        # Read metrics from 7 days ago
+    if target_date and (series or repo):
         seven_days_ago = target_date - timedelta(days=7)
-        prev_week_metrics = _read_previous_metrics(seven_days_ago, repo)
-
-        if prev_week_metrics:
-            ctl_change_7d = ctl - prev_week_metrics.ctl_atl.ctl
-
-            if ctl_change_7d > 2.0:
-                ctl_trend = "building"
-            elif ctl_change_7d < -2.0:
-                ctl_trend = "declining"
-            else:
-                ctl_trend = "maintaining"
+        if series is None:
+            series = DailyLoadSeries.from_metrics(seven_days_ago, seven_days_ago, repo)
+        stored_ctl = series.ctl_on(seven_days_ago)
+        if stored_ctl is not None:
+            ctl_7d_ago = stored_ctl
+
+    if ctl_7d_ago is not None:
+        ctl_change_7d = ctl - ctl_7d_ago
+
+        if ctl_change_7d > 2.0:
+            ctl_trend = "building"
+        elif ctl_change_7d < -2.0:
+            ctl_trend = "declining"
+        else:
+            ctl_trend = "maintaining"
 
     return CTLATLMetrics(
         ctl=round(ctl, 1),
@@ -534,8 +680,9 @@ def calculate_ctl_atl(
 
 def calculate_acwr(
     target_date: date,
-    repo: RepositoryIO,
+    repo: Optional[RepositoryIO] = None,
     today_load: Optional[float] = None,
+    series: Optional[DailyLoadSeries] = None,
 ) -> Optional[ACWRMetrics]:
     """
     Calculate Acute:Chronic Workload Ratio.
@@ -548,55 +695,41 @@ def calculate_acwr(
 
     Args:
         target_date: Date to calculate ACWR for
-        repo: Repository I/O instance
+        repo: Repository I/O instance (used when no series is given)
         today_load: Optional systemic load for target_date. When provided, ACWR
-                    includes today's load (reads 27 previous days + today = 28 total).
-                    When None, reads 28 previous days (original behavior).
+                    includes today's load (27 previous days + today = 28 total).
+                    When None, uses 28 previous days (original behavior).
+        series: Optional preloaded history covering the previous 28 days
 
     Returns:
         ACWRMetrics or None if insufficient data
     """
+    yesterday = target_date - timedelta(days=1)
+    if series is None:
+        series = DailyLoadSeries.from_metrics(target_date - timedelta(days=28), yesterday, repo)
+
     if today_load is not None:
-        # Include today: read 27 previous days + today = 28 days total
+        # Include today: 27 previous days + today = 28 days total
         # Acute = today + 6 previous = 7 days
         # Chronic = today + 27 previous = 28 days
-        metrics_prev = []
-        for i in range(1, 28):  # Days 1-27 ago
-            check_date = target_date - timedelta(days=i)
-            metrics = _read_previous_metrics(check_date, repo)
-
-            if metrics is None:
-                # Not enough data
-                return None
-
-            metrics_prev.append(metrics)
-
-        # Sum loads with today included
-        acute_7d = today_load + sum(m.daily_load.systemic_load_au for m in metrics_prev[:6])
-        chronic_28d_total = today_load + sum(m.daily_load.systemic_load_au for m in metrics_prev)
-
-        # Calculate average
-        chronic_28d_avg = chronic_28d_total / 28.0
-
+        if series.present_count(yesterday, 27) < 27:
+            return None  # Not enough data
+        acute_7d = today_load + series.load_sum(yesterday, 6)
+        chronic_28d_total = today_load + series.load_sum(yesterday, 27)
     else:
-        # Original behavior: read 28 previous days (not including today)
-        metrics_28d = []
-        for i in range(1, 29):  # Days 1-28 ago
-            check_date = target_date - timedelta(days=i)
-            metrics = _read_previous_metrics(check_date, repo)
+        # Original behavior: 28 previous days (not including today)
+        if series.present_count(yesterday, 28) < 28:
+            return None  # Not enough data
+        acute_7d = series.load_sum(yesterday, 7)
+        chronic_28d_total = series.load_sum(yesterday, 28)
 
-            if metrics is None:
-                # Not enough data
-                return None
+    return _acwr_from_window(acute_7d, chronic_28d_total)
 
-            metrics_28d.append(metrics)
 
-        # Sum loads
-        acute_7d = sum(m.daily_load.systemic_load_au for m in metrics_28d[:7])
-        chronic_28d_total = sum(m.daily_load.systemic_load_au for m in metrics_28d)
-
-        # Calculate average
-        chronic_28d_avg = chronic_28d_total / 28.0
+def _acwr_from_window(acute_7d: float, chronic_28d_total: float) -> Optional[ACWRMetrics]:
+    """Build ACWR metrics from 7-day and 28-day systemic load totals."""
+    # Calculate average
+    chronic_28d_avg = chronic_28d_total / 28.0
 
     # Handle divide-by-zero
     if chronic_28d_avg == 0:
@@ -785,8 +918,9 @@ def compute_intensity_distribution(
 
 def compute_load_trend(
     target_date: date,
-    repo: RepositoryIO,
+    repo: Optional[RepositoryIO] = None,
     today_load: Optional[float] = None,
+    series: Optional[DailyLoadSeries] = None,
 ) -> float:
     """
     Compute recent load trend for readiness calculation.
@@ -796,39 +930,40 @@ def compute_load_trend(
 
     Args:
         target_date: Date to compute trend for
-        repo: Repository I/O instance
+        repo: Repository I/O instance (used when no series is given)
         today_load: Optional systemic load for target_date (avoids missing metrics bias)
+        series: Optional preloaded history covering the last 7 days
 
     Returns:
         Load trend score 0-100 (100 = freshest). Returns neutral (65) if history is incomplete.
     """
-    # Read last 7 days of metrics
-    loads_7d = []
-    missing_data = False
-    for i in range(7):
-        check_date = target_date - timedelta(days=i)
-        if i == 0 and today_load is not None:
-            loads_7d.append(today_load)
-            continue
+    yesterday = target_date - timedelta(days=1)
+    if series is None:
+        first_day = target_date - timedelta(days=6)
+        series = DailyLoadSeries.from_metrics(
+            first_day, yesterday if today_load is not None else target_date, repo
+        )
 
-        metrics = _read_previous_metrics(check_date, repo)
-        if metrics:
-            loads_7d.append(metrics.daily_load.systemic_load_au)
-        else:
-            loads_7d.append(None)
-            missing_data = True
+    if today_load is None:
+        if not series.is_present(target_date):
+            return 65.0
+        today_load = series.load_sum(target_date, 1)
 
     # If we have missing history data, return neutral to avoid false freshness
-    if missing_data:
+    if series.present_count(yesterday, 6) < 6:
         return 65.0
 
-    if len(loads_7d) < 3:
-        # Not enough data, return neutral
-        return 65.0
+    return _load_trend_score(
+        today_load + series.load_sum(yesterday, 2),
+        today_load + series.load_sum(yesterday, 6),
+    )
 
+
+def _load_trend_score(sum_3d: float, sum_7d: float) -> float:
+    """Score load trend from the last 3-day and 7-day load totals (including today)."""
     # Calculate averages
-    avg_3d = sum(loads_7d[:3]) / 3.0
-    avg_7d = sum(loads_7d) / 7.0
+    avg_3d = sum_3d / 3.0
+    avg_7d = sum_7d / 7.0
 
     if avg_7d == 0:
         return 65.0  # Neutral if no load
@@ -889,6 +1024,238 @@ def compute_metrics_batch(
     return results
 
 
+def compute_metrics_range(
+    start_date: date,
+    end_date: date,
+    repo: RepositoryIO,
+) -> list[DailyMetrics]:
+    """
+    Compute and persist daily metrics for a date range in a single pass.
+
+    Produces the same DailyMetrics files as calling compute_daily_metrics()
+    for each day in order, but without re-reading history for every day:
+    - Every activity in the range is read once and bucketed by date
+    - Up to HISTORY_LOOKBACK_DAYS of stored metrics before start_date are
+      read once to seed the CTL/ATL chain and the trailing windows
+    - CTL/ATL are chained in memory; ACWR, load trend, CTL change and
+      data-days are O(1) queries on a DailyLoadSeries
+
+    Args:
+        start_date: First date to compute
+        end_date: Last date to compute (inclusive)
+        repo: Repository I/O instance
+
+    Returns:
+        List of computed DailyMetrics (one per day, in date order)
+
+    Raises:
+        InvalidMetricsInputError: If end_date is before start_date
+        MetricsCalculationError: If a daily metrics file cannot be written
+    """
+    if end_date < start_date:
+        raise InvalidMetricsInputError(
+            f"end_date {end_date} is before start_date {start_date}"
+        )
+
+    # Cold start looks 14 days ahead of start_date, possibly past end_date
+    baseline_end = start_date + timedelta(days=13)
+    activities_by_date = _load_activities_by_date(
+        start_date, max(end_date, baseline_end), repo
+    )
+
+    return _compute_range(
+        start_date,
+        end_date,
+        repo,
+        lambda day: activities_by_date.get(day, []),
+    )
+
+
+def compute_metrics_incremental(
+    changed_dates: Iterable[date],
+    repo: RepositoryIO,
+    end_date: Optional[date] = None,
+    tolerance: float = INCREMENTAL_TOLERANCE,
+) -> list[DailyMetrics]:
+    """
+    Bring stored daily metrics up to date after the loads of some dates changed.
+
+    Recomputes forward from each changed date only while the result can still
+    differ from what is on disk:
+    - CTL/ATL are chained until they are back within `tolerance` of the
+      stored values
+    - A changed daily load keeps the next ACWR_WINDOW_DAYS days dirty (ACWR
+      and load trend), a changed CTL the next CTL_CHANGE_WINDOW_DAYS days
+      (ctl_change_7d), and a newly created file the next
+      HISTORY_LOOKBACK_DAYS days (data_days_available)
+    - Days with no stored metrics between the earliest changed date and
+      end_date are filled in (e.g. rest days since the last sync)
+
+    Days whose serialized metrics are unchanged are not rewritten. Activities
+    are found through the activity index and read one day at a time, so only
+    recomputed days cost any YAML parsing.
+
+    Args:
+        changed_dates: Dates whose activities were added, edited or removed
+        repo: Repository I/O instance
+        end_date: Last date to keep up to date (default: today)
+        tolerance: Largest CTL/ATL difference treated as unchanged
+
+    Returns:
+        Recomputed DailyMetrics in date order (including days found unchanged)
+
+    Raises:
+        MetricsCalculationError: If a daily metrics file cannot be written
+    """
+    if end_date is None:
+        end_date = date.today()
+
+    pending = {day for day in changed_dates if day <= end_date}
+    if not pending:
+        return []
+
+    stored_dates = _list_stored_metrics_dates(repo)
+    day = min(pending)
+    while day <= end_date:
+        if day not in stored_dates:
+            pending.add(day)
+        day += timedelta(days=1)
+    pending_dates = sorted(pending)
+
+    # Cold start may look 14 days past end_date
+    index = repo.activity_index()
+    entries_by_date: dict[date, list] = {}
+    for entry in index.query(pending_dates[0], end_date + timedelta(days=13)):
+        entries_by_date.setdefault(entry.date, []).append(entry)
+
+    loaded: dict[date, list[NormalizedActivity]] = {}
+
+    def activities_for(day: date) -> list[NormalizedActivity]:
+        if day not in loaded:
+            entries = sorted(entries_by_date.get(day, []), key=lambda entry: entry.path)
+            loaded[day] = index.load(entries)
+        return loaded[day]
+
+    results: list[DailyMetrics] = []
+    while pending_dates:
+        segment = _compute_range(
+            pending_dates[0], end_date, repo, activities_for, tolerance=tolerance
+        )
+        results.extend(segment)
+        last_date = segment[-1].date
+        pending_dates = [day for day in pending_dates if day > last_date]
+
+    return results
+
+
+def _compute_range(
+    start_date: date,
+    end_date: date,
+    repo: RepositoryIO,
+    activities_for: Callable[[date], list[NormalizedActivity]],
+    tolerance: Optional[float] = None,
+) -> list[DailyMetrics]:
+    """
+    Range engine shared by compute_metrics_range and compute_metrics_incremental.
+
+    With a tolerance, each day is compared with its stored metrics: unchanged
+    days are not rewritten, and the pass stops at the first day after which
+    nothing downstream can differ (see compute_metrics_incremental).
+    """
+    incremental = tolerance is not None
+    dirty_until = start_date  # Last day whose output may still differ from disk
+
+    # Trailing history: stored metrics before start_date, then each computed
+    # day is appended so window queries stay O(1) throughout the range
+    series = DailyLoadSeries.from_metrics(
+        start_date - timedelta(days=HISTORY_LOOKBACK_DAYS),
+        start_date - timedelta(days=1),
+        repo,
+    )
+    prev_metrics = _read_previous_metrics(start_date - timedelta(days=1), repo)
+
+    if prev_metrics:
+        previous_ctl = prev_metrics.ctl_atl.ctl
+        previous_atl = prev_metrics.ctl_atl.atl
+    else:
+        baseline = DailyLoadSeries(start_date)
+        for i in range(14):
+            day = start_date + timedelta(days=i)
+            baseline.append(_summarize_daily_load(day, activities_for(day)).systemic_load_au)
+        avg_daily_load = baseline.load_average(start_date + timedelta(days=13), 14)
+        previous_ctl = round(avg_daily_load, 1)
+        previous_atl = round(avg_daily_load, 1)
+    chained = prev_metrics is not None
+
+    results = []
+    current_date = start_date
+    while current_date <= end_date:
+        day_activities = activities_for(current_date)
+        daily_load = _summarize_daily_load(current_date, day_activities)
+        today_load = daily_load.systemic_load_au
+
+        ctl_atl = calculate_ctl_atl(
+            today_load,
+            previous_ctl,
+            previous_atl,
+            target_date=current_date,
+            series=series,
+        )
+        acwr = calculate_acwr(current_date, today_load=today_load, series=series)
+        load_trend = compute_load_trend(current_date, today_load=today_load, series=series)
+
+        injury_flags, illness_flags = _scan_activity_flags(day_activities)
+
+        daily_metrics = _assemble_daily_metrics(
+            target_date=current_date,
+            daily_load=daily_load,
+            ctl_atl=ctl_atl,
+            acwr=acwr,
+            load_trend=load_trend,
+            data_days=_count_historical_days(current_date, series=series),
+            injury_flags=injury_flags,
+            illness_flags=illness_flags,
+            chained=chained,
+            previous_ctl=previous_ctl,
+        )
+
+        stored = _read_previous_metrics(current_date, repo) if incremental else None
+        if stored is None or not _metrics_unchanged(stored, daily_metrics):
+            result = repo.write_yaml(
+                daily_metrics_path(current_date), daily_metrics, file_format=DAILY_METRICS_FILE_FORMAT
+            )
+            if result is not None:
+                raise MetricsCalculationError(
+                    f"Failed to write daily metrics: {result.message}"
+                )
+        results.append(daily_metrics)
+
+        # Chain from the stored (rounded) values, as the per-day engine does
+        series.append(today_load, ctl_atl.ctl)
+        previous_ctl = ctl_atl.ctl
+        previous_atl = ctl_atl.atl
+        chained = True
+
+        if incremental:
+            if stored is None:
+                # A new file changes data_days_available downstream
+                dirty_until = max(dirty_until, current_date + timedelta(days=HISTORY_LOOKBACK_DAYS))
+                converged = False
+            else:
+                if stored.daily_load.systemic_load_au != today_load:
+                    dirty_until = max(dirty_until, current_date + timedelta(days=ACWR_WINDOW_DAYS - 1))
+                ctl_delta = abs(stored.ctl_atl.ctl - ctl_atl.ctl)
+                if ctl_delta > tolerance:
+                    dirty_until = max(dirty_until, current_date + timedelta(days=CTL_CHANGE_WINDOW_DAYS))
+                converged = ctl_delta <= tolerance and abs(stored.ctl_atl.atl - ctl_atl.atl) <= tolerance
+            if converged and current_date >= dirty_until:
+                break
+
+        current_date += timedelta(days=1)
+
+    return results
+
+
 # ============================================================
 # VALIDATION
 # ============================================================
@@ -958,15 +1325,43 @@ def _read_previous_metrics(target_date: date, repo: RepositoryIO) -> Optional[Da
     result = repo.read_yaml(metrics_path, DailyMetrics)
 
     # repo.read_yaml returns RepoError if file doesn't exist
-    from resilio.schemas.repository import RepoError
     if isinstance(result, RepoError):
         return None
 
     return result
 
 
-def _read_activities_for_date(target_date: date, repo: RepositoryIO) -> list[NormalizedActivity]:
-    """Read all activities for a specific date."""
+def _list_stored_metrics_dates(repo: RepositoryIO) -> set[date]:
+    """Dates that have a daily metrics file."""
+    dates = set()
+    for file_path in repo.list_files(f"{get_metrics_dir()}/daily/*.yaml"):
+        try:
+            dates.add(date.fromisoformat(file_path.stem))
+        except ValueError:
+            continue
+    return dates
+
+
+def _metrics_unchanged(stored: DailyMetrics, computed: DailyMetrics) -> bool:
+    """Whether computed metrics serialize identically to stored ones (ignoring calculated_at)."""
+    def render(metrics: DailyMetrics) -> str:
+        return serialize(
+            metrics.model_dump(mode="json", exclude={"calculated_at"}), DAILY_METRICS_FILE_FORMAT
+        )
+
+    return render(stored) == render(computed)
+
+
+def _read_activities_for_date(
+    target_date: date,
+    repo: RepositoryIO,
+    fields: Optional[tuple[str, ...]] = None,
+) -> list[NormalizedActivity]:
+    """
+    Read all activities for a specific date.
+
+    With fields, only those fields are projected (see core/projection.py).
+    """
     year_month = f"{target_date.year}-{target_date.month:02d}"
     date_str = target_date.isoformat()
     pattern = f"{activities_month_dir(year_month)}/{date_str}_*.yaml"
@@ -975,13 +1370,49 @@ def _read_activities_for_date(target_date: date, repo: RepositoryIO) -> list[Nor
     activities = []
 
     for file_path in activity_files:
-        activity = repo.read_yaml(file_path, NormalizedActivity)
-        if activity:
+        if fields is not None:
+            activity = repo.read_projection(file_path, NormalizedActivity, fields)
+        else:
+            activity = repo.read_yaml(file_path, NormalizedActivity)
+        if activity and not isinstance(activity, RepoError):
             activities.append(activity)
 
     return activities
 
 
+def _load_activities_by_date(
+    start_date: date,
+    end_date: date,
+    repo: RepositoryIO,
+) -> dict[date, list[NormalizedActivity]]:
+    """
+    Read all activities between two dates (inclusive), grouped by date.
+
+    Globs each month directory once and groups files by the date prefix of
+    their filename, matching what _read_activities_for_date() finds per day.
+    """
+    activities_by_date: dict[date, list[NormalizedActivity]] = {}
+
+    month = date(start_date.year, start_date.month, 1)
+    while month <= end_date:
+        year_month = f"{month.year}-{month.month:02d}"
+        for file_path in repo.list_files(f"{activities_month_dir(year_month)}/*.yaml"):
+            try:
+                file_date = date.fromisoformat(file_path.name[:10])
+            except ValueError:
+                continue
+            if not (start_date <= file_date <= end_date) or file_path.name[10:11] != "_":
+                continue
+
+            activity = repo.read_yaml(file_path, NormalizedActivity)
+            if isinstance(activity, NormalizedActivity):
+                activities_by_date.setdefault(file_date, []).append(activity)
+
+        month = (month + timedelta(days=32)).replace(day=1)
+
+    return activities_by_date
+
+
 def _extract_activity_flags(target_date: date, repo: RepositoryIO) -> tuple[list[str], list[str]]:
     """
     Extract injury and illness flags from activity notes for a given date.
@@ -1004,6 +1435,8 @@ def _extract_activity_flags(target_date: date, repo: RepositoryIO) -> tuple[list
 
     Note: Excludes ambiguous terms like "tired" or "fatigued" which are normal
     training responses. AI coach can ask clarifying questions if needed.
+    Negated mentions ("no pain") are ignored. Keywords are matched once at
+    import and stored as activity.note_flags (see core/keywords.py).
 
     Args:
         target_date: Date to check activities for
@@ -1013,84 +1446,87 @@ def _extract_activity_flags(target_date: date, repo: RepositoryIO) -> tuple[list
         Tuple of (injury_flags, illness_flags) where each is a list of
         descriptive strings (e.g., ["pain mentioned in activity notes"])
     """
-    # Injury keywords - clear pain/injury signals
-    INJURY_KEYWORDS = {
-        "pain", "ache", "aching", "hurt", "hurting", "hurts",
-        "sore", "soreness", "tender", "tenderness",
-        "injury", "injured", "strain", "strained", "sprain", "sprained",
-        "tear", "torn", "tweak", "tweaked",
-        "limp", "limping", "limped",
-        "sharp", "stabbing", "shooting",  # Pain descriptors
-        "tight", "tightness",  # Can indicate injury
-        "swollen", "swelling", "inflamed", "inflammation",
-    }
-
-    # Illness keywords - systemic illness
-    ILLNESS_KEYWORDS = {
-        "sick", "ill", "illness",
-        "fever", "feverish", "temperature",
-        "flu", "influenza", "cold",
-        "covid", "coronavirus", "virus", "viral",
-        "nauseous", "nausea", "vomiting", "vomit", "threw up",
-        "diarrhea", "stomach",
-        "congested", "congestion", "cough", "coughing",
-        "chills", "shivering",
-        "headache" , "migraine",  # Can indicate illness
-    }
-
     activities = _read_activities_for_date(target_date, repo)
+    return _scan_activity_flags(activities)
+
 
+def _scan_activity_flags(activities: list[NormalizedActivity]) -> tuple[list[str], list[str]]:
+    """Collect injury/illness flags of already-loaded activities (see _extract_activity_flags)."""
     injury_flags = []
     illness_flags = []
 
     for activity in activities:
-        # Combine description and private_note for scanning
-        text_fields = []
-        if activity.description:
-            text_fields.append(activity.description.lower())
-        if activity.private_note:
-            text_fields.append(activity.private_note.lower())
-
-        combined_text = " ".join(text_fields)
-
-        if not combined_text:
-            continue  # No notes to scan
-
-        # Check for injury keywords
-        found_injury_keywords = []
-        for keyword in INJURY_KEYWORDS:
-            if keyword in combined_text:
-                found_injury_keywords.append(keyword)
-
-        if found_injury_keywords:
-            # Create descriptive flag
-            keywords_str = ", ".join(sorted(set(found_injury_keywords)))
-            injury_flags.append(f"{activity.sport_type} activity: {keywords_str}")
-
-        # Check for illness keywords
-        found_illness_keywords = []
-        for keyword in ILLNESS_KEYWORDS:
-            if keyword in combined_text:
-                found_illness_keywords.append(keyword)
-
-        if found_illness_keywords:
-            # Create descriptive flag
-            keywords_str = ", ".join(sorted(set(found_illness_keywords)))
-            illness_flags.append(f"{activity.sport_type} activity: {keywords_str}")
+        # Flags are matched at import; older activities are scanned here
+        flags = activity_note_flags(activity)
+        if flags.injury:
+            injury_flags.append(f"{activity.sport_type} activity: {', '.join(flags.injury)}")
+        if flags.illness:
+            illness_flags.append(f"{activity.sport_type} activity: {', '.join(flags.illness)}")
 
     return injury_flags, illness_flags
 
 
-def _count_historical_days(target_date: date, repo: RepositoryIO) -> int:
+def _assemble_daily_metrics(
+    target_date: date,
+    daily_load: DailyLoad,
+    ctl_atl: CTLATLMetrics,
+    acwr: Optional[ACWRMetrics],
+    load_trend: float,
+    data_days: int,
+    injury_flags: list[str],
+    illness_flags: list[str],
+    chained: bool,
+    previous_ctl: float,
+) -> DailyMetrics:
+    """Build the DailyMetrics record shared by the per-day and range engines."""
+    readiness = compute_readiness(
+        tsb=ctl_atl.tsb,
+        load_trend=load_trend,
+        injury_flags=injury_flags,
+        illness_flags=illness_flags,
+    )
+
+    baseline_established = data_days >= BASELINE_DAYS_THRESHOLD
+
+    # Determine initialization method for transparency
+    if chained:
+        ctl_init_method = "chained"
+        estimated_days = None
+    elif previous_ctl > 0:
+        ctl_init_method = "estimated"
+        estimated_days = 14
+    else:
+        ctl_init_method = "zero_start"
+        estimated_days = None
+
+    return DailyMetrics(
+        date=target_date,
+        calculated_at=datetime.now(),
+        daily_load=daily_load,
+        ctl_atl=ctl_atl,
+        acwr=acwr,
+        readiness=readiness,
+        baseline_established=baseline_established,
+        acwr_available=acwr is not None,
+        data_days_available=data_days,
+        ctl_initialization_method=ctl_init_method,
+        estimated_baseline_days=estimated_days,
+        flags=injury_flags + illness_flags,
+    )
+
+
+def _count_historical_days(
+    target_date: date,
+    repo: Optional[RepositoryIO] = None,
+    series: Optional[DailyLoadSeries] = None,
+) -> int:
     """Count days of available metrics data (not including current day being computed)."""
-    count = 0
-    for i in range(1, 61):  # Check last 60 days (not including today)
-        check_date = target_date - timedelta(days=i)
-        metrics = _read_previous_metrics(check_date, repo)
-        if metrics:
-            count += 1
-
-    return count
+    yesterday = target_date - timedelta(days=1)
+    if series is None:
+        series = DailyLoadSeries.from_metrics(
+            target_date - timedelta(days=HISTORY_LOOKBACK_DAYS), yesterday, repo
+        )
+    return series.present_count(yesterday, HISTORY_LOOKBACK_DAYS)
 
 
 def _classify_ctl_zone(ctl: float) -> CTLZone:
@@ -0,0 +1,375 @@
+"""
+Metrics Store - Columnar time series of daily metrics.
+
+Keeps the numeric core of every DailyMetrics record (loads, CTL, ATL, TSB,
+ACWR, readiness score) in one packed binary file per year under
+data/metrics/series/, so range queries ("last 90 days of CTL") are a single
+memory-mapped read instead of one YAML parse and Pydantic validation per day.
+
+The per-day files under data/metrics/daily/ remain the source of truth (and
+what the coach reads for full detail). The store is derived from them:
+- RepositoryIO.write_yaml/delete_file update it as daily metrics are written
+- Every day slot records the (mtime_ns, size) stamp of its YAML file; reads
+  re-check the stamps and re-read only days whose file changed, appeared or
+  disappeared outside RepositoryIO (git checkout, manual edits)
+- Deleting the series directory is always safe; it is rebuilt on demand
+
+File layout (native byte order):
+    header   16 bytes  magic "RSMS", format version, year, slots, columns
+    columns  one array of SLOTS_PER_YEAR values per column, in COLUMNS order
+             (float64, NaN = missing), followed by the int64 stamp columns
+
+Slot i holds day-of-year i + 1.
+"""
+
+import logging
+import math
+import mmap
+import os
+import struct
+import threading
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Optional, Union
+
+from resilio.core.paths import daily_metrics_path, metrics_series_path
+from resilio.core.repository import RepositoryIO
+from resilio.schemas.metrics import DailyMetrics
+from resilio.schemas.repository import RepoError
+
+logger = logging.getLogger(__name__)
+
+
+# Bump when the layout or the column set changes (forces a rebuild)
+STORE_FORMAT_VERSION = 1
+
+COLUMNS = (
+    "systemic_load_au",
+    "lower_body_load_au",
+    "ctl",
+    "atl",
+    "tsb",
+    "acwr",
+    "readiness_score",
+)
+_STAMP_COLUMNS = ("mtime_ns", "size")
+
+SLOTS_PER_YEAR = 366
+_MAGIC = b"RSMS"
+_HEADER = struct.Struct("=4sHHHH4x")
+_VALUE_SIZE = 8
+_COLUMN_BYTES = SLOTS_PER_YEAR * _VALUE_SIZE
+_FILE_SIZE = _HEADER.size + (len(COLUMNS) + len(_STAMP_COLUMNS)) * _COLUMN_BYTES
+
+
+def _column_offset(position: int) -> int:
+    return _HEADER.size + position * _COLUMN_BYTES
+
+
+def _slot(day: date) -> int:
+    return day.timetuple().tm_yday - 1
+
+
+def _row_from_metrics(metrics: DailyMetrics) -> dict[str, float]:
+    """Extract the stored columns from a DailyMetrics record (NaN = missing)."""
+    return {
+        "systemic_load_au": metrics.daily_load.systemic_load_au,
+        "lower_body_load_au": metrics.daily_load.lower_body_load_au,
+        "ctl": metrics.ctl_atl.ctl,
+        "atl": metrics.ctl_atl.atl,
+        "tsb": metrics.ctl_atl.tsb,
+        "acwr": metrics.acwr.acwr if metrics.acwr is not None else math.nan,
+        "readiness_score": float(metrics.readiness.score),
+    }
+
+
+@dataclass
+class MetricsSeries:
+    """
+    Daily metric columns for a contiguous date range.
+
+    A day is present when its daily metrics file exists. Values are None for
+    missing days, for files that could not be parsed, and for ACWR when it
+    was not available that day.
+    """
+
+    start_date: date
+    end_date: date
+    present: list[bool] = field(default_factory=list)
+    columns: dict[str, list[Optional[float]]] = field(default_factory=dict)
+
+    def dates(self) -> list[date]:
+        """All dates in the range, in order."""
+        return [self.start_date + timedelta(days=i) for i in range(len(self.present))]
+
+    def latest_date(self) -> Optional[date]:
+        """Most recent date with metrics, or None."""
+        for i in range(len(self.present) - 1, -1, -1):
+            if self.present[i]:
+                return self.start_date + timedelta(days=i)
+        return None
+
+    def to_records(self) -> list[dict]:
+        """Per-day rows ({"date": ISO date, column: value, ...}) for days with metrics."""
+        records = []
+        for i, day in enumerate(self.dates()):
+            if not self.present[i]:
+                continue
+            record = {"date": day.isoformat()}
+            for name in COLUMNS:
+                record[name] = self.columns[name][i]
+            records.append(record)
+        return records
+
+
+class MetricsStore:
+    """
+    Per-year columnar files of daily metrics, kept in sync with daily YAML.
+
+    Usage:
+        store = repo.metrics_store()
+        series = store.read_range(date(2026, 1, 1), date(2026, 3, 31))
+        ctl = series.columns["ctl"]
+    """
+
+    def __init__(self, repo: RepositoryIO):
+        """
+        Args:
+            repo: Repository I/O instance (locates files and reads daily YAML)
+        """
+        self.repo = repo
+        self._lock = threading.Lock()
+
+    # ============================================================
+    # WRITES
+    # ============================================================
+
+    def record(self, metrics: DailyMetrics, path: Optional[Union[str, Path]] = None) -> None:
+        """
+        Store one day after its daily metrics file was written.
+
+        Args:
+            metrics: The record that was written
+            path: Its YAML file (default: daily_metrics_path(metrics.date))
+        """
+        resolved = self.repo.resolve_path(path or daily_metrics_path(metrics.date))
+        self._store(metrics.date, _row_from_metrics(metrics), _stat_stamp(resolved))
+
+    def remove(self, day: date) -> None:
+        """Clear one day after its daily metrics file was deleted."""
+        if self._year_path(day.year).exists():
+            self._store(day, None, (0, 0))
+
+    # ============================================================
+    # READS
+    # ============================================================
+
+    def read_range(self, start_date: date, end_date: date, validate: bool = True) -> MetricsSeries:
+        """
+        Read all columns for an inclusive date range.
+
+        Args:
+            start_date: First date
+            end_date: Last date
+            validate: Re-check each day's YAML file stamp and re-read days
+                      changed outside RepositoryIO (default: True)
+
+        Returns:
+            MetricsSeries covering every day in the range
+        """
+        series = MetricsSeries(start_date=start_date, end_date=end_date)
+        for name in COLUMNS:
+            series.columns[name] = []
+
+        year = start_date.year
+        while year <= end_date.year:
+            first = max(start_date, date(year, 1, 1))
+            last = min(end_date, date(year, 12, 31))
+            self._read_year_span(first, last, series, validate)
+            year += 1
+        return series
+
+    def latest_date(self, on_or_before: Optional[date] = None, lookback_days: int = 30) -> Optional[date]:
+        """
+        Most recent date with metrics within a lookback window.
+
+        Args:
+            on_or_before: Last date to consider (default: today)
+            lookback_days: How many days back to search
+
+        Returns:
+            Date of the most recent metrics, or None
+        """
+        end_date = on_or_before or date.today()
+        start_date = end_date - timedelta(days=lookback_days - 1)
+        return self.read_range(start_date, end_date).latest_date()
+
+    # ============================================================
+    # INTERNAL HELPERS
+    # ============================================================
+
+    def _store(self, day: date, row: Optional[dict[str, float]], stamp: tuple[int, int]) -> None:
+        with self._lock:
+            with self._open_year(day.year, writable=True) as view:
+                _write_slot(view, _slot(day), row, stamp)
+
+    def _year_path(self, year: int) -> Path:
+        return self.repo.resolve_path(metrics_series_path(year))
+
+    def _open_year(self, year: int, writable: bool) -> "_MappedYear":
+        path = self._year_path(year)
+        if writable and not _is_valid_file(path, year):
+            _create_year_file(path, year)
+        return _MappedYear(path, writable)
+
+    def _read_year_span(self, first: date, last: date, series: MetricsSeries, validate: bool) -> None:
+        """Append [first, last] (same year) to series, refreshing stale slots."""
+        lo, hi = _slot(first), _slot(last) + 1
+        path = self._year_path(first.year)
+
+        if _is_valid_file(path, first.year):
+            with _MappedYear(path, writable=False) as view:
+                values = {
+                    name: view[position][lo:hi].tolist()
+                    for position, name in enumerate(COLUMNS)
+                }
+                mtimes = view[len(COLUMNS)][lo:hi].tolist()
+                sizes = view[len(COLUMNS) + 1][lo:hi].tolist()
+        else:
+            values = {name: [math.nan] * (hi - lo) for name in COLUMNS}
+            mtimes = [0] * (hi - lo)
+            sizes = [0] * (hi - lo)
+
+        for i in range(hi - lo):
+            day = first + timedelta(days=i)
+            stored_stamp = (mtimes[i], sizes[i])
+            if validate:
+                resolved = self.repo.resolve_path(daily_metrics_path(day))
+                current_stamp = _stat_stamp(resolved)
+                if current_stamp != stored_stamp:
+                    row = self._refresh_day(day, resolved, current_stamp)
+                    for name in COLUMNS:
+                        values[name][i] = row[name] if row else math.nan
+                    stored_stamp = current_stamp
+
+            present = stored_stamp[1] > 0
+            series.present.append(present)
+            for name in COLUMNS:
+                value = values[name][i]
+                series.columns[name].append(None if not present or math.isnan(value) else value)
+
+    def _refresh_day(
+        self, day: date, resolved: Path, stamp: tuple[int, int]
+    ) -> Optional[dict[str, float]]:
+        """Re-read one day's YAML into the store; returns its row, or None if missing/unparseable."""
+        row = None
+        if stamp[1] > 0:
+            result = self.repo.read_yaml(resolved, DailyMetrics)
+            if not isinstance(result, RepoError):
+                row = _row_from_metrics(result)
+
+        try:
+            if row is not None or stamp[1] > 0 or self._year_path(day.year).exists():
+                self._store(day, row, stamp)
+        except OSError as e:
+            logger.debug("Metrics store refresh skipped for %s: %s", day, e)
+
+        return row
+
+
+class _MappedYear:
+    """Context manager exposing a year file's columns as memoryviews over an mmap."""
+
+    def __init__(self, path: Path, writable: bool):
+        self.path = path
+        self.writable = writable
+        self._file = None
+        self._map = None
+        self._views: list[memoryview] = []
+
+    def __enter__(self) -> list[memoryview]:
+        self._file = open(self.path, "r+b" if self.writable else "rb")
+        access = mmap.ACCESS_WRITE if self.writable else mmap.ACCESS_READ
+        self._map = mmap.mmap(self._file.fileno(), _FILE_SIZE, access=access)
+        for position in range(len(COLUMNS) + len(_STAMP_COLUMNS)):
+            offset = _column_offset(position)
+            raw = memoryview(self._map)[offset:offset + _COLUMN_BYTES]
+            self._views.append(raw.cast("d" if position < len(COLUMNS) else "q"))
+        return self._views
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        for view in self._views:
+            view.release()
+        self._views = []
+        if self.writable:
+            self._map.flush()
+        self._map.close()
+        self._file.close()
+
+
+def _write_slot(
+    views: list[memoryview],
+    slot: int,
+    row: Optional[dict[str, float]],
+    stamp: tuple[int, int],
+) -> None:
+    # Clear the stamp first so a torn write is re-read on next validation
+    views[len(COLUMNS) + 1][slot] = 0
+    for position, name in enumerate(COLUMNS):
+        views[position][slot] = row[name] if row else math.nan
+    views[len(COLUMNS)][slot] = stamp[0]
+    views[len(COLUMNS) + 1][slot] = stamp[1]
+
+
+def _stat_stamp(path: Path) -> tuple[int, int]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return (0, 0)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _is_valid_file(path: Path, year: int) -> bool:
+    try:
+        if path.stat().st_size != _FILE_SIZE:
+            return False
+        with open(path, "rb") as handle:
+            magic, version, file_year, slots, columns = _HEADER.unpack(handle.read(_HEADER.size))
+    except (OSError, struct.error):
+        return False
+    return (
+        magic == _MAGIC
+        and version == STORE_FORMAT_VERSION
+        and file_year == year
+        and slots == SLOTS_PER_YEAR
+        and columns == len(COLUMNS)
+    )
+
+
+def _create_year_file(path: Path, year: int) -> None:
+    """Write an empty year file (all values missing) atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    header = _HEADER.pack(_MAGIC, STORE_FORMAT_VERSION, year, SLOTS_PER_YEAR, len(COLUMNS))
+    empty_floats = struct.pack(f"{SLOTS_PER_YEAR}d", *([math.nan] * SLOTS_PER_YEAR))
+    empty_ints = bytes(_COLUMN_BYTES)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as handle:
+        handle.write(header)
+        handle.write(empty_floats * len(COLUMNS))
+        handle.write(empty_ints * len(_STAMP_COLUMNS))
+    os.replace(tmp_path, path)
+
+
+def is_daily_metrics_path(repo: RepositoryIO, path: Union[str, Path]) -> Optional[date]:
+    """Return the date of a daily metrics YAML path, or None if it is not one."""
+    resolved = repo.resolve_path(path)
+    if resolved.suffix != ".yaml":
+        return None
+    try:
+        day = date.fromisoformat(resolved.stem)
+    except ValueError:
+        return None
+    if resolved != repo.resolve_path(daily_metrics_path(day)):
+        return None
+    return day
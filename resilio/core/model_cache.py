@@ -0,0 +1,151 @@
+"""
+Process-level cache of validated models returned by RepositoryIO.read_yaml.
+
+Kept free of schema imports so the CLI entry point can enable it without
+paying for the repository layer on commands that never touch it.
+"""
+
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Type, TypeVar
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+T = TypeVar("T", bound="BaseModel")
+
+
+# ============================================================
+# MODEL CACHE
+# ============================================================
+
+DEFAULT_MODEL_CACHE_ENTRIES = 4096
+DEFAULT_MODEL_CACHE_BYTES = 64 * 1024 * 1024  # Measured as on-disk YAML size
+
+
+class ModelCache:
+    """
+    Process-level LRU cache of validated models returned by read_yaml.
+
+    Entries are keyed by (resolved path, schema) and stamped with the file's
+    (mtime_ns, size): a changed file is a miss, so edits made outside
+    RepositoryIO are never served stale. RepositoryIO.write_yaml/delete_file
+    invalidate entries directly.
+
+    Callers always receive a deep copy, so mutating a returned model never
+    affects the cached one.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MODEL_CACHE_ENTRIES,
+        max_bytes: int = DEFAULT_MODEL_CACHE_BYTES,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[tuple[str, type], tuple[tuple[int, int], "BaseModel"]] = OrderedDict()
+        self._keys_by_path: dict[str, set[tuple[str, type]]] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, path: Path, schema: Type[T], stamp: tuple[int, int]) -> Optional[T]:
+        """Return a copy of the cached model, or None on a miss/stale entry."""
+        key = (str(path), schema)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != stamp:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            model = entry[1]
+        return model.model_copy(deep=True)
+
+    def put(self, path: Path, schema: Type[T], stamp: tuple[int, int], model: T) -> None:
+        """Cache a freshly validated model (a private copy is stored)."""
+        key = (str(path), schema)
+        model = model.model_copy(deep=True)
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (stamp, model)
+            self._keys_by_path.setdefault(key[0], set()).add(key)
+            self._bytes += stamp[1]
+            while self._entries and (
+                len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+            ):
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def invalidate(self, path: Path) -> None:
+        """Drop all entries for a path (any schema)."""
+        with self._lock:
+            for key in list(self._keys_by_path.get(str(path), ())):
+                self._remove(key)
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_path.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict:
+        """Hit/miss counters and current size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+    def _remove(self, key: tuple[str, type]) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._bytes -= entry[0][1]
+        keys = self._keys_by_path.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_path[key[0]]
+
+
+_model_cache: Optional[ModelCache] = None
+
+
+def enable_model_cache(
+    max_entries: int = DEFAULT_MODEL_CACHE_ENTRIES,
+    max_bytes: int = DEFAULT_MODEL_CACHE_BYTES,
+) -> ModelCache:
+    """
+    Enable the process-level read_yaml model cache (idempotent).
+
+    Intended for short-lived processes such as one CLI invocation, where the
+    same files are parsed many times.
+
+    Returns:
+        The active ModelCache
+    """
+    global _model_cache
+    if _model_cache is None:
+        _model_cache = ModelCache(max_entries=max_entries, max_bytes=max_bytes)
+    return _model_cache
+
+
+def disable_model_cache() -> None:
+    """Disable and drop the process-level model cache."""
+    global _model_cache
+    _model_cache = None
+
+
+def get_model_cache() -> Optional[ModelCache]:
+    """Get the active model cache, or None if disabled."""
+    return _model_cache
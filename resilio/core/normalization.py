@@ -18,6 +18,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
+from resilio.core.keywords import match_note_flags
 from resilio.core.notes import detect_treadmill
 from resilio.core.paths import activities_month_dir
 from resilio.core.repository import RepositoryIO
@@ -127,6 +128,7 @@ def normalize_activity(
     - Surface type detection
     - Data quality assessment
     - Unit conversions
+    - Note keyword flags (injury/illness/travel)
 
     Args:
         raw: Raw activity from Strava or manual input
@@ -204,6 +206,7 @@ def normalize_activity(
         # User notes
         description=raw.description,
         private_note=raw.private_note,
+        note_flags=match_note_flags(raw.description, raw.private_note),
         # Strava-specific
         workout_type=raw.workout_type,
         suffer_score=raw.suffer_score,
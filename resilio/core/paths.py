@@ -12,21 +12,32 @@ Design:
 """
 
 from datetime import date
+from pathlib import Path
 from typing import Optional
 
 from resilio.core.config import load_config
 from resilio.core.repository import RepositoryIO
 
-# Cache config to avoid repeated file reads
+# Cache config to avoid repeated file reads. Keyed by repo root and the
+# settings file stamp so a long-lived process (`resilio serve`) sees edits.
 _config_cache: Optional[object] = None
-_config_cache_root: Optional[object] = None
+_config_cache_key: Optional[tuple] = None
+
+
+def _settings_stamp(repo_root: Path) -> Optional[tuple[int, int]]:
+    try:
+        stat = (repo_root / "config" / "settings.yaml").stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
 
 
 def _get_paths():
     """Get path settings from config (cached)."""
-    global _config_cache, _config_cache_root
+    global _config_cache, _config_cache_key
     repo = RepositoryIO()
-    if _config_cache is None or _config_cache_root != repo.repo_root:
+    key = (repo.repo_root, _settings_stamp(repo.repo_root))
+    if _config_cache is None or _config_cache_key != key:
         config_result = load_config(repo.repo_root)
         if hasattr(config_result, "error_type"):
             # Config load failed, use defaults
@@ -35,7 +46,7 @@ def _get_paths():
             _config_cache = PathSettings()
         else:
             _config_cache = config_result.settings.paths
-        _config_cache_root = repo.repo_root
+        _config_cache_key = key
     return _config_cache
 
 
@@ -157,6 +168,18 @@ def weekly_metrics_summary_path() -> str:
     return f"{get_metrics_dir()}/weekly_summary.yaml"
 
 
+def metrics_series_path(year: int) -> str:
+    """Get path to the columnar daily-metrics series for a year.
+
+    Args:
+        year: Calendar year
+
+    Returns:
+        Path to series file (e.g., "data/metrics/series/2026.bin")
+    """
+    return f"{get_metrics_dir()}/series/{year}.bin"
+
+
 # ==========================================================================
 # PLANS PATHS
 # ==========================================================================
@@ -173,6 +196,33 @@ def current_plan_path() -> str:
 
 
 
+def activity_index_path() -> str:
+    """Get path to the persistent activity index.
+
+    Returns:
+        Path to activity_index.sqlite (e.g., "data/state/activity_index.sqlite")
+    """
+    return f"{get_state_dir()}/activity_index.sqlite"
+
+
+def strava_cache_dir() -> str:
+    """Get directory for cached Strava API responses.
+
+    Returns:
+        Path to cache directory (e.g., "data/state/strava_cache")
+    """
+    return f"{get_state_dir()}/strava_cache"
+
+
+def vdot_estimate_cache_path() -> str:
+    """Get path to the cached current-VDOT estimates.
+
+    Returns:
+        Path to vdot_estimate_cache.json (e.g., "data/state/vdot_estimate_cache.json")
+    """
+    return f"{get_state_dir()}/vdot_estimate_cache.json"
+
+
 def approvals_state_path() -> str:
     """Get path to approvals state JSON."""
     return f"{get_state_dir()}/approvals.json"
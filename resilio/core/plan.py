@@ -30,7 +30,7 @@ from qualitative planning (Claude Code with athlete context).
 """
 
 from datetime import date, timedelta, datetime
-from typing import Optional
+from typing import Optional, Union
 from pathlib import Path
 import uuid
 import shutil
@@ -46,6 +46,8 @@ from resilio.schemas.plan import (
     MasterPlan,
 )
 from resilio.core.guardrails.volume import validate_workout_minimums
+from resilio.core.keywords import KeywordMatcher
+from resilio.core.markdown_log import MarkdownLog
 from resilio.core.paths import (
     current_plan_path,
     get_plans_dir,
@@ -58,6 +60,26 @@ from resilio.core.repository import RepositoryIO
 # Constants removed - weekly structures and day preferences now handled
 # by Claude Code in conversation based on athlete schedule and preferences
 
+# Entry headings of the append-only markdown logs (see markdown_log.py)
+TRAINING_LOG_HEADING = r"^## Week (\d+):"
+PLAN_REVIEW_HEADING = r"^## (📋 Plan Adaptation - .+|Adaptations)$"
+
+# Note keywords behind monthly-assessment injury/illness signals
+ADAPTATION_SIGNAL_KEYWORDS = KeywordMatcher({
+    "injury": {"pain", "hurt", "sore", "injury", "strain", "ache"},
+    "illness": {"sick", "ill", "cold", "flu", "fever", "tired"},
+})
+
+
+def training_log(path: Union[str, Path]) -> MarkdownLog:
+    """Training log at path, indexed by week number."""
+    return MarkdownLog(path, TRAINING_LOG_HEADING)
+
+
+def plan_review_log(path: Union[str, Path]) -> MarkdownLog:
+    """Plan review at path, indexed by adaptation."""
+    return MarkdownLog(path, PLAN_REVIEW_HEADING)
+
 
 # ============================================================
 # PERIODIZATION ALGORITHMS
@@ -1731,10 +1753,7 @@ def save_plan_review(
 
     # Save to repository
     target_path = current_plan_review_path()
-    target_abs_path = repo.resolve_path(target_path)
-
-    with open(target_abs_path, 'w') as f:
-        f.write(full_content)
+    plan_review_log(repo.resolve_path(target_path)).write(full_content)
 
     return {
         "saved_path": target_path,
@@ -1752,11 +1771,11 @@ def append_plan_adaptation(
     """Append plan adaptation to existing review markdown.
 
     Workflow:
-    1. Read existing review markdown from data/plans/current_plan_review.md
+    1. Check the review exists at data/plans/current_plan_review.md
     2. Read adaptation markdown from source file (e.g., /tmp/plan_adaptation_2026_02_15.md)
     3. Generate adaptation header block with date, reason, and context
-    4. Append adaptation content to existing review
-    5. Save updated review back to repository
+    4. Append header and adaptation content to the review (O_APPEND + fsync;
+       the existing review is not read)
 
     Args:
         adaptation_file_path: Path to adaptation markdown (e.g., /tmp/plan_adaptation_2026_02_15.md)
@@ -1782,18 +1801,15 @@ def append_plan_adaptation(
     if timestamp is None:
         timestamp = datetime.now()
 
-    # Read existing review
+    # Check existing review
     review_path = current_plan_review_path()
-    review_abs_path = repo.resolve_path(review_path)
+    review_log = plan_review_log(repo.resolve_path(review_path))
 
-    if not review_abs_path.exists():
+    if not review_log.exists():
         raise FileNotFoundError(
             f"Plan review not found. Generate and approve plan first with save_plan_review()"
         )
 
-    with open(review_abs_path, 'r') as f:
-        existing_content = f.read()
-
     # Read adaptation markdown
     if not os.path.exists(adaptation_file_path):
         raise FileNotFoundError(f"Adaptation file not found: {adaptation_file_path}")
@@ -1816,12 +1832,8 @@ def append_plan_adaptation(
 
 """
 
-    # Combine: existing + header + adaptation content
-    updated_content = existing_content + "\n" + adaptation_header + adaptation_content
-
-    # Save updated review
-    with open(review_abs_path, 'w') as f:
-        f.write(updated_content)
+    # Append header + adaptation content
+    review_log.append("\n" + adaptation_header + adaptation_content)
 
     return {
         "review_path": review_path,
@@ -1891,12 +1903,9 @@ def initialize_training_log(
 
 """
 
-    # Save log file
+    # Save log file (replaces any previous log and its index)
     log_path = current_training_log_path()
-    log_abs_path = repo.resolve_path(log_path)
-
-    with open(log_abs_path, 'w') as f:
-        f.write(log_content)
+    training_log(repo.resolve_path(log_path)).write(log_content)
 
     return {
         "log_path": log_path,
@@ -1952,18 +1961,15 @@ def append_weekly_summary(
         if field not in week_data:
             raise ValueError(f"Missing required field in week_data: {field}")
 
-    # Read existing log
+    # Check existing log
     log_path = current_training_log_path()
-    log_abs_path = repo.resolve_path(log_path)
+    log = training_log(repo.resolve_path(log_path))
 
-    if not log_abs_path.exists():
+    if not log.exists():
         raise FileNotFoundError(
             f"Training log not found. Initialize it first with initialize_training_log()"
         )
 
-    with open(log_abs_path, 'r') as f:
-        existing_content = f.read()
-
     # Get phase for this week
     week_obj = next((w for w in plan.weeks if w.week_number == week_data["week_number"]), None)
     phase_display = week_obj.phase.replace("_", " ").title() if week_obj else "Training"
@@ -2047,11 +2053,8 @@ You completed **{week_data['actual_volume_km']:.1f} km** of your planned {week_d
 
     week_summary += "\n---\n"
 
-    # Append to log
-    updated_content = existing_content + "\n" + week_summary
-
-    with open(log_abs_path, 'w') as f:
-        f.write(updated_content)
+    # Append to log (O_APPEND + fsync; the existing log is not read)
+    log.append("\n" + week_summary)
 
     return {
         "log_path": log_path,
@@ -2144,16 +2147,14 @@ def assess_monthly_completion(
     injury_signals = []
     illness_signals = []
     for activity in completed_activities:
-        description = activity.get("description", "").lower()
-        private_note = activity.get("private_note", "").lower()
-        combined = description + " " + private_note
+        signals = ADAPTATION_SIGNAL_KEYWORDS.match(activity.get("description"), activity.get("private_note"))
 
         # Injury keywords
-        if any(keyword in combined for keyword in ["pain", "hurt", "sore", "injury", "strain", "ache"]):
+        if signals["injury"]:
             injury_signals.append(f"Week {activity.get('week', '?')}: {activity.get('description', 'Activity')[:50]}...")
 
         # Illness keywords
-        if any(keyword in combined for keyword in ["sick", "ill", "cold", "flu", "fever", "tired"]):
+        if signals["illness"]:
             illness_signals.append(f"Week {activity.get('week', '?')}: {activity.get('description', 'Activity')[:50]}...")
 
     # Detect patterns (simple v0: just check for consistent day-of-week skips)
@@ -0,0 +1,93 @@
+"""
+Projection reads - Load only the fields an analysis needs.
+
+Some reads need a few fields that the activity index does not store, but a
+full NormalizedActivity read validates everything: laps, notes, timestamps,
+the `calculated` block. A projection validates only the requested fields:
+
+    fields = ("date", "sport_type", "distance_km")
+    record = repo.read_projection(path, NormalizedActivity, fields)
+    record.distance_km
+
+The record is an instance of a generated model holding just those fields,
+with the same types, defaults and config as the full schema (dates parsed,
+enum values as strings), so code written against the full model works on
+it unchanged. Fields that are not requested (e.g. laps) are never built.
+
+Callers:
+- activity_summary.summarize_entries: DETAIL_FIELDS of recent activities
+  (VDOT estimation pace window)
+- metrics._read_activities_for_date: WEEKLY_SUMMARY_FIELDS for weekly summaries
+- analysis.inputs.load_activity_inputs(include_notes=True): NOTE_INPUT_FIELDS
+  for gap cause detection
+"""
+
+from functools import lru_cache
+from typing import Any, Iterable, Type
+
+from pydantic import BaseModel, ConfigDict, create_model
+
+
+@lru_cache(maxsize=None)
+def projection_model(schema: Type[BaseModel], fields: tuple[str, ...]) -> Type[BaseModel]:
+    """
+    Model class holding a subset of a schema's fields (cached per field set).
+
+    Args:
+        schema: Full Pydantic model (e.g. NormalizedActivity)
+        fields: Field names to keep
+
+    Returns:
+        Model class validating only those fields; other keys are ignored
+
+    Raises:
+        ValueError: If a name is not a field of schema
+    """
+    unknown = [name for name in fields if name not in schema.model_fields]
+    if unknown:
+        raise ValueError(f"Unknown {schema.__name__} field(s): {', '.join(unknown)}")
+
+    config = ConfigDict(**{**schema.model_config, "extra": "ignore"})
+    definitions: dict[str, Any] = {
+        name: (schema.model_fields[name].annotation, schema.model_fields[name]) for name in fields
+    }
+    return create_model(
+        f"{schema.__name__}Projection",
+        __config__=config,
+        __module__=schema.__module__,
+        **definitions,
+    )
+
+
+def project(data: Any, schema: Type[BaseModel], fields: Iterable[str]) -> BaseModel:
+    """
+    Validate the projected fields of raw data (e.g. parsed YAML).
+
+    Args:
+        data: Mapping of field values
+        schema: Full Pydantic model the data conforms to
+        fields: Field names to validate
+
+    Returns:
+        Projection model instance
+
+    Raises:
+        ValueError: If data is not a mapping or the projected fields are invalid
+    """
+    if not isinstance(data, dict):
+        raise ValueError(f"Expected a mapping, got {type(data).__name__}")
+    fields = tuple(dict.fromkeys(fields))
+    model = projection_model(schema, fields)
+    return model.model_validate(_pick(data, schema, fields))
+
+
+def _pick(data: dict, schema: Type[BaseModel], fields: tuple[str, ...]) -> dict:
+    """Keys of data for the given fields, by field name or alias."""
+    picked = {}
+    for name in fields:
+        alias = schema.model_fields[name].alias
+        if alias and alias in data:
+            picked[alias] = data[alias]
+        elif name in data:
+            picked[name] = data[name]
+    return picked
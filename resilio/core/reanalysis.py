@@ -0,0 +1,163 @@
+"""
+Reanalysis - Recompute stored activity analysis in bulk.
+
+When RPE heuristics (core/notes.py), load multipliers (core/load.py), the
+note-flag vocabulary (core/keywords.py) or the athlete's profile (VDOT,
+max HR) change, the `calculated` blocks and `note_flags` stored on
+activities go stale. reanalyze_activities() re-runs analyze_activity ->
+select_best_rpe_estimate -> compute_load (and note-flag matching) over every
+activity in a date range.
+
+Activities are split into chunks processed by a process pool, each worker
+reading, analyzing and (only when the result differs) rewriting its files.
+Activity-index updates happen in the parent, which owns the index
+connection, followed by one incremental metrics recompute over all changed
+dates.
+"""
+
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from resilio.core.keywords import match_note_flags
+from resilio.core.load import compute_load
+from resilio.core.notes import analyze_activity
+from resilio.core.profile import ProfileService
+from resilio.core.repository import RepositoryIO
+from resilio.core.workflows import WorkflowLock, select_best_rpe_estimate, update_metrics_incremental
+from resilio.schemas.activity import NormalizedActivity
+from resilio.schemas.repository import RepoError
+
+logger = logging.getLogger(__name__)
+
+# Activity files per worker task
+REANALYZE_CHUNK_SIZE = 64
+
+
+@dataclass
+class ReanalysisResult:
+    """Result from reanalyze_activities."""
+
+    activities_scanned: int = 0
+    activities_changed: int = 0
+    activities_failed: int = 0
+    changed_dates: list[date] = field(default_factory=list)
+    metrics_computed: int = 0
+    workers: int = 1
+    errors: list[str] = field(default_factory=list)
+
+
+def reanalyze_activities(
+    repo: RepositoryIO,
+    since: Optional[date] = None,
+    workers: Optional[int] = None,
+) -> ReanalysisResult:
+    """
+    Recompute loads and note flags for stored activities.
+
+    Args:
+        repo: Repository
+        since: Only activities on or after this date (None = all history)
+        workers: Worker processes (default: CPU count; 1 = in-process)
+
+    Returns:
+        ReanalysisResult with counts, changed dates and metrics recomputed
+
+    Raises:
+        WorkflowLockError: If another workflow (e.g. sync) holds the lock
+    """
+    workers = max(1, workers or os.cpu_count() or 1)
+    result = ReanalysisResult(workers=workers)
+
+    with WorkflowLock(operation="reanalyze", repo=repo):
+        profile = ProfileService(repo).load_profile()
+        paths = [entry.path for entry in repo.activity_index().query(start_date=since)]
+        result.activities_scanned = len(paths)
+        chunks = [paths[i : i + REANALYZE_CHUNK_SIZE] for i in range(0, len(paths), REANALYZE_CHUNK_SIZE)]
+
+        changed_dates: set[date] = set()
+        for outcomes in _run_chunks(str(repo.repo_root), chunks, profile, workers):
+            for path, updated, error in outcomes:
+                if error is not None:
+                    result.activities_failed += 1
+                    result.errors.append(f"{path}: {error}")
+                elif updated is not None:
+                    repo.record_written(path, updated)
+                    result.activities_changed += 1
+                    changed_dates.add(updated.date)
+
+        result.changed_dates = sorted(changed_dates)
+        if changed_dates:
+            metrics = update_metrics_incremental(repo, changed_dates, end_date=max(max(changed_dates), date.today()))
+            result.metrics_computed = metrics["metrics_computed"]
+
+    logger.info(
+        "[Reanalyze] %s scanned, %s changed, %s failed",
+        result.activities_scanned,
+        result.activities_changed,
+        result.activities_failed,
+    )
+    return result
+
+
+def _run_chunks(
+    repo_root: str,
+    chunks: list[list[str]],
+    profile: Any,
+    workers: int,
+) -> Iterator[list[tuple[str, Optional[NormalizedActivity], Optional[str]]]]:
+    """Yield per-chunk outcomes, in-process or from a process pool."""
+    if workers == 1 or len(chunks) <= 1:
+        for chunk in chunks:
+            yield _reanalyze_chunk(repo_root, chunk, profile)
+        return
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+        yield from executor.map(_reanalyze_chunk, [repo_root] * len(chunks), chunks, [profile] * len(chunks))
+
+
+def _reanalyze_chunk(
+    repo_root: str,
+    paths: list[str],
+    profile: Any,
+) -> list[tuple[str, Optional[NormalizedActivity], Optional[str]]]:
+    """
+    Reanalyze one chunk of activity files (runs in a worker process).
+
+    Only files whose load or note flags changed are rewritten. Returns
+    (path, updated activity or None if unchanged, error message or None)
+    per file; the caller updates derived indexes.
+    """
+    repo = RepositoryIO()
+    repo.repo_root = Path(repo_root)
+
+    outcomes = []
+    for path in paths:
+        try:
+            activity = repo.read_yaml(path, NormalizedActivity)
+            if isinstance(activity, RepoError):
+                outcomes.append((path, None, activity.message))
+                continue
+
+            analysis = analyze_activity(activity, profile)
+            load = compute_load(activity, select_best_rpe_estimate(analysis.rpe_estimates))
+            note_flags = match_note_flags(activity.description, activity.private_note)
+            if activity.calculated == load and activity.note_flags == note_flags:
+                outcomes.append((path, None, None))
+                continue
+
+            activity.calculated = load
+            activity.note_flags = note_flags
+            content = repo.serialize_for_write(activity)
+            error = content if isinstance(content, RepoError) else repo.write_serialized(path, content)
+            if error is not None:
+                outcomes.append((path, None, error.message))
+            else:
+                outcomes.append((path, activity, None))
+        except Exception as e:
+            outcomes.append((path, None, str(e)))
+    return outcomes
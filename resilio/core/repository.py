@@ -3,19 +3,34 @@ M3 - Repository I/O
 
 Centralized file system operations for all data persistence.
 Handles YAML/JSON read/write, atomic writes, file locking, schema validation.
+YAML goes through core/serialization.py (libyaml when available).
 """
 
-import yaml
+import logging
 from pathlib import Path
-from typing import Optional, Type, TypeVar, Union
+from typing import Iterable, Optional, Type, TypeVar, Union
 
 from pydantic import BaseModel
 
 from resilio.core.config import get_repo_root
+from resilio.core.model_cache import (  # noqa: F401 - re-exported
+    DEFAULT_MODEL_CACHE_BYTES,
+    DEFAULT_MODEL_CACHE_ENTRIES,
+    ModelCache,
+    disable_model_cache,
+    enable_model_cache,
+    get_model_cache,
+)
+from resilio.core.projection import project
+from resilio.core.serialization import YAMLError, load_yaml, serialize
+from resilio.schemas.activity import NormalizedActivity
+from resilio.schemas.metrics import DailyMetrics
 from resilio.schemas.repository import RepoError, RepoErrorType, ReadOptions
 
 T = TypeVar("T", bound=BaseModel)
 
+logger = logging.getLogger(__name__)
+
 
 class RepositoryIO:
     """Centralized repository for file I/O operations."""
@@ -29,6 +44,8 @@ class RepositoryIO:
         """
         self.config = config
         self.repo_root = get_repo_root()
+        self._activity_index = None
+        self._metrics_store = None
 
     def resolve_path(self, relative_path: str | Path) -> Path:
         """
@@ -65,8 +82,12 @@ class RepositoryIO:
         options = options or ReadOptions()
         resolved_path = self.resolve_path(path)
 
-        # Check file exists
-        if not resolved_path.exists():
+        # Check file exists (the stat doubles as the model cache stamp)
+        try:
+            stat = resolved_path.stat()
+        except OSError:
+            stat = None
+        if stat is None:
             if options.allow_missing:
                 return None
             return RepoError(
@@ -75,11 +96,18 @@ class RepositoryIO:
                 path=str(resolved_path),
             )
 
+        cache = get_model_cache() if options.use_cache else None
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if cache is not None:
+            cached = cache.get(resolved_path, schema, stamp)
+            if cached is not None:
+                return cached
+
         # Read and parse
         try:
-            with open(resolved_path) as f:
-                data = yaml.safe_load(f)
-        except yaml.YAMLError as e:
+            with open(resolved_path, encoding="utf-8") as f:
+                data = load_yaml(f)
+        except YAMLError as e:
             return RepoError(
                 error_type=RepoErrorType.PARSE_ERROR,
                 message=str(e),
@@ -89,15 +117,74 @@ class RepositoryIO:
         # Validate against schema
         if options.should_validate:
             try:
-                return schema.model_validate(data)
+                model = schema.model_validate(data)
             except Exception as e:
                 return RepoError(
                     error_type=RepoErrorType.VALIDATION_ERROR,
                     message=f"Validation failed: {e}",
                     path=str(resolved_path),
                 )
+        else:
+            # Trusted data (e.g. files this code wrote): build without validation
+            if not isinstance(data, dict):
+                return RepoError(
+                    error_type=RepoErrorType.VALIDATION_ERROR,
+                    message=f"Expected a mapping, got {type(data).__name__}",
+                    path=str(resolved_path),
+                )
+            # Unvalidated models keep raw values (e.g. date strings): never cache them
+            return schema.model_construct(**data)
 
-        return schema.model_validate(data)
+        if cache is not None:
+            cache.put(resolved_path, schema, stamp, model)
+        return model
+
+    def read_projection(
+        self,
+        path: str | Path,
+        schema: Type[BaseModel],
+        fields: Iterable[str],
+    ) -> Union[BaseModel, RepoError]:
+        """
+        Read a YAML file, validating only some of its fields.
+
+        Skips everything a full read_yaml() builds but the caller does not
+        need (laps, notes, nested blocks). See core/projection.py.
+
+        Args:
+            path: Path to YAML file (relative to repo root)
+            schema: Pydantic model the file conforms to
+            fields: Field names to validate
+
+        Returns:
+            Projection record, or RepoError
+        """
+        resolved_path = self.resolve_path(path)
+
+        try:
+            with open(resolved_path, encoding="utf-8") as f:
+                data = load_yaml(f)
+        except FileNotFoundError:
+            return RepoError(
+                error_type=RepoErrorType.FILE_NOT_FOUND,
+                message=f"File not found",
+                path=str(resolved_path),
+            )
+        except YAMLError as e:
+            return RepoError(
+                error_type=RepoErrorType.PARSE_ERROR,
+                message=str(e),
+                path=str(resolved_path),
+            )
+
+        try:
+            return project(data, schema, fields)
+        except Exception as e:
+            return RepoError(
+                error_type=RepoErrorType.VALIDATION_ERROR,
+                message=f"Validation failed: {e}",
+                path=str(resolved_path),
+            )
 
     def file_exists(self, path: str | Path) -> bool:
         """
@@ -132,6 +219,7 @@ class RepositoryIO:
         path: str | Path,
         data: Union[BaseModel, dict, list],
         atomic: bool = True,
+        file_format: str = "yaml",
     ) -> Optional["RepoError"]:
         """
         Write data to a YAML file with optional atomic write.
@@ -140,37 +228,99 @@ class RepositoryIO:
             path: Path to YAML file (relative to repo root)
             data: Pydantic model, dict, or list to serialize
             atomic: Use atomic write (default: True)
+            file_format: "yaml" (default) or "json" for machine-only files;
+                JSON is valid YAML, so read_yaml reads both (JSON much faster)
 
         Returns:
             None on success, RepoError on failure
         """
+        content = self.serialize_for_write(data, file_format)
+        if isinstance(content, RepoError):
+            return content
+
         resolved_path = self.resolve_path(path)
+        error = self.write_serialized(resolved_path, content, atomic=atomic)
+        self.record_written(resolved_path, data if error is None else None)
+        return error
 
-        # Ensure parent directory exists
-        resolved_path.parent.mkdir(parents=True, exist_ok=True)
+    def serialize_for_write(
+        self,
+        data: Union[BaseModel, dict, list],
+        file_format: str = "yaml",
+    ) -> Union[str, "RepoError"]:
+        """
+        Serialize data the way write_yaml() stores it, without touching disk.
+
+        Args:
+            data: Pydantic model, dict, or list to serialize
+            file_format: "yaml" (default) or "json"
 
-        # Serialize to YAML
+        Returns:
+            File content, or RepoError if serialization failed
+        """
         try:
             payload = data.model_dump(mode='json') if isinstance(data, BaseModel) else data
-            yaml_content = yaml.safe_dump(payload, sort_keys=False, allow_unicode=True)
+            return serialize(payload, file_format)
         except Exception as e:
             return RepoError(
                 error_type=RepoErrorType.VALIDATION_ERROR,
                 message=f"Serialization failed: {e}",
             )
 
+    def write_serialized(
+        self, path: str | Path, content: str, atomic: bool = True
+    ) -> Optional["RepoError"]:
+        """
+        Write already-serialized content (file system only).
+
+        Does not touch the model cache or the derived activity/metrics
+        indexes, so it is safe to call from a background thread; the caller
+        must call record_written() afterwards on the repository's thread.
+
+        Args:
+            path: Target path (relative to repo root, or already resolved)
+            content: Serialized file content
+            atomic: Use atomic write (default: True)
+
+        Returns:
+            None on success, RepoError on failure
+        """
+        resolved_path = self.resolve_path(path)
+
+        # Ensure parent directory exists
+        resolved_path.parent.mkdir(parents=True, exist_ok=True)
+
         if atomic:
-            return self._atomic_write(resolved_path, yaml_content)
-        else:
-            try:
-                resolved_path.write_text(yaml_content)
-                return None
-            except Exception as e:
-                return RepoError(
-                    error_type=RepoErrorType.WRITE_ERROR,
-                    message=str(e),
-                    path=str(resolved_path),
-                )
+            return self._atomic_write(resolved_path, content)
+        try:
+            resolved_path.write_text(content)
+            return None
+        except Exception as e:
+            return RepoError(
+                error_type=RepoErrorType.WRITE_ERROR,
+                message=str(e),
+                path=str(resolved_path),
+            )
+
+    def record_written(
+        self, path: str | Path, data: Optional[Union[BaseModel, dict, list]]
+    ) -> None:
+        """
+        Update the model cache and derived indexes after a file write.
+
+        Args:
+            path: Written path (relative to repo root, or already resolved)
+            data: What was written, or None if the write failed (only the
+                  cache entry is dropped)
+        """
+        resolved_path = self.resolve_path(path)
+        cache = get_model_cache()
+        if cache is not None:
+            cache.invalidate(resolved_path)
+        if isinstance(data, NormalizedActivity):
+            self._update_activity_index(resolved_path, data)
+        elif isinstance(data, DailyMetrics):
+            self._update_metrics_store(resolved_path, data)
 
     def _atomic_write(self, path: Path, content: str) -> Optional["RepoError"]:
         """
@@ -481,7 +631,6 @@ class RepositoryIO:
 
         try:
             resolved_path.unlink()
-            return None
         except Exception as e:
             return RepoError(
                 error_type=RepoErrorType.WRITE_ERROR,
@@ -489,6 +638,89 @@ class RepositoryIO:
                 path=str(resolved_path),
             )
 
+        cache = get_model_cache()
+        if cache is not None:
+            cache.invalidate(resolved_path)
+        if resolved_path.suffix == ".yaml":
+            self._update_activity_index(resolved_path, None)
+            self._update_metrics_store(resolved_path, None)
+        return None
+
+    # ============================================================
+    # ACTIVITY INDEX
+    # ============================================================
+
+    def activity_index(self) -> "ActivityIndex":
+        """
+        Get the persistent activity index for this repository (opened lazily).
+
+        Returns:
+            ActivityIndex shared by this RepositoryIO instance
+        """
+        from resilio.core.activity_index import ActivityIndex
+
+        if self._activity_index is None:
+            self._activity_index = ActivityIndex(self)
+        return self._activity_index
+
+    def _update_activity_index(
+        self, path: Path, activity: Optional[NormalizedActivity]
+    ) -> None:
+        """
+        Keep the activity index in sync after a write (activity) or delete (None).
+
+        Best-effort: the index re-validates file stamps on read, so a failure
+        here only costs a re-parse later and must never fail the write.
+        """
+        from resilio.core.activity_index import is_activity_path
+
+        try:
+            if not is_activity_path(self, path):
+                return
+            if activity is None:
+                self.activity_index().record_delete(path)
+            else:
+                self.activity_index().record_write(path, activity)
+        except Exception as e:
+            logger.debug("Activity index update skipped for %s: %s", path, e)
+
+    # ============================================================
+    # METRICS STORE
+    # ============================================================
+
+    def metrics_store(self) -> "MetricsStore":
+        """
+        Get the columnar daily-metrics store for this repository (created lazily).
+
+        Returns:
+            MetricsStore shared by this RepositoryIO instance
+        """
+        from resilio.core.metrics_store import MetricsStore
+
+        if self._metrics_store is None:
+            self._metrics_store = MetricsStore(self)
+        return self._metrics_store
+
+    def _update_metrics_store(self, path: Path, metrics: Optional[DailyMetrics]) -> None:
+        """
+        Keep the metrics store in sync after a write (metrics) or delete (None).
+
+        Best-effort, like the activity index: the store re-validates file
+        stamps on read, so a failure here must never fail the write.
+        """
+        from resilio.core.metrics_store import is_daily_metrics_path
+
+        try:
+            day = is_daily_metrics_path(self, path)
+            if day is None:
+                return
+            if metrics is None:
+                self.metrics_store().remove(day)
+            else:
+                self.metrics_store().record(metrics, path)
+        except Exception as e:
+            logger.debug("Metrics store update skipped for %s: %s", path, e)
+
     # ============================================================
     # DIRECTORY OPERATIONS
     # ============================================================
@@ -0,0 +1,160 @@
+"""
+Serialization - Central YAML/JSON encoding and decoding.
+
+All YAML I/O goes through this module so the C-accelerated libyaml
+loader/dumper is used whenever PyYAML was built with it, with a clean
+fallback to the pure-Python implementation otherwise.
+
+It also provides JSON helpers (orjson when installed, stdlib json otherwise)
+for machine-only files such as data/metrics/daily/*.yaml. JSON is a subset of
+YAML, so those files keep their .yaml extension and stay readable by any YAML
+tool, while load_yaml() detects them and uses the much faster JSON parser.
+
+Usage:
+    from resilio.core.serialization import load_yaml, dump_yaml
+
+    data = load_yaml(path.read_text())
+    text = dump_yaml(data)
+"""
+
+import json
+from typing import IO, Any, Optional, Union
+
+import yaml
+
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+
+    LIBYAML_AVAILABLE = True
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper, SafeLoader
+
+    LIBYAML_AVAILABLE = False
+
+try:
+    import orjson
+except ImportError:  # Optional speedup
+    orjson = None
+
+ORJSON_AVAILABLE = orjson is not None
+
+# Re-exported so callers only need this module
+YAMLError = yaml.YAMLError
+
+# On-disk formats accepted by RepositoryIO.write_yaml
+FILE_FORMATS = ("yaml", "json")
+
+
+def load_yaml(source: Union[str, bytes, IO]) -> Any:
+    """
+    Parse YAML (or JSON, which is valid YAML) into Python objects.
+
+    Documents that look like JSON are parsed with the JSON parser first and
+    fall back to YAML if that fails.
+
+    Args:
+        source: YAML text, bytes, or an open file
+
+    Returns:
+        Parsed data (None for an empty document)
+
+    Raises:
+        YAMLError: If the document is not valid YAML
+    """
+    if hasattr(source, "read"):
+        source = source.read()
+    if isinstance(source, bytes):
+        source = source.decode("utf-8")
+
+    if source.lstrip()[:1] in ("{", "["):
+        try:
+            return load_json(source)
+        except ValueError:
+            pass
+
+    return yaml.load(source, Loader=SafeLoader)
+
+
+def dump_yaml(
+    data: Any,
+    stream: Optional[IO] = None,
+    *,
+    sort_keys: bool = False,
+    allow_unicode: bool = True,
+    default_flow_style: bool = False,
+) -> Optional[str]:
+    """
+    Serialize data to block-style YAML (same output as yaml.safe_dump).
+
+    Args:
+        data: Plain Python data (dicts, lists, scalars)
+        stream: Optional open file to write to
+        sort_keys: Sort mapping keys (default: keep insertion order)
+        allow_unicode: Write non-ASCII characters as-is
+        default_flow_style: Use flow style for collections
+
+    Returns:
+        YAML text if no stream was given, otherwise None
+
+    Raises:
+        YAMLError: If data contains unrepresentable objects
+    """
+    return yaml.dump(
+        data,
+        stream,
+        Dumper=SafeDumper,
+        sort_keys=sort_keys,
+        allow_unicode=allow_unicode,
+        default_flow_style=default_flow_style,
+    )
+
+
+def load_json(source: Union[str, bytes]) -> Any:
+    """
+    Parse JSON text.
+
+    Raises:
+        ValueError: If the text is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(source)
+    return json.loads(source)
+
+
+def dump_json(data: Any, indent: bool = True) -> str:
+    """
+    Serialize data to JSON text (UTF-8, keys in insertion order).
+
+    Args:
+        data: JSON-compatible data
+        indent: Pretty-print with 2-space indentation
+
+    Returns:
+        JSON text
+
+    Raises:
+        TypeError: If data is not JSON-serializable
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(data, option=option).decode("utf-8")
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False)
+
+
+def serialize(data: Any, file_format: str = "yaml") -> str:
+    """
+    Serialize data in one of FILE_FORMATS.
+
+    Args:
+        data: Plain Python data
+        file_format: "yaml" (human-edited files) or "json" (machine-only files)
+
+    Returns:
+        Serialized text (JSON output ends with a newline, like YAML)
+    """
+    if file_format == "yaml":
+        return dump_yaml(data)
+    if file_format == "json":
+        return dump_json(data) + "\n"
+    raise ValueError(f"Unknown file format: {file_format!r} (expected one of {FILE_FORMATS})")
@@ -10,7 +10,8 @@ This module handles:
 - Activity list fetching with pagination
 - Activity detail fetching (including private notes)
 - Two-tier deduplication (primary key + fuzzy matching)
-- Rate limiting with exponential backoff
+- Rate limiting (header-driven token bucket) with exponential backoff
+- Concurrent detail/lap fetching during sync
 - Manual activity logging
 
 OAuth Flow:
@@ -22,10 +23,15 @@ OAuth Flow:
 6. Check expiration before each API call, refresh if needed
 """
 
-from datetime import datetime, timezone, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from datetime import date, datetime, timezone, timedelta
 from typing import Optional, Callable
 from uuid import uuid4
+import hashlib
+import json
 import logging
+import threading
 import time
 
 import httpx
@@ -37,6 +43,7 @@ from tenacity import (
 )
 
 from resilio.core.config import load_config, ConfigError
+from resilio.core.http_cache import ResponseCache
 from resilio.core.repository import RepositoryIO
 from resilio.schemas.activity import (
     ActivitySource,
@@ -93,7 +100,125 @@ DEFAULT_SYNC_LOOKBACK_DAYS = 365
 
 # Rate limits (Strava defaults)
 DEFAULT_RETRY_ATTEMPTS = 3
-DEFAULT_WAIT_BETWEEN_REQUESTS = 1.0  # seconds
+DEFAULT_MAX_REQUESTS_PER_SECOND = 5.0
+DEFAULT_FETCH_WORKERS = 4
+DEFAULT_MAX_CONNECTIONS = 10  # Pooled keep-alive connections per session
+
+# Strava's short-term quota resets on quarter-hour boundaries, the daily quota
+# at midnight UTC
+RATE_LIMIT_SHORT_WINDOW_SECONDS = 15 * 60
+RATE_LIMIT_DAILY_WINDOW_SECONDS = 24 * 60 * 60
+
+
+# ============================================================
+# RATE LIMITING
+# ============================================================
+
+
+class StravaRateLimiter:
+    """
+    Thread-safe token-bucket limiter driven by Strava's rate-limit headers.
+
+    The bucket paces requests (refills at requests_per_second, holds at most
+    one second's worth of tokens). Quota comes from the response headers:
+    X-RateLimit-Limit / X-RateLimit-Usage (or the X-ReadRateLimit-* pair when
+    present) carry "15min,daily" values. Once either window is spent,
+    acquire() raises StravaRateLimitError instead of sending a request that
+    Strava would answer with 429.
+
+    Until the first response arrives the quota is unknown and only the
+    bucket applies.
+    """
+
+    def __init__(self, requests_per_second: float = DEFAULT_MAX_REQUESTS_PER_SECOND):
+        self.requests_per_second = max(requests_per_second, 0.1)
+        self.capacity = max(1.0, self.requests_per_second)
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+        # [remaining, window_end_unix] per quota window (short, daily)
+        self._quota: list[Optional[list[float]]] = [None, None]
+
+    def acquire(self) -> None:
+        """
+        Block until a request may be sent.
+
+        Raises:
+            StravaRateLimitError: If the known quota for a window is spent
+        """
+        while True:
+            with self._lock:
+                self._check_quota()
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._last_refill) * self.requests_per_second,
+                )
+                self._last_refill = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    for window in self._quota:
+                        if window is not None:
+                            window[0] -= 1
+                    return
+                wait = (1.0 - self._tokens) / self.requests_per_second
+            time.sleep(wait)
+
+    def update_from_headers(self, headers) -> None:
+        """
+        Update the remaining quota from a Strava response's headers.
+
+        Args:
+            headers: Response headers (missing or malformed values are ignored)
+        """
+        limits = _parse_rate_limit_pair(headers, "X-ReadRateLimit-Limit") or _parse_rate_limit_pair(
+            headers, "X-RateLimit-Limit"
+        )
+        usage = _parse_rate_limit_pair(headers, "X-ReadRateLimit-Usage") or _parse_rate_limit_pair(
+            headers, "X-RateLimit-Usage"
+        )
+        if limits is None or usage is None:
+            return
+
+        now = time.time()
+        windows = (RATE_LIMIT_SHORT_WINDOW_SECONDS, RATE_LIMIT_DAILY_WINDOW_SECONDS)
+        with self._lock:
+            for i, (window_seconds, limit, used) in enumerate(zip(windows, limits, usage)):
+                window_end = (now // window_seconds + 1) * window_seconds
+                remaining = limit - used
+                current = self._quota[i]
+                # Responses can arrive out of order: within a window keep the
+                # lower count (it already accounts for requests in flight)
+                if current is not None and current[1] == window_end:
+                    remaining = min(remaining, current[0])
+                self._quota[i] = [remaining, window_end]
+
+    def _check_quota(self) -> None:
+        now = time.time()
+        for i, window in enumerate(self._quota):
+            if window is None:
+                continue
+            remaining, window_end = window
+            if now >= window_end:
+                # Window rolled over; quota unknown until the next response
+                self._quota[i] = None
+            elif remaining <= 0:
+                raise StravaRateLimitError(
+                    "Rate limit quota exhausted",
+                    retry_after=int(window_end - now) + 1,
+                )
+
+
+def _parse_rate_limit_pair(headers, name: str) -> Optional[tuple[int, int]]:
+    """Parse a "short,daily" rate-limit header into two ints."""
+    try:
+        value = headers.get(name)
+        if not isinstance(value, str):
+            return None
+        short, daily = value.split(",")
+        return int(short), int(daily)
+    except (AttributeError, ValueError, TypeError):
+        return None
 
 
 # ============================================================
@@ -273,21 +398,341 @@ def store_tokens(config: Config, tokens: dict) -> None:
 
 
 # ============================================================
-# ACTIVITY FETCHING
+# API SESSION
 # ============================================================
 
 
-@retry(
-    stop=stop_after_attempt(DEFAULT_RETRY_ATTEMPTS),
-    wait=wait_exponential(multiplier=2, min=2, max=8),
-    retry=retry_if_exception_type((httpx.HTTPError, StravaAPIError)),
+class StravaSession:
+    """
+    Long-lived Strava API session.
+
+    Owns one pooled httpx client (keep-alive connections, HTTP/2 when the
+    optional h2 package is installed) and caches the valid access token in
+    memory until it is about to expire, so repeated calls skip both the
+    TCP/TLS handshake and the token check. Safe to share between threads.
+
+    With a ResponseCache, GET responses are served from disk while fresh,
+    revalidated with If-None-Match / If-Modified-Since once stale, and
+    detail/lap payloads are reused whenever the activity summary they were
+    fetched for is unchanged.
+
+    Usage:
+        with StravaSession(config) as session:
+            page = session.fetch_activities(per_page=50)
+            detail = session.fetch_activity_details(str(page[0]["id"]))
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        rate_limiter: Optional[StravaRateLimiter] = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        cache: Optional[ResponseCache] = None,
+    ):
+        """
+        Open a session.
+
+        Args:
+            config: Configuration with Strava credentials
+            rate_limiter: Optional limiter to pace requests and record quota
+            max_connections: Connection pool size (keep >= concurrent workers)
+            cache: Optional on-disk response cache
+        """
+        self.config = config
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.api_base = config.settings.strava.api_base_url.rstrip("/")
+        self._exit_stack = ExitStack()
+        self._client = self._exit_stack.enter_context(
+            httpx.Client(
+                http2=_http2_available(),
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_connections,
+                ),
+                timeout=30.0,
+            )
+        )
+        self._token_lock = threading.Lock()
+        self._access_token: Optional[str] = None
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        self._exit_stack.close()
+
+    def __enter__(self) -> "StravaSession":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def access_token(self) -> str:
+        """
+        Get a valid access token, refreshing only when near expiry.
+
+        Returns:
+            Valid access token
+
+        Raises:
+            StravaAuthError: If token refresh fails
+        """
+        with self._token_lock:
+            expires_at = self.config.secrets.strava.token_expires_at
+            if self._access_token is None or expires_at - int(time.time()) < 300:
+                self._access_token = get_valid_token(self.config)
+            return self._access_token
+
+    def _get(
+        self,
+        path: str,
+        params: Optional[dict] = None,
+        max_age: Optional[float] = None,
+        tag: Optional[str] = None,
+    ) -> httpx.Response:
+        """
+        Send an authenticated GET and handle auth/rate-limit responses.
+
+        Args:
+            path: API path (e.g. "/athlete/activities")
+            params: Query parameters
+            max_age: Cache freshness override in seconds (0 = always revalidate)
+            tag: Cache validator; a cached entry with the same tag is served
+                without contacting Strava
+
+        Raises:
+            StravaAuthError: On 401
+            StravaRateLimitError: On 429 or when the known quota is spent
+        """
+        url = f"{self.api_base}{path}"
+        cache_key = None
+        cached = None
+        if self.cache is not None:
+            cache_key = self.cache.make_key(url, params)
+            cached = self.cache.get(cache_key)
+            if cached is not None and (
+                (tag is not None and cached.tag == tag) or self.cache.is_fresh(cached, max_age)
+            ):
+                self.cache.record_hit()
+                return cached.to_response()
+            self.cache.record_miss()
+
+        access_token = self.access_token()
+        headers = {"Authorization": f"Bearer {access_token}"}
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+
+        response = self._client.get(url, headers=headers, params=params)
+        if self.rate_limiter is not None:
+            self.rate_limiter.update_from_headers(response.headers)
+
+        if response.status_code == 304 and cached is not None:
+            self.cache.touch(cached)
+            return cached.to_response()
+
+        if response.status_code == 401:
+            raise StravaAuthError("Invalid or expired token")
+        elif response.status_code == 429:
+            retry_after = response.headers.get("Retry-After")
+            raise StravaRateLimitError(
+                "Rate limit exceeded",
+                retry_after=int(retry_after) if retry_after else None,
+            )
+
+        if self.cache is not None and response.status_code == 200:
+            self.cache.put(
+                cache_key,
+                url,
+                response.text,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                tag=tag,
+            )
+        return response
+
+    @retry(
+        stop=stop_after_attempt(DEFAULT_RETRY_ATTEMPTS),
+        wait=wait_exponential(multiplier=2, min=2, max=8),
+        retry=retry_if_exception_type((httpx.HTTPError, StravaAPIError)),
+    )
+    def fetch_activities(
+        self,
+        page: int = 1,
+        per_page: int = 50,
+        after: Optional[int] = None,
+        before: Optional[int] = None,
+    ) -> list[dict]:
+        """Fetch activity list page. See fetch_activities()."""
+        params = {
+            "page": page,
+            "per_page": min(per_page, 200),  # Cap at Strava max
+        }
+        if after:
+            params["after"] = after
+        if before:
+            params["before"] = before
+
+        try:
+            # The newest page (no "before" cursor) gains new uploads, so it is
+            # always revalidated; older pages are served while fresh
+            response = self._get(
+                "/athlete/activities",
+                params=params,
+                max_age=None if before else 0,
+            )
+
+            if response.status_code != 200:
+                raise StravaAPIError(
+                    f"API request failed: {response.status_code} - {response.text}",
+                    status_code=response.status_code,
+                )
+
+            return response.json()
+
+        except httpx.HTTPError as e:
+            raise StravaAPIError(f"HTTP error: {e}")
+
+    @retry(
+        stop=stop_after_attempt(DEFAULT_RETRY_ATTEMPTS),
+        wait=wait_exponential(multiplier=2, min=2, max=8),
+        retry=retry_if_exception_type((httpx.HTTPError, StravaAPIError)),
+    )
+    def fetch_activity_details(self, activity_id: str, summary_tag: Optional[str] = None) -> dict:
+        """Fetch full activity details. See fetch_activity_details()."""
+        try:
+            response = self._get(f"/activities/{activity_id}", tag=summary_tag)
+
+            if response.status_code != 200:
+                raise StravaAPIError(
+                    f"Activity detail fetch failed: {response.status_code}",
+                    status_code=response.status_code,
+                )
+
+            return response.json()
+
+        except httpx.HTTPError as e:
+            raise StravaAPIError(f"HTTP error: {e}")
+
+    @retry(
+        stop=stop_after_attempt(DEFAULT_RETRY_ATTEMPTS),
+        wait=wait_exponential(multiplier=2, min=2, max=8),
+        retry=retry_if_exception_type((httpx.HTTPError, StravaAPIError)),
+    )
+    def fetch_athlete_profile(self) -> Optional[dict]:
+        """Fetch the authenticated athlete's profile. See fetch_athlete_profile()."""
+        try:
+            response = self._get("/athlete")
+
+            if response.status_code != 200:
+                raise StravaAPIError(
+                    f"Athlete profile fetch failed: {response.status_code}",
+                    status_code=response.status_code,
+                )
+
+            return response.json()
+
+        except httpx.HTTPError as e:
+            raise StravaAPIError(f"HTTP error: {e}")
+
+    @retry(
+        stop=stop_after_attempt(DEFAULT_RETRY_ATTEMPTS),
+        wait=wait_exponential(multiplier=2, min=2, max=8),
+        retry=retry_if_exception_type((httpx.HTTPError, StravaAPIError)),
+    )
+    def fetch_activity_laps(
+        self, activity_id: str, summary_tag: Optional[str] = None
+    ) -> Optional[list[dict]]:
+        """Fetch lap data for an activity. See fetch_activity_laps()."""
+        logger = logging.getLogger(__name__)
+
+        try:
+            response = self._get(f"/activities/{activity_id}/laps", tag=summary_tag)
+
+            if response.status_code == 404:
+                # Activity exists but has no laps (normal case)
+                logger.debug(f"No laps found for activity {activity_id}")
+                return None
+            elif response.status_code != 200:
+                # Non-fatal error: log and continue without laps
+                logger.warning(
+                    f"Failed to fetch laps for {activity_id}: "
+                    f"{response.status_code} - {response.text}"
+                )
+                return None
+
+            laps = response.json()
+            return laps if laps else None
+
+        except httpx.HTTPError as e:
+            logger.warning(f"HTTP error fetching laps for {activity_id}: {e}")
+            return None
+
+
+# Summary fields that change when an activity is edited (social counters such
+# as kudos_count are deliberately left out)
+_SUMMARY_FINGERPRINT_FIELDS = (
+    "id",
+    "name",
+    "sport_type",
+    "type",
+    "start_date",
+    "start_date_local",
+    "moving_time",
+    "elapsed_time",
+    "distance",
+    "total_elevation_gain",
+    "average_heartrate",
+    "max_heartrate",
+    "workout_type",
+    "gear_id",
+    "private",
+    "visibility",
 )
+
+
+def summary_fingerprint(activity_summary: dict) -> str:
+    """
+    Fingerprint of an activity-list summary, used as the cache tag for detail
+    and lap payloads.
+
+    Strava exposes no updated_at on activities (RawActivity.strava_updated_at
+    mirrors start_date), so an unchanged summary is the best available signal
+    that a previously fetched detail is still current.
+    """
+    fields = {name: activity_summary.get(name) for name in _SUMMARY_FINGERPRINT_FIELDS}
+    payload = json.dumps(fields, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def _http2_available() -> bool:
+    """HTTP/2 needs the optional h2 package (httpx[http2])."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+# ============================================================
+# ACTIVITY FETCHING
+# ============================================================
+#
+# One-shot helpers: each opens a short-lived session unless one is passed in.
+# Pass a StravaSession when making repeated calls.
+
+
 def fetch_activities(
     config: Config,
     page: int = 1,
     per_page: int = 50,
     after: Optional[int] = None,
     before: Optional[int] = None,
+    session: Optional[StravaSession] = None,
 ) -> list[dict]:
     """
     Fetch activity list from Strava with pagination.
@@ -298,6 +743,7 @@ def fetch_activities(
         per_page: Activities per page (max 200, default 50)
         after: Unix timestamp - return activities after this time
         before: Unix timestamp - return activities before this time
+        session: Optional open session to reuse (pooled client, cached token)
 
     Returns:
         List of activity summary dicts
@@ -307,58 +753,27 @@ def fetch_activities(
         StravaRateLimitError: If rate limited
         StravaAPIError: If API request fails
     """
-    access_token = get_valid_token(config)
-
-    params = {
-        "page": page,
-        "per_page": min(per_page, 200),  # Cap at Strava max
-    }
-    if after:
-        params["after"] = after
-    if before:
-        params["before"] = before
-
-    try:
-        with httpx.Client() as client:
-            response = client.get(
-                f"{STRAVA_API_BASE}/athlete/activities",
-                headers={"Authorization": f"Bearer {access_token}"},
-                params=params,
-                timeout=30.0,
-            )
+    if session is not None:
+        return session.fetch_activities(page=page, per_page=per_page, after=after, before=before)
+    with StravaSession(config) as one_shot:
+        return one_shot.fetch_activities(page=page, per_page=per_page, after=after, before=before)
 
-            if response.status_code == 401:
-                raise StravaAuthError("Invalid or expired token")
-            elif response.status_code == 429:
-                retry_after = response.headers.get("Retry-After")
-                raise StravaRateLimitError(
-                    "Rate limit exceeded",
-                    retry_after=int(retry_after) if retry_after else None,
-                )
-            elif response.status_code != 200:
-                raise StravaAPIError(
-                    f"API request failed: {response.status_code} - {response.text}",
-                    status_code=response.status_code,
-                )
 
-            return response.json()
-
-    except httpx.HTTPError as e:
-        raise StravaAPIError(f"HTTP error: {e}")
-
-
-@retry(
-    stop=stop_after_attempt(DEFAULT_RETRY_ATTEMPTS),
-    wait=wait_exponential(multiplier=2, min=2, max=8),
-    retry=retry_if_exception_type((httpx.HTTPError, StravaAPIError)),
-)
-def fetch_activity_details(config: Config, activity_id: str) -> dict:
+def fetch_activity_details(
+    config: Config,
+    activity_id: str,
+    session: Optional[StravaSession] = None,
+    summary_tag: Optional[str] = None,
+) -> dict:
     """
     Fetch full activity details including private notes.
 
     Args:
         config: Configuration with Strava credentials
         activity_id: Strava activity ID
+        session: Optional open session to reuse (pooled client, cached token)
+        summary_tag: Fingerprint of the activity summary (see
+            summary_fingerprint); a cached detail with the same tag is reused
 
     Returns:
         Full activity dict with description and private_note
@@ -368,42 +783,16 @@ def fetch_activity_details(config: Config, activity_id: str) -> dict:
         StravaRateLimitError: If rate limited
         StravaAPIError: If API request fails
     """
-    access_token = get_valid_token(config)
+    if session is not None:
+        return session.fetch_activity_details(activity_id, summary_tag=summary_tag)
+    with StravaSession(config) as one_shot:
+        return one_shot.fetch_activity_details(activity_id, summary_tag=summary_tag)
 
-    try:
-        with httpx.Client() as client:
-            response = client.get(
-                f"{STRAVA_API_BASE}/activities/{activity_id}",
-                headers={"Authorization": f"Bearer {access_token}"},
-                timeout=30.0,
-            )
-
-            if response.status_code == 401:
-                raise StravaAuthError("Invalid or expired token")
-            elif response.status_code == 429:
-                retry_after = response.headers.get("Retry-After")
-                raise StravaRateLimitError(
-                    "Rate limit exceeded",
-                    retry_after=int(retry_after) if retry_after else None,
-                )
-            elif response.status_code != 200:
-                raise StravaAPIError(
-                    f"Activity detail fetch failed: {response.status_code}",
-                    status_code=response.status_code,
-                )
-
-            return response.json()
 
-    except httpx.HTTPError as e:
-        raise StravaAPIError(f"HTTP error: {e}")
-
-
-@retry(
-    stop=stop_after_attempt(DEFAULT_RETRY_ATTEMPTS),
-    wait=wait_exponential(multiplier=2, min=2, max=8),
-    retry=retry_if_exception_type((httpx.HTTPError, StravaAPIError)),
-)
-def fetch_athlete_profile(config: Config) -> Optional[dict]:
+def fetch_athlete_profile(
+    config: Config,
+    session: Optional[StravaSession] = None,
+) -> Optional[dict]:
     """
     Fetch authenticated athlete's profile data from Strava.
 
@@ -422,6 +811,7 @@ def fetch_athlete_profile(config: Config) -> Optional[dict]:
 
     Args:
         config: Configuration with Strava credentials
+        session: Optional open session to reuse (pooled client, cached token)
 
     Returns:
         Athlete profile dict, or None if fetch fails
@@ -437,42 +827,18 @@ def fetch_athlete_profile(config: Config) -> Optional[dict]:
         ...     athlete_gender = profile.get("sex")  # "M" or "F"
         ...     athlete_weight = profile.get("weight")  # kg, may be None
     """
-    access_token = get_valid_token(config)
-
-    try:
-        with httpx.Client() as client:
-            response = client.get(
-                f"{STRAVA_API_BASE}/athlete",
-                headers={"Authorization": f"Bearer {access_token}"},
-                timeout=30.0,
-            )
-
-            if response.status_code == 401:
-                raise StravaAuthError("Invalid or expired token")
-            elif response.status_code == 429:
-                retry_after = response.headers.get("Retry-After")
-                raise StravaRateLimitError(
-                    "Rate limit exceeded",
-                    retry_after=int(retry_after) if retry_after else None,
-                )
-            elif response.status_code != 200:
-                raise StravaAPIError(
-                    f"Athlete profile fetch failed: {response.status_code}",
-                    status_code=response.status_code,
-                )
-
-            return response.json()
-
-    except httpx.HTTPError as e:
-        raise StravaAPIError(f"HTTP error: {e}")
+    if session is not None:
+        return session.fetch_athlete_profile()
+    with StravaSession(config) as one_shot:
+        return one_shot.fetch_athlete_profile()
 
 
-@retry(
-    stop=stop_after_attempt(DEFAULT_RETRY_ATTEMPTS),
-    wait=wait_exponential(multiplier=2, min=2, max=8),
-    retry=retry_if_exception_type((httpx.HTTPError, StravaAPIError)),
-)
-def fetch_activity_laps(config: Config, activity_id: str) -> Optional[list[dict]]:
+def fetch_activity_laps(
+    config: Config,
+    activity_id: str,
+    session: Optional[StravaSession] = None,
+    summary_tag: Optional[str] = None,
+) -> Optional[list[dict]]:
     """
     Fetch lap data for an activity from Strava.
 
@@ -484,6 +850,9 @@ def fetch_activity_laps(config: Config, activity_id: str) -> Optional[list[dict]
     Args:
         config: Configuration with Strava credentials
         activity_id: Strava activity ID
+        session: Optional open session to reuse (pooled client, cached token)
+        summary_tag: Fingerprint of the activity summary (see
+            summary_fingerprint); cached laps with the same tag are reused
 
     Returns:
         List of lap dicts from Strava API, or None if no laps or error
@@ -497,43 +866,10 @@ def fetch_activity_laps(config: Config, activity_id: str) -> Optional[list[dict]
         - Non-fatal errors are logged and return None (graceful degradation)
         - Activities save successfully even if lap fetch fails
     """
-    access_token = get_valid_token(config)
-    logger = logging.getLogger(__name__)
-
-    try:
-        with httpx.Client() as client:
-            response = client.get(
-                f"{STRAVA_API_BASE}/activities/{activity_id}/laps",
-                headers={"Authorization": f"Bearer {access_token}"},
-                timeout=30.0,
-            )
-
-            if response.status_code == 401:
-                raise StravaAuthError("Invalid or expired token")
-            elif response.status_code == 429:
-                retry_after = response.headers.get("Retry-After")
-                raise StravaRateLimitError(
-                    "Rate limit exceeded",
-                    retry_after=int(retry_after) if retry_after else None,
-                )
-            elif response.status_code == 404:
-                # Activity exists but has no laps (normal case)
-                logger.debug(f"No laps found for activity {activity_id}")
-                return None
-            elif response.status_code != 200:
-                # Non-fatal error: log and continue without laps
-                logger.warning(
-                    f"Failed to fetch laps for {activity_id}: "
-                    f"{response.status_code} - {response.text}"
-                )
-                return None
-
-            laps = response.json()
-            return laps if laps else None
-
-    except httpx.HTTPError as e:
-        logger.warning(f"HTTP error fetching laps for {activity_id}: {e}")
-        return None
+    if session is not None:
+        return session.fetch_activity_laps(activity_id, summary_tag=summary_tag)
+    with StravaSession(config) as one_shot:
+        return one_shot.fetch_activity_laps(activity_id, summary_tag=summary_tag)
 
 
 # ============================================================
@@ -548,6 +884,7 @@ def sync_strava_generator(
     since: Optional[datetime] = None,
     before: Optional[int] = None,
     progress_hook: Optional[Callable[[dict], None]] = None,
+    response_cache: Optional[ResponseCache] = None,
 ):
     """
     Sync activities from Strava (Greedy Reverse-Chronological) as a generator.
@@ -563,11 +900,20 @@ def sync_strava_generator(
 
     Skips detail fetching for activities present in existing_ids.
 
+    All requests go through one StravaSession (pooled keep-alive client, cached
+    token). Details and laps for a page are fetched by a small worker pool
+    (settings.strava.fetch_workers) paced by a shared StravaRateLimiter, so
+    requests overlap instead of running back-to-back. Results are consumed in
+    page order, so activities are still yielded newest -> oldest and the
+    pagination cursor only advances once a page is fully processed.
+
     Args:
         config: Configuration (loads from file if not provided)
         lookback_days: Optional days to look back.
         existing_ids: Set of strava_{id} strings to skip.
         since: Optional datetime to sync from (alternative to lookback_days).
+        response_cache: Optional on-disk cache for list pages and detail/lap
+            payloads (details are reused while their summary is unchanged).
 
     Yields:
         RawActivity: Each activity as it's fetched and mapped
@@ -635,6 +981,21 @@ def sync_strava_generator(
     stop_sync = False
     rate_limit_hit = False
 
+    # One session (pooled client, cached token, shared rate limiter) for the
+    # whole run; details/laps are fetched by a small worker pool ahead of the
+    # consumer
+    fetch_workers = max(1, config.settings.strava.fetch_workers)
+    session = StravaSession(
+        config,
+        rate_limiter=StravaRateLimiter(config.settings.strava.max_requests_per_second),
+        max_connections=max(DEFAULT_MAX_CONNECTIONS, fetch_workers + 1),
+        cache=response_cache,
+    )
+    executor = ThreadPoolExecutor(
+        max_workers=fetch_workers,
+        thread_name_prefix="strava-fetch",
+    )
+
     def emit_progress(payload: dict) -> None:
         if progress_hook is None:
             return
@@ -675,12 +1036,15 @@ def sync_strava_generator(
                     page=1,
                     per_page=50,
                     before=cursor_before,
+                    session=session,
                 )
 
                 if not activities_page:
                     break  # No more activities
 
                 oldest_timestamp_in_page = None
+                reached_cutoff = False
+                pending: list[tuple[dict, Optional[date]]] = []  # Summaries to fetch, page order
                 for activity_summary in activities_page:
                     # Track cursor boundary from summary payload
                     try:
@@ -695,13 +1059,14 @@ def sync_strava_generator(
                         pass
 
                     # Check date cutoff
+                    act_date = None
                     try:
                         act_date_str = activity_summary["start_date_local"]
                         act_date = datetime.fromisoformat(act_date_str.replace("Z", "+00:00")).date()
 
                         if cutoff_date and act_date < cutoff_date:
                             logger.info(f"Reached cutoff date {cutoff_date} (activity date: {act_date}). Stopping.")
-                            stop_sync = True
+                            reached_cutoff = True
                             break
                     except (KeyError, ValueError):
                         pass # Skip date check malformed
@@ -712,52 +1077,34 @@ def sync_strava_generator(
                         skipped_count += 1
                         continue
 
-                    # Fetch full details
+                    pending.append((activity_summary, act_date))
+
+                # Fetch details (and laps) concurrently; results are consumed
+                # in page order so activities are still yielded newest -> oldest
+                futures = [
+                    executor.submit(
+                        _fetch_activity_payload,
+                        config,
+                        str(activity_summary["id"]),
+                        lap_max_age,
+                        session,
+                        summary_fingerprint(activity_summary),
+                    )
+                    for activity_summary, _ in pending
+                ]
+
+                for index, (activity_summary, act_date) in enumerate(pending):
                     try:
-                        activity_detail = fetch_activity_details(
-                            config, str(activity_summary["id"])
-                        )
+                        activity_detail, laps_data, lap_outcome = futures[index].result()
+                        if lap_outcome == "fetched":
+                            laps_fetched += 1
+                        elif lap_outcome == "failed":
+                            lap_fetch_failures += 1
+                        elif lap_outcome == "skipped_age":
+                            laps_skipped_age += 1
 
-                        # Respect rate limits between calls
-                        time.sleep(DEFAULT_WAIT_BETWEEN_REQUESTS)
-
-                        # Fetch laps for running activities (adaptive strategy)
-                        laps_data = None
-                        if _is_running_activity(activity_detail):
-                            # Calculate activity age
-                            activity_date = datetime.fromisoformat(
-                                activity_detail["start_date"].replace("Z", "+00:00")
-                            )
-                            activity_age_days = (datetime.now(timezone.utc) - activity_date).days
-
-                            if activity_age_days <= lap_max_age:
-                                # Fetch lap data (within threshold for current sync mode)
-                                try:
-                                    laps_data = fetch_activity_laps(config, str(activity_summary["id"]))
-                                    time.sleep(DEFAULT_WAIT_BETWEEN_REQUESTS)
-                                    laps_fetched += 1
-                                except StravaRateLimitError:
-                                    # Make error message user-friendly with date and activity name
-                                    activity_name = activity_detail.get("name", "Unknown")
-                                    activity_date_str = activity_date.strftime("%Y-%m-%d")
-                                    logger.warning(
-                                        f"Rate limit hit while fetching laps for: {activity_name} "
-                                        f"({activity_date_str})"
-                                    )
-                                    lap_fetch_failures += 1
-                                    laps_data = None
-                                except Exception as e:
-                                    logger.debug(f"No laps for {activity_summary['id']}: {e}")
-                                    lap_fetch_failures += 1
-                                    laps_data = None
-                            else:
-                                # Skip lap fetch (outside threshold for historical sync)
-                                laps_skipped_age += 1
-                                logger.debug(
-                                    f"Skipping lap fetch for {activity_summary['id']} "
-                                    f"(age: {activity_age_days} days, mode: {'incremental' if is_incremental_sync else 'historical'}, "
-                                    f"threshold: {lap_max_age} days)"
-                                )
+                        if act_date is None:
+                            act_date = _activity_local_date(activity_detail)
 
                         # Map to RawActivity
                         raw_activity = map_strava_to_raw(activity_detail, laps_data=laps_data)
@@ -796,6 +1143,10 @@ def sync_strava_generator(
                         logger.warning(f"Strava rate limit hit during detail fetch for {activity_summary['id']}. Pausing sync.")
                         print(f"[Sync] Rate limit reached at {activities_yielded} activities. Pausing sync.", flush=True)
                         print(f"[Sync] Data saved successfully. Run 'resilio sync' again in 15 minutes to continue.", flush=True)
+                        # Drop fetches that have not started; the resume cursor
+                        # still points at this page, so they are retried next run
+                        for future in futures[index + 1:]:
+                            future.cancel()
                         rate_limit_hit = True
                         stop_sync = True
                         break
@@ -804,6 +1155,9 @@ def sync_strava_generator(
                         activity_failures += 1
                         continue
 
+                if reached_cutoff:
+                    stop_sync = True
+
                 if stop_sync:
                     break
 
@@ -825,9 +1179,6 @@ def sync_strava_generator(
                     }
                 )
 
-                # Respect rate limits between pages
-                time.sleep(DEFAULT_WAIT_BETWEEN_REQUESTS)
-
             except StravaRateLimitError:
                 logger.warning(f"Strava rate limit hit during page {page} fetch. Pausing sync.")
                 print(f"[Sync] Rate limit reached at {activities_yielded} activities. Pausing sync.", flush=True)
@@ -840,6 +1191,16 @@ def sync_strava_generator(
                 break
 
     finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+        session.close()
+        if response_cache is not None:
+            logger.info(
+                "Response cache: %s hits, %s misses, %s revalidated",
+                response_cache.hits,
+                response_cache.misses,
+                response_cache.revalidations,
+            )
+
         # Output final month's progress if we fetched any activities
         if current_month is not None and month_activity_count > 0:
             month_name = datetime(current_month[0], current_month[1], 1).strftime("%B %Y")
@@ -887,6 +1248,77 @@ def sync_strava_generator(
         return sync_result
 
 
+def _fetch_activity_payload(
+    config: Config,
+    activity_id: str,
+    lap_max_age: int,
+    session: Optional[StravaSession],
+    summary_tag: Optional[str] = None,
+) -> tuple[dict, Optional[list[dict]], Optional[str]]:
+    """
+    Fetch details, and laps for recent running activities, for one activity.
+
+    Runs on a sync worker thread. Lap failures are absorbed (activities save
+    without laps); detail failures, including rate limits, propagate.
+
+    Args:
+        config: Configuration with Strava credentials
+        activity_id: Strava activity ID
+        lap_max_age: Only fetch laps for activities at most this many days old
+        session: Shared session for the sync run
+        summary_tag: Fingerprint of the activity's list summary (cache tag)
+
+    Returns:
+        Tuple of (activity detail, laps or None, lap outcome), where lap outcome
+        is "fetched", "failed", "skipped_age" or None (not a running activity)
+    """
+    logger = logging.getLogger(__name__)
+
+    activity_detail = fetch_activity_details(
+        config, activity_id, session=session, summary_tag=summary_tag
+    )
+
+    # Fetch laps for running activities (adaptive strategy)
+    if not _is_running_activity(activity_detail):
+        return activity_detail, None, None
+
+    # Calculate activity age
+    activity_date = datetime.fromisoformat(activity_detail["start_date"].replace("Z", "+00:00"))
+    activity_age_days = (datetime.now(timezone.utc) - activity_date).days
+
+    if activity_age_days > lap_max_age:
+        # Skip lap fetch (outside threshold for current sync mode)
+        logger.debug(
+            f"Skipping lap fetch for {activity_id} "
+            f"(age: {activity_age_days} days, threshold: {lap_max_age} days)"
+        )
+        return activity_detail, None, "skipped_age"
+
+    try:
+        laps_data = fetch_activity_laps(
+            config, activity_id, session=session, summary_tag=summary_tag
+        )
+        return activity_detail, laps_data, "fetched"
+    except StravaRateLimitError:
+        # Make error message user-friendly with date and activity name
+        activity_name = activity_detail.get("name", "Unknown")
+        activity_date_str = activity_date.strftime("%Y-%m-%d")
+        logger.warning(
+            f"Rate limit hit while fetching laps for: {activity_name} "
+            f"({activity_date_str})"
+        )
+        return activity_detail, None, "failed"
+    except Exception as e:
+        logger.debug(f"No laps for {activity_id}: {e}")
+        return activity_detail, None, "failed"
+
+
+def _activity_local_date(activity_detail: dict) -> date:
+    """Local calendar date of an activity payload (falls back to UTC start)."""
+    start = activity_detail.get("start_date_local") or activity_detail["start_date"]
+    return datetime.fromisoformat(start.replace("Z", "+00:00")).date()
+
+
 # sync_strava() wrapper removed - use sync_strava_generator() directly
 # No backward compatibility needed for v0
 
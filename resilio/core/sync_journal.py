@@ -0,0 +1,313 @@
+"""
+Sync journal - Append-only record of a running Strava sync.
+
+Each sync appends small JSON events to config/.sync_journal.jsonl instead of
+rewriting a progress file on every progress callback:
+
+    {"event": "start", "at": ..., "backfill_in_progress": true, "target_start_date": "2025-02-12", ...}
+    {"event": "cursor", "at": ..., "phase": "fetching", "before": 1736500000, "page": 3, "month": null, "listed": 120}
+    {"event": "imported", "at": ..., "id": "strava_123", "date": "2025-11-02"}
+    {"event": "failed", "at": ..., "id": "strava_456", "error": "..."}
+
+Current state (SyncJournalState) is derived by replaying the events after the
+last snapshot. Events are buffered in memory and only written, then fsynced,
+by commit(); the sync workflow commits at its checkpoints, after flushing the
+background activity writer, so the journal never records a cursor ahead of
+the activity files on disk.
+
+When a sync ends the journal is compacted: deleted on success (the resume
+state lives in training_history.yaml), or rewritten as a single snapshot
+event when the sync pauses on a rate limit or fails. A crash leaves the
+journal as is, and the next sync resumes from its last committed cursor.
+"""
+
+import json
+import logging
+import os
+from datetime import date, datetime, timezone
+from typing import IO, Any, Optional
+
+from resilio.core.repository import RepositoryIO
+from resilio.schemas.repository import RepoError
+from resilio.schemas.sync import SyncJournalState, SyncPhase, SyncReport, SyncResumeState
+
+logger = logging.getLogger(__name__)
+
+SYNC_JOURNAL_FILE = "config/.sync_journal.jsonl"
+
+# Phases journaled on their own; FETCHING/PROCESSING alternate per activity
+# and are only recorded along with cursor events
+JOURNALED_PHASES = frozenset(
+    {SyncPhase.METRICS, SyncPhase.DONE, SyncPhase.PAUSED_RATE_LIMIT, SyncPhase.FAILED}
+)
+
+
+def replay_sync_journal(repo: RepositoryIO) -> Optional[SyncJournalState]:
+    """
+    Rebuild sync state from the journal.
+
+    A torn last line (crash during a write) is ignored.
+
+    Returns:
+        State after the last event, or None if there is no journal
+    """
+    path = repo.resolve_path(SYNC_JOURNAL_FILE)
+    try:
+        with open(path, encoding="utf-8") as f:
+            lines = f.readlines()
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        logger.warning("[SyncJournal] Could not read journal: %s", e)
+        return None
+
+    # Replay the tail: everything before the last snapshot is superseded
+    events = []
+    for line in lines:
+        try:
+            event = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(event, dict):
+            if event.get("event") == "snapshot":
+                events = []
+            events.append(event)
+
+    if not events:
+        return None
+    state = SyncJournalState()
+    for event in events:
+        try:
+            state = _apply_event(state, event)
+        except Exception as e:
+            logger.warning("[SyncJournal] Ignoring malformed %r event: %s", event.get("event"), e)
+    return state
+
+
+def apply_journal_to_resume_state(resume_state: SyncResumeState, journal: SyncJournalState) -> SyncResumeState:
+    """
+    Overlay an unfinished backfill recorded in the journal on resume state.
+
+    training_history.yaml is only written when a sync ends; after a crash the
+    journal holds the newer cursor. A journal older than the history (a
+    finished sync that crashed before deleting it) is ignored.
+    """
+    if not journal.backfill_in_progress or journal.target_start_date is None or journal.updated_at is None:
+        return resume_state
+    last_progress_at = resume_state.last_progress_at
+    if last_progress_at is not None and last_progress_at.tzinfo is None:
+        last_progress_at = last_progress_at.replace(tzinfo=timezone.utc)
+    if last_progress_at is not None and journal.updated_at <= last_progress_at:
+        return resume_state
+    resume_state.backfill_in_progress = True
+    resume_state.target_start_date = journal.target_start_date
+    if journal.cursor_before_timestamp is not None:
+        resume_state.resume_before_timestamp = journal.cursor_before_timestamp
+    resume_state.last_progress_at = journal.updated_at
+    return resume_state
+
+
+class SyncJournal:
+    """
+    Writer for the sync journal (one per sync run).
+
+    Usage:
+        journal = SyncJournal(repo)
+        journal.begin(resume_state)
+        journal.record_imported(activity.id, activity.date)
+        journal.commit()           # write + fsync buffered events
+        journal.finish(report)     # compact when the sync ends
+    """
+
+    def __init__(self, repo: RepositoryIO):
+        self.repo = repo
+        self.state = replay_sync_journal(repo) or SyncJournalState()
+        self._pending: list[str] = []
+        self._file: Optional[IO[str]] = None
+        self._latest_month: Optional[str] = None
+        self._latest_listed: Optional[int] = None
+
+    # ============================================================
+    # EVENTS
+    # ============================================================
+
+    def begin(self, resume_state: SyncResumeState) -> None:
+        """Start a sync run from the given resume state."""
+        self._append(
+            "start",
+            backfill_in_progress=resume_state.backfill_in_progress,
+            target_start_date=_iso(resume_state.target_start_date),
+            before=resume_state.resume_before_timestamp,
+        )
+
+    def record_progress(
+        self,
+        phase: SyncPhase,
+        cursor_before_timestamp: Optional[int] = None,
+        current_page: Optional[int] = None,
+        current_month: Optional[str] = None,
+        activities_listed: Optional[int] = None,
+    ) -> bool:
+        """
+        Record a cursor advance or a phase change that matters for resume.
+
+        Only a new cursor (before/page) appends a "cursor" event; the latest
+        phase, month and listed count ride along with it. The per-activity
+        FETCHING <-> PROCESSING alternation is not journaled; METRICS, DONE,
+        PAUSED_RATE_LIMIT and FAILED are.
+
+        Returns:
+            True if an event was appended (the caller should checkpoint)
+        """
+        if current_month is not None:
+            self._latest_month = current_month
+        if activities_listed is not None:
+            self._latest_listed = activities_listed
+
+        cursor_moved = (
+            cursor_before_timestamp is not None and cursor_before_timestamp != self.state.cursor_before_timestamp
+        ) or (current_page is not None and current_page != self.state.current_page)
+        if cursor_moved:
+            self._append(
+                "cursor",
+                phase=phase.value,
+                before=cursor_before_timestamp,
+                page=current_page,
+                month=self._latest_month,
+                listed=self._latest_listed,
+            )
+            return True
+        if phase != self.state.phase and phase in JOURNALED_PHASES:
+            self._append("phase", phase=phase.value)
+            return True
+        return False
+
+    def record_imported(self, activity_id: str, activity_date: date) -> None:
+        """Record an activity handed to the writer."""
+        self._append("imported", id=activity_id, date=activity_date.isoformat())
+
+    def record_skipped(self, activity_id: str) -> None:
+        """Record a duplicate activity."""
+        self._append("skipped", id=activity_id)
+
+    def record_failed(self, activity_id: str, error: str, was_imported: bool = False) -> None:
+        """
+        Record an activity that could not be imported.
+
+        Args:
+            activity_id: Activity id
+            error: Error message
+            was_imported: The activity was recorded as imported, but its file
+                write failed later
+        """
+        self._append("failed", id=activity_id, error=error, was_imported=was_imported)
+
+    # ============================================================
+    # DURABILITY AND COMPACTION
+    # ============================================================
+
+    def commit(self) -> None:
+        """Append buffered events to the journal file and fsync it."""
+        if not self._pending:
+            return
+        if self._file is None:
+            path = self.repo.resolve_path(SYNC_JOURNAL_FILE)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(path, "a", encoding="utf-8")
+        self._file.write("".join(self._pending))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._pending = []
+
+    def finish(self, report: SyncReport, resume_state: Optional[SyncResumeState] = None) -> None:
+        """
+        Compact the journal at the end of a sync.
+
+        Done: the journal is deleted. Paused or failed: it is replaced by one
+        snapshot event carrying the report counters and the resume cursor.
+
+        Args:
+            report: Final sync report
+            resume_state: Resume state persisted for the next sync (default:
+                the journal's own backfill target and cursor)
+        """
+        self._close()
+        self._pending = []
+        if report.phase == SyncPhase.DONE:
+            if self.repo.file_exists(SYNC_JOURNAL_FILE):
+                self.repo.delete_file(SYNC_JOURNAL_FILE)
+            return
+
+        update = {
+            "phase": report.phase,
+            "activities_imported": report.activities_imported,
+            "activities_skipped": report.activities_skipped,
+            "activities_failed": report.activities_failed,
+            "updated_at": datetime.now(timezone.utc),
+        }
+        if resume_state is not None:
+            update.update(
+                backfill_in_progress=resume_state.backfill_in_progress,
+                target_start_date=resume_state.target_start_date,
+                cursor_before_timestamp=resume_state.resume_before_timestamp,
+            )
+        self.state = self.state.model_copy(update=update)
+        snapshot = {"event": "snapshot", **self.state.model_dump(mode="json")}
+        error = self.repo.write_serialized(SYNC_JOURNAL_FILE, json.dumps(snapshot) + "\n")
+        if isinstance(error, RepoError):
+            logger.warning("[SyncJournal] Could not compact journal: %s", error.message)
+
+    def _append(self, kind: str, **fields: Any) -> None:
+        event = {"event": kind, "at": datetime.now(timezone.utc).isoformat(), **fields}
+        self.state = _apply_event(self.state, event)
+        self._pending.append(json.dumps(event, separators=(",", ":")) + "\n")
+
+    def _close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def _iso(value: Optional[date]) -> Optional[str]:
+    return value.isoformat() if value is not None else None
+
+
+def _apply_event(state: SyncJournalState, event: dict) -> SyncJournalState:
+    """Apply one journal event (updates state in place, except start/snapshot)."""
+    kind = event.get("event")
+    if kind == "snapshot":
+        return SyncJournalState.model_validate({k: v for k, v in event.items() if k != "event"})
+
+    if kind == "start":
+        # New run: counters reset, resume position comes from the event
+        state = SyncJournalState(
+            backfill_in_progress=bool(event.get("backfill_in_progress")),
+            target_start_date=event.get("target_start_date"),
+            cursor_before_timestamp=event.get("before"),
+        )
+    elif kind == "phase":
+        state.phase = SyncPhase(event["phase"])
+    elif kind == "cursor":
+        if event.get("phase") is not None:
+            state.phase = SyncPhase(event["phase"])
+        if event.get("before") is not None:
+            state.cursor_before_timestamp = int(event["before"])
+        if event.get("page") is not None:
+            state.current_page = int(event["page"])
+        if event.get("month") is not None:
+            state.current_month = str(event["month"])
+        if event.get("listed") is not None:
+            state.activities_listed = int(event["listed"])
+    elif kind == "imported":
+        state.activities_imported += 1
+    elif kind == "skipped":
+        state.activities_skipped += 1
+    elif kind == "failed":
+        if event.get("was_imported"):
+            state.activities_imported -= 1
+        state.activities_failed += 1
+        state.failed_ids.append(str(event["id"]))
+
+    if event.get("at"):
+        state.updated_at = datetime.fromisoformat(event["at"])
+    return state
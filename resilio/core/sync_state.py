@@ -5,10 +5,10 @@ Sync state I/O helpers.
 import logging
 from datetime import date, datetime
 
-import yaml
-
 from resilio.core.paths import athlete_training_history_path
 from resilio.core.repository import RepositoryIO
+from resilio.core.serialization import load_yaml
+from resilio.core.sync_journal import apply_journal_to_resume_state, replay_sync_journal
 from resilio.schemas.sync import SyncResumeState
 
 
@@ -24,7 +24,7 @@ def read_training_history(repo: RepositoryIO) -> dict:
 
     try:
         with open(resolved) as handle:
-            data = yaml.safe_load(handle)
+            data = load_yaml(handle)
     except Exception:
         return {}
 
@@ -133,6 +133,13 @@ def resume_state_from_history(history: dict) -> SyncResumeState:
 
 
 def read_resume_state(repo: RepositoryIO) -> SyncResumeState:
-    """Read and normalize persisted resume state from training history."""
+    """Read and normalize persisted resume state from training history.
+
+    A newer cursor from an interrupted sync's journal takes precedence.
+    """
     history = read_training_history(repo)
-    return resume_state_from_history(history)
+    state = resume_state_from_history(history)
+    journal = replay_sync_journal(repo)
+    if journal is not None:
+        state = apply_journal_to_resume_state(state, journal)
+    return state
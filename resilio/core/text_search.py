@@ -0,0 +1,125 @@
+"""
+Text search helpers - Tokenizer, light stemmer, ranking and snippets.
+
+Shared by the activity notes index (core/activity_index.py). Pure functions
+with no I/O.
+
+Tokens are lowercase, accent-folded word runs ("Genou" and "genou" match;
+"didn't" stays one token). The stemmer is a deliberately light English
+suffix stripper (plurals, -ing, -ed, -ly, -ness, -ful): enough for "knees"
+to find "knee" or "hurting" to find "hurt", without a stemming dependency.
+"""
+
+import math
+import re
+import unicodedata
+from typing import Iterable, Optional
+
+_TOKEN_RE = re.compile(r"[^\W_]+(?:'[^\W_]+)*")
+
+# Checked in order; the first suffix that leaves >= 3 characters is removed
+_SUFFIXES = ("ingly", "edly", "ness", "ful", "ing", "ies", "ied", "ed", "ly", "es", "s")
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+SNIPPET_CONTEXT_CHARS = 50
+
+
+def fold(text: str) -> str:
+    """
+    Lowercase and strip accents, preserving length.
+
+    Each character maps to exactly one character, so offsets found in the
+    folded text are valid in the original (used for snippets).
+    """
+    return "".join(unicodedata.normalize("NFKD", char)[0] for char in text.lower())
+
+
+def tokenize(text: Optional[str]) -> list[str]:
+    """Split text into folded word tokens, in order."""
+    if not text:
+        return []
+    return _TOKEN_RE.findall(fold(text))
+
+
+def stem(token: str) -> str:
+    """
+    Reduce a token to a light English stem.
+
+    Examples:
+        knees -> knee, hurting -> hurt, running -> run, injuries -> injury,
+        soreness -> sore, painful -> pain
+    """
+    for _ in range(2):  # "tiredness" -> "tired" -> "tir"
+        stripped = _strip_suffix(token)
+        if stripped == token:
+            break
+        token = stripped
+    return token
+
+
+def _strip_suffix(token: str) -> str:
+    for suffix in _SUFFIXES:
+        if not token.endswith(suffix) or len(token) - len(suffix) < 3:
+            continue
+        base = token[: -len(suffix)]
+        if suffix in ("ies", "ied"):
+            return base + "y"
+        if suffix == "es" and not base.endswith(("s", "x", "z", "ch", "sh")):
+            continue  # "knees" -> "knee" via "s", not "kne"
+        if suffix == "s" and base.endswith(("s", "u", "i")):
+            return token  # "stress", "virus", "tennis"
+        if suffix in ("ing", "ed") and len(base) >= 4 and base[-1] == base[-2] and base[-1] not in "lsz":
+            base = base[:-1]  # "running" -> "run"
+        return base
+    return token
+
+
+def bm25_term_score(tf: float, df: int, doc_count: int, doc_length: int, avg_doc_length: float) -> float:
+    """
+    BM25 contribution of one query term to one document.
+
+    Args:
+        tf: (Weighted) term frequency in the document
+        df: Number of documents containing the term
+        doc_count: Number of documents searched
+        doc_length: Document length in tokens
+        avg_doc_length: Mean document length in tokens
+
+    Returns:
+        Score contribution (0 if tf is 0)
+    """
+    if tf <= 0:
+        return 0.0
+    idf = math.log(1.0 + (doc_count - df + 0.5) / (df + 0.5))
+    norm = 1.0 - BM25_B + BM25_B * (doc_length / avg_doc_length if avg_doc_length else 1.0)
+    return idf * tf * (BM25_K1 + 1.0) / (tf + BM25_K1 * norm)
+
+
+def snippet(text: str, keywords: Iterable[str], context: int = SNIPPET_CONTEXT_CHARS) -> str:
+    """
+    Excerpt of text around the first keyword occurrence.
+
+    Keywords match at word starts, accent- and case-insensitively. Falls back
+    to the first 100 characters when no keyword is found.
+    """
+    folded = fold(text)
+    first: Optional[tuple[int, int]] = None
+    for keyword in keywords:
+        match = re.search(r"(?<![^\W_])" + re.escape(keyword), folded)
+        if match and (first is None or match.start() < first[0]):
+            first = (match.start(), match.end())
+
+    if first is None:
+        return text[:100] + ("..." if len(text) > 100 else "")
+
+    start = max(0, first[0] - context)
+    end = min(len(text), first[1] + context)
+    excerpt = text[start:end]
+    if start > 0:
+        excerpt = "..." + excerpt
+    if end < len(text):
+        excerpt = excerpt + "..."
+    return excerpt
@@ -17,11 +17,12 @@ from resilio.schemas.vdot import (
     ConfidenceLevel,
     PaceUnit,
 )
-from resilio.core.vdot.tables import (
-    VDOT_TABLE,
-    VDOT_BY_VALUE,
-    get_nearest_vdot_values,
-    linear_interpolate,
+from resilio.core.vdot.lookup import (
+    PACE_ZONE_FIELDS,
+    RACE_TIME_FIELDS,
+    race_time_for_vdot,
+    pace_range_for_vdot,
+    vdot_from_race_time,
 )
 
 
@@ -48,8 +49,8 @@ RACE_DISTANCE_KM: dict[RaceDistance, float] = {
 def calculate_vdot(race_distance: RaceDistance, race_time_seconds: int) -> VDOTResult:
     """Calculate VDOT from race performance.
 
-    Uses lookup table with linear interpolation to find the VDOT value
-    corresponding to a race time.
+    Uses the precomputed lookup columns (core/vdot/lookup.py) with linear
+    interpolation to find the VDOT value corresponding to a race time.
 
     Args:
         race_distance: Race distance (mile, 5K, 10K, half, marathon)
@@ -64,61 +65,11 @@ def calculate_vdot(race_distance: RaceDistance, race_time_seconds: int) -> VDOTR
     if race_time_seconds <= 0:
         raise ValueError(f"Race time must be positive, got {race_time_seconds}")
 
-    # Get field name for this distance in table
-    field_map = {
-        RaceDistance.MILE: "mile_seconds",
-        RaceDistance.FIVE_K: "five_k_seconds",
-        RaceDistance.TEN_K: "ten_k_seconds",
-        RaceDistance.FIFTEEN_K: "fifteen_k_seconds",
-        RaceDistance.HALF_MARATHON: "half_marathon_seconds",
-        RaceDistance.MARATHON: "marathon_seconds",
-    }
-
-    field_name = field_map.get(race_distance)
-    if not field_name:
+    if race_distance not in RACE_TIME_FIELDS:
         raise ValueError(f"Unsupported race distance: {race_distance}")
 
-    # Find the two closest VDOT entries by race time
-    best_vdot = None
-    min_diff = float("inf")
-
-    for entry in VDOT_TABLE:
-        time_value = getattr(entry, field_name, None)
-        if time_value is None:
-            continue
-
-        diff = abs(time_value - race_time_seconds)
-        if diff < min_diff:
-            min_diff = diff
-            best_vdot = entry.vdot
-
-    if best_vdot is None:
-        raise ValueError(f"Could not find VDOT for {race_distance.value} @ {race_time_seconds}s")
-
-    # For more accurate results, interpolate between two nearest VDOTs
-    # if race time falls between two table entries
-    vdot_lower, vdot_upper = get_nearest_vdot_values(best_vdot)
-
-    entry_lower = VDOT_BY_VALUE[vdot_lower]
-    entry_upper = VDOT_BY_VALUE[vdot_upper]
-
-    time_lower = getattr(entry_lower, field_name)
-    time_upper = getattr(entry_upper, field_name)
-
-    # Check if we need interpolation
-    if time_lower and time_upper and time_lower != time_upper:
-        # Interpolate VDOT based on race time
-        vdot_interpolated = linear_interpolate(
-            race_time_seconds,
-            time_lower,
-            time_upper,
-            vdot_lower,
-            vdot_upper,
-        )
-        # Round to nearest integer
-        vdot_final = max(30, min(85, round(vdot_interpolated)))
-    else:
-        vdot_final = best_vdot
+    # Bisect the precomputed time column and interpolate between table rows
+    vdot_final = max(30, min(85, round(vdot_from_race_time(race_distance, race_time_seconds))))
 
     # Format race time
     formatted_time = format_time_seconds(race_time_seconds)
@@ -153,51 +104,25 @@ def calculate_training_paces(vdot: int, unit: PaceUnit = PaceUnit.MIN_PER_KM) ->
     if vdot < 30 or vdot > 85:
         raise ValueError(f"VDOT must be between 30 and 85, got {vdot}")
 
-    # Check if exact entry exists
-    if vdot in VDOT_BY_VALUE:
-        entry = VDOT_BY_VALUE[vdot]
-    else:
-        # Interpolate between two nearest VDOTs
-        vdot_lower, vdot_upper = get_nearest_vdot_values(vdot)
-        entry_lower = VDOT_BY_VALUE[vdot_lower]
-        entry_upper = VDOT_BY_VALUE[vdot_upper]
-
-        # Interpolate all pace fields
-        entry_data = {}
-        for field in [
-            "easy_min_sec_per_km",
-            "easy_max_sec_per_km",
-            "marathon_min_sec_per_km",
-            "marathon_max_sec_per_km",
-            "threshold_min_sec_per_km",
-            "threshold_max_sec_per_km",
-            "interval_min_sec_per_km",
-            "interval_max_sec_per_km",
-            "repetition_min_sec_per_km",
-            "repetition_max_sec_per_km",
-        ]:
-            val_lower = getattr(entry_lower, field)
-            val_upper = getattr(entry_upper, field)
-            entry_data[field] = round(
-                linear_interpolate(vdot, vdot_lower, vdot_upper, val_lower, val_upper)
-            )
-
-        # Create a minimal entry object for pace extraction
-        from resilio.schemas.vdot import VDOTTableEntry
-
-        entry = VDOTTableEntry(vdot=vdot, **entry_data)
+    # Exact table rows interpolate to themselves
+    paces = {zone: _rounded_pace_range(zone, vdot) for zone in PACE_ZONE_FIELDS}
 
     return TrainingPaces(
         vdot=vdot,
         unit=unit,
-        easy_pace_range=(entry.easy_min_sec_per_km, entry.easy_max_sec_per_km),
-        marathon_pace_range=(entry.marathon_min_sec_per_km, entry.marathon_max_sec_per_km),
-        threshold_pace_range=(entry.threshold_min_sec_per_km, entry.threshold_max_sec_per_km),
-        interval_pace_range=(entry.interval_min_sec_per_km, entry.interval_max_sec_per_km),
-        repetition_pace_range=(entry.repetition_min_sec_per_km, entry.repetition_max_sec_per_km),
+        easy_pace_range=paces["easy"],
+        marathon_pace_range=paces["marathon"],
+        threshold_pace_range=paces["threshold"],
+        interval_pace_range=paces["interval"],
+        repetition_pace_range=paces["repetition"],
     )
 
 
+def _rounded_pace_range(zone: str, vdot: float) -> Tuple[int, int]:
+    fastest, slowest = pace_range_for_vdot(zone, vdot)
+    return round(fastest), round(slowest)
+
+
 # ============================================================
 # RACE TIME PREDICTIONS
 # ============================================================
@@ -222,70 +147,12 @@ def calculate_race_equivalents(
     vdot_result = calculate_vdot(race_distance, race_time_seconds)
     vdot = vdot_result.vdot
 
-    # Get or interpolate table entry
-    if vdot in VDOT_BY_VALUE:
-        entry = VDOT_BY_VALUE[vdot]
-    else:
-        vdot_lower, vdot_upper = get_nearest_vdot_values(vdot)
-        entry_lower = VDOT_BY_VALUE[vdot_lower]
-        entry_upper = VDOT_BY_VALUE[vdot_upper]
-
-        # Interpolate race times
-        entry_data = {"vdot": vdot}
-        for dist in RaceDistance:
-            field_map = {
-                RaceDistance.MILE: "mile_seconds",
-                RaceDistance.FIVE_K: "five_k_seconds",
-                RaceDistance.TEN_K: "ten_k_seconds",
-                RaceDistance.FIFTEEN_K: "fifteen_k_seconds",
-                RaceDistance.HALF_MARATHON: "half_marathon_seconds",
-                RaceDistance.MARATHON: "marathon_seconds",
-            }
-            field = field_map[dist]
-            val_lower = getattr(entry_lower, field, None)
-            val_upper = getattr(entry_upper, field, None)
-            if val_lower and val_upper:
-                entry_data[field] = round(
-                    linear_interpolate(vdot, vdot_lower, vdot_upper, val_lower, val_upper)
-                )
-
-        # Fill in missing pace fields (required by VDOTTableEntry)
-        for field in [
-            "easy_min_sec_per_km",
-            "easy_max_sec_per_km",
-            "marathon_min_sec_per_km",
-            "marathon_max_sec_per_km",
-            "threshold_min_sec_per_km",
-            "threshold_max_sec_per_km",
-            "interval_min_sec_per_km",
-            "interval_max_sec_per_km",
-            "repetition_min_sec_per_km",
-            "repetition_max_sec_per_km",
-        ]:
-            val_lower = getattr(entry_lower, field)
-            val_upper = getattr(entry_upper, field)
-            entry_data[field] = round(
-                linear_interpolate(vdot, vdot_lower, vdot_upper, val_lower, val_upper)
-            )
-
-        from resilio.schemas.vdot import VDOTTableEntry
-
-        entry = VDOTTableEntry(**entry_data)
-
-    # Build predictions dictionary
+    # Build predictions dictionary (exact table rows interpolate to themselves)
     predictions = {}
     for dist in RaceDistance:
-        field_map = {
-            RaceDistance.MILE: "mile_seconds",
-            RaceDistance.FIVE_K: "five_k_seconds",
-            RaceDistance.TEN_K: "ten_k_seconds",
-            RaceDistance.FIFTEEN_K: "fifteen_k_seconds",
-            RaceDistance.HALF_MARATHON: "half_marathon_seconds",
-            RaceDistance.MARATHON: "marathon_seconds",
-        }
-        time_val = getattr(entry, field_map[dist], None)
+        time_val = race_time_for_vdot(dist, vdot)
         if time_val:
-            predictions[dist] = format_time_seconds(time_val)
+            predictions[dist] = format_time_seconds(round(time_val))
 
     return RaceEquivalents(
         vdot=vdot,
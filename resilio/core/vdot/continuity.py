@@ -20,15 +20,18 @@ from resilio.schemas.vdot import (
     VDOTDecayResult,
     ConfidenceLevel,
 )
-from resilio.schemas.activity import NormalizedActivity
-from resilio.utils.dates import get_week_boundaries
+from resilio.core.activity_summary import ActivityLike
+from resilio.utils.dates import WeekBuckets
+
+# Sport types counted as runs for continuity
+RUN_SPORT_TYPES = frozenset({"run", "trail_run", "virtual_run"})
 
 
 def group_by_training_week(
-    activities: List[NormalizedActivity],
+    activities: List[ActivityLike],
     start_date: date,
     end_date: date
-) -> dict[date, List[NormalizedActivity]]:
+) -> dict[date, List[ActivityLike]]:
     """
     Group activities by training week (Monday-Sunday).
 
@@ -40,30 +43,49 @@ def group_by_training_week(
     Returns:
         Dict mapping week start (Monday) to list of activities in that week
     """
-    weeks = {}
+    buckets = WeekBuckets(start_date, end_date)
+    grouped: List[List[ActivityLike]] = [[] for _ in range(buckets.num_weeks)]
+
+    # One pass: each activity's week index is computed once
+    for a in activities:
+        index = buckets.week_index(_date_ordinal(a))
+        if index is not None:
+            grouped[index].append(a)
 
-    # Find the Monday on or before start_date
-    days_since_monday = start_date.weekday()
-    current_monday = start_date - timedelta(days=days_since_monday)
+    return {buckets.week_start(index): week_activities for index, week_activities in enumerate(grouped)}
 
-    # Iterate through all weeks
-    while current_monday <= end_date:
-        week_start, week_end = get_week_boundaries(current_monday)
 
-        # Filter activities in this week
-        week_activities = [
-            a for a in activities
-            if week_start <= a.date <= week_end
-        ]
+def bucket_runs_by_week(
+    activities: List[ActivityLike],
+    start_date: date,
+    end_date: date
+) -> WeekBuckets:
+    """
+    Count runs per training week (Monday-Sunday) between two dates.
+
+    Non-running activities and runs outside [start_date, end_date] are
+    skipped.
 
-        weeks[week_start] = week_activities
-        current_monday += timedelta(days=7)
+    Args:
+        activities: Activities or summaries
+        start_date: Analysis start date
+        end_date: Analysis end date
 
-    return weeks
+    Returns:
+        WeekBuckets with one count per week
+    """
+    buckets = WeekBuckets(start_date, end_date)
+    start_ordinal = start_date.toordinal()
+    end_ordinal = end_date.toordinal()
+    for a in activities:
+        ordinal = _date_ordinal(a)
+        if start_ordinal <= ordinal <= end_ordinal and a.sport_type.lower() in RUN_SPORT_TYPES:
+            buckets.add(ordinal)
+    return buckets
 
 
 def detect_training_breaks(
-    activities: List[NormalizedActivity],
+    activities: List[ActivityLike],
     race_date: date,
     lookback_months: int = 18
 ) -> BreakAnalysis:
@@ -86,54 +108,27 @@ def detect_training_breaks(
     today = dt_date.today()
     analysis_start = max(race_date, today - timedelta(days=lookback_months * 30))
 
-    # Filter to runs only (should already be filtered, but be explicit)
-    runs = [
-        a for a in activities
-        if a.sport_type.lower() in ["run", "trail_run", "virtual_run"]
-        and analysis_start <= a.date <= today
-    ]
-
-    # Group by training week
-    weeks = group_by_training_week(runs, analysis_start, today)
+    # Count runs per training week (filters to runs, explicitly)
+    weeks = bucket_runs_by_week(activities, analysis_start, today)
 
     # Count active weeks (≥1 run)
-    active_weeks = sum(1 for week_activities in weeks.values() if len(week_activities) > 0)
-    total_weeks = len(weeks)
+    active_weeks = weeks.active_weeks
+    total_weeks = weeks.num_weeks
     continuity_score = active_weeks / total_weeks if total_weeks > 0 else 0.0
 
-    # Identify break periods (consecutive inactive weeks)
+    # Identify break periods (consecutive inactive weeks); a break ends the
+    # day before the next active week, or today if still inactive
     break_periods: List[BreakPeriod] = []
-    sorted_weeks = sorted(weeks.keys())
-
-    break_start = None
-    for week_start in sorted_weeks:
-        week_activities = weeks[week_start]
-
-        if len(week_activities) == 0:
-            # Inactive week
-            if break_start is None:
-                break_start = week_start
+    for first, last in weeks.inactive_runs():
+        break_start = weeks.week_start(first)
+        if last == total_weeks - 1:
+            week_end = today
         else:
-            # Active week - close any open break
-            if break_start is not None:
-                week_end = week_start - timedelta(days=1)  # Day before this active week
-                days = (week_end - break_start).days + 1
-
-                break_periods.append(BreakPeriod(
-                    start_date=break_start,
-                    end_date=week_end,
-                    days=days
-                ))
-                break_start = None
-
-    # Close final break if analysis ends during inactive period
-    if break_start is not None:
-        week_end = today
-        days = (week_end - break_start).days + 1
+            week_end = weeks.week_start(last + 1) - timedelta(days=1)
         break_periods.append(BreakPeriod(
             start_date=break_start,
             end_date=week_end,
-            days=days
+            days=(week_end - break_start).days + 1
         ))
 
     # Find longest break
@@ -148,6 +143,12 @@ def detect_training_breaks(
     )
 
 
+def _date_ordinal(activity: ActivityLike) -> int:
+    """Date ordinal of an activity (summaries carry it precomputed)."""
+    ordinal = getattr(activity, "date_ordinal", None)
+    return ordinal if ordinal is not None else activity.date.toordinal()
+
+
 def _calculate_short_break_decay(days: int) -> float:
     """
     Calculate decay percentage for short breaks (6-28 days).
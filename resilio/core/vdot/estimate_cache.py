@@ -0,0 +1,153 @@
+"""
+VDOT estimate cache - Persisted current-VDOT estimates keyed by their inputs.
+
+Estimating current VDOT walks the whole running history (break detection)
+and reads the profile, recent activity details and current CTL. The result
+only depends on:
+- the activity store contents (activity index store_id + version)
+- the profile's personal bests and max HR (HR-based easy-run detection)
+- the latest stored daily metrics (date and CTL, read on the race-decay
+  path; metrics are recomputed separately from activity syncs)
+- lookback_days
+- today's date (race age, decay, pace-analysis window)
+
+estimate_fingerprint() hashes those inputs; an entry is served only when its
+fingerprint matches exactly, so any change to an input is a miss and the
+estimate is recomputed. Entries live in one small JSON file under
+data/state/ (the most recent MAX_ENTRIES fingerprints, so callers using
+different lookback windows do not evict each other).
+
+The cache is a pure optimization: an unreadable file is treated as empty and
+deleting it is always safe.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from datetime import date
+from pathlib import Path
+from typing import Any, Mapping, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+MAX_ENTRIES = 8
+
+
+def estimate_fingerprint(
+    store_id: str,
+    store_version: int,
+    personal_bests: Mapping[str, Any],
+    max_hr: Optional[int],
+    metrics_date: Optional[date],
+    ctl: Optional[float],
+    lookback_days: int,
+    today: date,
+) -> str:
+    """
+    Hash of everything a current-VDOT estimate depends on.
+
+    Args:
+        store_id: ActivityIndex.store_id
+        store_version: ActivityIndex.version (after refresh)
+        personal_bests: Profile personal bests (distance -> PBEntry or dict)
+        max_hr: Max HR used for easy-run detection (None if unset)
+        metrics_date: Date of the latest stored daily metrics (None if none)
+        ctl: CTL stored for metrics_date
+        lookback_days: Pace-analysis window
+        today: Date the estimate is made on
+
+    Returns:
+        Hex digest
+    """
+    bests = {
+        distance: pb.model_dump(mode="json") if hasattr(pb, "model_dump") else pb
+        for distance, pb in personal_bests.items()
+    }
+    payload = json.dumps(
+        {
+            "store": [store_id, store_version],
+            "personal_bests": bests,
+            "max_hr": max_hr,
+            "metrics": [metrics_date.isoformat() if metrics_date else None, ctl],
+            "lookback_days": lookback_days,
+            "today": today.isoformat(),
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class VDOTEstimateCache:
+    """
+    Small on-disk map of fingerprint -> serialized VDOTEstimate.
+
+    Usage:
+        cache = VDOTEstimateCache(repo.resolve_path(vdot_estimate_cache_path()))
+        data = cache.get(fingerprint)
+        if data is None:
+            data = compute().model_dump(mode="json")
+            cache.put(fingerprint, data)
+    """
+
+    def __init__(self, path: Union[str, Path], max_entries: int = MAX_ENTRIES):
+        """
+        Args:
+            path: Cache file (created on first put)
+            max_entries: Fingerprints kept, most recently stored first
+        """
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, fingerprint: str) -> Optional[dict]:
+        """
+        Cached estimate for a fingerprint.
+
+        Returns:
+            Serialized estimate, or None on a miss
+        """
+        data = self._read().get(fingerprint)
+        if data is None:
+            self.misses += 1
+            logger.info("VDOT estimate cache miss (%s)", fingerprint[:12])
+            return None
+        self.hits += 1
+        logger.info("VDOT estimate cache hit (%s)", fingerprint[:12])
+        return data
+
+    def put(self, fingerprint: str, data: dict) -> None:
+        """Store an estimate, dropping the oldest entries beyond max_entries."""
+        entries = self._read()
+        entries.pop(fingerprint, None)
+        entries = {fingerprint: data, **entries}
+        entries = dict(list(entries.items())[: self.max_entries])
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(f".{threading.get_ident()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as handle:
+                json.dump(entries, handle)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            logger.debug("Failed to write VDOT estimate cache %s", self.path, exc_info=True)
+
+    def clear(self) -> None:
+        """Delete all entries."""
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def _read(self) -> dict:
+        try:
+            with open(self.path, encoding="utf-8") as handle:
+                entries = json.load(handle)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError):
+            logger.debug("Ignoring unreadable VDOT estimate cache %s", self.path, exc_info=True)
+            return {}
+        return entries if isinstance(entries, dict) else {}
@@ -0,0 +1,232 @@
+"""
+VDOT lookup - Precomputed, sorted views of the VDOT table.
+
+tables.py holds one VDOTTableEntry per VDOT value. The lookups here need the
+table by column instead (every 5K time, every threshold pace), so the columns
+are extracted once at import into sorted tuples and searched with bisect:
+
+- Forward: VDOT -> race time or pace, interpolated between table rows
+- Inverse: race time -> (fractional) VDOT, pace -> VDOT of the matching zone
+- Batch: many paces -> many VDOTs (scoring whole activity histories)
+
+Race times and paces fall as VDOT rises; the builders check that every column
+is strictly decreasing, which is what makes binary search valid.
+"""
+
+from bisect import bisect_left
+from typing import Iterable, NamedTuple, Optional
+
+from resilio.core.vdot.tables import (
+    VDOT_TABLE,
+    get_nearest_vdot_values,
+    linear_interpolate,
+)
+from resilio.schemas.vdot import RaceDistance
+
+# ============================================================
+# COLUMN NAMES
+# ============================================================
+
+RACE_TIME_FIELDS: dict[RaceDistance, str] = {
+    RaceDistance.MILE: "mile_seconds",
+    RaceDistance.FIVE_K: "five_k_seconds",
+    RaceDistance.TEN_K: "ten_k_seconds",
+    RaceDistance.FIFTEEN_K: "fifteen_k_seconds",
+    RaceDistance.HALF_MARATHON: "half_marathon_seconds",
+    RaceDistance.MARATHON: "marathon_seconds",
+}
+
+# Zone -> (fastest, slowest) pace field
+PACE_ZONE_FIELDS: dict[str, tuple[str, str]] = {
+    "easy": ("easy_min_sec_per_km", "easy_max_sec_per_km"),
+    "marathon": ("marathon_min_sec_per_km", "marathon_max_sec_per_km"),
+    "threshold": ("threshold_min_sec_per_km", "threshold_max_sec_per_km"),
+    "interval": ("interval_min_sec_per_km", "interval_max_sec_per_km"),
+    "repetition": ("repetition_min_sec_per_km", "repetition_max_sec_per_km"),
+}
+
+# A pace within this many sec/km of a zone range still counts as in the zone
+PACE_ZONE_TOLERANCE_SEC = 5
+
+
+# ============================================================
+# PRECOMPUTED COLUMNS
+# ============================================================
+
+
+class RaceTimeColumn(NamedTuple):
+    """Race times for one distance, ascending (fastest first)."""
+
+    times: tuple[int, ...]
+    vdots: tuple[int, ...]  # VDOT of each time (descending)
+
+
+class PaceZoneColumn(NamedTuple):
+    """Pace range of one zone per VDOT, in ascending VDOT order."""
+
+    vdots: tuple[int, ...]
+    neg_fastest: tuple[int, ...]  # -fastest pace (ascending, for bisect)
+    slowest: tuple[int, ...]
+
+
+def _check_decreasing(values: list[int], column: str) -> None:
+    if any(later >= earlier for earlier, later in zip(values, values[1:])):
+        raise ValueError(f"VDOT table column {column} must decrease as VDOT increases")
+
+
+def _build_race_time_columns() -> dict[RaceDistance, RaceTimeColumn]:
+    columns = {}
+    for distance, field in RACE_TIME_FIELDS.items():
+        rows = [(entry.vdot, getattr(entry, field)) for entry in VDOT_TABLE if getattr(entry, field) is not None]
+        if not rows:
+            continue
+        _check_decreasing([seconds for _, seconds in rows], field)
+        rows.reverse()
+        columns[distance] = RaceTimeColumn(
+            times=tuple(seconds for _, seconds in rows),
+            vdots=tuple(vdot for vdot, _ in rows),
+        )
+    return columns
+
+
+def _build_pace_zone_columns() -> dict[str, PaceZoneColumn]:
+    columns = {}
+    for zone, (fastest_field, slowest_field) in PACE_ZONE_FIELDS.items():
+        fastest = [getattr(entry, fastest_field) for entry in VDOT_TABLE]
+        slowest = [getattr(entry, slowest_field) for entry in VDOT_TABLE]
+        _check_decreasing(fastest, fastest_field)
+        _check_decreasing(slowest, slowest_field)
+        columns[zone] = PaceZoneColumn(
+            vdots=tuple(entry.vdot for entry in VDOT_TABLE),
+            neg_fastest=tuple(-pace for pace in fastest),
+            slowest=tuple(slowest),
+        )
+    return columns
+
+
+# Row values by VDOT as plain dicts (no getattr in the interpolation path)
+_ROW_BY_VDOT: dict[int, dict[str, Optional[int]]] = {entry.vdot: entry.model_dump() for entry in VDOT_TABLE}
+
+RACE_TIME_COLUMNS: dict[RaceDistance, RaceTimeColumn] = _build_race_time_columns()
+PACE_ZONE_COLUMNS: dict[str, PaceZoneColumn] = _build_pace_zone_columns()
+
+
+# ============================================================
+# FORWARD LOOKUP (VDOT -> TIME / PACE)
+# ============================================================
+
+
+def interpolate_field(vdot: float, field: str) -> Optional[float]:
+    """Value of a table column at vdot, interpolated between neighbouring rows.
+
+    Args:
+        vdot: VDOT value (can be fractional)
+        field: VDOTTableEntry field name (e.g. "five_k_seconds")
+
+    Returns:
+        Interpolated value, or None if either neighbouring row lacks the field
+    """
+    vdot_lower, vdot_upper = get_nearest_vdot_values(vdot)
+    value_lower = _ROW_BY_VDOT[vdot_lower].get(field)
+    value_upper = _ROW_BY_VDOT[vdot_upper].get(field)
+    if not value_lower or not value_upper:
+        return None
+    return linear_interpolate(vdot, vdot_lower, vdot_upper, value_lower, value_upper)
+
+
+def race_time_for_vdot(race_distance: RaceDistance, vdot: float) -> Optional[float]:
+    """Predicted race time in seconds for a VDOT (None if not tabulated)."""
+    field = RACE_TIME_FIELDS.get(race_distance)
+    return interpolate_field(vdot, field) if field else None
+
+
+def pace_range_for_vdot(zone: str, vdot: float) -> tuple[float, float]:
+    """(fastest, slowest) pace in sec/km of a training zone at a VDOT.
+
+    Raises:
+        ValueError: If zone is unknown
+    """
+    if zone not in PACE_ZONE_FIELDS:
+        raise ValueError(f"Unknown pace zone: {zone}")
+    fastest_field, slowest_field = PACE_ZONE_FIELDS[zone]
+    return interpolate_field(vdot, fastest_field), interpolate_field(vdot, slowest_field)
+
+
+# ============================================================
+# INVERSE LOOKUP (TIME / PACE -> VDOT)
+# ============================================================
+
+
+def vdot_from_race_time(race_distance: RaceDistance, race_time_seconds: float) -> float:
+    """Fractional VDOT for a race time.
+
+    The row with the closest time (the slower row on a tie) is found by
+    bisect, then VDOT is interpolated across that row and the one below it
+    (see get_nearest_vdot_values). Times outside the table extrapolate.
+
+    Raises:
+        ValueError: If the distance has no race times in the table
+    """
+    column = RACE_TIME_COLUMNS.get(race_distance)
+    if column is None:
+        raise ValueError(f"Could not find VDOT for {race_distance.value} @ {race_time_seconds}s")
+
+    times = column.times
+    i = bisect_left(times, race_time_seconds)
+    if i == len(times) or (i > 0 and race_time_seconds - times[i - 1] < times[i] - race_time_seconds):
+        i -= 1
+    nearest_vdot = column.vdots[i]
+
+    field = RACE_TIME_FIELDS[race_distance]
+    vdot_lower, vdot_upper = get_nearest_vdot_values(nearest_vdot)
+    time_lower = _ROW_BY_VDOT[vdot_lower].get(field)
+    time_upper = _ROW_BY_VDOT[vdot_upper].get(field)
+    if not time_lower or not time_upper or time_lower == time_upper:
+        return float(nearest_vdot)
+    return linear_interpolate(race_time_seconds, time_lower, time_upper, vdot_lower, vdot_upper)
+
+
+def vdot_for_pace(
+    pace_sec_per_km: float,
+    zone: str = "threshold",
+    tolerance: int = PACE_ZONE_TOLERANCE_SEC,
+) -> Optional[int]:
+    """Lowest VDOT whose zone range (± tolerance) contains a pace.
+
+    Args:
+        pace_sec_per_km: Pace in seconds per km
+        zone: Training zone ("easy", "marathon", "threshold", "interval", "repetition")
+        tolerance: Slack in sec/km on both ends of each range
+
+    Returns:
+        VDOT value, or None if the zone is unknown or the pace out of range
+    """
+    column = PACE_ZONE_COLUMNS.get(zone)
+    if column is None:
+        return None
+    # First row (lowest VDOT) whose fastest pace - tolerance <= pace; later
+    # rows have faster slowest paces, so only this row can contain it
+    i = bisect_left(column.neg_fastest, -(pace_sec_per_km + tolerance))
+    if i < len(column.vdots) and pace_sec_per_km <= column.slowest[i] + tolerance:
+        return column.vdots[i]
+    return None
+
+
+def vdots_for_paces(
+    paces_sec_per_km: Iterable[float],
+    zone: str = "threshold",
+    tolerance: int = PACE_ZONE_TOLERANCE_SEC,
+) -> list[Optional[int]]:
+    """vdot_for_pace over many paces, in input order.
+
+    Repeated paces (common for whole activity histories, where paces are
+    whole seconds) are looked up once.
+    """
+    resolved: dict[float, Optional[int]] = {}
+    vdots = []
+    for pace in paces_sec_per_km:
+        if pace not in resolved:
+            resolved[pace] = vdot_for_pace(pace, zone, tolerance)
+        vdots.append(resolved[pace])
+    return vdots
+
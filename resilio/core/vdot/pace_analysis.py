@@ -19,8 +19,11 @@ from resilio.schemas.vdot import (
     EasyPaceData,
     PaceAnalysisResult,
 )
-from resilio.schemas.activity import NormalizedActivity
-from resilio.core.vdot.tables import VDOT_TABLE
+from resilio.core.activity_summary import ActivityLike
+from resilio.core.vdot.lookup import vdot_for_pace, vdots_for_paces
+
+# Zones find_vdot_from_pace resolves; other zones return None
+PACE_ANALYSIS_ZONES = ("easy", "threshold", "interval")
 
 
 def calculate_easy_hr_range(max_hr: int) -> Tuple[int, int]:
@@ -40,7 +43,7 @@ def calculate_easy_hr_range(max_hr: int) -> Tuple[int, int]:
     return (min_hr, max_hr_zone)
 
 
-def is_easy_effort_by_hr(activity: NormalizedActivity, max_hr: int) -> bool:
+def is_easy_effort_by_hr(activity: ActivityLike, max_hr: int) -> bool:
     """
     Check if activity is an easy effort based on heart rate.
 
@@ -58,7 +61,7 @@ def is_easy_effort_by_hr(activity: NormalizedActivity, max_hr: int) -> bool:
     return min_hr <= activity.average_hr <= max_hr_zone
 
 
-def is_quality_workout(activity: NormalizedActivity) -> bool:
+def is_quality_workout(activity: ActivityLike) -> bool:
     """
     Check if activity is a quality workout (tempo, threshold, interval).
 
@@ -81,37 +84,20 @@ def find_vdot_from_pace(pace_sec_per_km: int, zone_type: str = "threshold") -> O
     """
     Find VDOT that corresponds to a given pace.
 
-    Searches VDOT table for entry where pace falls within zone range (±5 sec tolerance).
+    Bisects the precomputed zone columns for the lowest VDOT whose pace range
+    contains the pace (±5 sec tolerance).
 
     Args:
         pace_sec_per_km: Pace in seconds per km
         zone_type: Zone type ("easy", "threshold", "interval")
 
     Returns:
-        VDOT value, or None if pace out of range
+        VDOT value, or None if pace out of range or zone_type is not one of
+        PACE_ANALYSIS_ZONES
     """
-    # Map zone type to table fields
-    pace_field_map = {
-        "threshold": ("threshold_min_sec_per_km", "threshold_max_sec_per_km"),
-        "interval": ("interval_min_sec_per_km", "interval_max_sec_per_km"),
-        "easy": ("easy_min_sec_per_km", "easy_max_sec_per_km"),
-    }
-
-    if zone_type not in pace_field_map:
+    if zone_type not in PACE_ANALYSIS_ZONES:
         return None
-
-    min_field, max_field = pace_field_map[zone_type]
-
-    # Find VDOT where pace falls within range
-    for entry in VDOT_TABLE:
-        min_pace = getattr(entry, min_field)
-        max_pace = getattr(entry, max_field)
-
-        # Check if pace falls within this VDOT's range (with tolerance)
-        if min_pace - 5 <= pace_sec_per_km <= max_pace + 5:
-            return entry.vdot
-
-    return None
+    return vdot_for_pace(pace_sec_per_km, zone_type)
 
 
 def find_vdot_from_easy_pace(pace_sec_per_km: int) -> Optional[int]:
@@ -130,7 +116,7 @@ def find_vdot_from_easy_pace(pace_sec_per_km: int) -> Optional[int]:
 
 
 def analyze_recent_paces(
-    activities: List[NormalizedActivity],
+    activities: List[ActivityLike],
     lookback_days: int,
     max_hr: Optional[int] = None
 ) -> PaceAnalysisResult:
@@ -142,7 +128,8 @@ def analyze_recent_paces(
     2. Easy runs: HR-based (65-78% max HR) + pace inference (NEW)
 
     Args:
-        activities: Recent activities (pre-filtered to runs)
+        activities: Recent activities (pre-filtered to runs); summaries need
+            their details loaded for the lookback window (details_since)
         lookback_days: Days to look back from today
         max_hr: Athlete's max HR (required for HR-based easy detection)
 
@@ -171,44 +158,46 @@ def analyze_recent_paces(
     easy_runs: List[EasyPaceData] = []
 
     # Detect quality workouts (existing logic)
-    for activity in recent_runs:
-        if is_quality_workout(activity):
-            avg_pace_sec_per_km = int(activity.duration_seconds / activity.distance_km)
-
-            # Only quality if pace <6:00/km (360 sec/km)
-            if avg_pace_sec_per_km < 360:
-                implied_vdot = find_vdot_from_pace(avg_pace_sec_per_km, "threshold")
-
-                if implied_vdot:
-                    workout_type = "tempo" if "tempo" in (activity.name or "").lower() else "interval"
-                    quality_workouts.append(WorkoutPaceData(
-                        date=activity.date.isoformat(),
-                        workout_type=workout_type,
-                        pace_sec_per_km=avg_pace_sec_per_km,
-                        implied_vdot=implied_vdot
-                    ))
+    # Only quality if pace <6:00/km (360 sec/km)
+    quality_candidates = [
+        (activity, int(activity.duration_seconds / activity.distance_km))
+        for activity in recent_runs
+        if is_quality_workout(activity)
+    ]
+    quality_candidates = [(activity, pace) for activity, pace in quality_candidates if pace < 360]
+    quality_vdots = vdots_for_paces([pace for _, pace in quality_candidates], "threshold")
+
+    for (activity, avg_pace_sec_per_km), implied_vdot in zip(quality_candidates, quality_vdots):
+        if implied_vdot:
+            workout_type = "tempo" if "tempo" in (activity.name or "").lower() else "interval"
+            quality_workouts.append(WorkoutPaceData(
+                date=activity.date.isoformat(),
+                workout_type=workout_type,
+                pace_sec_per_km=avg_pace_sec_per_km,
+                implied_vdot=implied_vdot
+            ))
 
     # Detect easy runs by HR (NEW)
     detection_method = "none"
     if max_hr:
-        for activity in recent_runs:
-            # Skip if already classified as quality workout
-            if any(qw.date == activity.date.isoformat() for qw in quality_workouts):
-                continue
-
-            # Check if easy effort by HR
-            if is_easy_effort_by_hr(activity, max_hr):
-                avg_pace_sec_per_km = int(activity.duration_seconds / activity.distance_km)
-                implied_vdot = find_vdot_from_easy_pace(avg_pace_sec_per_km)
-
-                if implied_vdot:
-                    easy_runs.append(EasyPaceData(
-                        date=activity.date.isoformat(),
-                        pace_sec_per_km=avg_pace_sec_per_km,
-                        average_hr=activity.average_hr,
-                        implied_vdot=implied_vdot,
-                        detected_by="heart_rate"
-                    ))
+        # Skip if already classified as quality workout
+        quality_dates = {qw.date for qw in quality_workouts}
+        easy_candidates = [
+            (activity, int(activity.duration_seconds / activity.distance_km))
+            for activity in recent_runs
+            if activity.date.isoformat() not in quality_dates and is_easy_effort_by_hr(activity, max_hr)
+        ]
+        easy_vdots = vdots_for_paces([pace for _, pace in easy_candidates], "easy")
+
+        for (activity, avg_pace_sec_per_km), implied_vdot in zip(easy_candidates, easy_vdots):
+            if implied_vdot:
+                easy_runs.append(EasyPaceData(
+                    date=activity.date.isoformat(),
+                    pace_sec_per_km=avg_pace_sec_per_km,
+                    average_hr=activity.average_hr,
+                    implied_vdot=implied_vdot,
+                    detected_by="heart_rate"
+                ))
 
         detection_method = "heart_rate" if easy_runs else "none"
 
@@ -11,6 +11,7 @@ References:
 - Table 5.2: VDOT to training paces
 """
 
+from bisect import bisect_left
 from typing import Dict, List, Optional
 from resilio.schemas.vdot import RaceDistance, VDOTTableEntry
 
@@ -271,6 +272,9 @@ VDOT_TABLE: List[VDOTTableEntry] = [VDOTTableEntry(**entry) for entry in VDOT_TA
 # Create lookup dictionaries for fast access
 VDOT_BY_VALUE: Dict[int, VDOTTableEntry] = {entry.vdot: entry for entry in VDOT_TABLE}
 
+# Tabulated VDOT values, ascending (for bisect)
+VDOT_VALUES: List[int] = sorted(VDOT_BY_VALUE)
+
 
 # ============================================================
 # HELPER FUNCTIONS
@@ -302,20 +306,14 @@ def get_nearest_vdot_values(vdot: float) -> tuple[int, int]:
         >>> get_nearest_vdot_values(47.5)
         (45, 48)
     """
-    vdot_int = int(vdot)
-
-    # Find the two closest VDOT values in table
-    available_vdots = sorted(VDOT_BY_VALUE.keys())
-
-    # Find insertion point
-    for i, val in enumerate(available_vdots):
-        if val >= vdot_int:
-            if i == 0:
-                return available_vdots[0], available_vdots[1]
-            return available_vdots[i - 1], available_vdots[i]
-
-    # vdot is higher than all table values
-    return available_vdots[-2], available_vdots[-1]
+    # First table value >= int(vdot), paired with the one before it
+    i = bisect_left(VDOT_VALUES, int(vdot))
+    if i == 0:
+        return VDOT_VALUES[0], VDOT_VALUES[1]
+    if i == len(VDOT_VALUES):
+        # vdot is higher than all table values
+        return VDOT_VALUES[-2], VDOT_VALUES[-1]
+    return VDOT_VALUES[i - 1], VDOT_VALUES[i]
 
 
 def linear_interpolate(x: float, x0: float, x1: float, y0: float, y1: float) -> float:
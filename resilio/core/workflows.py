@@ -38,6 +38,7 @@ from resilio.core.paths import (
     activity_path,
     weekly_metrics_summary_path,
     get_plans_dir,
+    strava_cache_dir,
 )
 from resilio.core.sync_state import (
     read_resume_state,
@@ -47,6 +48,7 @@ from resilio.core.sync_state import (
 from resilio.core.repository import RepositoryIO, ReadOptions
 from resilio.core.profile import ProfileService
 from resilio.schemas.repository import RepoError
+from resilio.core.http_cache import ResponseCache
 from resilio.core.strava import (
     fetch_athlete_profile,
     sync_strava_generator,
@@ -54,10 +56,16 @@ from resilio.core.strava import (
     StravaRateLimitError,
     StravaAPIError,
 )
+from resilio.core.ingest import BackgroundWriter, WriteFailure
+from resilio.core.sync_journal import SyncJournal
+from resilio.core.keywords import KeywordMatcher
 from resilio.core.normalization import normalize_activity
 from resilio.core.notes import analyze_activity
 from resilio.core.load import compute_load
-from resilio.core.metrics import compute_daily_metrics, compute_weekly_summary, _read_activities_for_date
+from resilio.core.metrics import (
+    compute_daily_metrics,
+    compute_weekly_summary,
+)
 from resilio.core.adaptation import (
     detect_adaptation_triggers,
     assess_override_risk,
@@ -73,7 +81,7 @@ from resilio.schemas.activity import (
 )
 from resilio.schemas.metrics import DailyMetrics
 from resilio.schemas.profile import AthleteProfile, Goal, GoalType, StravaConnection
-from resilio.schemas.sync import SyncPhase, SyncProgress, SyncReport, SyncResumeState
+from resilio.schemas.sync import SyncPhase, SyncReport, SyncResumeState
 # ProfileError import removed to avoid circular dependency - using duck typing instead
 from resilio.schemas.plan import WeekPlan, MasterPlan, PlanPhase
 
@@ -506,7 +514,27 @@ def _fetch_and_update_athlete_profile(
         return None
 
 
-SYNC_PROGRESS_FILE = "config/.sync_progress.json"
+# Progress checkpoints during sync are coalesced: the background writer is
+# flushed and the sync journal committed (written + fsynced) when the resume
+# cursor advances or the sync reaches METRICS/DONE/PAUSED/FAILED, and
+# otherwise at most once per SYNC_CHECKPOINT_EVERY activities or
+# SYNC_CHECKPOINT_INTERVAL_S seconds. The per-activity FETCHING <-> PROCESSING
+# alternation is not a checkpoint.
+SYNC_CHECKPOINT_EVERY = 25
+SYNC_CHECKPOINT_INTERVAL_S = 1.0
+
+# Activities serialized ahead of the background writer before processing waits
+SYNC_WRITE_BATCH_SIZE = 50
+
+# Default for _process_and_save_activity(profile=...); None is a valid profile
+# result (no profile yet)
+_PROFILE_NOT_LOADED = object()
+
+# Notes worth saving as memories during sync (negated mentions don't count)
+MEMORY_KEYWORDS = KeywordMatcher({
+    "injury_history": {"pain", "injury", "knee", "ankle"},
+    "preference": {"prefer", "like"},
+})
 
 
 def _apply_resume_state_to_history(history: dict, resume_state: SyncResumeState) -> None:
@@ -525,20 +553,9 @@ def _apply_resume_state_to_history(history: dict, resume_state: SyncResumeState)
     )
 
 
-def _write_sync_progress(repo: RepositoryIO, progress: SyncProgress) -> None:
-    """Persist sync heartbeat progress for observability."""
-    repo.write_json(SYNC_PROGRESS_FILE, progress.model_dump(mode="json"))
-
-
-def _clear_sync_progress(repo: RepositoryIO) -> None:
-    """Remove sync heartbeat file if present."""
-    if repo.file_exists(SYNC_PROGRESS_FILE):
-        repo.delete_file(SYNC_PROGRESS_FILE)
-
-
 def _has_existing_activities(repo: RepositoryIO) -> bool:
-    """Check if at least one activity file exists."""
-    return len(repo.list_files("data/activities/**/*.yaml")) > 0
+    """Check if at least one activity exists (via the activity index)."""
+    return repo.activity_index().earliest_date() is not None
 
 
 def run_sync_workflow(
@@ -578,6 +595,8 @@ def run_sync_workflow(
     """
     result = SyncReport(phase=SyncPhase.FETCHING)
     imported_activities: list[NormalizedActivity] = []
+    writer: Optional[BackgroundWriter] = None
+    journal: Optional[SyncJournal] = None
 
     # Acquire lock
     with WorkflowLock(operation="sync", repo=repo):
@@ -617,6 +636,11 @@ def run_sync_workflow(
                 )
                 resume_before = resume_state.resume_before_timestamp
 
+            # Append-only record of this run (cursor, outcomes) for status and
+            # crash resume; replaces rewriting a progress file per event
+            journal = SyncJournal(repo)
+            journal.begin(resume_state)
+
             # Step 0: Fetch and update athlete profile from Strava (best-effort)
             # Profile has its own transaction - failures don't block activity sync
             try:
@@ -629,11 +653,7 @@ def run_sync_workflow(
 
             # Load existing activities to prevent duplicates
             since_date = effective_since.date() if effective_since else None
-            existing_ids, existing_by_date = _load_existing_activity_index(
-                repo,
-                "data/activities",
-                since_date
-            )
+            existing_ids, existing_by_date = _load_existing_activity_index(repo, since_date)
 
             # Step 1: Sync activities from Strava using generator (streaming)
             # Build existing IDs set for skipping
@@ -645,6 +665,11 @@ def run_sync_workflow(
                 resume_before,
             )
 
+            # Activity files are written by a background thread; every
+            # checkpoint flushes it first so progress never runs ahead of disk
+            writer = BackgroundWriter(repo, max_pending=SYNC_WRITE_BATCH_SIZE)
+            checkpoint = {"at": time.monotonic(), "activities": 0}
+
             def progress_hook(payload: dict) -> None:
                 phase_raw = payload.get("phase", result.phase)
                 try:
@@ -657,19 +682,36 @@ def run_sync_workflow(
                 if cursor_before_timestamp is not None:
                     resume_state.resume_before_timestamp = int(cursor_before_timestamp)
                 resume_state.last_progress_at = datetime.now(timezone.utc)
-
-                progress = SyncProgress(
-                    phase=phase,
-                    activities_seen=int(payload.get("activities_seen", result.activities_imported)),
-                    activities_imported=result.activities_imported,
-                    activities_skipped=result.activities_skipped,
-                    activities_failed=result.activities_failed,
+                cursor_or_phase_recorded = journal.record_progress(
+                    phase,
+                    cursor_before_timestamp=resume_state.resume_before_timestamp,
                     current_page=payload.get("current_page"),
                     current_month=payload.get("current_month"),
-                    cursor_before_timestamp=resume_state.resume_before_timestamp,
-                    updated_at=resume_state.last_progress_at,
+                    activities_listed=payload.get("activities_seen") if phase == SyncPhase.FETCHING else None,
+                )
+
+                processed = result.activities_imported + result.activities_failed
+                now_s = time.monotonic()
+                if (
+                    not cursor_or_phase_recorded
+                    and processed - checkpoint["activities"] < SYNC_CHECKPOINT_EVERY
+                    and now_s - checkpoint["at"] < SYNC_CHECKPOINT_INTERVAL_S
+                ):
+                    return
+                _record_write_failures(writer.flush(), existing_ids, imported_activities, result, journal)
+                checkpoint.update(at=now_s, activities=processed)
+                journal.commit()
+
+            # Cache list pages and detail/lap payloads so resumed syncs don't
+            # spend rate-limit quota on responses already seen
+            response_cache = None
+            strava_settings = config.settings.strava
+            if strava_settings.response_cache_enabled:
+                response_cache = ResponseCache(
+                    repo.resolve_path(strava_cache_dir()),
+                    ttl_seconds=strava_settings.response_cache_ttl_minutes * 60,
+                    max_bytes=strava_settings.response_cache_max_mb * 1024 * 1024,
                 )
-                _write_sync_progress(repo, progress)
 
             # Use generator for streaming - activities processed as they're fetched
             gen = sync_strava_generator(
@@ -678,8 +720,12 @@ def run_sync_workflow(
                 before=resume_before,
                 existing_ids=existing_strava_ids,
                 progress_hook=progress_hook,
+                response_cache=response_cache,
             )
 
+            # Profile is read once per sync for RPE analysis (not per activity)
+            profile = ProfileService(repo).load_profile()
+
             # Show progress: starting sync
             print("[Sync] Starting activity sync...", flush=True)
 
@@ -702,7 +748,7 @@ def run_sync_workflow(
                     break
 
                 result.phase = SyncPhase.PROCESSING
-                # Process and save immediately (no buffering)
+                # Process in memory, hand the file to the background writer
                 _process_and_save_activity(
                     raw_activity,
                     existing_ids,
@@ -710,6 +756,9 @@ def run_sync_workflow(
                     repo,
                     imported_activities,
                     result,
+                    profile=profile,
+                    writer=writer,
+                    journal=journal,
                 )
                 progress_hook(
                     {
@@ -718,6 +767,10 @@ def run_sync_workflow(
                     }
                 )
 
+            # Every imported activity must be on disk before metrics and the
+            # resume cursor are persisted
+            _record_write_failures(writer.close(), existing_ids, imported_activities, result, journal)
+
             # Merge fetch-layer report counters/errors
             result.activities_skipped += sync_cmd_result.activities_skipped
             result.activities_failed += sync_cmd_result.activities_failed
@@ -741,7 +794,7 @@ def run_sync_workflow(
                 result.activities_skipped,
             )
 
-            # Step 9: Recompute all metrics (including rest days and weekly summary)
+            # Step 9: Update metrics (including rest days and weekly summary)
             if imported_activities:
                 # Show progress: metrics calculation phase
                 print("[Sync] Calculating training metrics (CTL/ATL/TSB)...", flush=True)
@@ -749,15 +802,12 @@ def run_sync_workflow(
                 progress_hook({"phase": SyncPhase.METRICS.value})
 
                 try:
-                    # Get earliest activity date to start metrics computation
-                    earliest = min(act.date for act in imported_activities)
-
-                    # Recompute metrics from earliest imported activity to today
-                    # This includes activity days, rest days, and weekly summary
-                    metrics_result = recompute_all_metrics(
+                    # Recompute forward from each imported activity date only as far
+                    # as the result changes, filling any missing days up to today
+                    metrics_result = update_metrics_incremental(
                         repo,
-                        start_date=earliest,
-                        end_date=date.today()
+                        {act.date for act in imported_activities},
+                        end_date=date.today(),
                     )
 
                     logger.info(
@@ -787,27 +837,9 @@ def run_sync_workflow(
             _apply_resume_state_to_history(history, resume_state)
             write_training_history(repo, history)
 
-            if result.rate_limited:
-                result.phase = SyncPhase.PAUSED_RATE_LIMIT
-                _write_sync_progress(
-                    repo,
-                    SyncProgress(
-                        phase=SyncPhase.PAUSED_RATE_LIMIT,
-                        activities_seen=(
-                            result.activities_imported
-                            + result.activities_skipped
-                            + result.activities_failed
-                        ),
-                        activities_imported=result.activities_imported,
-                        activities_skipped=result.activities_skipped,
-                        activities_failed=result.activities_failed,
-                        cursor_before_timestamp=resume_state.resume_before_timestamp,
-                        updated_at=now,
-                    ),
-                )
-            else:
-                result.phase = SyncPhase.DONE
-                _clear_sync_progress(repo)
+            # Compact the journal: a snapshot when paused, removed when done
+            result.phase = SyncPhase.PAUSED_RATE_LIMIT if result.rate_limited else SyncPhase.DONE
+            journal.finish(result, resume_state)
 
             logger.info(
                 "[Sync] Complete: %s imported, %s failed",
@@ -818,35 +850,21 @@ def run_sync_workflow(
             return result
 
         except (StravaAuthError, StravaRateLimitError, StravaAPIError):
+            if writer is not None:
+                writer.close()  # Keep activities processed before the failure
             result.phase = SyncPhase.FAILED
             result.errors.append("Fatal Strava API/auth error")
-            _write_sync_progress(
-                repo,
-                SyncProgress(
-                    phase=SyncPhase.FAILED,
-                    activities_seen=result.activities_imported + result.activities_failed,
-                    activities_imported=result.activities_imported,
-                    activities_skipped=result.activities_skipped,
-                    activities_failed=result.activities_failed,
-                    updated_at=datetime.now(timezone.utc),
-                ),
-            )
+            if journal is not None:
+                journal.finish(result)  # Snapshot keeps the cursor for the next sync
             raise
 
         except Exception as e:
+            if writer is not None:
+                writer.close()  # Keep activities processed before the failure
             result.phase = SyncPhase.FAILED
             result.errors.append(f"Sync workflow failed: {e}")
-            _write_sync_progress(
-                repo,
-                SyncProgress(
-                    phase=SyncPhase.FAILED,
-                    activities_seen=result.activities_imported + result.activities_failed,
-                    activities_imported=result.activities_imported,
-                    activities_skipped=result.activities_skipped,
-                    activities_failed=result.activities_failed,
-                    updated_at=datetime.now(timezone.utc),
-                ),
-            )
+            if journal is not None:
+                journal.finish(result)  # Snapshot keeps the cursor for the next sync
             logger.error("[Sync] Fatal error (partial progress preserved): %s", e)
             raise WorkflowError(f"Sync workflow failed: {e}") from e
 
@@ -1365,14 +1383,16 @@ def run_manual_activity_workflow(
         activity_path = _get_activity_path(normalized)
         repo.write_yaml(activity_path, normalized)
 
-        # M9: Recompute metrics for activity date
-        metrics = compute_daily_metrics(activity_date, repo)
-        metrics_path = daily_metrics_path(activity_date)
-        repo.write_yaml(metrics_path, metrics)
+        # M9: Update metrics from the activity date forward (only as far as they change)
+        metrics_result = update_metrics_incremental(
+            repo,
+            {activity_date},
+            end_date=max(activity_date, date.today()),
+        )
 
         result.success = True
         result.activity = normalized
-        result.metrics_updated = metrics
+        result.metrics_updated = metrics_result["metrics"][0] if metrics_result["metrics"] else None
 
         logger.info(
             "[ManualActivity] Complete: %s logged (%s min, RPE %s)",
@@ -1394,48 +1414,34 @@ def run_manual_activity_workflow(
 
 def _load_existing_activity_index(
     repo: RepositoryIO,
-    activities_dir: str,
     since_date: Optional[date],
-) -> tuple[set[str], dict[date, list[NormalizedActivity]]]:
-    """Build an index of existing activities to prevent duplicate imports."""
-    existing_ids: set[str] = set()
-    existing_by_date: dict[date, list[NormalizedActivity]] = {}
-
-    pattern = f"{activities_dir}/**/*.yaml"
-    for file_path in repo.list_files(pattern):
-        file_date = _parse_activity_date_from_filename(Path(file_path).name)
-        if since_date and file_date and file_date < since_date:
-            continue
+) -> tuple[set[str], dict[date, list]]:
+    """
+    Build an in-memory index of existing activities to prevent duplicate imports.
 
-        activity = repo.read_yaml(
-            file_path,
-            NormalizedActivity,
-            ReadOptions(allow_missing=True, should_validate=True),
-        )
-        if activity is None or isinstance(activity, RepoError):
-            continue
+    Served from the persistent activity index, so no activity YAML is parsed
+    unless it changed since it was last indexed. Values of existing_by_date are
+    ActivityIndexEntry records, which carry the fields _is_fuzzy_duplicate uses.
+    """
+    existing_ids: set[str] = set()
+    existing_by_date: dict[date, list] = {}
 
-        existing_ids.add(activity.id)
-        existing_by_date.setdefault(activity.date, []).append(activity)
+    for entry in repo.activity_index().query(start_date=since_date):
+        existing_ids.add(entry.id)
+        existing_by_date.setdefault(entry.date, []).append(entry)
 
     return existing_ids, existing_by_date
 
 
-def _parse_activity_date_from_filename(filename: str) -> Optional[date]:
-    """Extract YYYY-MM-DD date from activity filename, if present."""
-    if len(filename) < 10:
-        return None
-    try:
-        return datetime.strptime(filename[:10], "%Y-%m-%d").date()
-    except ValueError:
-        return None
-
-
 def _is_fuzzy_duplicate(
     new_activity: NormalizedActivity,
-    existing_activities: list[NormalizedActivity],
+    existing_activities: list,
 ) -> bool:
-    """Check if activity matches an existing one by date, sport, time, and duration."""
+    """
+    Check if activity matches an existing one by date, sport, time, and duration.
+
+    existing_activities may hold NormalizedActivity or ActivityIndexEntry records.
+    """
     for existing in existing_activities:
         if new_activity.sport_type != existing.sport_type:
             continue
@@ -1488,10 +1494,13 @@ def _get_activity_path(activity: NormalizedActivity) -> str:
 def _process_and_save_activity(
     raw_activity: RawActivity,
     existing_ids: set[str],
-    existing_by_date: dict[date, list[NormalizedActivity]],
+    existing_by_date: dict[date, list],
     repo: RepositoryIO,
     imported_activities: list[NormalizedActivity],
     result: SyncReport,
+    profile: Any = _PROFILE_NOT_LOADED,
+    writer: Optional[BackgroundWriter] = None,
+    journal: Optional[SyncJournal] = None,
 ) -> bool:
     """
     Process and save a single activity through the pipeline.
@@ -1499,6 +1508,10 @@ def _process_and_save_activity(
     This function is idempotent via deduplication checks and does NOT use
     transactions since activity writes are atomic at the file level.
 
+    Steps 2-5 are an in-memory transform. With a writer, step 6 only
+    serializes the activity and queues the file; the writer reports write
+    failures on flush (see _record_write_failures).
+
     Pipeline steps:
     1. Check for duplicate by ID
     2. Normalize activity (M6)
@@ -1516,14 +1529,20 @@ def _process_and_save_activity(
         repo: Repository for file operations
         imported_activities: Imported activity records (updated in-place)
         result: Sync report to update (updated in-place)
+        profile: Result of ProfileService.load_profile() from the caller, so
+            a batch reads it once (loaded here if not given)
+        writer: Background writer for the activity file (written inline if None)
+        journal: Sync journal to record the outcome in
 
     Returns:
-        True if activity saved successfully, False if skipped or failed
+        True if activity saved (or queued) successfully, False if skipped or failed
     """
     try:
         # Step 1: Check for exact duplicate by ID
         if raw_activity.id in existing_ids:
             result.activities_skipped += 1
+            if journal is not None:
+                journal.record_skipped(raw_activity.id)
             return False
 
         # Step 2: Normalize (M6)
@@ -1533,11 +1552,13 @@ def _process_and_save_activity(
         existing_on_day = existing_by_date.get(normalized.date, [])
         if _is_fuzzy_duplicate(normalized, existing_on_day):
             result.activities_skipped += 1
+            if journal is not None:
+                journal.record_skipped(raw_activity.id)
             return False
 
         # Step 4: Analyze notes & RPE (M7)
-        profile_service = ProfileService(repo)
-        profile = profile_service.load_profile()
+        if profile is _PROFILE_NOT_LOADED:
+            profile = ProfileService(repo).load_profile()
         analysis = analyze_activity(normalized, profile)
 
         # Resolve RPE (use intelligent selection with confidence-based priority)
@@ -1547,9 +1568,14 @@ def _process_and_save_activity(
         load_result = compute_load(normalized, estimated_rpe, repo)
         normalized.calculated = load_result
 
-        # Step 6: Save activity immediately (no transaction needed - idempotent)
+        # Step 6: Save activity (no transaction needed - idempotent)
         activity_file_path = _get_activity_path(normalized)
-        repo.write_yaml(activity_file_path, normalized)
+        if writer is not None:
+            error = writer.submit(activity_file_path, normalized)
+        else:
+            error = repo.write_yaml(activity_file_path, normalized)
+        if error is not None:
+            raise RuntimeError(error.message)
 
         # Step 7: Update in-memory indexes BEFORE memory extraction
         # This ensures consistency even if Step 8 fails
@@ -1557,21 +1583,21 @@ def _process_and_save_activity(
         existing_by_date.setdefault(normalized.date, []).append(normalized)
         imported_activities.append(normalized)
         result.activities_imported += 1
+        if journal is not None:
+            journal.record_imported(normalized.id, normalized.date)
 
         # Step 8: Extract memories from notes (M13)
         # Failures here won't corrupt existing_ids since we updated it in Step 7
         if normalized.description or normalized.private_note:
             memory_text = normalized.description or normalized.private_note
             # Simple memory extraction (v0: just store interesting notes)
-            if any(
-                keyword in memory_text.lower()
-                for keyword in ["pain", "injury", "prefer", "like", "knee", "ankle"]
-            ):
+            memory_keywords = MEMORY_KEYWORDS.match(memory_text)
+            if memory_keywords["injury_history"] or memory_keywords["preference"]:
                 now = datetime.now(timezone.utc)
                 memory = Memory(
                     id=str(uuid.uuid4()),
                     type=MemoryType.INJURY_HISTORY
-                    if any(kw in memory_text.lower() for kw in ["pain", "injury", "knee"])
+                    if memory_keywords["injury_history"]
                     else MemoryType.PREFERENCE,
                     content=memory_text[:200],  # First 200 chars
                     source=MemorySource.ACTIVITY_NOTE,
@@ -1590,9 +1616,32 @@ def _process_and_save_activity(
         result.activities_failed += 1
         activity_id = raw_activity.id if raw_activity else "unknown"
         result.errors.append(f"Failed to process activity {activity_id}: {e}")
+        if journal is not None:
+            journal.record_failed(activity_id, str(e))
         return False
 
 
+def _record_write_failures(
+    failures: list[WriteFailure],
+    existing_ids: set[str],
+    imported_activities: list[NormalizedActivity],
+    result: SyncReport,
+    journal: Optional[SyncJournal] = None,
+) -> None:
+    """Move activities whose queued file write failed from imported to failed."""
+    for failure in failures:
+        activity = failure.data
+        existing_ids.discard(activity.id)
+        was_imported = activity in imported_activities
+        if was_imported:
+            imported_activities.remove(activity)
+            result.activities_imported -= 1
+        result.activities_failed += 1
+        result.errors.append(f"Failed to save activity {activity.id}: {failure.error.message}")
+        if journal is not None:
+            journal.record_failed(activity.id, failure.error.message, was_imported=was_imported)
+
+
 def _get_existing_metrics_dates(repo: RepositoryIO) -> list[date]:
     """
     Get list of all dates that have computed metrics.
@@ -1624,10 +1673,9 @@ def _get_existing_metrics_dates(repo: RepositoryIO) -> list[date]:
 
 def _get_earliest_activity_date(repo: RepositoryIO) -> Optional[date]:
     """
-    Find earliest activity date from disk.
+    Find earliest activity date from the activity index.
 
-    Scans all activity files to determine the earliest activity date,
-    which is used as the starting point for metrics recomputation.
+    Used as the starting point for metrics recomputation.
 
     Args:
         repo: Repository I/O instance
@@ -1636,23 +1684,7 @@ def _get_earliest_activity_date(repo: RepositoryIO) -> Optional[date]:
         Earliest activity date, or None if no activities exist
     """
     try:
-        activity_files = repo.list_files("data/activities/**/*.yaml")
-        if not activity_files:
-            return None
-
-        dates = []
-        for file_path in activity_files:
-            # Extract date from filename: "2026-01-14_run_0930.yaml" → "2026-01-14"
-            filename = Path(file_path).name
-            date_str = filename.split('_')[0]
-            try:
-                dates.append(date.fromisoformat(date_str))
-            except ValueError:
-                # Skip invalid filenames
-                continue
-
-        return min(dates) if dates else None
-
+        return repo.activity_index().earliest_date()
     except Exception:
         return None
 
@@ -1667,6 +1699,8 @@ def recompute_all_metrics(
 
     Reads activity files from disk, computes daily metrics (including rest days),
     and updates weekly summary. NO external API calls - completely offline.
+    Uses the single-pass range engine, so each activity file is read once
+    regardless of how many days are recomputed.
 
     This function enables:
     - Fixing metric calculation bugs without re-syncing from Strava
@@ -1685,14 +1719,9 @@ def recompute_all_metrics(
         MetricsCalculationError: If no activities found or computation fails
     """
     from resilio.core.metrics import (
-        compute_daily_metrics,
-        compute_weekly_summary,
+        compute_metrics_range,
         MetricsCalculationError,
     )
-    from resilio.core.paths import (
-        daily_metrics_path,
-        weekly_metrics_summary_path,
-    )
 
     # Step 1: Discover date range from existing activities
     if start_date is None:
@@ -1706,29 +1735,13 @@ def recompute_all_metrics(
     logger.info("[Metrics] Recomputing from %s to %s", start_date, end_date)
 
     # Step 2: Compute metrics for ALL dates (activities + rest days)
-    metrics_computed = 0
-    rest_days_filled = 0
-
-    current_date = start_date
-    while current_date <= end_date:
-        # Check if rest day by reading activities for this date
-        activities = _read_activities_for_date(current_date, repo)
-        is_rest_day = len(activities) == 0
-
-        # Compute metrics (compute_daily_metrics persists to disk)
-        metrics = compute_daily_metrics(current_date, repo)
-
-        metrics_computed += 1
-        if is_rest_day:
-            rest_days_filled += 1
-
-        current_date += timedelta(days=1)
+    # compute_metrics_range persists each day to disk
+    computed = compute_metrics_range(start_date, end_date, repo)
+    metrics_computed = len(computed)
+    rest_days_filled = sum(1 for m in computed if m.daily_load.activity_count == 0)
 
     # Step 3: Recompute weekly summary for current week
-    today = date.today()
-    week_start = today - timedelta(days=today.weekday())  # Monday
-    weekly_summary = compute_weekly_summary(week_start, repo)
-    repo.write_yaml(weekly_metrics_summary_path(), weekly_summary.model_dump())
+    _refresh_weekly_summary(repo)
 
     logger.info(
         "[Metrics] Computed %s days (%s rest days)",
@@ -1742,3 +1755,56 @@ def recompute_all_metrics(
         "metrics_computed": metrics_computed,
         "rest_days_filled": rest_days_filled,
     }
+
+
+def update_metrics_incremental(
+    repo: RepositoryIO,
+    changed_dates: set[date],
+    end_date: Optional[date] = None,
+) -> dict:
+    """
+    Update metrics after activities changed on a few dates.
+
+    Unlike recompute_all_metrics, days are only recomputed forward from each
+    changed date while the CTL/ATL chain and trailing windows still differ
+    from the stored metrics, and unchanged days are not rewritten. Missing
+    days up to end_date are filled in. The weekly summary is refreshed.
+
+    Args:
+        repo: Repository I/O instance
+        changed_dates: Dates whose activities were added, edited or removed
+        end_date: Last date to keep up to date (default: today)
+
+    Returns:
+        Dict with metrics_computed count and the recomputed metrics (date order)
+
+    Raises:
+        MetricsCalculationError: If computation fails
+    """
+    from resilio.core.metrics import compute_metrics_incremental
+
+    if end_date is None:
+        end_date = date.today()
+
+    computed = compute_metrics_incremental(changed_dates, repo, end_date=end_date)
+    _refresh_weekly_summary(repo)
+
+    logger.info(
+        "[Metrics] Incrementally recomputed %s days for %s changed dates",
+        len(computed),
+        len(changed_dates),
+    )
+
+    return {
+        "end_date": end_date,
+        "metrics_computed": len(computed),
+        "metrics": computed,
+    }
+
+
+def _refresh_weekly_summary(repo: RepositoryIO) -> None:
+    """Recompute and persist the weekly summary for the current week."""
+    today = date.today()
+    week_start = today - timedelta(days=today.weekday())  # Monday
+    weekly_summary = compute_weekly_summary(week_start, repo)
+    repo.write_yaml(weekly_metrics_summary_path(), weekly_summary.model_dump())
@@ -191,6 +191,14 @@ class DataQuality(str, Enum):
     TREADMILL = "treadmill"  # Pace unreliable, HR prioritized
 
 
+class NoteFlags(BaseModel):
+    """Keywords found in an activity's description/private note (negated mentions excluded)."""
+
+    injury: list[str] = Field(default_factory=list)
+    illness: list[str] = Field(default_factory=list)
+    travel: list[str] = Field(default_factory=list)
+
+
 class NormalizedActivity(BaseModel):
     """
     Fully normalized activity ready for downstream processing.
@@ -260,6 +268,9 @@ class NormalizedActivity(BaseModel):
     # Calculated load (added by M8 Load Engine)
     calculated: Optional["LoadCalculation"] = None
 
+    # Note keywords, matched once at import (None = saved before note flags existed)
+    note_flags: Optional[NoteFlags] = None
+
     @model_validator(mode="before")
     @classmethod
     def compute_day_of_week(cls, data):
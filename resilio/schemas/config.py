@@ -52,6 +52,11 @@ class StravaSettings(BaseModel):
     history_import_weeks: int = 12
     lap_fetch_incremental_days: int = 999999  # Fetch all laps for incremental sync (effectively unlimited)
     lap_fetch_historical_days: int = 60  # 60-day limit for historical/backfill sync
+    fetch_workers: int = 4  # Concurrent detail/lap fetches during sync (1 = sequential)
+    max_requests_per_second: float = 5.0  # Token-bucket refill rate (burst size = same)
+    response_cache_enabled: bool = True  # On-disk cache for list pages and detail/lap payloads
+    response_cache_ttl_minutes: int = 30  # Serve cached pages without revalidating for this long
+    response_cache_max_mb: int = 100  # Size budget; oldest entries are evicted first
 
 
 class TrainingDefaults(BaseModel):
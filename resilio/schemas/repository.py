@@ -54,6 +54,7 @@ class ReadOptions(BaseModel):
     should_validate: bool = True
     allow_missing: bool = False
     migrate_schema: bool = True
+    use_cache: bool = True  # Use the process-level model cache when enabled
 
 
 # ============================================================
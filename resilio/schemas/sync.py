@@ -63,6 +63,42 @@ class SyncProgress(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
 
+class SyncJournalState(BaseModel):
+    """Sync state derived by replaying the sync journal (core/sync_journal.py)."""
+
+    phase: SyncPhase = SyncPhase.FETCHING
+    backfill_in_progress: bool = False
+    target_start_date: Optional[date] = None
+    cursor_before_timestamp: Optional[int] = None
+    current_page: Optional[int] = None
+    current_month: Optional[str] = None
+    activities_listed: int = 0
+    activities_imported: int = 0
+    activities_skipped: int = 0
+    activities_failed: int = 0
+    failed_ids: list[str] = Field(default_factory=list)
+    updated_at: Optional[datetime] = None
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    def to_progress(self) -> SyncProgress:
+        """Heartbeat view for `resilio sync --status`."""
+        return SyncProgress(
+            phase=self.phase,
+            activities_seen=max(
+                self.activities_listed,
+                self.activities_imported + self.activities_skipped + self.activities_failed,
+            ),
+            activities_imported=self.activities_imported,
+            activities_skipped=self.activities_skipped,
+            activities_failed=self.activities_failed,
+            current_page=self.current_page,
+            current_month=self.current_month,
+            cursor_before_timestamp=self.cursor_before_timestamp,
+            updated_at=self.updated_at or datetime.min,
+        )
+
+
 class SyncLockStatus(BaseModel):
     """Current lock status for observability."""
 
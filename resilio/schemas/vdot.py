@@ -239,6 +239,9 @@ class VDOTEstimate(BaseModel):
     supporting_data: list[WorkoutPaceData] = Field(
         default_factory=list, description="Workout paces used for estimation"
     )
+    cache: Optional[str] = Field(
+        default=None, description="Estimate cache outcome: 'hit', 'miss' or 'bypass'"
+    )
 
     model_config = ConfigDict(
         use_enum_values=True,
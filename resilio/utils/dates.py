@@ -3,7 +3,7 @@
 Ensures all training plans follow Monday-Sunday week structure.
 """
 from datetime import date, timedelta
-from typing import Tuple
+from typing import Any, Iterable, Optional, Tuple, Union
 
 
 def get_next_monday(from_date: date = None) -> date:
@@ -93,3 +93,127 @@ def validate_week_start(week_start: date) -> bool:
         True if Monday, False otherwise
     """
     return week_start.weekday() == 0
+
+
+def monday_ordinal(ordinal: int) -> int:
+    """
+    Ordinal of the Monday starting the week of a date ordinal.
+
+    date.fromordinal(1) (0001-01-01) is a Monday, so weeks are the runs of
+    seven ordinals starting at 1, 8, 15, ...
+
+    Examples:
+        >>> date.fromordinal(monday_ordinal(date(2026, 1, 22).toordinal()))
+        datetime.date(2026, 1, 19)
+    """
+    return ordinal - (ordinal - 1) % 7
+
+
+class WeekBuckets:
+    """
+    Per-week activity counts and totals over consecutive Monday-Sunday weeks.
+
+    Each activity's week index is computed once from its date ordinal, so
+    bucketing N activities over W weeks is a single O(N + W) pass instead of
+    filtering every activity for every week.
+
+    Weeks run from the Monday on or before start_date to the week containing
+    end_date; dates outside those weeks are ignored.
+
+    Examples:
+        >>> buckets = WeekBuckets(date(2026, 1, 19), date(2026, 2, 1))
+        >>> buckets.add(date(2026, 1, 21), distance_km=10.0)
+        True
+        >>> buckets.counts, buckets.totals["distance_km"]
+        ([1, 0], [10.0, 0.0])
+    """
+
+    __slots__ = ("first_monday", "num_weeks", "counts", "totals", "_first_ordinal")
+
+    def __init__(self, start_date: date, end_date: date):
+        self._first_ordinal = monday_ordinal(start_date.toordinal())
+        self.first_monday = date.fromordinal(self._first_ordinal)
+        self.num_weeks = max(0, (monday_ordinal(end_date.toordinal()) - self._first_ordinal) // 7 + 1)
+        self.counts: list[int] = [0] * self.num_weeks
+        self.totals: dict[str, list[float]] = {}
+
+    @classmethod
+    def from_activities(
+        cls,
+        activities: Iterable[Any],
+        start_date: date,
+        end_date: date,
+        values: Iterable[str] = (),
+    ) -> "WeekBuckets":
+        """
+        Bucket activities (anything with date_ordinal or date attributes).
+
+        Args:
+            activities: Activities or summaries
+            start_date: First day of the analysis window
+            end_date: Last day of the analysis window
+            values: Attribute names to total per week (None counts as 0);
+                their totals exist even when no activity falls in range
+        """
+        buckets = cls(start_date, end_date)
+        names = tuple(values)
+        for name in names:
+            buckets.totals[name] = [0.0] * buckets.num_weeks
+        for activity in activities:
+            ordinal = getattr(activity, "date_ordinal", None)
+            if ordinal is None:
+                ordinal = activity.date.toordinal()
+            buckets.add(ordinal, **{name: getattr(activity, name) or 0.0 for name in names})
+        return buckets
+
+    def week_index(self, day: Union[date, int]) -> Optional[int]:
+        """Index of the week containing a date (or date ordinal), None if outside."""
+        ordinal = day if isinstance(day, int) else day.toordinal()
+        index = (ordinal - self._first_ordinal) // 7
+        return index if 0 <= index < self.num_weeks else None
+
+    def add(self, day: Union[date, int], **values: float) -> bool:
+        """
+        Count one activity in its week and add its values to the week totals.
+
+        Returns:
+            False if the date falls outside the bucketed weeks
+        """
+        index = self.week_index(day)
+        if index is None:
+            return False
+        self.counts[index] += 1
+        for name, value in values.items():
+            totals = self.totals.get(name)
+            if totals is None:
+                totals = self.totals[name] = [0.0] * self.num_weeks
+            totals[index] += value
+        return True
+
+    def week_start(self, index: int) -> date:
+        """Monday of a week index."""
+        return date.fromordinal(self._first_ordinal + 7 * index)
+
+    @property
+    def active_weeks(self) -> int:
+        """Weeks with at least one activity."""
+        return sum(1 for count in self.counts if count)
+
+    def inactive_runs(self) -> list[tuple[int, int]]:
+        """(first, last) week indexes of each run of consecutive empty weeks."""
+        runs = []
+        run_start = None
+        for index, count in enumerate(self.counts):
+            if count == 0:
+                if run_start is None:
+                    run_start = index
+            elif run_start is not None:
+                runs.append((run_start, index - 1))
+                run_start = None
+        if run_start is not None:
+            runs.append((run_start, self.num_weeks - 1))
+        return runs
+
+    def max_total(self, name: str) -> float:
+        """Largest weekly total of a value (0.0 if nothing was added)."""
+        return max(self.totals.get(name, ()), default=0.0)
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for the serialization backends used by RepositoryIO.
+
+Compares, on the real activity and daily-metrics fixtures in tests/fixtures/:
+- pure-Python PyYAML (yaml.SafeLoader / yaml.SafeDumper)
+- libyaml (yaml.CSafeLoader / yaml.CSafeDumper), if PyYAML was built with it
+- stdlib json
+- orjson, if installed
+
+Usage:
+    python scripts/bench_serialization.py [--iterations 500]
+"""
+
+import argparse
+import json
+import sys
+import timeit
+from pathlib import Path
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from resilio.core.serialization import LIBYAML_AVAILABLE, ORJSON_AVAILABLE  # noqa: E402
+
+FIXTURES_DIR = Path(__file__).resolve().parent.parent / "tests" / "fixtures"
+FIXTURES = ["activity_sample.yaml", "daily_metrics_sample.yaml"]
+
+DUMP_KWARGS = {"sort_keys": False, "allow_unicode": True, "default_flow_style": False}
+
+
+def _backends() -> dict:
+    """Map backend name -> (load(text), dump(data))."""
+    backends = {
+        "pyyaml (pure)": (
+            lambda text: yaml.load(text, Loader=yaml.SafeLoader),
+            lambda data: yaml.dump(data, Dumper=yaml.SafeDumper, **DUMP_KWARGS),
+        ),
+    }
+    if LIBYAML_AVAILABLE:
+        backends["pyyaml (libyaml)"] = (
+            lambda text: yaml.load(text, Loader=yaml.CSafeLoader),
+            lambda data: yaml.dump(data, Dumper=yaml.CSafeDumper, **DUMP_KWARGS),
+        )
+    backends["json (stdlib)"] = (
+        json.loads,
+        lambda data: json.dumps(data, indent=2, ensure_ascii=False),
+    )
+    if ORJSON_AVAILABLE:
+        import orjson
+
+        backends["orjson"] = (
+            orjson.loads,
+            lambda data: orjson.dumps(data, option=orjson.OPT_INDENT_2),
+        )
+    return backends
+
+
+def _time_per_call(func, iterations: int) -> float:
+    """Best-of-3 time per call in microseconds."""
+    return min(timeit.repeat(func, number=iterations, repeat=3)) / iterations * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--iterations", type=int, default=500, help="Calls per timing run")
+    args = parser.parse_args()
+
+    backends = _backends()
+    print(f"libyaml: {LIBYAML_AVAILABLE}  orjson: {ORJSON_AVAILABLE}  iterations: {args.iterations}")
+
+    for fixture in FIXTURES:
+        data = yaml.load((FIXTURES_DIR / fixture).read_text(), Loader=yaml.SafeLoader)
+        print(f"\n{fixture}")
+        print(f"  {'backend':<18} {'load (us)':>10} {'dump (us)':>10} {'bytes':>8}")
+
+        baseline = None
+        for name, (load, dump) in backends.items():
+            text = dump(data)
+            load_us = _time_per_call(lambda: load(text), args.iterations)
+            dump_us = _time_per_call(lambda: dump(data), args.iterations)
+            baseline = baseline or load_us
+            print(
+                f"  {name:<18} {load_us:>10.1f} {dump_us:>10.1f} {len(text):>8}"
+                f"   (load {baseline / load_us:.0f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
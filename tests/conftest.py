@@ -5,6 +5,8 @@ Pytest configuration and shared fixtures.
 import pytest
 from pathlib import Path
 
+from resilio.core.repository import RepositoryIO
+
 
 @pytest.fixture
 def temp_data_dir(tmp_path):
@@ -22,6 +24,14 @@ def temp_data_dir(tmp_path):
     return data_dir
 
 
+@pytest.fixture
+def temp_repo(tmp_path, monkeypatch):
+    """Empty repository rooted at tmp_path (also the working directory)."""
+    (tmp_path / ".git").mkdir()
+    monkeypatch.chdir(tmp_path)
+    return RepositoryIO()
+
+
 @pytest.fixture
 def sample_profile():
     """Sample athlete profile for testing."""
@@ -0,0 +1,81 @@
+"""
+Shared test factories for activities and daily metrics stored in a
+temporary repository.
+
+Use with the temp_repo fixture (tests/conftest.py):
+
+    save_activity(temp_repo, make_activity("a1", date(2026, 1, 5), private_note="knee sore"))
+    save_metrics(temp_repo, make_metrics(date(2026, 1, 5), ctl=42.5))
+"""
+
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+from resilio.core.repository import RepositoryIO
+from resilio.core.serialization import load_yaml
+from resilio.schemas.activity import NormalizedActivity, SportType
+from resilio.schemas.metrics import ACWRMetrics, DailyMetrics
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def make_activity(
+    activity_id: str = "a1",
+    activity_date: date = date(2026, 1, 5),
+    sport_type: SportType = SportType.RUN,
+    **overrides,
+) -> NormalizedActivity:
+    """Minimal valid activity: 60 minutes starting 07:00 UTC on activity_date."""
+    start_time = datetime(activity_date.year, activity_date.month, activity_date.day, 7, 0, tzinfo=timezone.utc)
+    data = dict(
+        id=activity_id,
+        source="strava",
+        sport_type=sport_type,
+        name="Test Activity",
+        date=activity_date,
+        start_time=start_time,
+        duration_minutes=60,
+        duration_seconds=3600,
+        created_at=start_time,
+        updated_at=start_time,
+    )
+    data.update(overrides)
+    return NormalizedActivity(**data)
+
+
+def activity_path(activity: NormalizedActivity) -> str:
+    """Repository-relative path the sync workflow stores an activity at."""
+    return f"data/activities/{activity.date:%Y-%m}/{activity.date.isoformat()}_{activity.id}.yaml"
+
+
+def save_activity(repo: RepositoryIO, activity: NormalizedActivity) -> str:
+    """Write an activity through the repository (indexing it) and return its path."""
+    path = activity_path(activity)
+    assert repo.write_yaml(path, activity) is None
+    return path
+
+
+def make_metrics(day: date, ctl: float, acwr: Optional[float] = None) -> DailyMetrics:
+    """Sample daily metrics (fixtures/daily_metrics_sample.yaml) moved to day."""
+    metrics = DailyMetrics.model_validate(load_yaml((FIXTURES_DIR / "daily_metrics_sample.yaml").read_text()))
+    metrics.date = day
+    metrics.daily_load.date = day
+    metrics.ctl_atl.ctl = ctl
+    if acwr is not None:
+        metrics.acwr = ACWRMetrics(
+            acwr=acwr, zone="safe", acute_load_7d=350.0, chronic_load_28d=45.0, load_spike_elevated=False
+        )
+    return metrics
+
+
+def metrics_path(day: date) -> str:
+    """Repository-relative path of a day's metrics file."""
+    return f"data/metrics/daily/{day.isoformat()}.yaml"
+
+
+def save_metrics(repo: RepositoryIO, metrics: DailyMetrics, file_format: str = "yaml") -> str:
+    """Write daily metrics through the repository and return their path."""
+    path = metrics_path(metrics.date)
+    assert repo.write_yaml(path, metrics, file_format=file_format) is None
+    return path
@@ -0,0 +1,47 @@
+"""
+Integration tests for `resilio activity export`.
+"""
+
+import gzip
+import json
+from datetime import date, timedelta
+
+from typer.testing import CliRunner
+
+from resilio.cli.commands.activity import app
+from tests.factories import make_activity, save_activity
+
+runner = CliRunner()
+
+
+def test_export_ndjson_gzip_fields(temp_repo, tmp_path):
+    """A .gz output path is compressed and lines carry only --fields."""
+    today = date.today()
+    save_activity(temp_repo, make_activity("a1", today - timedelta(days=3)))
+    save_activity(temp_repo, make_activity("a2", today - timedelta(days=1)))
+    out = tmp_path / "history.ndjson.gz"
+
+    result = runner.invoke(
+        app, ["export", "--since", "7d", "--format", "ndjson", "--fields", "id,date", "--out", str(out)]
+    )
+
+    assert result.exit_code == 0
+    data = json.loads(result.stdout)["data"]
+    assert data["count"] == 2
+    assert data["format"] == "ndjson"
+    assert data["gzip"] is True
+    assert data["filters"] == {"sport": None, "fields": ["id", "date"]}
+    with gzip.open(out, "rt", encoding="utf-8") as f:
+        records = [json.loads(line) for line in f]
+    assert [record["id"] for record in records] == ["a2", "a1"]
+    assert set(records[0]) == {"id", "date"}
+
+
+def test_export_rejects_unknown_field(temp_repo, tmp_path):
+    """Unknown --fields names are a validation error."""
+    result = runner.invoke(app, ["export", "--fields", "id,pace", "--out", str(tmp_path / "x.json")])
+
+    assert result.exit_code == 5
+    payload = json.loads(result.stdout)
+    assert payload["ok"] is False
+    assert "pace" in payload["message"]
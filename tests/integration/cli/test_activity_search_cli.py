@@ -0,0 +1,34 @@
+"""
+Integration tests for `resilio activity search`.
+"""
+
+import json
+from datetime import date, timedelta
+
+from typer.testing import CliRunner
+
+from resilio.cli.commands.activity import app
+from tests.factories import make_activity, save_activity
+
+runner = CliRunner()
+
+
+def test_search_returns_ranked_matches(temp_repo):
+    """Search output keeps its shape and adds a relevance score."""
+    today = date.today()
+    note = "x" * 60 + " left knee hurting on descents"
+    save_activity(temp_repo, make_activity("a1", today - timedelta(days=2), private_note=note))
+    save_activity(temp_repo, make_activity("a2", today - timedelta(days=1), private_note="Felt great"))
+
+    result = runner.invoke(app, ["search", "--query", "hurts", "--stem", "--limit", "5"])
+
+    assert result.exit_code == 0
+    data = json.loads(result.stdout)["data"]
+    assert data["total_matches"] == 1
+    assert data["activities_searched"] == 2
+    match = data["matches"][0]
+    assert match["id"] == "a1"
+    assert match["matched_field"] == "private_note"
+    assert match["matched_text"].startswith("...") and "knee hurting" in match["matched_text"]
+    assert match["score"] > 0
+    assert data["filters"] == {"sport": None, "stem": True, "limit": 5}
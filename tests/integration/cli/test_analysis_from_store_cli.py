@@ -0,0 +1,84 @@
+"""
+Integration tests for `--from-store` on `resilio analysis` / `resilio risk`.
+"""
+
+import json
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from resilio.cli.commands.analysis import app, risk_app
+from resilio.core.serialization import load_yaml
+from resilio.schemas.activity import NormalizedActivity, SessionType
+from tests.factories import make_metrics, save_activity, save_metrics
+
+FIXTURES_DIR = Path(__file__).parent.parent.parent / "fixtures"
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def store_repo(temp_repo):
+    """Repository with five recent activities and yesterday's metrics."""
+    today = date.today()
+
+    template = load_yaml((FIXTURES_DIR / "activity_sample.yaml").read_text())
+    session_types = [SessionType.EASY, SessionType.EASY, SessionType.QUALITY, SessionType.EASY, SessionType.MODERATE]
+    for offset, session_type in enumerate(session_types):
+        activity = NormalizedActivity.model_validate(template)
+        activity.id = f"strava_{offset}"
+        activity.date = today - timedelta(days=offset * 2)
+        activity.start_time = activity.start_time.replace(
+            year=activity.date.year, month=activity.date.month, day=activity.date.day
+        )
+        activity.calculated.session_type = session_type
+        save_activity(temp_repo, activity)
+
+    save_metrics(temp_repo, make_metrics(today - timedelta(days=1), ctl=6.0))
+    return temp_repo
+
+
+def test_intensity_from_store_matches_export_file(store_repo, tmp_path):
+    """--from-store should give the same analysis as an exported JSON file."""
+    index = store_repo.activity_index()
+    exported = [
+        activity.model_dump(mode="json")
+        for activity in index.load(index.query(start_date=date.today() - timedelta(days=28)))
+    ]
+    export_file = tmp_path / "activities.json"
+    export_file.write_text(json.dumps(exported))
+
+    from_file = runner.invoke(app, ["intensity", "--activities", str(export_file), "--days", "28"])
+    from_store = runner.invoke(app, ["intensity", "--from-store", "--days", "28"])
+
+    assert from_store.exit_code == 0
+    assert json.loads(from_store.stdout)["data"] == json.loads(from_file.stdout)["data"]
+
+
+def test_risk_assess_from_store_reports_missing_metrics(store_repo):
+    """Store metrics without ACWR/readiness surface the API's validation error."""
+    result = runner.invoke(risk_app, ["assess", "--from-store", "--days", "7"])
+
+    payload = json.loads(result.stdout)
+    assert payload["ok"] is False
+    assert "acwr" in payload["message"]
+
+
+def test_gaps_from_store_runs(store_repo):
+    """Gap detection should run on the projection with CTL attached."""
+    result = runner.invoke(app, ["gaps", "--from-store", "--min-days", "1"])
+
+    assert result.exit_code == 0
+    assert json.loads(result.stdout)["ok"] is True
+
+
+def test_missing_input_without_from_store(store_repo):
+    """Omitting both the JSON file and --from-store is an invalid_input error."""
+    result = runner.invoke(app, ["load", "--days", "7"])
+
+    payload = json.loads(result.stdout)
+    assert payload["ok"] is False
+    assert payload["error_type"] == "invalid_input"
+    assert "--from-store" in payload["message"]
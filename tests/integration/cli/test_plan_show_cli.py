@@ -103,6 +103,33 @@ def test_plan_show_log_last_weeks_filter(tmp_path, monkeypatch):
     assert "## Week 3:" in content
 
 
+def test_plan_show_log_single_week(tmp_path, monkeypatch):
+    """`--type log --week N` should return the header and that week only."""
+    log_file = tmp_path / "current_training_log.md"
+    log_file.write_text(
+        "# Training Log\n\n"
+        "## Week 1:\nSummary one.\n\n"
+        "## Week 2:\nSummary two.\n"
+    )
+
+    monkeypatch.setattr(
+        "resilio.core.paths.current_training_log_path",
+        lambda: str(log_file),
+    )
+
+    result = runner.invoke(app, ["show", "--type", "log", "--week", "1"])
+
+    assert result.exit_code == 0
+    payload = json.loads(result.stdout)
+    assert payload["data"]["weeks_shown"] == [1]
+    assert payload["data"]["content"] == "# Training Log\n\n## Week 1:\nSummary one.\n\n"
+
+    result = runner.invoke(app, ["show", "--type", "log", "--week", "5"])
+
+    assert result.exit_code == 2
+    assert json.loads(result.stdout)["error_type"] == "not_found"
+
+
 def test_plan_show_log_missing_file(tmp_path, monkeypatch):
     """`--type log` should return not_found when log file is missing."""
     missing_log_file = tmp_path / "missing_log.md"
@@ -79,7 +79,7 @@ class TestIncrementalSync:
 
     @patch("resilio.core.workflows.sync_strava_generator")
     @patch("resilio.core.workflows._fetch_and_update_athlete_profile")
-    @patch("resilio.core.workflows.recompute_all_metrics")
+    @patch("resilio.core.workflows.update_metrics_incremental")
     def test_activity_persisted_before_next_processed(
         self,
         mock_metrics,
@@ -147,7 +147,7 @@ class TestIncrementalSync:
 
     @patch("resilio.core.workflows.sync_strava_generator")
     @patch("resilio.core.workflows._fetch_and_update_athlete_profile")
-    @patch("resilio.core.workflows.recompute_all_metrics")
+    @patch("resilio.core.workflows.update_metrics_incremental")
     def test_resume_after_rate_limit(
         self,
         mock_metrics,
@@ -257,7 +257,7 @@ class TestIncrementalSync:
 
     @patch("resilio.core.workflows.sync_strava_generator")
     @patch("resilio.core.workflows._fetch_and_update_athlete_profile")
-    @patch("resilio.core.workflows.recompute_all_metrics")
+    @patch("resilio.core.workflows.update_metrics_incremental")
     def test_rate_limit_persists_resume_cursor_state(
         self,
         mock_metrics,
@@ -335,16 +335,20 @@ class TestIncrementalSync:
         assert training_history["resume_before_timestamp"] == 1736500000
         assert training_history["last_progress_at"] is not None
 
-        progress_file = repo_with_activities.repo_root / "config" / ".sync_progress.json"
-        assert progress_file.exists()
-        progress_payload = json.loads(progress_file.read_text())
-        assert progress_payload["phase"] == "paused_rate_limit"
-        assert progress_payload["cursor_before_timestamp"] == 1736500000
-        assert progress_payload["updated_at"] is not None
+        # The journal is compacted to a single snapshot carrying the cursor
+        journal_file = repo_with_activities.repo_root / "config" / ".sync_journal.jsonl"
+        lines = journal_file.read_text().splitlines()
+        assert len(lines) == 1
+        snapshot = json.loads(lines[0])
+        assert snapshot["event"] == "snapshot"
+        assert snapshot["phase"] == "paused_rate_limit"
+        assert snapshot["backfill_in_progress"] is True
+        assert snapshot["cursor_before_timestamp"] == 1736500000
+        assert snapshot["updated_at"] is not None
 
     @patch("resilio.core.workflows.sync_strava_generator")
     @patch("resilio.core.workflows._fetch_and_update_athlete_profile")
-    @patch("resilio.core.workflows.recompute_all_metrics")
+    @patch("resilio.core.workflows.update_metrics_incremental")
     def test_completion_clears_resume_state_and_progress_file(
         self,
         mock_metrics,
@@ -356,7 +360,7 @@ class TestIncrementalSync:
         """Successful completion after paused state should clear resume cursor/progress."""
         from resilio.schemas.activity import ActivitySource, RawActivity
 
-        # Seed a paused backfill state + heartbeat progress file.
+        # Seed a paused backfill state + compacted sync journal.
         repo_with_activities.write_yaml(
             "data/athlete/training_history.yaml",
             {
@@ -366,16 +370,22 @@ class TestIncrementalSync:
                 "last_progress_at": "2026-02-12T12:00:00+00:00",
             },
         )
-        repo_with_activities.write_json(
-            "config/.sync_progress.json",
-            {
-                "phase": "paused_rate_limit",
-                "activities_seen": 10,
-                "activities_imported": 8,
-                "activities_skipped": 2,
-                "activities_failed": 0,
-                "updated_at": "2026-02-12T12:00:00+00:00",
-            },
+        journal_file = repo_with_activities.repo_root / "config" / ".sync_journal.jsonl"
+        journal_file.parent.mkdir(exist_ok=True)
+        journal_file.write_text(
+            json.dumps(
+                {
+                    "event": "snapshot",
+                    "phase": "paused_rate_limit",
+                    "backfill_in_progress": True,
+                    "target_start_date": "2025-02-12",
+                    "cursor_before_timestamp": 1736500000,
+                    "activities_imported": 8,
+                    "activities_skipped": 2,
+                    "updated_at": "2026-02-12T12:00:00+00:00",
+                }
+            )
+            + "\n"
         )
 
         raw_activity = RawActivity(
@@ -438,11 +448,11 @@ class TestIncrementalSync:
         assert training_history["target_start_date"] is None
         assert training_history["resume_before_timestamp"] is None
         assert training_history["last_progress_at"] is not None
-        assert repo_with_activities.file_exists("config/.sync_progress.json") is False
+        assert repo_with_activities.file_exists("config/.sync_journal.jsonl") is False
 
     @patch("resilio.core.workflows.sync_strava_generator")
     @patch("resilio.core.workflows._fetch_and_update_athlete_profile")
-    @patch("resilio.core.workflows.recompute_all_metrics")
+    @patch("resilio.core.workflows.update_metrics_incremental")
     def test_profile_failure_doesnt_block_activities(
         self,
         mock_metrics,
@@ -484,7 +494,7 @@ class TestIncrementalSync:
 
     @patch("resilio.core.workflows.sync_strava_generator")
     @patch("resilio.core.workflows._fetch_and_update_athlete_profile")
-    @patch("resilio.core.workflows.recompute_all_metrics")
+    @patch("resilio.core.workflows.update_metrics_incremental")
     def test_metrics_failure_doesnt_block_activities(
         self,
         mock_metrics,
@@ -531,7 +541,7 @@ class TestIncrementalSync:
 
     @patch("resilio.core.workflows.sync_strava_generator")
     @patch("resilio.core.workflows._fetch_and_update_athlete_profile")
-    @patch("resilio.core.workflows.recompute_all_metrics")
+    @patch("resilio.core.workflows.update_metrics_incremental")
     def test_no_duplicate_activities_created(
         self,
         mock_metrics,
@@ -577,3 +587,126 @@ class TestIncrementalSync:
             )
         )
         assert len(activity_files) == 1
+
+    @patch("resilio.core.workflows.sync_strava_generator")
+    @patch("resilio.core.workflows._fetch_and_update_athlete_profile")
+    @patch("resilio.core.workflows.update_metrics_incremental")
+    def test_batched_ingest_loads_profile_once_and_coalesces_progress(
+        self,
+        mock_metrics,
+        mock_profile,
+        mock_generator,
+        repo_with_activities,
+        mock_config,
+    ):
+        """A backfill reads the profile once, checkpoints rarely, and flushes writes before metrics."""
+        from resilio.core import workflows
+        from resilio.schemas.activity import RawActivity, ActivitySource
+
+        activities = [
+            RawActivity(
+                id=f"strava_{500 + day}",
+                source=ActivitySource.STRAVA,
+                sport_type="Run",
+                name=f"Activity {day}",
+                date=date(2026, 1, day),
+                start_time=datetime(2026, 1, day, 7, 0, tzinfo=timezone.utc),
+                duration_seconds=1800,
+            )
+            for day in range(1, 31)
+        ]
+
+        def metrics_side_effect(repo, dates, end_date=None):
+            # The background writer must have flushed (and indexed) everything
+            assert len(repo.activity_index().query(start_date=date(2026, 1, 1))) == 31
+            return {"metrics_computed": len(dates)}
+
+        mock_generator.return_value = iter(activities)
+        mock_profile.return_value = []
+        mock_metrics.side_effect = metrics_side_effect
+
+        with patch.object(
+            workflows.ProfileService, "load_profile", autospec=True, return_value=None
+        ) as load_profile, patch.object(
+            workflows.SyncJournal, "commit", autospec=True, side_effect=workflows.SyncJournal.commit
+        ) as commit_journal, patch.object(workflows, "SYNC_CHECKPOINT_INTERVAL_S", 3600):
+            result = run_sync_workflow(repo_with_activities, mock_config)
+
+        assert result.phase == SyncPhase.DONE
+        assert result.activities_imported == 30
+        assert load_profile.call_count == 1
+        # One checkpoint after 25 activities, and metrics
+        assert commit_journal.call_count == 2
+
+    @patch("resilio.core.workflows.sync_strava_generator")
+    @patch("resilio.core.workflows._fetch_and_update_athlete_profile")
+    @patch("resilio.core.workflows.update_metrics_incremental")
+    def test_checkpoints_ignore_per_activity_phase_switches(
+        self,
+        mock_metrics,
+        mock_profile,
+        mock_generator,
+        repo_with_activities,
+        mock_config,
+    ):
+        """With the real generator's event pattern, checkpoints follow pages and counts, not activities."""
+        from resilio.core import workflows
+        from resilio.core.ingest import BackgroundWriter
+        from resilio.schemas.activity import RawActivity, ActivitySource
+
+        pages, per_page = 2, 50
+
+        def generator(config, since=None, before=None, existing_ids=None, progress_hook=None, response_cache=None):
+            # Same progress events as sync_strava_generator: page start, one
+            # FETCHING event after each yielded activity, cursor at page end
+            cursor, seen = None, 0
+
+            def emit(page, **extra):
+                progress_hook({
+                    "phase": SyncPhase.FETCHING.value,
+                    "current_page": page,
+                    "activities_seen": seen,
+                    "cursor_before_timestamp": cursor,
+                    **extra,
+                })
+
+            emit(0)
+            for page in range(1, pages + 1):
+                emit(page)
+                for n in range(per_page):
+                    day = date.fromordinal(date(2025, 12, 31).toordinal() - seen)
+                    seen += 1
+                    yield RawActivity(
+                        id=f"strava_{1000 + seen}",
+                        source=ActivitySource.STRAVA,
+                        sport_type="Run",
+                        name=f"Activity {seen}",
+                        date=day,
+                        start_time=datetime(day.year, day.month, day.day, 7, 0, tzinfo=timezone.utc),
+                        duration_seconds=1800,
+                    )
+                    emit(page, current_month=f"{day.year:04d}-{day.month:02d}")
+                cursor = int(datetime(day.year, day.month, day.day, tzinfo=timezone.utc).timestamp()) - 1
+                emit(page)
+            progress_hook({"phase": SyncPhase.DONE.value, "current_page": pages, "cursor_before_timestamp": cursor})
+            return SyncReport(phase=SyncPhase.DONE, activities_imported=seen)
+
+        mock_generator.side_effect = generator
+        mock_profile.return_value = []
+        mock_metrics.return_value = {"metrics_computed": 1}
+
+        with patch.object(
+            BackgroundWriter, "flush", autospec=True, side_effect=BackgroundWriter.flush
+        ) as flush_writer, patch.object(
+            workflows.SyncJournal, "commit", autospec=True, side_effect=workflows.SyncJournal.commit
+        ) as commit_journal, patch.object(workflows, "SYNC_CHECKPOINT_INTERVAL_S", 3600):
+            result = run_sync_workflow(repo_with_activities, mock_config)
+
+        assert result.phase == SyncPhase.DONE
+        assert result.activities_imported == pages * per_page
+        # Initial event, each page start and end, DONE, METRICS, plus one
+        # count-based checkpoint per SYNC_CHECKPOINT_EVERY activities
+        expected = 1 + 2 * pages + 2 + pages * per_page // workflows.SYNC_CHECKPOINT_EVERY
+        assert expected == 11
+        assert commit_journal.call_count == expected
+        assert flush_writer.call_count == expected + 1  # close() flushes once more
@@ -0,0 +1,130 @@
+"""
+Unit tests for streaming activity export (core/activity_export.py).
+"""
+
+import gzip
+import io
+import json
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from resilio.core.activity_export import (
+    _write_json_array,
+    export_activities,
+    parse_export_fields,
+)
+from resilio.core.repository import RepositoryIO
+from tests.factories import make_activity, save_activity
+
+
+@pytest.fixture
+def repo(temp_repo):
+    """Repository with three runs (two on the same day) and a ride."""
+    base = date(2026, 1, 10)
+    for activity_id, day, hour, sport in [
+        ("a1", base, 7, "run"),
+        ("a2", base, 18, "run"),
+        ("a3", base + timedelta(days=1), 7, "cycle"),
+        ("a4", base + timedelta(days=40), 7, "run"),
+    ]:
+        start_time = datetime(day.year, day.month, day.day, hour, 0, tzinfo=timezone.utc)
+        activity = make_activity(
+            activity_id,
+            day,
+            sport,
+            name="Session",
+            start_time=start_time,
+            duration_minutes=40,
+            duration_seconds=2400,
+            created_at=start_time,
+            updated_at=start_time,
+            private_note="Line one\nline two",
+        )
+        save_activity(temp_repo, activity)
+    return temp_repo
+
+
+def _expected_json(repo: RepositoryIO) -> str:
+    """The pre-streaming export: dump everything, sort by date desc, json.dump."""
+    index = repo.activity_index()
+    exported = [activity.model_dump(mode="json") for activity in index.load(index.query())]
+    exported.sort(key=lambda x: x.get("date", ""), reverse=True)
+    return json.dumps(exported, indent=2, default=str)
+
+
+class TestJsonArrayWriter:
+    """Tests for the incremental JSON array writer."""
+
+    @pytest.mark.parametrize(
+        "records",
+        [[], [{"a": 1}], [{"a": [1, {"b": "x\ny"}], "c": None}, {"d": {}}, {"e": []}]],
+    )
+    def test_matches_json_dump(self, records):
+        """Output is byte-identical to json.dump(records, indent=2)."""
+        f = io.StringIO()
+        assert _write_json_array(f, iter(records)) == len(records)
+        assert f.getvalue() == json.dumps(records, indent=2)
+
+
+class TestExportActivities:
+    """Tests for export_activities."""
+
+    def test_json_matches_previous_export(self, repo, tmp_path):
+        """Default JSON output is unchanged from the in-memory export."""
+        out = tmp_path / "export.json"
+        result = export_activities(repo, out)
+
+        assert result.count == 4
+        assert out.read_text() == _expected_json(repo)
+
+    def test_newest_first_keeps_same_day_order(self, repo, tmp_path):
+        """Dates descend; same-day activities stay in start-time order."""
+        out = tmp_path / "export.ndjson"
+        export_activities(repo, out, output_format="ndjson", fields=["id"])
+
+        ids = [json.loads(line)["id"] for line in out.read_text().splitlines()]
+        assert ids == ["a4", "a3", "a1", "a2"]
+
+    def test_ndjson_gzip_with_fields(self, repo, tmp_path):
+        """NDJSON lines hold only the requested fields, in the requested order."""
+        out = tmp_path / "export.ndjson.gz"
+        result = export_activities(
+            repo,
+            out,
+            start_date=date(2026, 1, 1),
+            end_date=date(2026, 1, 31),
+            sport="run",
+            output_format="ndjson",
+            fields=["date", "id"],
+            compress=True,
+        )
+
+        with gzip.open(out, "rt", encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        assert result.count == 2
+        assert [list(json.loads(line)) for line in lines] == [["date", "id"], ["date", "id"]]
+        assert "\n" not in lines[0]
+
+    def test_unknown_format_rejected(self, repo, tmp_path):
+        """Only json and ndjson are supported."""
+        with pytest.raises(ValueError):
+            export_activities(repo, tmp_path / "export.csv", output_format="csv")
+
+
+class TestParseExportFields:
+    """Tests for --fields parsing."""
+
+    def test_parses_and_dedupes(self):
+        """Whitespace is stripped and duplicates dropped, order kept."""
+        assert parse_export_fields(" id, date ,id") == ["id", "date"]
+
+    def test_empty_means_all(self):
+        """No fields selects every field."""
+        assert parse_export_fields(None) is None
+        assert parse_export_fields(" , ") is None
+
+    def test_unknown_field_rejected(self):
+        """Typos are reported with the valid names."""
+        with pytest.raises(ValueError, match="distance_miles"):
+            parse_export_fields("id,distance_miles")
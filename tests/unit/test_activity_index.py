@@ -0,0 +1,190 @@
+"""
+Unit tests for the persistent activity index.
+
+Tests incremental maintenance via RepositoryIO, refresh on external edits,
+and date/sport/id queries.
+"""
+
+import os
+from datetime import date
+
+import pytest
+import yaml
+
+from resilio.core.repository import RepositoryIO
+from resilio.schemas.activity import NormalizedActivity, SportType
+from tests.factories import activity_path, make_activity, save_activity
+
+
+class TestActivityIndex:
+    """Tests for ActivityIndex."""
+
+    def test_write_yaml_records_activity(self, temp_repo):
+        """Writing an activity through the repository should index it."""
+        save_activity(temp_repo, make_activity("a1", date(2026, 1, 5)))
+
+        index = temp_repo.activity_index()
+        entry = index.get("a1")
+
+        assert entry is not None
+        assert entry.date == date(2026, 1, 5)
+        assert entry.sport_type == "run"
+        assert entry.path == "data/activities/2026-01/2026-01-05_a1.yaml"
+
+    def test_query_filters_by_date_and_sport(self, temp_repo):
+        """Query should return only entries in range, ordered by date."""
+        save_activity(temp_repo, make_activity("a1", date(2026, 1, 5)))
+        save_activity(temp_repo, make_activity("a2", date(2026, 2, 10), SportType.CYCLE))
+        save_activity(temp_repo, make_activity("a3", date(2026, 2, 3)))
+        save_activity(temp_repo, make_activity("a4", date(2026, 3, 1)))
+
+        index = temp_repo.activity_index()
+        in_range = index.query(start_date=date(2026, 2, 1), end_date=date(2026, 2, 28))
+        runs = index.query(start_date=date(2026, 2, 1), end_date=date(2026, 2, 28), sport="run")
+
+        assert [entry.id for entry in in_range] == ["a3", "a2"]
+        assert [entry.id for entry in runs] == ["a3"]
+        assert index.earliest_date() == date(2026, 1, 5)
+        assert index.count() == 4
+
+    def test_delete_file_removes_entry(self, temp_repo):
+        """Deleting an activity file through the repository should unindex it."""
+        path = save_activity(temp_repo, make_activity("a1", date(2026, 1, 5)))
+        index = temp_repo.activity_index()
+        assert index.get("a1") is not None
+
+        assert temp_repo.delete_file(path) is None
+
+        assert index.get("a1") is None
+        assert index.earliest_date() is None
+
+    def test_refresh_picks_up_external_edits(self, temp_repo):
+        """Files changed or added outside RepositoryIO should be re-read."""
+        path = save_activity(temp_repo, make_activity("a1", date(2026, 1, 5)))
+        index = temp_repo.activity_index()
+        version = index.version
+
+        # Edit one file and add another out-of-band (bypassing RepositoryIO)
+        resolved = temp_repo.resolve_path(path)
+        resolved.write_text(
+            resolved.read_text().replace("sport_type: run", "sport_type: cycle")
+            + "private_note: legs tired\n"
+        )
+        stat = resolved.stat()
+        os.utime(resolved, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        added = make_activity("a2", date(2026, 1, 9))
+        temp_repo.resolve_path(activity_path(added)).write_text(
+            yaml.safe_dump(added.model_dump(mode="json"))
+        )
+
+        entries = index.query()
+
+        assert [entry.id for entry in entries] == ["a1", "a2"]
+        assert entries[0].sport_type == "cycle"
+        assert entries[0].has_notes is True
+        assert index.version > version
+
+    def test_index_survives_reopen(self, temp_repo):
+        """A new repository instance should reuse the persisted index."""
+        save_activity(temp_repo, make_activity("a1", date(2026, 1, 5)))
+        temp_repo.activity_index().close()
+
+        reopened = RepositoryIO().activity_index()
+
+        assert reopened.ids() == {"a1"}
+        assert reopened.refresh() == 0
+
+    def test_store_id_changes_when_rebuilt(self, temp_repo):
+        """store_id persists across reopens but not across a deleted index."""
+        save_activity(temp_repo, make_activity("a1", date(2026, 1, 5)))
+        index = temp_repo.activity_index()
+        store_id = index.store_id
+        index.close()
+        assert RepositoryIO().activity_index().store_id == store_id
+
+        index.index_path.unlink()
+        assert RepositoryIO().activity_index().store_id != store_id
+
+    def test_load_returns_models(self, temp_repo):
+        """load() should return full activity models for entries."""
+        save_activity(temp_repo, make_activity("a1", date(2026, 1, 5)))
+        index = temp_repo.activity_index()
+
+        activities = index.load(index.query())
+
+        assert len(activities) == 1
+        assert isinstance(activities[0], NormalizedActivity)
+        assert activities[0].id == "a1"
+
+
+class TestNotesSearch:
+    """Tests for ActivityIndex.search_notes()."""
+
+    def test_search_ranks_and_snippets_without_parsing(self, temp_repo, monkeypatch):
+        """Hits come ranked with snippets straight from the index."""
+        save_activity(temp_repo, make_activity("a1", date(2026, 1, 5), private_note="Knee ok, knee fine, knees strong"))
+        save_activity(temp_repo, make_activity("a2", date(2026, 1, 9), description="Slight knee twinge after hills"))
+        save_activity(temp_repo, make_activity("a3", date(2026, 1, 12), private_note="Legs tired"))
+        index = temp_repo.activity_index()
+        monkeypatch.setattr(
+            RepositoryIO, "read_yaml", lambda *args, **kwargs: pytest.fail("activity file was parsed")
+        )
+
+        hits, searched = index.search_notes("knee")
+
+        assert searched == 3
+        assert [hit.id for hit in hits] == ["a1", "a2"]
+        assert hits[0].score > hits[1].score
+        assert hits[0].matched_field == "private_note"
+        assert hits[1].matched_field == "description"
+        assert hits[1].snippet == "Slight knee twinge after hills"
+        assert hits[1].matched_keywords == ["knee"]
+
+    def test_prefix_and_stem_matching(self, temp_repo):
+        """Keywords match word starts; stemming adds other word forms."""
+        save_activity(temp_repo, make_activity("a1", date(2026, 1, 5), private_note="Calf hurts on the climb"))
+        save_activity(temp_repo, make_activity("a2", date(2026, 1, 9), private_note="Réveil difficile, ankles swollen"))
+        index = temp_repo.activity_index()
+
+        assert [hit.id for hit in index.search_notes("ankle")[0]] == ["a2"]
+        assert [hit.id for hit in index.search_notes("reveil")[0]] == ["a2"]
+        assert index.search_notes("hurting")[0] == []
+        assert [hit.id for hit in index.search_notes("hurting", use_stemming=True)[0]] == ["a1"]
+        assert index.search_notes("alf")[0] == []
+
+    def test_search_filters_by_date_and_sport(self, temp_repo):
+        """Date and sport filters restrict both hits and the searched count."""
+        save_activity(temp_repo, make_activity("a1", date(2026, 1, 5), private_note="tired"))
+        save_activity(temp_repo, make_activity("a2", date(2026, 2, 10), SportType.CYCLE, private_note="tired"))
+        save_activity(temp_repo, make_activity("a3", date(2026, 2, 12), private_note="tired"))
+        index = temp_repo.activity_index()
+
+        hits, searched = index.search_notes("tired", start_date=date(2026, 2, 1))
+        runs, run_count = index.search_notes("tired", start_date=date(2026, 2, 1), sport="run")
+
+        assert [hit.id for hit in hits] == ["a3", "a2"]
+        assert searched == 2
+        assert [hit.id for hit in runs] == ["a3"]
+        assert run_count == 1
+        assert [hit.id for hit in index.search_notes("tired", limit=1)[0]] == ["a3"]
+
+    def test_postings_follow_writes_deletes_and_external_edits(self, temp_repo):
+        """Rewrites, deletes and out-of-band edits update the postings."""
+        path = save_activity(temp_repo, make_activity("a1", date(2026, 1, 5), private_note="ankle sore"))
+        save_activity(temp_repo, make_activity("a2", date(2026, 1, 6), private_note="ankle fine"))
+        index = temp_repo.activity_index()
+
+        save_activity(temp_repo, make_activity("a1", date(2026, 1, 5), private_note="shin sore"))
+        assert [hit.id for hit in index.search_notes("ankle")[0]] == ["a2"]
+        assert [hit.id for hit in index.search_notes("shin")[0]] == ["a1"]
+
+        assert temp_repo.delete_file(path) is None
+        assert index.search_notes("shin")[0] == []
+
+        resolved = temp_repo.resolve_path(activity_path(make_activity("a2", date(2026, 1, 6))))
+        resolved.write_text(resolved.read_text().replace("ankle fine", "hamstring tight"))
+        stat = resolved.stat()
+        os.utime(resolved, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert index.search_notes("ankle")[0] == []
+        assert [hit.id for hit in index.search_notes("hamstring")[0]] == ["a2"]
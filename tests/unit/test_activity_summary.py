@@ -0,0 +1,139 @@
+"""
+Unit tests for compact activity summaries (core/activity_summary.py).
+"""
+
+from datetime import date
+
+from resilio.core.activity_summary import (
+    SPORT_CODES,
+    ActivitySummary,
+    load_activity_summaries,
+    sport_code,
+    sport_codes,
+)
+from resilio.core.vdot.continuity import detect_training_breaks
+from resilio.core.vdot.pace_analysis import analyze_recent_paces
+from resilio.schemas.activity import LoadCalculation, NormalizedActivity, SessionType
+from tests.factories import make_activity, save_activity
+
+
+def _activity(activity_id: str, day: date, sport_type: str = "run", **overrides) -> NormalizedActivity:
+    data = dict(
+        name="Threshold intervals",
+        description="5x1km",
+        duration_minutes=40,
+        duration_seconds=2400,
+        distance_km=10.0,
+        average_hr=150.0,
+        max_hr=172.0,
+        surface_type="road",
+        has_gps_data=True,
+        calculated=LoadCalculation(
+            activity_id=activity_id,
+            duration_minutes=40,
+            estimated_rpe=7,
+            sport_type=sport_type,
+            surface_type="road",
+            base_effort_au=280.0,
+            systemic_multiplier=1.0,
+            lower_body_multiplier=1.0,
+            systemic_load_au=280.0,
+            lower_body_load_au=280.0,
+            session_type=SessionType.QUALITY,
+        ),
+    )
+    data.update(overrides)
+    return make_activity(activity_id, day, sport_type, **data)
+
+
+class TestSportCodes:
+    """Tests for sport code mapping."""
+
+    def test_round_trip(self):
+        """Every sport type maps to a code and back."""
+        for sport in SPORT_CODES:
+            assert SPORT_CODES[sport_code(sport)] == sport
+
+    def test_unknown_sport_is_other(self):
+        """Unrecognized sports map to 'other'."""
+        assert SPORT_CODES[sport_code("kitesurf")] == "other"
+
+    def test_codes_for_filters(self):
+        """sport_codes accepts values and enum members."""
+        assert sport_codes("run", "trail_run") == {sport_code("run"), sport_code("trail_run")}
+
+
+class TestActivitySummary:
+    """Tests for the record and its converters."""
+
+    def test_slots_only(self):
+        """Summaries have no per-instance dict."""
+        summary = ActivitySummary.from_activity(_activity("a1", date(2026, 1, 10)))
+        assert not hasattr(summary, "__dict__")
+
+    def test_from_activity(self):
+        """Full activities convert with loads, session type and details."""
+        summary = ActivitySummary.from_activity(_activity("a1", date(2026, 1, 10)))
+        assert summary.date == date(2026, 1, 10)
+        assert summary.date_ordinal == date(2026, 1, 10).toordinal()
+        assert summary.sport_type == "run"
+        assert summary.systemic_load_au == 280.0
+        assert summary.session_type == "quality"
+        assert summary.surface_type == "road"
+        assert summary.has_gps_data is True
+
+    def test_from_entry_matches_from_activity(self, temp_repo):
+        """Index-built summaries equal converted activities, minus details."""
+        activity = _activity("a1", date(2026, 1, 10))
+        save_activity(temp_repo, activity)
+
+        [from_index] = load_activity_summaries(temp_repo)
+        expected = ActivitySummary.from_activity(activity)
+        expected.name = expected.description = expected.surface_type = None
+        expected.has_gps_data = False
+        assert from_index == expected
+
+    def test_details_since(self, temp_repo):
+        """Only activities on or after details_since read their details."""
+        save_activity(temp_repo, _activity("old", date(2026, 1, 10)))
+        save_activity(temp_repo, _activity("new", date(2026, 2, 10)))
+
+        old, new = load_activity_summaries(temp_repo, details_since=date(2026, 2, 1))
+        assert (old.name, old.has_gps_data) == (None, False)
+        assert (new.name, new.surface_type, new.has_gps_data) == ("Threshold intervals", "road", True)
+
+    def test_filters(self, temp_repo):
+        """Date and sport filters pass through to the index."""
+        save_activity(temp_repo, _activity("run", date(2026, 1, 10)))
+        save_activity(temp_repo, _activity("ride", date(2026, 1, 11), sport_type="cycle"))
+
+        assert [s.id for s in load_activity_summaries(temp_repo, sport="cycle")] == ["ride"]
+        assert [s.id for s in load_activity_summaries(temp_repo, start_date=date(2026, 1, 11))] == ["ride"]
+
+
+class TestAnalyticsOnSummaries:
+    """VDOT analytics give the same answers on summaries as on full activities."""
+
+    def test_break_detection(self):
+        """Break detection only needs date and sport."""
+        today = date.today()
+        activities = [
+            _activity(f"a{i}", date.fromordinal(today.toordinal() - days))
+            for i, days in enumerate([3, 10, 60, 64, 120])
+        ]
+        summaries = [ActivitySummary.from_activity(a) for a in activities]
+        race_date = date.fromordinal(today.toordinal() - 150)
+
+        assert detect_training_breaks(summaries, race_date) == detect_training_breaks(activities, race_date)
+
+    def test_pace_analysis(self):
+        """Pace analysis reads details, loaded for recent activities."""
+        today = date.today()
+        activities = [
+            _activity("q1", date.fromordinal(today.toordinal() - 2), duration_seconds=2400),
+            _activity("e1", date.fromordinal(today.toordinal() - 4), name="Easy", description=None,
+                      duration_seconds=3300, average_hr=135.0),
+        ]
+        summaries = [ActivitySummary.from_activity(a) for a in activities]
+
+        assert analyze_recent_paces(summaries, 28, max_hr=185) == analyze_recent_paces(activities, 28, max_hr=185)
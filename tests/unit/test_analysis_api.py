@@ -259,6 +259,26 @@ class TestDetectActivityGaps:
         assert isinstance(result, ActivityGapAnalysis)
         assert result.total_gaps >= 1
 
+    def test_gap_cause_from_notes_and_stored_flags(self):
+        """Gap causes come from stored note flags, else from the note text."""
+        from_notes = api_detect_activity_gaps(
+            activities=[
+                {"date": "2026-01-01", "notes": "No pain, felt sick"},
+                {"date": "2026-01-12", "notes": "Easy run"},
+            ],
+            min_gap_days=7,
+        )
+        from_flags = api_detect_activity_gaps(
+            activities=[
+                {"date": "2026-01-01", "note_flags": {"travel": ["vacation"]}},
+                {"date": "2026-01-12", "note_flags": {}},
+            ],
+            min_gap_days=7,
+        )
+
+        assert from_notes.gaps[0].potential_cause == "illness"
+        assert from_flags.gaps[0].potential_cause == "planned_break"
+
     def test_invalid_min_gap_days(self, sample_gap_activities):
         """min_gap_days < 1 returns error."""
         result = api_detect_activity_gaps(
@@ -359,6 +379,24 @@ class TestCheckWeeklyCapacity:
         assert isinstance(result, AnalysisError)
         assert result.error_type == "invalid_input"
 
+    def test_capacity_is_best_week(self):
+        """Historical max is the largest Monday-Sunday total, not one activity."""
+        historical = [
+            {"distance_km": 20.0, "systemic_load_au": 200, "date": "2026-01-05"},  # Mon
+            {"distance_km": 25.0, "systemic_load_au": 250, "date": "2026-01-11"},  # Sun, same week
+            {"distance_km": 30.0, "systemic_load_au": 300, "date": "2026-01-12"},  # next Mon
+        ]
+        result = api_check_weekly_capacity(
+            week_number=3,
+            planned_volume_km=45.0,
+            planned_systemic_load_au=450,
+            historical_activities=historical,
+        )
+
+        assert result.historical_max_volume_km == 45.0
+        assert result.historical_max_systemic_load_au == 450
+        assert result.exceeds_proven_capacity is False
+
     def test_no_historical_data(self):
         """Empty historical activities returns error."""
         result = api_check_weekly_capacity(
@@ -0,0 +1,103 @@
+"""
+Unit tests for store-backed analysis inputs.
+
+Tests the activity projection (fields, window, CTL attachment), the latest
+current-metrics lookup and Monday-Sunday week summaries.
+"""
+
+from datetime import date, timedelta
+from pathlib import Path
+
+from resilio.core.analysis.inputs import load_activity_inputs, load_current_metrics, load_recent_weeks
+from resilio.core.serialization import load_yaml
+from resilio.schemas.activity import NormalizedActivity
+from tests.factories import make_metrics, save_activity, save_metrics
+
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures"
+
+
+def _make_activity(activity_id: str, day: date, sport_type: str = "run", distance_km: float = 10.0):
+    activity = NormalizedActivity.model_validate(
+        load_yaml((FIXTURES_DIR / "activity_sample.yaml").read_text())
+    )
+    activity.id = activity_id
+    activity.date = day
+    activity.start_time = activity.start_time.replace(year=day.year, month=day.month, day=day.day)
+    activity.sport_type = sport_type
+    activity.distance_km = distance_km
+    return activity
+
+
+class TestAnalysisInputs:
+    """Tests for load_activity_inputs/load_current_metrics/load_recent_weeks."""
+
+    def test_activity_projection_matches_export_fields(self, temp_repo):
+        """Projected dicts expose the fields the analysis API reads, without laps."""
+        today = date(2026, 3, 20)
+        save_activity(temp_repo, _make_activity("a1", today - timedelta(days=3)))
+        save_activity(temp_repo, _make_activity("old", today - timedelta(days=40)))
+
+        activities = load_activity_inputs(temp_repo, days=28, end_date=today)
+
+        assert [a["id"] for a in activities] == ["a1"]
+        activity = activities[0]
+        assert activity["date"] == "2026-03-17"
+        assert activity["sport_type"] == "run"
+        assert activity["duration_minutes"] == 50
+        assert activity["systemic_load_au"] == activity["calculated"]["systemic_load_au"] == 63.9
+        assert activity["calculated"]["session_type"] == "quality"
+        assert "laps" not in activity and "ctl" not in activity
+
+    def test_activity_projection_attaches_ctl(self, temp_repo):
+        """include_ctl should attach CTL for days with stored metrics, else None."""
+        today = date(2026, 3, 20)
+        save_activity(temp_repo, _make_activity("a1", today - timedelta(days=2)))
+        save_activity(temp_repo, _make_activity("a2", today))
+        save_metrics(temp_repo, make_metrics(today - timedelta(days=2), 41.5))
+
+        activities = load_activity_inputs(temp_repo, end_date=today, include_ctl=True)
+
+        assert [a["ctl"] for a in activities] == [41.5, None]
+
+    def test_activity_projection_attaches_notes(self, temp_repo):
+        """include_notes reads the note fields of annotated activities only."""
+        today = date(2026, 3, 20)
+        noted = _make_activity("noted", today - timedelta(days=1))
+        noted.private_note = "Calf pain, stopped early"
+        silent = _make_activity("silent", today)
+        silent.name, silent.description, silent.private_note = None, None, None
+        save_activity(temp_repo, noted)
+        save_activity(temp_repo, silent)
+
+        activities = load_activity_inputs(temp_repo, end_date=today, include_notes=True)
+
+        assert activities[0]["private_note"] == "Calf pain, stopped early"
+        assert "private_note" not in activities[1]
+
+    def test_current_metrics_uses_latest_day(self, temp_repo):
+        """The latest stored day wins; unknown values are omitted."""
+        today = date(2026, 3, 20)
+        save_metrics(temp_repo, make_metrics(today - timedelta(days=5), 40.0, acwr=1.1))
+        save_metrics(temp_repo, make_metrics(today - timedelta(days=1), 42.0))
+
+        metrics = load_current_metrics(temp_repo, on_or_before=today)
+
+        assert metrics["date"] == "2026-03-19"
+        assert metrics["ctl"] == 42.0
+        assert "acwr" not in metrics
+        assert load_current_metrics(temp_repo, on_or_before=today - timedelta(days=60)) is None
+
+    def test_recent_weeks_sum_running_volume(self, temp_repo):
+        """Weeks are Monday-Sunday, oldest first, counting running distance only."""
+        wednesday = date(2026, 3, 18)
+        save_activity(temp_repo, _make_activity("w2run", wednesday, distance_km=12.0))
+        save_activity(temp_repo, _make_activity("w2ride", wednesday, sport_type="cycle", distance_km=40.0))
+        save_activity(temp_repo, _make_activity("w1run", wednesday - timedelta(days=7), distance_km=8.5))
+
+        weeks = load_recent_weeks(temp_repo, weeks=2, end_date=wednesday)
+
+        assert [(w["week_number"], w["start_date"], w["end_date"]) for w in weeks] == [
+            (1, "2026-03-09", "2026-03-15"),
+            (2, "2026-03-16", "2026-03-22"),
+        ]
+        assert [w["actual_volume_km"] for w in weeks] == [8.5, 12.0]
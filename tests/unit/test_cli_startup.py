@@ -0,0 +1,81 @@
+"""
+Unit tests for CLI cold-start cost.
+
+Tests that the lazy command registry resolves every command, that importing
+the CLI (or running a light command) does not pull in the Strava client or
+the API layer, and that `python -X importtime` stays within budget.
+"""
+
+import json
+import subprocess
+import sys
+
+import click
+import pytest
+import typer
+
+from resilio.cli import LAZY_COMMANDS, app, load_command
+
+# Cumulative `import resilio.cli` time, in microseconds. The lazy CLI measures
+# ~50ms (almost all of it Typer itself); eager imports measured ~820ms.
+IMPORT_TIME_BUDGET_US = 250_000
+
+HEAVY_MODULES = ["httpx", "tenacity", "resilio.core.strava", "resilio.api.coach", "resilio.core.workflows"]
+
+
+def _run_python(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, *args], capture_output=True, text=True, check=True)
+
+
+def _loaded_heavy_modules(script: str) -> list[str]:
+    probe = f"import json, sys\n{script}\nprint(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    return json.loads(_run_python("-c", probe).stdout.strip().splitlines()[-1])
+
+
+class TestCLIStartup:
+    """Tests for lazy command loading."""
+
+    @pytest.mark.parametrize("name", list(LAZY_COMMANDS))
+    def test_registered_command_loads(self, name):
+        """Every registry entry should build a click command with its help."""
+        command = load_command(name)
+
+        assert isinstance(command, click.Command)
+        assert command.name == name
+        assert command.help == LAZY_COMMANDS[name][2]
+
+    def test_unknown_command_is_none(self):
+        """Unregistered names should fall through to click's usage error."""
+        assert load_command("nope") is None
+
+    def test_help_lists_all_commands(self):
+        """Root --help should list every registered command in order."""
+        root = typer.main.get_command(app)
+
+        assert root.list_commands(click.Context(root)) == list(LAZY_COMMANDS)
+
+    def test_import_skips_heavy_modules(self):
+        """Importing the CLI should not import any command module's dependencies."""
+        assert _loaded_heavy_modules("import resilio.cli") == []
+
+    def test_light_command_skips_heavy_modules(self):
+        """`resilio dates today` should run without the Strava client or coach API."""
+        script = (
+            "from resilio.cli import app\n"
+            "app(['dates', 'today'], standalone_mode=False)"
+        )
+
+        assert _loaded_heavy_modules(script) == []
+
+    def test_import_time_within_budget(self):
+        """`python -X importtime -c 'import resilio.cli'` should stay under budget."""
+        result = _run_python("-X", "importtime", "-c", "import resilio.cli")
+
+        cumulative = [
+            int(line.split("|")[1])
+            for line in result.stderr.splitlines()
+            if line.startswith("import time:") and line.split("|")[2].strip() == "resilio.cli"
+        ]
+
+        assert cumulative, "resilio.cli missing from -X importtime output"
+        assert cumulative[0] < IMPORT_TIME_BUDGET_US
@@ -74,12 +74,12 @@ def test_sync_status_stale_lock(tmp_path, monkeypatch):
     assert envelope["data"]["lock"]["stale"] is True
 
 
-def test_sync_status_malformed_progress_file(tmp_path, monkeypatch):
+def test_sync_status_malformed_journal(tmp_path, monkeypatch):
     (tmp_path / ".git").mkdir()
     (tmp_path / "config").mkdir()
     monkeypatch.chdir(tmp_path)
 
-    (tmp_path / "config" / ".sync_progress.json").write_text("{bad-json")
+    (tmp_path / "config" / ".sync_journal.jsonl").write_text("{bad-json")
 
     runner = CliRunner()
     result = runner.invoke(app, ["sync", "--status"])
@@ -117,23 +117,21 @@ last_progress_at: "2026-02-12T12:00:00+00:00"
     assert parsed_last_progress == datetime(2026, 2, 12, 12, 0, tzinfo=timezone.utc)
 
 
-def test_sync_status_reads_valid_progress_payload(tmp_path, monkeypatch):
+def test_sync_status_replays_journal(tmp_path, monkeypatch):
     (tmp_path / ".git").mkdir()
     (tmp_path / "config").mkdir()
     monkeypatch.chdir(tmp_path)
 
-    progress_payload = {
-        "phase": "fetching",
-        "activities_seen": 12,
-        "activities_imported": 10,
-        "activities_skipped": 2,
-        "activities_failed": 0,
-        "current_page": 3,
-        "current_month": "2025-11",
-        "cursor_before_timestamp": 1736000000,
-        "updated_at": "2026-02-12T12:03:00+00:00",
-    }
-    (tmp_path / "config" / ".sync_progress.json").write_text(json.dumps(progress_payload))
+    events = [
+        {"event": "start", "at": "2026-02-12T12:00:00+00:00", "backfill_in_progress": False},
+        {"event": "cursor", "at": "2026-02-12T12:01:00+00:00", "before": 1736000000, "page": 3, "listed": 12},
+        {"event": "imported", "at": "2026-02-12T12:02:00+00:00", "id": "strava_1", "date": "2025-11-02"},
+        {"event": "skipped", "at": "2026-02-12T12:02:30+00:00", "id": "strava_2"},
+        {"event": "phase", "at": "2026-02-12T12:03:00+00:00", "phase": "processing"},
+    ]
+    lines = "".join(json.dumps(event) + "\n" for event in events)
+    # A torn last line (crash mid-write) is ignored
+    (tmp_path / "config" / ".sync_journal.jsonl").write_text(lines + '{"event": "imp')
 
     runner = CliRunner()
     result = runner.invoke(app, ["sync", "--status"])
@@ -141,8 +139,11 @@ def test_sync_status_reads_valid_progress_payload(tmp_path, monkeypatch):
     assert result.exit_code == 0
     envelope = _parse_output(result.stdout)
     progress = envelope["data"]["progress"]
-    assert progress["phase"] == "fetching"
+    assert progress["phase"] == "processing"
     assert progress["activities_seen"] == 12
+    assert progress["activities_imported"] == 1
+    assert progress["activities_skipped"] == 1
+    assert progress["current_page"] == 3
     assert progress["cursor_before_timestamp"] == 1736000000
 
 
@@ -9,6 +9,7 @@ import yaml
 from pathlib import Path
 
 from resilio.core.config import ConfigError, get_repo_root, load_config
+from resilio.core.model_cache import disable_model_cache, enable_model_cache
 from resilio.schemas.config import Config, ConfigErrorType
 
 
@@ -152,3 +153,37 @@ class TestLoadConfig:
         assert result.settings.training_defaults.ctl_time_constant == 42
         assert result.settings.training_defaults.atl_time_constant == 7
         assert result.settings.paths.athlete_dir == "data/athlete"
+
+    def test_load_config_cache_sees_file_edits(self, tmp_path, monkeypatch):
+        """With the model cache on, edited config files must be re-read."""
+        (tmp_path / ".git").mkdir()
+        config_dir = tmp_path / "config"
+        config_dir.mkdir()
+        secrets = {
+            "strava": {
+                "client_id": "12345",
+                "client_secret": "s" * 40,
+                "access_token": "token",
+                "refresh_token": "refresh",
+                "token_expires_at": 1704067200,
+            }
+        }
+        with open(config_dir / "secrets.local.yaml", "w") as f:
+            yaml.dump(secrets, f)
+        with open(config_dir / "settings.yaml", "w") as f:
+            yaml.dump({"paths": {"athlete_dir": "data/athlete"}}, f)
+        monkeypatch.chdir(tmp_path)
+
+        cache = enable_model_cache()
+        try:
+            first = load_config()
+            first.settings.paths.athlete_dir = "mutated"
+            assert load_config().settings.paths.athlete_dir == "data/athlete"
+            assert cache.stats()["hits"] == 2
+
+            with open(config_dir / "settings.yaml", "w") as f:
+                yaml.dump({"paths": {"athlete_dir": "data/athlete-v2"}}, f)
+
+            assert load_config().settings.paths.athlete_dir == "data/athlete-v2"
+        finally:
+            disable_model_cache()
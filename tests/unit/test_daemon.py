@@ -0,0 +1,126 @@
+"""
+Unit tests for the `resilio serve` daemon and its thin client.
+
+Tests argv forwarding over a real Unix socket, exit-code/stderr passthrough,
+fallback when no compatible daemon is listening, and which commands always
+run in-process.
+"""
+
+import json
+import os
+import socket
+import stat
+import threading
+
+import pytest
+
+from resilio import client
+from resilio.cli.daemon import DaemonServer, daemon_running, run_request
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs Unix sockets")
+
+
+@pytest.fixture
+def repo_dir(tmp_path):
+    (tmp_path / ".git").mkdir()
+    return tmp_path
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    """Daemon on a temp socket, serving requests from a background thread."""
+    server = DaemonServer(tmp_path / "resilio.sock", idle_timeout=5)
+    thread = threading.Thread(target=server.serve_until_idle, daemon=True)
+    thread.start()
+    yield server
+    server.stopped = True
+    daemon_running(server.socket_path)  # Wake handle_request() so the loop exits
+    thread.join()
+    server.server_close()
+
+
+class TestDaemon:
+    """Tests for request execution and client forwarding."""
+
+    def test_run_request_captures_envelope(self, repo_dir):
+        """A command should return the same JSON envelope it prints in-process."""
+        response = run_request(["dates", "today"], str(repo_dir))
+
+        assert response["exit_code"] == 0
+        assert json.loads(response["stdout"])["ok"] is True
+
+    def test_forward_round_trip(self, daemon, repo_dir):
+        """The client should receive stdout and exit codes from the daemon."""
+        ok = client.forward(["dates", "today"], daemon.socket_path, cwd=str(repo_dir))
+        usage_error = client.forward(["no-such-command"], daemon.socket_path, cwd=str(repo_dir))
+
+        assert ok["exit_code"] == 0
+        assert json.loads(ok["stdout"])["message"].startswith("Today is")
+        assert usage_error["exit_code"] == 2
+        assert "No such command" in usage_error["stderr"]
+        assert daemon.requests_handled == 2
+
+    def test_forward_without_daemon_returns_none(self, tmp_path):
+        """Missing or stale sockets mean the caller runs in-process."""
+        stale = tmp_path / "stale.sock"
+        stale.write_text("")
+
+        assert client.forward(["dates", "today"], tmp_path / "missing.sock") is None
+        assert client.forward(["dates", "today"], stale) is None
+
+    def test_protocol_mismatch_falls_back(self, daemon, repo_dir, monkeypatch):
+        """A daemon speaking another protocol must not run the command."""
+        monkeypatch.setattr(client, "PROTOCOL_VERSION", client.PROTOCOL_VERSION + 1)
+
+        assert client.forward(["dates", "today"], daemon.socket_path, cwd=str(repo_dir)) is None
+        assert daemon.requests_handled == 1
+
+    @pytest.mark.parametrize(
+        "argv,local",
+        [
+            (["serve"], True),
+            (["--repo-root", "/tmp/x", "profile", "edit"], True),
+            (["profile", "show"], False),
+            (["memory", "search", "--query", "serve"], False),
+        ],
+    )
+    def test_requires_local(self, argv, local):
+        """Only serve and terminal-bound commands bypass the daemon."""
+        assert client.requires_local(argv) is local
+
+
+class TestSocketTrust:
+    """Tests for the socket location and ownership checks."""
+
+    def test_tmp_fallback_is_per_user_dir(self, tmp_path, monkeypatch):
+        """Without XDG_RUNTIME_DIR the socket lives in a 0700 per-user directory."""
+        monkeypatch.delenv(client.SOCKET_ENV, raising=False)
+        monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+        monkeypatch.setattr(client.tempfile, "gettempdir", lambda: str(tmp_path))
+
+        path = client.default_socket_path()
+
+        assert path.parent == tmp_path / f"resilio-{os.getuid()}"
+        assert client.ensure_socket_dir(path) is True
+        assert stat.S_IMODE(path.parent.stat().st_mode) == 0o700
+
+    def test_shared_dir_is_rejected(self, tmp_path):
+        """A directory others can write to is not a safe socket location."""
+        shared = tmp_path / "shared"
+        shared.mkdir()
+        shared.chmod(0o777)
+
+        assert client.ensure_socket_dir(shared / "resilio.sock") is False
+
+    def test_forward_refuses_untrusted_socket(self, daemon, repo_dir, monkeypatch):
+        """A socket owned by another user, or in a writable dir, is never used."""
+        monkeypatch.setattr(client.os, "getuid", lambda: os.geteuid() + 1)
+        assert client.forward(["dates", "today"], daemon.socket_path, cwd=str(repo_dir)) is None
+        monkeypatch.undo()
+
+        daemon.socket_path.parent.chmod(0o777)
+        try:
+            assert client.forward(["dates", "today"], daemon.socket_path, cwd=str(repo_dir)) is None
+        finally:
+            daemon.socket_path.parent.chmod(0o700)
+        assert daemon.requests_handled == 0
@@ -6,6 +6,8 @@ from resilio.utils.dates import (
     get_week_boundaries,
     format_week_range,
     validate_week_start,
+    monday_ordinal,
+    WeekBuckets,
 )
 
 
@@ -116,3 +118,67 @@ class TestValidateWeekStart:
             expected = (i == 0)  # Only Monday (i=0) should be True
             assert validate_week_start(day) == expected, \
                 f"Day {i} ({day.strftime('%A')}) failed"
+
+
+class TestMondayOrdinal:
+    """Tests for monday_ordinal function."""
+
+    def test_every_weekday_maps_to_its_monday(self):
+        """All days of a week share the same Monday."""
+        monday = date(2026, 1, 19)
+        for i in range(7):
+            day = monday + timedelta(days=i)
+            assert date.fromordinal(monday_ordinal(day.toordinal())) == monday
+
+
+class TestWeekBuckets:
+    """Tests for WeekBuckets."""
+
+    def test_weeks_cover_start_to_end(self):
+        """Weeks run from the Monday before start to the week of end."""
+        buckets = WeekBuckets(date(2026, 1, 21), date(2026, 2, 2))  # Wed .. Mon
+        assert buckets.first_monday == date(2026, 1, 19)
+        assert buckets.num_weeks == 3
+        assert buckets.week_start(2) == date(2026, 2, 2)
+
+    def test_add_counts_and_totals(self):
+        """Activities land in their week; values are summed per week."""
+        buckets = WeekBuckets(date(2026, 1, 19), date(2026, 2, 1))
+        assert buckets.add(date(2026, 1, 19), distance_km=5.0)
+        assert buckets.add(date(2026, 1, 25).toordinal(), distance_km=7.5)
+        assert buckets.add(date(2026, 1, 26), distance_km=10.0)
+
+        assert buckets.counts == [2, 1]
+        assert buckets.totals["distance_km"] == [12.5, 10.0]
+        assert buckets.max_total("distance_km") == 12.5
+
+    def test_out_of_range_dates_are_ignored(self):
+        """Dates outside the bucketed weeks are rejected."""
+        buckets = WeekBuckets(date(2026, 1, 19), date(2026, 1, 25))
+        assert not buckets.add(date(2026, 1, 18))
+        assert not buckets.add(date(2026, 1, 26))
+        assert buckets.counts == [0]
+
+    def test_inactive_runs(self):
+        """Consecutive empty weeks are reported as (first, last) runs."""
+        buckets = WeekBuckets(date(2026, 1, 5), date(2026, 2, 22))  # 7 weeks
+        for week in (0, 3, 4):
+            buckets.add(buckets.week_start(week))
+
+        assert buckets.active_weeks == 3
+        assert buckets.inactive_runs() == [(1, 2), (5, 6)]
+
+    def test_from_activities(self):
+        """Activities with date or date_ordinal attributes are bucketed."""
+        class Run:
+            def __init__(self, day, distance_km):
+                self.date = day
+                self.distance_km = distance_km
+
+        runs = [Run(date(2026, 1, 20), 8.0), Run(date(2026, 1, 22), None)]
+        buckets = WeekBuckets.from_activities(runs, date(2026, 1, 19), date(2026, 1, 25), values=("distance_km",))
+        assert buckets.counts == [2]
+        assert buckets.totals["distance_km"] == [8.0]
+
+        empty = WeekBuckets.from_activities([], date(2026, 1, 19), date(2026, 1, 25), values=("distance_km",))
+        assert empty.totals["distance_km"] == [0.0]
@@ -0,0 +1,175 @@
+"""
+Unit tests for the on-disk Strava response cache.
+
+Runs StravaSession against a local stub HTTP server to check freshness,
+ETag revalidation, summary-tag reuse and size-based eviction.
+"""
+
+import json
+import os
+import sys
+import threading
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from resilio.core.http_cache import ResponseCache
+from resilio.core.strava import StravaSession, summary_fingerprint
+from resilio.schemas.config import Config, Secrets, Settings, StravaSecrets, StravaSettings
+
+
+class _StubStrava(BaseHTTPRequestHandler):
+    """Minimal Strava stand-in: JSON bodies with ETags, honours If-None-Match."""
+
+    requests: list[tuple[str, str]] = []
+
+    def do_GET(self):  # noqa: N802 (http.server API)
+        body = json.dumps({"path": self.path, "id": 1}).encode("utf-8")
+        etag = f'"{len(body)}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.requests.append((self.path, "304"))
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        self.requests.append((self.path, "200"))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    _StubStrava.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubStrava)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def stub_config(stub_server):
+    host, port = stub_server.server_address
+    return Config(
+        secrets=Secrets(
+            strava=StravaSecrets(
+                client_id="client",
+                client_secret="secret",
+                access_token="token",
+                refresh_token="refresh",
+                token_expires_at=int((datetime.now(timezone.utc) + timedelta(hours=6)).timestamp()),
+            )
+        ),
+        settings=Settings(strava=StravaSettings(api_base_url=f"http://{host}:{port}/api/v3")),
+        loaded_at=datetime.now(timezone.utc),
+    )
+
+
+class TestResponseCache:
+    """Tests for ResponseCache with StravaSession."""
+
+    def test_fresh_page_served_without_request(self, stub_config, tmp_path):
+        """Older list pages are served from disk while within TTL."""
+        cache = ResponseCache(tmp_path / "cache", ttl_seconds=600)
+
+        with StravaSession(stub_config, cache=cache) as session:
+            first = session.fetch_activities(before=1700000000)
+            second = session.fetch_activities(before=1700000000)
+
+        assert first == second
+        assert len(_StubStrava.requests) == 1
+        assert cache.hits == 1
+
+    def test_newest_page_is_revalidated_with_etag(self, stub_config, tmp_path):
+        """The head page always revalidates; a 304 reuses the cached body."""
+        cache = ResponseCache(tmp_path / "cache", ttl_seconds=600)
+
+        with StravaSession(stub_config, cache=cache) as session:
+            first = session.fetch_activities()
+            second = session.fetch_activities()
+
+        assert first == second
+        assert [status for _, status in _StubStrava.requests] == ["200", "304"]
+        assert cache.revalidations == 1
+
+    def test_detail_reused_while_summary_unchanged(self, stub_config, tmp_path):
+        """Details with a matching summary tag are reused even when stale."""
+        cache = ResponseCache(tmp_path / "cache", ttl_seconds=0)
+        summary = {"id": 1, "name": "Morning Run", "moving_time": 1800, "kudos_count": 1}
+        tag = summary_fingerprint(summary)
+
+        with StravaSession(stub_config, cache=cache) as session:
+            session.fetch_activity_details("1", summary_tag=tag)
+            # Social counters don't change the fingerprint
+            session.fetch_activity_details("1", summary_tag=summary_fingerprint({**summary, "kudos_count": 5}))
+            # An edited summary forces a refetch (revalidated via ETag)
+            session.fetch_activity_details("1", summary_tag=summary_fingerprint({**summary, "name": "Renamed"}))
+
+        assert [status for _, status in _StubStrava.requests] == ["200", "304"]
+
+    def test_cache_persists_across_sessions(self, stub_config, tmp_path):
+        """A new session (e.g. a resumed sync) reuses entries from disk."""
+        cache_dir = tmp_path / "cache"
+        with StravaSession(stub_config, cache=ResponseCache(cache_dir)) as session:
+            session.fetch_activities(before=1700000000)
+
+        with StravaSession(stub_config, cache=ResponseCache(cache_dir)) as session:
+            session.fetch_activities(before=1700000000)
+
+        assert len(_StubStrava.requests) == 1
+
+    def test_size_eviction_removes_oldest_entries(self, tmp_path):
+        """Entries beyond the size budget are evicted oldest-first."""
+        cache = ResponseCache(tmp_path / "cache", max_bytes=2_000)
+        body = "x" * 500
+        keys = [cache.make_key("http://stub/activities", {"page": page}) for page in range(6)]
+
+        for i, key in enumerate(keys):
+            cache.put(key, "http://stub/activities", body)
+            # Distinct mtimes so eviction order is deterministic
+            os.utime(cache._entry_path(key), ns=(i * 10**9, i * 10**9))
+
+        assert cache.get(keys[0]) is None
+        assert cache.get(keys[-1]) is not None
+        assert cache._scan_size() <= 2_000
+
+    def test_unreadable_entry_is_a_miss(self, tmp_path):
+        """Corrupt entries should be ignored rather than raise."""
+        cache = ResponseCache(tmp_path / "cache")
+        key = cache.make_key("http://stub/activities")
+        cache.put(key, "http://stub/activities", "[]")
+        cache._entry_path(key).write_text("{not json")
+
+        assert cache.get(key) is None
+
+    def test_counters_are_exact_across_threads(self, tmp_path):
+        """Fetch workers record hits and misses concurrently without losing counts."""
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)  # Switch threads as often as possible
+        cache = ResponseCache(tmp_path / "cache")
+
+        def worker():
+            for _ in range(2_000):
+                cache.record_hit()
+                cache.record_miss()
+
+        try:
+            threads = [threading.Thread(target=worker) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+
+        assert (cache.hits, cache.misses) == (16_000, 16_000)
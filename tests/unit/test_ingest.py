@@ -0,0 +1,45 @@
+"""
+Unit tests for the background activity writer.
+
+Tests that queued files land on disk and in the activity index by flush(),
+and that write failures are reported instead of raised.
+"""
+
+from datetime import date
+
+from resilio.core.ingest import BackgroundWriter
+from resilio.schemas.activity import NormalizedActivity
+from tests.factories import make_activity
+
+
+class TestBackgroundWriter:
+    """Tests for BackgroundWriter."""
+
+    def test_flush_writes_and_indexes_files(self, temp_repo):
+        """After flush() every submitted activity is readable and indexed."""
+        with BackgroundWriter(temp_repo, max_pending=2) as writer:
+            for day in range(1, 6):
+                activity = make_activity(f"a{day}", date(2026, 1, day))
+                path = f"data/activities/2026-01/2026-01-0{day}_a{day}.yaml"
+                assert writer.submit(path, activity) is None
+            assert writer.flush() == []
+
+            index = temp_repo.activity_index()
+            assert [entry.id for entry in index.query()] == ["a1", "a2", "a3", "a4", "a5"]
+            loaded = temp_repo.read_yaml("data/activities/2026-01/2026-01-03_a3.yaml", NormalizedActivity)
+            assert loaded.id == "a3"
+
+    def test_write_failure_reported_on_flush(self, temp_repo):
+        """A failed write comes back from flush() and is not indexed."""
+        blocker = temp_repo.resolve_path("data/activities/2026-01")
+        blocker.parent.mkdir(parents=True)
+        blocker.write_text("not a directory")
+        activity = make_activity("a1", date(2026, 1, 5))
+
+        with BackgroundWriter(temp_repo) as writer:
+            writer.submit("data/activities/2026-01/2026-01-05_a1.yaml", activity)
+            failures = writer.flush()
+
+        assert len(failures) == 1
+        assert failures[0].data is activity
+        assert temp_repo.activity_index().get("a1") is None
@@ -0,0 +1,85 @@
+"""
+Unit tests for precompiled keyword matching.
+
+Tests whole-word, inflected-form and phrase matching, negation handling and
+the stored note-flag fallback used by metrics.
+"""
+
+import pytest
+
+from resilio.core.keywords import KeywordMatcher, activity_note_flags, match_note_flags
+from resilio.core.metrics import _scan_activity_flags
+from resilio.schemas.activity import NoteFlags
+from tests.factories import make_activity
+
+
+class TestKeywordMatcher:
+    """Tests for KeywordMatcher and note flags."""
+
+    def test_matches_whole_words_and_phrases(self):
+        """Keywords match whole words, any case or accent, and multi-word phrases."""
+        matcher = KeywordMatcher({"illness": {"ill", "threw up"}, "injury": {"pain"}})
+
+        assert matcher.match("Hill repeats, will do again") == {"illness": [], "injury": []}
+        assert matcher.match("Felt ILL and threw\nup", "Knee PAIN") == {
+            "illness": ["ill", "threw up"],
+            "injury": ["pain"],
+        }
+
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            ("Painful left calf", {"injury": ["pain"], "memory": []}),
+            ("Two injuries this season", {"injury": ["injury"], "memory": []}),
+            ("Both knees stiff", {"injury": [], "memory": ["knee"]}),
+            ("Knee's fine, ankles hurting", {"injury": ["hurt"], "memory": ["ankle", "knee"]}),
+            ("Kneeling stretches, painting the fence", {"injury": [], "memory": []}),
+        ],
+    )
+    def test_matches_inflected_forms(self, text, expected):
+        """Keywords match other forms of the same word, reported as the keyword."""
+        matcher = KeywordMatcher({"injury": {"pain", "injury", "hurt"}, "memory": {"knee", "ankle"}})
+
+        assert matcher.match(text) == expected
+
+    def test_note_flags_and_memory_keywords_match_inflections(self):
+        """Inflected forms reach note flags and sync memory keywords."""
+        from resilio.core.workflows import MEMORY_KEYWORDS
+
+        assert match_note_flags("Painful knees after two injuries").injury == ["injury", "pain"]
+        assert MEMORY_KEYWORDS.match("Sore knees again")["injury_history"] == ["knee"]
+        assert MEMORY_KEYWORDS.match("No knees pain")["injury_history"] == []
+
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            ("no pain today", []),
+            ("didn't feel any pain", []),
+            ("pain-free run", []),
+            ("no issues, but pain in the knee", ["pain"]),
+            ("no pain but calf sore", ["sore"]),
+            ("never had so much fun. Sharp pain after", ["pain", "sharp"]),
+        ],
+    )
+    def test_negation(self, text, expected):
+        """Negated mentions are skipped within their clause only."""
+        matcher = KeywordMatcher({"injury": {"pain", "sore", "sharp"}})
+
+        assert matcher.match(text)["injury"] == expected
+
+    def test_negation_can_be_disabled(self):
+        """With negation off, every mention counts."""
+        assert KeywordMatcher({"injury": {"pain"}}, negation=False).match("no pain")["injury"] == ["pain"]
+
+    def test_stored_flags_are_used_without_rescanning(self):
+        """Metrics read stored flags; activities without them are scanned."""
+        stored = make_activity(private_note="knee pain", note_flags=NoteFlags(illness=["flu"]))
+        legacy = make_activity(private_note="Sprained ankle, no fever")
+
+        assert activity_note_flags(stored).injury == []
+        assert activity_note_flags(legacy) == match_note_flags("Sprained ankle, no fever")
+        assert legacy.note_flags is None
+
+        injury_flags, illness_flags = _scan_activity_flags([stored, legacy])
+        assert len(injury_flags) == 1 and injury_flags[0].endswith("activity: sprained")
+        assert len(illness_flags) == 1 and illness_flags[0].endswith("activity: flu")
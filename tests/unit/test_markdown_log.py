@@ -0,0 +1,106 @@
+"""
+Unit tests for append-only markdown logs (core/markdown_log.py).
+"""
+
+import os
+
+import pytest
+
+from resilio.core.markdown_log import MarkdownLog
+from resilio.core.plan import plan_review_log, training_log
+
+HEADER = "# Training Log: Half Marathon\n\n---\n\n"
+
+
+def _week(number: int, note: str = "Solid week") -> str:
+    return f"\n## Week {number}: Base (Jan {number})\n\n{note} 🏃\n\n---\n"
+
+
+@pytest.fixture
+def log(tmp_path):
+    log = training_log(tmp_path / "current_training_log.md")
+    log.write(HEADER)
+    return log
+
+
+class TestMarkdownLog:
+    """Tests for MarkdownLog writes and indexed reads."""
+
+    def test_append_matches_concatenation(self, log):
+        """Appending produces the same markdown as rewriting the file."""
+        log.append(_week(1))
+        log.append(_week(2))
+        assert log.render() == HEADER + _week(1) + _week(2)
+
+    def test_append_returns_entries(self, log):
+        """Appended sections are indexed by their heading key."""
+        [entry] = log.append(_week(1))
+        assert entry.key == "1"
+        assert log.read(entry) == _week(1)[1:]
+
+    def test_entries_and_tail(self, log):
+        """The last N sections render after the header."""
+        for number in (1, 2, 3):
+            log.append(_week(number))
+
+        assert [entry.key for entry in log.entries()] == ["1", "2", "3"]
+        assert log.render(log.entries()[-2:]) == HEADER + "\n" + _week(2)[1:] + _week(3)
+
+    def test_find_week(self, log):
+        """find() returns one week's section, non-ASCII text included."""
+        log.append(_week(1))
+        log.append(_week(2, note="Légère fatigue"))
+        assert "Légère fatigue" in log.read(log.find("2"))
+        assert log.find("9") is None
+
+    def test_reads_use_the_index(self, log):
+        """A current index is trusted: no rescan of the markdown."""
+        log.append(_week(1))
+        log.heading = None  # Any rescan would fail
+        assert [entry.key for entry in log.entries()] == ["1"]
+
+    def test_external_edit_rebuilds_index(self, log):
+        """An out-of-band rewrite is detected and rescanned."""
+        log.append(_week(1))
+        log.path.write_text(HEADER + _week(1) + _week(2), encoding="utf-8")
+        stat = log.path.stat()
+        os.utime(log.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert [entry.key for entry in log.entries()] == ["1", "2"]
+        log.append(_week(3))
+        assert [entry.key for entry in log.entries()] == ["1", "2", "3"]
+
+    def test_missing_or_torn_index(self, log):
+        """A deleted or torn index is rebuilt from the markdown."""
+        log.append(_week(1))
+        with open(log.index_path, "a", encoding="utf-8") as f:
+            f.write('{"entries": [[99, "x"]], "sta')
+        assert [entry.key for entry in log.entries()] == ["1"]
+
+        log.index_path.unlink()
+        assert [entry.key for entry in log.entries()] == ["1"]
+
+    def test_write_resets_index(self, log):
+        """write() starts a new log."""
+        log.append(_week(1))
+        log.write(HEADER)
+        assert log.entries() == []
+        assert log.header() == HEADER
+
+    def test_append_requires_file(self, tmp_path):
+        """Appending to a log that was never written fails."""
+        with pytest.raises(FileNotFoundError):
+            MarkdownLog(tmp_path / "missing.md", r"^## (.+)$").append("\n## Entry\n")
+
+    def test_review_headings(self, tmp_path):
+        """The plan review indexes adaptations and the Adaptations section."""
+        review = plan_review_log(tmp_path / "current_plan_review.md")
+        review.write("# Plan\n\n## Week 1\nEasy.\n")
+        review.append("\n\n---\n\n## 📋 Plan Adaptation - February 15, 2026\n\nRest.\n")
+        review.append("\n\n## Adaptations\n\n### 2026-02-16 10:00\nReplanned weeks 5-10\n\n")
+
+        assert [entry.key for entry in review.entries()] == [
+            "📋 Plan Adaptation - February 15, 2026",
+            "Adaptations",
+        ]
+        assert review.header() == "# Plan\n\n## Week 1\nEasy.\n\n\n---\n\n"
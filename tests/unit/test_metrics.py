@@ -17,6 +17,9 @@ from resilio.core.metrics import (
     compute_intensity_distribution,
     compute_load_trend,
     compute_metrics_batch,
+    compute_metrics_range,
+    compute_metrics_incremental,
+    DailyLoadSeries,
     validate_metrics,
     InvalidMetricsInputError,
     MetricsCalculationError,
@@ -1586,3 +1589,243 @@ class TestBatchOperations:
 
         # Should complete all 3 days
         assert len(results) == 3
+
+
+class TestMetricsRangeEngine:
+    """Tests for the single-pass compute_metrics_range engine."""
+
+    @staticmethod
+    def _write_history(repo, activity, start_date, days):
+        """Write a varied history with rest days, month boundary and notes."""
+        for i in range(days):
+            if i % 5 == 3:
+                continue  # Rest day
+            current_date = start_date + timedelta(days=i)
+            year_month = f"{current_date.year}-{current_date.month:02d}"
+            activity.id = f"test_run_{i}"
+            activity.date = current_date
+            activity.calculated.activity_id = f"test_run_{i}"
+            activity.calculated.systemic_load_au = 40.0 + (i * 7) % 45
+            activity.calculated.lower_body_load_au = 30.0 + (i * 3) % 20
+            activity.description = "left knee pain after run" if i % 11 == 0 else None
+            activity_path = f"data/activities/{year_month}/{current_date.isoformat()}_run.yaml"
+            repo.write_yaml(activity_path, activity)
+
+    @staticmethod
+    def _snapshot(metrics_list):
+        return [m.model_dump(mode="json", exclude={"calculated_at"}) for m in metrics_list]
+
+    def test_range_matches_per_day_engine_cold_start(self, temp_repo, sample_run_activity):
+        """Range engine should write the same metrics as day-by-day computation."""
+        start_date = date(2026, 1, 10)
+        end_date = start_date + timedelta(days=44)
+        self._write_history(temp_repo, sample_run_activity, start_date, 45)
+
+        expected = self._snapshot(compute_metrics_batch(start_date, end_date, temp_repo))
+        for path in temp_repo.list_files("data/metrics/daily/*.yaml"):
+            path.unlink()
+
+        results = compute_metrics_range(start_date, end_date, temp_repo)
+
+        assert self._snapshot(results) == expected
+        assert results[0].ctl_initialization_method == "estimated"
+        assert results[-1].acwr is not None
+        assert any(m.readiness.injury_flag_override for m in results)
+        assert len(temp_repo.list_files("data/metrics/daily/*.yaml")) == 45
+
+    def test_range_matches_per_day_engine_with_stored_history(
+        self, temp_repo, sample_run_activity
+    ):
+        """Partial recompute should chain from stored metrics before start_date."""
+        start_date = date(2026, 1, 10)
+        end_date = start_date + timedelta(days=44)
+        self._write_history(temp_repo, sample_run_activity, start_date, 45)
+        compute_metrics_batch(start_date, end_date, temp_repo)
+
+        recompute_start = start_date + timedelta(days=30)
+        expected = self._snapshot(compute_metrics_batch(recompute_start, end_date, temp_repo))
+        results = compute_metrics_range(recompute_start, end_date, temp_repo)
+
+        assert self._snapshot(results) == expected
+        assert results[0].ctl_initialization_method == "chained"
+
+    def test_range_rejects_inverted_dates(self, temp_repo):
+        """Should raise when end_date precedes start_date."""
+        with pytest.raises(InvalidMetricsInputError):
+            compute_metrics_range(date(2026, 1, 5), date(2026, 1, 1), temp_repo)
+
+
+class TestIncrementalMetrics:
+    """Tests for compute_metrics_incremental."""
+
+    START_DATE = date(2026, 1, 10)
+
+    @staticmethod
+    def _add_activity(repo, activity, activity_date, load):
+        """Write an extra activity on a date (indexed via write_yaml)."""
+        extra = activity.model_copy(deep=True)
+        extra.id = f"extra_{activity_date.isoformat()}"
+        extra.date = activity_date
+        extra.calculated.activity_id = extra.id
+        extra.calculated.systemic_load_au = load
+        path = f"data/activities/{activity_date.strftime('%Y-%m')}/{activity_date.isoformat()}_extra.yaml"
+        assert repo.write_yaml(path, extra) is None
+
+    @staticmethod
+    def _stored(repo, start_date, end_date):
+        days = (end_date - start_date).days + 1
+        return [
+            repo.read_yaml(f"data/metrics/daily/{(start_date + timedelta(days=i)).isoformat()}.yaml", DailyMetrics)
+            for i in range(days)
+        ]
+
+    def _setup(self, repo, activity, days):
+        end_date = self.START_DATE + timedelta(days=days - 1)
+        TestMetricsRangeEngine._write_history(repo, activity, self.START_DATE, days)
+        compute_metrics_range(self.START_DATE, end_date, repo)
+        return end_date
+
+    def test_exact_tolerance_matches_full_recompute(self, temp_repo, sample_run_activity):
+        """With a sub-rounding tolerance the result equals a full recompute."""
+        end_date = self._setup(temp_repo, sample_run_activity, 45)
+        changed = self.START_DATE + timedelta(days=38)
+        self._add_activity(temp_repo, sample_run_activity, changed, 90.0)
+
+        results = compute_metrics_incremental({changed}, temp_repo, end_date=end_date, tolerance=0.05)
+        incremental = TestMetricsRangeEngine._snapshot(self._stored(temp_repo, self.START_DATE, end_date))
+        full = TestMetricsRangeEngine._snapshot(compute_metrics_range(self.START_DATE, end_date, temp_repo))
+
+        assert [m.date for m in results] == [changed + timedelta(days=i) for i in range(7)]
+        assert incremental == full
+
+    def test_stops_once_converged_past_trailing_windows(self, temp_repo, sample_run_activity):
+        """Recompute should cover the ACWR window and stop before end_date."""
+        end_date = self._setup(temp_repo, sample_run_activity, 120)
+        changed = self.START_DATE + timedelta(days=20)
+        tail_before = self._stored(temp_repo, end_date, end_date)[0]
+        self._add_activity(temp_repo, sample_run_activity, changed, 60.0)
+
+        results = compute_metrics_incremental({changed}, temp_repo, end_date=end_date)
+
+        assert results[0].date == changed
+        assert 28 <= len(results) < 90
+        # Days past the stopping point were not rewritten
+        assert self._stored(temp_repo, end_date, end_date)[0].calculated_at == tail_before.calculated_at
+        # ...and the stopping day is within tolerance of a full recompute
+        last = results[-1]
+        full = {m.date: m for m in compute_metrics_range(self.START_DATE, end_date, temp_repo)}
+        assert abs(last.ctl_atl.ctl - full[last.date].ctl_atl.ctl) <= 0.5
+        assert abs(last.ctl_atl.atl - full[last.date].ctl_atl.atl) <= 0.5
+
+    def test_unchanged_days_are_not_rewritten(self, temp_repo, sample_run_activity):
+        """Days whose serialized output is unchanged keep their file as-is."""
+        end_date = self._setup(temp_repo, sample_run_activity, 30)
+        changed = self.START_DATE + timedelta(days=10)
+        before = self._stored(temp_repo, changed, changed)[0]
+
+        results = compute_metrics_incremental({changed}, temp_repo, end_date=end_date)
+
+        assert [m.date for m in results] == [changed]
+        assert self._stored(temp_repo, changed, changed)[0].calculated_at == before.calculated_at
+
+    def test_fills_missing_days_up_to_end_date(self, temp_repo, sample_run_activity):
+        """Days with no stored metrics after the changed date are computed."""
+        end_date = self._setup(temp_repo, sample_run_activity, 30)
+        for i in range(3):
+            temp_repo.delete_file(f"data/metrics/daily/{(end_date - timedelta(days=i)).isoformat()}.yaml")
+        new_end = end_date + timedelta(days=2)
+
+        results = compute_metrics_incremental({self.START_DATE + timedelta(days=5)}, temp_repo, end_date=new_end)
+
+        assert results[-1].date == new_end
+        assert all(isinstance(m, DailyMetrics) for m in self._stored(temp_repo, self.START_DATE, new_end))
+
+
+class TestDailyLoadSeries:
+    """Tests for the DailyLoadSeries window structure."""
+
+    @staticmethod
+    def _series():
+        """Ten days from Jan 1: loads 10..100, Jan 4 missing."""
+        series = DailyLoadSeries(date(2026, 1, 1))
+        for i in range(10):
+            if i == 3:
+                series.append(None)
+            else:
+                series.append(10.0 * (i + 1), ctl=float(i))
+        return series
+
+    def test_window_sums_and_counts(self):
+        """Windows should sum loads and count present days, treating missing as 0."""
+        series = self._series()
+        last = date(2026, 1, 7)
+
+        assert series.load_sum(last, 7) == 10 + 20 + 30 + 50 + 60 + 70
+        assert series.present_count(last, 7) == 6
+        assert series.load_average(date(2026, 1, 3), 3) == 20.0
+        assert not series.is_present(date(2026, 1, 4))
+        assert series.end_date == date(2026, 1, 11)
+
+    def test_windows_clamped_to_series_bounds(self):
+        """Days outside the series count as missing."""
+        series = self._series()
+
+        assert series.present_count(date(2026, 1, 2), 28) == 2
+        assert series.load_sum(date(2026, 1, 20), 5) == 0.0
+        assert series.present_count(date(2025, 12, 1), 60) == 0
+
+    def test_window_sums_exact_over_long_history(self):
+        """Window sums equal summing the window directly, however long the history."""
+        loads = [round(37.3 + (i * 7919 % 113) * 0.1, 1) for i in range(3000)]
+        series = DailyLoadSeries(date(2018, 1, 1))
+        for load in loads:
+            series.append(load)
+
+        for i in (27, 1500, 2999):
+            last = date(2018, 1, 1) + timedelta(days=i)
+            for days in (6, 7, 27, 28):
+                window = loads[i - days + 1 : i + 1]
+                assert series.load_sum(last, days) == sum(window)
+
+                fresh = DailyLoadSeries(last - timedelta(days=days - 1))
+                for load in window:
+                    fresh.append(load)
+                assert series.load_sum(last, days) == fresh.load_sum(last, days)
+
+    def test_ctl_lookup(self):
+        """ctl_on returns stored CTL only for present days inside the series."""
+        series = self._series()
+
+        assert series.ctl_on(date(2026, 1, 3)) == 2.0
+        assert series.ctl_on(date(2026, 1, 4)) is None
+        assert series.ctl_on(date(2025, 12, 31)) is None
+
+    def test_series_queries_match_repo_queries(self, temp_repo, sample_run_activity):
+        """ACWR and load trend from a series should match reading metrics files."""
+        start_date = date(2026, 1, 10)
+        end_date = start_date + timedelta(days=39)
+        TestMetricsRangeEngine._write_history(temp_repo, sample_run_activity, start_date, 40)
+        compute_metrics_range(start_date, end_date, temp_repo)
+        target_date = end_date + timedelta(days=1)
+
+        series = DailyLoadSeries.from_metrics(start_date, end_date, temp_repo)
+
+        assert calculate_acwr(target_date, series=series, today_load=50.0) == calculate_acwr(
+            target_date, temp_repo, today_load=50.0
+        )
+        assert compute_load_trend(target_date, series=series, today_load=50.0) == compute_load_trend(
+            target_date, temp_repo, today_load=50.0
+        )
+
+    def test_from_activity_index_sums_daily_loads(self, temp_repo, sample_run_activity):
+        """Index-built series has every day present and sums same-day activities."""
+        day = date(2026, 1, 12)
+        for suffix in ("am", "pm"):
+            sample_run_activity.id = f"run_{suffix}"
+            temp_repo.write_yaml(f"data/activities/2026-01/{day.isoformat()}_{suffix}.yaml", sample_run_activity)
+
+        series = DailyLoadSeries.from_activity_index(day - timedelta(days=2), day, temp_repo)
+
+        assert series.present_count(day, 3) == 3
+        assert series.load_sum(day, 1) == 2 * sample_run_activity.calculated.systemic_load_au
+        assert series.load_sum(day - timedelta(days=1), 2) == 0.0
@@ -0,0 +1,101 @@
+"""
+Unit tests for the columnar daily-metrics store.
+
+Tests maintenance via RepositoryIO, stamp-based refresh on external edits,
+cross-year range reads and recovery from a damaged series file.
+"""
+
+import os
+from datetime import date, timedelta
+
+from resilio.core.metrics_store import MetricsStore
+from resilio.core.repository import RepositoryIO
+from resilio.core.serialization import serialize
+from resilio.schemas.metrics import DailyMetrics
+from tests.factories import make_metrics, metrics_path, save_metrics
+
+
+def _save(repo: RepositoryIO, metrics: DailyMetrics) -> None:
+    save_metrics(repo, metrics, file_format="json")
+
+
+class TestMetricsStore:
+    """Tests for MetricsStore."""
+
+    def test_write_yaml_records_day(self, temp_repo):
+        """Writing daily metrics through the repository should store their columns."""
+        _save(temp_repo, make_metrics(date(2026, 1, 5), 42.5, acwr=1.1))
+        _save(temp_repo, make_metrics(date(2026, 1, 7), 43.0))
+
+        series = temp_repo.metrics_store().read_range(date(2026, 1, 5), date(2026, 1, 7))
+
+        assert series.present == [True, False, True]
+        assert series.columns["ctl"] == [42.5, None, 43.0]
+        assert series.columns["acwr"] == [1.1, None, None]
+        assert series.latest_date() == date(2026, 1, 7)
+        assert temp_repo.resolve_path("data/metrics/series/2026.bin").exists()
+
+    def test_delete_file_clears_day(self, temp_repo):
+        """Deleting a daily metrics file should remove the day from the store."""
+        _save(temp_repo, make_metrics(date(2026, 1, 5), 42.5))
+
+        assert temp_repo.delete_file(metrics_path(date(2026, 1, 5))) is None
+
+        assert temp_repo.metrics_store().read_range(date(2026, 1, 5), date(2026, 1, 5)).present == [False]
+
+    def test_external_edits_are_picked_up(self, temp_repo):
+        """Files changed or added outside RepositoryIO should be re-read."""
+        _save(temp_repo, make_metrics(date(2026, 1, 5), 42.5))
+        store = temp_repo.metrics_store()
+        store.read_range(date(2026, 1, 5), date(2026, 1, 6))
+
+        # Edit one file and add another, bypassing RepositoryIO
+        edited = temp_repo.resolve_path(metrics_path(date(2026, 1, 5)))
+        edited.write_text(serialize(make_metrics(date(2026, 1, 5), 50.0).model_dump(mode="json"), "json"))
+        stat = edited.stat()
+        os.utime(edited, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        temp_repo.resolve_path(metrics_path(date(2026, 1, 6))).write_text(
+            serialize(make_metrics(date(2026, 1, 6), 51.0).model_dump(mode="json"), "yaml")
+        )
+
+        series = store.read_range(date(2026, 1, 5), date(2026, 1, 6))
+
+        assert series.columns["ctl"] == [50.0, 51.0]
+        # A fresh store over the same files sees the persisted refresh without re-reading
+        assert MetricsStore(temp_repo).read_range(date(2026, 1, 5), date(2026, 1, 6), validate=False).columns[
+            "ctl"
+        ] == [50.0, 51.0]
+
+    def test_unparseable_file_is_present_without_values(self, temp_repo):
+        """A daily file that fails validation still counts as present."""
+        path = temp_repo.resolve_path(metrics_path(date(2026, 1, 5)))
+        path.parent.mkdir(parents=True)
+        path.write_text("test: data")
+
+        series = temp_repo.metrics_store().read_range(date(2026, 1, 5), date(2026, 1, 5))
+
+        assert series.present == [True]
+        assert series.columns["ctl"] == [None]
+        assert series.to_records() == [{"date": "2026-01-05", **{name: None for name in series.columns}}]
+
+    def test_range_spans_years(self, temp_repo):
+        """Ranges crossing New Year should read both year files in order."""
+        _save(temp_repo, make_metrics(date(2025, 12, 31), 40.0))
+        _save(temp_repo, make_metrics(date(2026, 1, 1), 41.0))
+
+        series = temp_repo.metrics_store().read_range(date(2025, 12, 30), date(2026, 1, 2))
+
+        assert series.dates()[0] == date(2025, 12, 30)
+        assert series.columns["ctl"] == [None, 40.0, 41.0, None]
+        assert [record["date"] for record in series.to_records()] == ["2025-12-31", "2026-01-01"]
+
+    def test_damaged_series_file_is_rebuilt(self, temp_repo):
+        """A truncated or foreign series file should be rebuilt from the daily files."""
+        day = date(2026, 3, 1)
+        _save(temp_repo, make_metrics(day, 44.0))
+        temp_repo.resolve_path("data/metrics/series/2026.bin").write_bytes(b"garbage")
+
+        series = temp_repo.metrics_store().read_range(day - timedelta(days=1), day)
+
+        assert series.columns["ctl"] == [None, 44.0]
+        assert temp_repo.resolve_path("data/metrics/series/2026.bin").stat().st_size > 7
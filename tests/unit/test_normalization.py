@@ -425,6 +425,17 @@ class TestNormalizationIntegration:
         assert normalized.created_at is not None
         assert normalized.synced_at is not None
 
+    def test_note_flags_matched_at_normalization(self, basic_raw_activity):
+        """Note keywords should be stored on the activity, negations excluded."""
+        basic_raw_activity.description = "No pain on the hills"
+        basic_raw_activity.private_note = "Left calf tight, slight cold"
+
+        normalized = normalize_activity(basic_raw_activity)
+
+        assert normalized.note_flags.injury == ["tight"]
+        assert normalized.note_flags.illness == ["cold"]
+        assert normalized.note_flags.travel == []
+
     def test_normalize_and_persist_creates_file(self, basic_raw_activity, temp_repo):
         """Should normalize and persist activity to disk."""
         result = normalize_and_persist(basic_raw_activity, temp_repo)
@@ -1699,3 +1699,35 @@ class TestUnavailableRunDaysScheduling:
         )
 
         assert schedule[6] != WorkoutType.LONG_RUN
+
+
+class TestMonthlyAssessmentSignals:
+    """Injury/illness signals in the monthly assessment come from note keywords."""
+
+    @staticmethod
+    def _signals(*activities):
+        from resilio.core.plan import assess_monthly_completion
+
+        result = assess_monthly_completion(
+            month_number=1,
+            week_numbers=[1, 2, 3, 4],
+            planned_workouts=[],
+            completed_activities=list(activities),
+            starting_ctl=30.0,
+            ending_ctl=34.0,
+            target_ctl=35.0,
+            current_vdot=45.0,
+        )
+        return len(result["injury_signals"]), len(result["illness_signals"])
+
+    def test_inflected_keywords_are_signals(self):
+        assert self._signals(
+            {"week": 2, "description": "Painful hill repeats", "private_note": ""},
+            {"week": 3, "description": "Easy run", "private_note": "feeling sick and tired"},
+        ) == (1, 1)
+
+    def test_substrings_and_negations_are_not_signals(self):
+        assert self._signals(
+            {"week": 1, "description": "Hill repeats, will go again", "private_note": "no pain"},
+            {"week": 2, "description": "Painting after a cold-free week"},
+        ) == (0, 0)
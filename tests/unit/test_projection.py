@@ -0,0 +1,135 @@
+"""
+Unit tests for projection reads (core/projection.py, RepositoryIO.read_projection)
+and non-validating read_yaml.
+"""
+
+from datetime import date
+
+import pytest
+import yaml
+
+from resilio.core.projection import project, projection_model
+from resilio.core.repository import RepositoryIO, disable_model_cache, enable_model_cache, get_model_cache
+from resilio.schemas.activity import NormalizedActivity
+from resilio.schemas.repository import ReadOptions, RepoError, RepoErrorType
+
+ACTIVITY_PATH = "data/activities/2026-01/2026-01-10_a1.yaml"
+
+
+def _raw_activity(**overrides) -> dict:
+    data = {
+        "id": "a1",
+        "source": "strava",
+        "sport_type": "run",
+        "name": "Tempo",
+        "date": "2026-01-10",
+        "start_time": "2026-01-10T07:00:00+00:00",
+        "duration_minutes": 40,
+        "duration_seconds": 2400,
+        "distance_km": 8.5,
+        "surface_type": "road",
+        "created_at": "2026-01-10T08:00:00+00:00",
+        "updated_at": "2026-01-10T08:00:00+00:00",
+    }
+    data.update(overrides)
+    return data
+
+
+def _write_raw(repo: RepositoryIO, data: dict, path: str = ACTIVITY_PATH) -> None:
+    resolved = repo.resolve_path(path)
+    resolved.parent.mkdir(parents=True, exist_ok=True)
+    resolved.write_text(yaml.safe_dump(data))
+
+
+class TestProjectionModel:
+    """Tests for projection_model/project."""
+
+    def test_only_requested_fields(self):
+        """The generated model has exactly the projected fields."""
+        model = projection_model(NormalizedActivity, ("date", "distance_km"))
+        assert set(model.model_fields) == {"date", "distance_km"}
+
+    def test_model_is_cached(self):
+        """The same field set reuses one generated class."""
+        assert projection_model(NormalizedActivity, ("date",)) is projection_model(NormalizedActivity, ("date",))
+
+    def test_values_are_coerced_like_the_full_schema(self):
+        """Dates are parsed and enums stored as values, as in NormalizedActivity."""
+        record = project(_raw_activity(), NormalizedActivity, ["date", "sport_type", "surface_type"])
+        assert record.date == date(2026, 1, 10)
+        assert record.sport_type == "run"
+        assert record.surface_type == "road"
+
+    def test_defaults_apply_to_missing_fields(self):
+        """Fields absent from the data take the schema default."""
+        record = project(_raw_activity(), NormalizedActivity, ["has_gps_data", "average_hr"])
+        assert record.has_gps_data is False
+        assert record.average_hr is None
+
+    def test_unprojected_fields_are_not_validated(self):
+        """Malformed laps do not matter when laps are not projected."""
+        data = _raw_activity(laps=[{"bogus": True}])
+        assert project(data, NormalizedActivity, ["date"]).date == date(2026, 1, 10)
+        with pytest.raises(ValueError):
+            project(data, NormalizedActivity, ["laps"])
+
+    def test_unknown_field_raises(self):
+        """Names that are not schema fields are rejected."""
+        with pytest.raises(ValueError, match="pace"):
+            projection_model(NormalizedActivity, ("pace",))
+
+
+class TestReadProjection:
+    """Tests for RepositoryIO.read_projection."""
+
+    def test_reads_projected_fields(self, temp_repo):
+        """Projected fields come back typed from the YAML file."""
+        _write_raw(temp_repo, _raw_activity())
+        record = temp_repo.read_projection(ACTIVITY_PATH, NormalizedActivity, ("date", "duration_seconds"))
+        assert record.date == date(2026, 1, 10)
+        assert record.duration_seconds == 2400
+
+    def test_missing_file(self, temp_repo):
+        """A missing file is a FILE_NOT_FOUND error."""
+        result = temp_repo.read_projection(ACTIVITY_PATH, NormalizedActivity, ("date",))
+        assert isinstance(result, RepoError)
+        assert result.error_type == RepoErrorType.FILE_NOT_FOUND
+
+    def test_invalid_projected_field(self, temp_repo):
+        """Invalid projected values are a VALIDATION_ERROR."""
+        _write_raw(temp_repo, _raw_activity(distance_km="far"))
+        result = temp_repo.read_projection(ACTIVITY_PATH, NormalizedActivity, ("distance_km",))
+        assert isinstance(result, RepoError)
+        assert result.error_type == RepoErrorType.VALIDATION_ERROR
+
+
+class TestReadWithoutValidation:
+    """Tests for read_yaml(..., ReadOptions(should_validate=False))."""
+
+    def test_skips_validation(self, temp_repo):
+        """Invalid data is returned as is instead of failing."""
+        _write_raw(temp_repo, _raw_activity(laps=[{"bogus": True}]))
+        assert isinstance(temp_repo.read_yaml(ACTIVITY_PATH, NormalizedActivity), RepoError)
+
+        activity = temp_repo.read_yaml(ACTIVITY_PATH, NormalizedActivity, ReadOptions(should_validate=False))
+        assert isinstance(activity, NormalizedActivity)
+        assert activity.laps == [{"bogus": True}]
+
+    def test_non_mapping_is_an_error(self, temp_repo):
+        """A file that is not a mapping cannot become a model."""
+        temp_repo.resolve_path("list.yaml").write_text("- 1\n- 2\n")
+        result = temp_repo.read_yaml("list.yaml", NormalizedActivity, ReadOptions(should_validate=False))
+        assert isinstance(result, RepoError)
+
+    def test_not_cached(self, temp_repo):
+        """Unvalidated models never enter the model cache."""
+        _write_raw(temp_repo, _raw_activity())
+        disable_model_cache()
+        enable_model_cache()
+        try:
+            temp_repo.read_yaml(ACTIVITY_PATH, NormalizedActivity, ReadOptions(should_validate=False))
+            activity = temp_repo.read_yaml(ACTIVITY_PATH, NormalizedActivity)
+            assert activity.date == date(2026, 1, 10)
+            assert get_model_cache().hits == 0
+        finally:
+            disable_model_cache()
@@ -0,0 +1,73 @@
+"""
+Unit tests for bulk activity reanalysis.
+
+Tests that stale loads and note flags are recomputed, unchanged files are
+left alone, the process pool gives the same result, and metrics are
+recomputed once for the changed dates.
+"""
+
+from datetime import date
+
+import pytest
+
+from resilio.core import reanalysis
+from resilio.core.reanalysis import reanalyze_activities
+from resilio.schemas.activity import NormalizedActivity
+from tests.factories import activity_path, make_activity, save_activity
+
+
+@pytest.fixture
+def metrics_calls(monkeypatch):
+    calls = []
+
+    def fake_update(repo, changed_dates, end_date=None):
+        calls.append(set(changed_dates))
+        return {"metrics_computed": len(changed_dates), "metrics": []}
+
+    monkeypatch.setattr(reanalysis, "update_metrics_incremental", fake_update)
+    return calls
+
+
+class TestReanalysis:
+    """Tests for reanalyze_activities."""
+
+    def test_recomputes_stale_activities_once(self, temp_repo, metrics_calls):
+        """Stale files are rewritten; a second run changes nothing."""
+        for day in (5, 6, 7):
+            activity = make_activity(f"a{day}", date(2026, 1, day), private_note="No pain, calf tight")
+            save_activity(temp_repo, activity)
+
+        first = reanalyze_activities(temp_repo, workers=1)
+        mtimes = [temp_repo.resolve_path(activity_path(make_activity(f"a{d}", date(2026, 1, d)))).stat().st_mtime_ns
+                  for d in (5, 6, 7)]
+        second = reanalyze_activities(temp_repo, since=date(2026, 1, 6), workers=1)
+
+        assert (first.activities_scanned, first.activities_changed, first.activities_failed) == (3, 3, 0)
+        stored = temp_repo.read_yaml(activity_path(make_activity("a5", date(2026, 1, 5))), NormalizedActivity)
+        assert stored.calculated is not None and stored.calculated.systemic_load_au > 0
+        assert stored.note_flags.injury == ["tight"]
+        assert temp_repo.activity_index().get("a5").systemic_load_au == stored.calculated.systemic_load_au
+        assert metrics_calls == [{date(2026, 1, 5), date(2026, 1, 6), date(2026, 1, 7)}]
+
+        assert (second.activities_scanned, second.activities_changed) == (2, 0)
+        assert [temp_repo.resolve_path(activity_path(make_activity(f"a{d}", date(2026, 1, d)))).stat().st_mtime_ns
+                for d in (5, 6, 7)] == mtimes
+        assert len(metrics_calls) == 1
+
+    def test_process_pool_matches_in_process(self, temp_repo, metrics_calls, monkeypatch):
+        """Chunks processed by worker processes give the same stored result."""
+        monkeypatch.setattr(reanalysis, "REANALYZE_CHUNK_SIZE", 2)
+        for day in range(1, 6):
+            activity = make_activity(f"a{day}", date(2026, 2, day), perceived_exertion=day + 3)
+            save_activity(temp_repo, activity)
+
+        result = reanalyze_activities(temp_repo, workers=2)
+
+        assert (result.activities_changed, result.workers) == (5, 2)
+        rpes = [
+            temp_repo.read_yaml(activity_path(make_activity(f"a{d}", date(2026, 2, d))), NormalizedActivity)
+            .calculated.estimated_rpe
+            for d in range(1, 6)
+        ]
+        assert rpes == [4, 5, 6, 7, 8]
+        assert reanalyze_activities(temp_repo, workers=2).activities_changed == 0
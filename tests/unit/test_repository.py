@@ -9,7 +9,7 @@ import yaml
 from pathlib import Path
 from pydantic import BaseModel
 
-from resilio.core.repository import RepositoryIO
+from resilio.core.repository import RepositoryIO, disable_model_cache, enable_model_cache
 from resilio.schemas.repository import RepoError, RepoErrorType, ReadOptions
 
 
@@ -280,3 +280,91 @@ class TestFileLocking:
         repo.release_lock(lock)
 
         assert not lock_path.exists()
+
+
+class TestModelCache:
+    """Tests for the process-level read_yaml model cache."""
+
+    @pytest.fixture
+    def cached_repo(self, tmp_path, monkeypatch):
+        (tmp_path / ".git").mkdir()
+        monkeypatch.chdir(tmp_path)
+        cache = enable_model_cache()
+        cache.clear()
+        yield RepositoryIO(), cache
+        disable_model_cache()
+
+    def test_repeated_reads_hit_cache(self, cached_repo):
+        """Second read of an unchanged file should be served from the cache."""
+        repo, cache = cached_repo
+        repo.write_yaml("data.yaml", TestSchema(name="a", value=1))
+
+        first = repo.read_yaml("data.yaml", TestSchema)
+        second = repo.read_yaml("data.yaml", TestSchema)
+
+        assert first == second
+        assert cache.stats()["misses"] == 1
+        assert cache.stats()["hits"] == 1
+
+    def test_returned_models_are_copies(self, cached_repo):
+        """Mutating a returned model must not poison the cache."""
+        repo, _ = cached_repo
+        repo.write_yaml("data.yaml", TestSchema(name="a", value=1))
+
+        first = repo.read_yaml("data.yaml", TestSchema)
+        first.value = 99
+        second = repo.read_yaml("data.yaml", TestSchema)
+
+        assert second.value == 1
+
+    def test_write_and_delete_invalidate(self, cached_repo):
+        """write_yaml/delete_file should drop cached entries."""
+        repo, _ = cached_repo
+        repo.write_yaml("data.yaml", TestSchema(name="a", value=1))
+        repo.read_yaml("data.yaml", TestSchema)
+
+        repo.write_yaml("data.yaml", TestSchema(name="a", value=2))
+        assert repo.read_yaml("data.yaml", TestSchema).value == 2
+
+        repo.delete_file("data.yaml")
+        result = repo.read_yaml("data.yaml", TestSchema)
+        assert isinstance(result, RepoError)
+        assert result.error_type == RepoErrorType.FILE_NOT_FOUND
+
+    def test_external_edit_is_a_miss(self, cached_repo, tmp_path):
+        """Files changed outside RepositoryIO are re-read (stamp mismatch)."""
+        repo, _ = cached_repo
+        repo.write_yaml("data.yaml", TestSchema(name="a", value=1))
+        repo.read_yaml("data.yaml", TestSchema)
+
+        (tmp_path / "data.yaml").write_text("name: a\nvalue: 12345\n")
+
+        assert repo.read_yaml("data.yaml", TestSchema).value == 12345
+
+    def test_lru_eviction_by_entry_count(self, tmp_path, monkeypatch):
+        """Least recently used entries are evicted beyond max_entries."""
+        (tmp_path / ".git").mkdir()
+        monkeypatch.chdir(tmp_path)
+        disable_model_cache()
+        cache = enable_model_cache(max_entries=2)
+        try:
+            repo = RepositoryIO()
+            for i in range(3):
+                repo.write_yaml(f"data{i}.yaml", TestSchema(name="a", value=i))
+                repo.read_yaml(f"data{i}.yaml", TestSchema)
+
+            assert cache.stats()["entries"] == 2
+            assert cache.stats()["evictions"] == 1
+        finally:
+            disable_model_cache()
+
+    def test_use_cache_false_bypasses(self, cached_repo):
+        """ReadOptions(use_cache=False) should always parse the file."""
+        repo, cache = cached_repo
+        repo.write_yaml("data.yaml", TestSchema(name="a", value=1))
+
+        repo.read_yaml("data.yaml", TestSchema, ReadOptions(use_cache=False))
+        repo.read_yaml("data.yaml", TestSchema, ReadOptions(use_cache=False))
+
+        assert cache.stats()["hits"] == 0
+        assert cache.stats()["entries"] == 0
@@ -0,0 +1,74 @@
+"""
+Unit tests for the central serialization layer.
+
+Tests libyaml/pure-Python parity on real fixtures, JSON-formatted files read
+through RepositoryIO, and the file_format option of write_yaml.
+"""
+
+from pathlib import Path
+
+import pytest
+import yaml
+
+from resilio.core.serialization import dump_yaml, load_yaml, serialize
+from resilio.schemas.activity import NormalizedActivity
+from resilio.schemas.metrics import DailyMetrics
+from resilio.schemas.repository import RepoErrorType
+
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures"
+
+
+class TestSerialization:
+    """Tests for load_yaml/dump_yaml/serialize and write_yaml formats."""
+
+    @pytest.mark.parametrize("fixture", ["activity_sample.yaml", "daily_metrics_sample.yaml"])
+    def test_matches_pure_python_pyyaml(self, fixture):
+        """Fast backend must produce exactly what yaml.safe_load/safe_dump produce."""
+        text = (FIXTURES_DIR / fixture).read_text()
+
+        data = load_yaml(text)
+
+        assert data == yaml.safe_load(text)
+        assert dump_yaml(data) == yaml.safe_dump(
+            data, default_flow_style=False, sort_keys=False, allow_unicode=True
+        )
+
+    def test_json_document_parsed_as_json(self):
+        """JSON text (valid YAML) should load to the same data as YAML."""
+        data = load_yaml((FIXTURES_DIR / "daily_metrics_sample.yaml").read_text())
+
+        assert load_yaml(serialize(data, "json")) == data
+
+    def test_json_looking_yaml_falls_back_to_yaml_parser(self):
+        """Flow-style YAML that is not valid JSON must still parse."""
+        assert load_yaml("{a: 1, b: [x, y]}") == {"a": 1, "b": ["x", "y"]}
+
+    def test_write_yaml_json_format_round_trips(self, temp_repo):
+        """Models written as JSON should read back through read_yaml unchanged."""
+        metrics = DailyMetrics.model_validate(
+            load_yaml((FIXTURES_DIR / "daily_metrics_sample.yaml").read_text())
+        )
+        path = "data/metrics/daily/2026-01-12.yaml"
+
+        assert temp_repo.write_yaml(path, metrics, file_format="json") is None
+
+        assert temp_repo.resolve_path(path).read_text().startswith("{")
+        assert temp_repo.read_yaml(path, DailyMetrics) == metrics
+
+    def test_write_yaml_activity_round_trips(self, temp_repo):
+        """Activity fixture should survive a YAML write/read cycle."""
+        activity = NormalizedActivity.model_validate(
+            load_yaml((FIXTURES_DIR / "activity_sample.yaml").read_text())
+        )
+        path = "data/activities/2026-01/2026-01-12_strava_123456789.yaml"
+
+        assert temp_repo.write_yaml(path, activity) is None
+
+        assert temp_repo.read_yaml(path, NormalizedActivity) == activity
+
+    def test_write_yaml_unknown_format_returns_error(self, temp_repo):
+        """An unknown file_format should surface as a RepoError, not raise."""
+        error = temp_repo.write_yaml("data/x.yaml", {"a": 1}, file_format="toml")
+
+        assert error is not None
+        assert error.error_type == RepoErrorType.VALIDATION_ERROR
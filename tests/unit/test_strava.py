@@ -5,6 +5,8 @@ Tests OAuth flow, activity fetching, deduplication, rate limiting,
 and error handling. Uses mocking for API calls.
 """
 
+import threading
+
 import pytest
 from datetime import date, datetime, timezone, timedelta
 from unittest.mock import Mock, patch, MagicMock
@@ -21,6 +23,8 @@ from resilio.core.strava import (
     check_duplicate,
     create_manual_activity,
     sync_strava_generator,
+    StravaRateLimiter,
+    StravaSession,
     StravaAuthError,
     StravaRateLimitError,
     StravaAPIError,
@@ -82,6 +86,21 @@ def sample_strava_activity():
     }
 
 
+def _details_by_id(details: dict):
+    """fetch_activity_details side effect keyed by activity id.
+
+    Sync fetches details on worker threads, so call order is not guaranteed.
+    """
+
+    def fetch(config, activity_id, **kwargs):
+        result = details[str(activity_id)]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    return fetch
+
+
 # ============================================================
 # OAUTH TESTS (4 tests)
 # ============================================================
@@ -627,27 +646,29 @@ class TestSync:
         ]
 
         # Mock fetch_activity_details to return full details
-        mock_fetch_details.side_effect = [
-            {
-                "id": 123,
-                "name": "Morning Run",
-                "sport_type": "Run",
-                "type": "Run",
-                "start_date": "2026-01-12T07:30:00Z",
-                "start_date_local": "2026-01-12T07:30:00Z",
-                "moving_time": 2700,
-                "distance": 8000.0,
-            },
+        mock_fetch_details.side_effect = _details_by_id(
             {
-                "id": 456,
-                "name": "Evening Climb",
-                "sport_type": "RockClimbing",
-                "type": "RockClimbing",
-                "start_date": "2026-01-12T19:00:00Z",
-                "start_date_local": "2026-01-12T19:00:00Z",
-                "moving_time": 5400,
-            },
-        ]
+                "123": {
+                    "id": 123,
+                    "name": "Morning Run",
+                    "sport_type": "Run",
+                    "type": "Run",
+                    "start_date": "2026-01-12T07:30:00Z",
+                    "start_date_local": "2026-01-12T07:30:00Z",
+                    "moving_time": 2700,
+                    "distance": 8000.0,
+                },
+                "456": {
+                    "id": 456,
+                    "name": "Evening Climb",
+                    "sport_type": "RockClimbing",
+                    "type": "RockClimbing",
+                    "start_date": "2026-01-12T19:00:00Z",
+                    "start_date_local": "2026-01-12T19:00:00Z",
+                    "moving_time": 5400,
+                },
+            }
+        )
 
         gen = sync_strava_generator(mock_config, lookback_days=30)
         activities = list(gen)
@@ -672,18 +693,20 @@ class TestSync:
         ]
 
         # First activity succeeds, second fails
-        mock_fetch_details.side_effect = [
+        mock_fetch_details.side_effect = _details_by_id(
             {
-                "id": 123,
-                "name": "Good Activity",
-                "sport_type": "Run",
-                "type": "Run",
-                "start_date": "2026-01-12T07:30:00Z",
-                "start_date_local": "2026-01-12T07:30:00Z",
-                "moving_time": 2700,
-            },
-            Exception("API error"),
-        ]
+                "123": {
+                    "id": 123,
+                    "name": "Good Activity",
+                    "sport_type": "Run",
+                    "type": "Run",
+                    "start_date": "2026-01-12T07:30:00Z",
+                    "start_date_local": "2026-01-12T07:30:00Z",
+                    "moving_time": 2700,
+                },
+                "456": Exception("API error"),
+            }
+        )
 
         gen = sync_strava_generator(mock_config)
         activities = list(gen)
@@ -720,35 +743,37 @@ class TestSync:
         ]
 
         # Mock fetch_activity_details
-        mock_fetch_details.side_effect = [
-            {
-                "id": 1,
-                "name": "Activity 1",
-                "sport_type": "Run",
-                "type": "Run",
-                "start_date": "2026-01-12T07:30:00Z",
-                "start_date_local": "2026-01-12T07:30:00Z",
-                "moving_time": 1800,
-            },
-            {
-                "id": 2,
-                "name": "Activity 2",
-                "sport_type": "Run",
-                "type": "Run",
-                "start_date": "2026-01-12T09:00:00Z",
-                "start_date_local": "2026-01-12T09:00:00Z",
-                "moving_time": 1800,
-            },
+        mock_fetch_details.side_effect = _details_by_id(
             {
-                "id": 3,
-                "name": "Activity 3",
-                "sport_type": "Run",
-                "type": "Run",
-                "start_date": "2026-01-12T11:00:00Z",
-                "start_date_local": "2026-01-12T11:00:00Z",
-                "moving_time": 1800,
-            },
-        ]
+                "1": {
+                    "id": 1,
+                    "name": "Activity 1",
+                    "sport_type": "Run",
+                    "type": "Run",
+                    "start_date": "2026-01-12T07:30:00Z",
+                    "start_date_local": "2026-01-12T07:30:00Z",
+                    "moving_time": 1800,
+                },
+                "2": {
+                    "id": 2,
+                    "name": "Activity 2",
+                    "sport_type": "Run",
+                    "type": "Run",
+                    "start_date": "2026-01-12T09:00:00Z",
+                    "start_date_local": "2026-01-12T09:00:00Z",
+                    "moving_time": 1800,
+                },
+                "3": {
+                    "id": 3,
+                    "name": "Activity 3",
+                    "sport_type": "Run",
+                    "type": "Run",
+                    "start_date": "2026-01-12T11:00:00Z",
+                    "start_date_local": "2026-01-12T11:00:00Z",
+                    "moving_time": 1800,
+                },
+            }
+        )
 
         gen = sync_strava_generator(mock_config, lookback_days=30)
 
@@ -779,18 +804,20 @@ class TestSync:
         ]
 
         # First activity succeeds, second hits rate limit
-        mock_fetch_details.side_effect = [
+        mock_fetch_details.side_effect = _details_by_id(
             {
-                "id": 1,
-                "name": "Activity 1",
-                "sport_type": "Run",
-                "type": "Run",
-                "start_date": "2026-01-12T07:30:00Z",
-                "start_date_local": "2026-01-12T07:30:00Z",
-                "moving_time": 1800,
-            },
-            StravaRateLimitError("Rate limit hit", retry_after=60),
-        ]
+                "1": {
+                    "id": 1,
+                    "name": "Activity 1",
+                    "sport_type": "Run",
+                    "type": "Run",
+                    "start_date": "2026-01-12T07:30:00Z",
+                    "start_date_local": "2026-01-12T07:30:00Z",
+                    "moving_time": 1800,
+                },
+                "2": StravaRateLimitError("Rate limit hit", retry_after=60),
+            }
+        )
 
         gen = sync_strava_generator(mock_config)
 
@@ -862,6 +889,185 @@ class TestSync:
         assert sync_result.activities_imported == 1
 
 
+    @patch("resilio.core.strava.fetch_activity_details")
+    @patch("resilio.core.strava.fetch_activities")
+    def test_sync_strava_generator_fetches_concurrently_in_order(
+        self, mock_fetch_activities, mock_fetch_details, mock_config
+    ):
+        """Details are fetched in parallel but yielded in page order."""
+        mock_fetch_activities.side_effect = [
+            [
+                {"id": 1, "name": "Activity 1", "sport_type": "Ride"},
+                {"id": 2, "name": "Activity 2", "sport_type": "Ride"},
+                {"id": 3, "name": "Activity 3", "sport_type": "Ride"},
+            ],
+            [],
+        ]
+        last_fetched = threading.Event()
+
+        def fetch(config, activity_id, **kwargs):
+            if activity_id == "1":
+                # Only completes if activity 3 is fetched while 1 is in flight
+                assert last_fetched.wait(timeout=5)
+            elif activity_id == "3":
+                last_fetched.set()
+            return {
+                "id": int(activity_id),
+                "name": f"Activity {activity_id}",
+                "sport_type": "Ride",
+                "type": "Ride",
+                "start_date": "2026-01-12T07:30:00Z",
+                "start_date_local": "2026-01-12T07:30:00Z",
+                "moving_time": 1800,
+            }
+
+        mock_fetch_details.side_effect = fetch
+
+        activities = list(sync_strava_generator(mock_config, lookback_days=None))
+
+        assert [activity.id for activity in activities] == ["strava_1", "strava_2", "strava_3"]
+
+
+# ============================================================
+# SESSION TESTS
+# ============================================================
+
+
+class TestStravaSession:
+    """Tests for the long-lived API session."""
+
+    @patch("resilio.core.strava.httpx.Client")
+    @patch("resilio.core.strava.get_valid_token")
+    def test_session_reuses_client_and_token(self, mock_get_token, mock_client_class, mock_config):
+        """Repeated calls should share one pooled client and one token check."""
+        mock_get_token.return_value = "valid_token"
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"id": 1, "name": "Run 1"}
+
+        mock_client = MagicMock()
+        mock_client.__enter__.return_value.get.return_value = mock_response
+        mock_client_class.return_value = mock_client
+
+        with StravaSession(mock_config) as session:
+            fetch_activity_details(mock_config, "1", session=session)
+            session.fetch_activity_details("2")
+            session.fetch_athlete_profile()
+
+        assert mock_client_class.call_count == 1
+        assert mock_get_token.call_count == 1
+        assert mock_client.__enter__.return_value.get.call_count == 3
+        mock_client.__exit__.assert_called_once()
+
+    @patch("resilio.core.strava.httpx.Client")
+    @patch("resilio.core.strava.get_valid_token")
+    def test_session_rechecks_token_near_expiry(self, mock_get_token, mock_client_class, mock_config):
+        """Cached token should be refreshed once it is about to expire."""
+        mock_get_token.side_effect = ["token_1", "token_2"]
+        mock_client_class.return_value = MagicMock()
+
+        with StravaSession(mock_config) as session:
+            assert session.access_token() == "token_1"
+            assert session.access_token() == "token_1"
+
+            mock_config.secrets.strava.token_expires_at = int(datetime.now(timezone.utc).timestamp()) + 60
+            assert session.access_token() == "token_2"
+
+    @patch("resilio.core.strava.httpx.Client")
+    @patch("resilio.core.strava.get_valid_token")
+    def test_session_records_rate_limit_headers(self, mock_get_token, mock_client_class, mock_config):
+        """Responses should feed the session's rate limiter."""
+        mock_get_token.return_value = "valid_token"
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {"X-RateLimit-Limit": "200,2000", "X-RateLimit-Usage": "200,300"}
+        mock_response.json.return_value = []
+
+        mock_client = MagicMock()
+        mock_client.__enter__.return_value.get.return_value = mock_response
+        mock_client_class.return_value = mock_client
+
+        with StravaSession(mock_config, rate_limiter=StravaRateLimiter(100)) as session:
+            session.fetch_activities()
+            with pytest.raises(StravaRateLimitError):
+                session.fetch_activities()
+
+
+# ============================================================
+# RATE LIMITER TESTS
+# ============================================================
+
+
+class TestRateLimiter:
+    """Tests for header-driven token-bucket limiter."""
+
+    def test_acquire_without_headers_uses_bucket_only(self):
+        """Unknown quota should not block requests."""
+        limiter = StravaRateLimiter(requests_per_second=100)
+
+        for _ in range(5):
+            limiter.acquire()
+
+    def test_acquire_raises_when_quota_exhausted(self):
+        """Spent 15-minute quota should pause instead of sending a request."""
+        limiter = StravaRateLimiter(requests_per_second=100)
+        limiter.update_from_headers(
+            {"X-RateLimit-Limit": "200,2000", "X-RateLimit-Usage": "200,350"}
+        )
+
+        with pytest.raises(StravaRateLimitError) as exc_info:
+            limiter.acquire()
+
+        assert 0 < exc_info.value.retry_after <= 15 * 60 + 1
+
+    def test_acquire_counts_requests_against_quota(self):
+        """Requests sent after the last response count against the quota."""
+        limiter = StravaRateLimiter(requests_per_second=100)
+        limiter.update_from_headers(
+            {"X-RateLimit-Limit": "200,2000", "X-RateLimit-Usage": "198,350"}
+        )
+
+        limiter.acquire()
+        limiter.acquire()
+        with pytest.raises(StravaRateLimitError):
+            limiter.acquire()
+
+    def test_read_rate_limit_headers_take_precedence(self):
+        """Read-specific limits should be used when Strava sends them."""
+        limiter = StravaRateLimiter(requests_per_second=100)
+        limiter.update_from_headers(
+            {
+                "X-RateLimit-Limit": "200,2000",
+                "X-RateLimit-Usage": "10,10",
+                "X-ReadRateLimit-Limit": "100,1000",
+                "X-ReadRateLimit-Usage": "100,10",
+            }
+        )
+
+        with pytest.raises(StravaRateLimitError):
+            limiter.acquire()
+
+    def test_malformed_headers_are_ignored(self):
+        """Missing or malformed headers should leave the quota unknown."""
+        limiter = StravaRateLimiter(requests_per_second=100)
+        limiter.update_from_headers({"X-RateLimit-Limit": "oops", "X-RateLimit-Usage": "1"})
+        limiter.update_from_headers({})
+
+        limiter.acquire()
+
+    @patch("resilio.core.strava.time.sleep")
+    def test_bucket_waits_when_empty(self, mock_sleep):
+        """Requests beyond the burst size should wait for a refill."""
+        limiter = StravaRateLimiter(requests_per_second=1)
+
+        limiter.acquire()
+        limiter.acquire()
+
+        assert mock_sleep.called
+
+
 # ============================================================
 # TOKEN STORAGE TESTS
 # ============================================================
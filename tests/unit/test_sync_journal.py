@@ -0,0 +1,186 @@
+"""
+Unit tests for the append-only sync journal (core/sync_journal.py).
+"""
+
+import json
+from datetime import date, datetime, timezone
+
+from resilio.core.repository import RepositoryIO
+from resilio.core.sync_journal import SYNC_JOURNAL_FILE, SyncJournal, replay_sync_journal
+from resilio.core.sync_state import read_resume_state, write_training_history
+from resilio.schemas.sync import SyncPhase, SyncReport, SyncResumeState
+
+
+def _backfill_journal(repo: RepositoryIO) -> SyncJournal:
+    journal = SyncJournal(repo)
+    journal.begin(SyncResumeState(backfill_in_progress=True, target_start_date=date(2025, 2, 12)))
+    journal.record_progress(SyncPhase.FETCHING, cursor_before_timestamp=1736500000, current_page=1)
+    journal.record_progress(SyncPhase.PROCESSING)
+    journal.record_imported("strava_1", date(2025, 12, 30))
+    journal.record_imported("strava_2", date(2025, 12, 29))
+    journal.record_skipped("strava_3")
+    journal.record_failed("strava_4", "bad payload")
+    return journal
+
+
+class TestSyncJournalEvents:
+    """Tests for recording and replaying events."""
+
+    def test_events_buffered_until_commit(self, temp_repo):
+        """Nothing reaches the file before commit()."""
+        journal = _backfill_journal(temp_repo)
+        assert replay_sync_journal(temp_repo) is None
+
+        journal.commit()
+
+        assert replay_sync_journal(temp_repo) == journal.state
+
+    def test_replay_counts_outcomes(self, temp_repo):
+        """Replayed state reflects cursor, phase and per-activity outcomes."""
+        journal = _backfill_journal(temp_repo)
+        journal.record_failed("strava_2", "disk full", was_imported=True)
+        journal.commit()
+
+        state = replay_sync_journal(temp_repo)
+        assert state.phase == SyncPhase.FETCHING  # PROCESSING alone is not journaled
+        assert state.cursor_before_timestamp == 1736500000
+        assert state.activities_imported == 1
+        assert state.activities_skipped == 1
+        assert state.activities_failed == 2
+        assert state.failed_ids == ["strava_4", "strava_2"]
+
+    def test_unchanged_progress_appends_nothing(self, temp_repo):
+        """Repeated progress callbacks without changes do not grow the journal."""
+        journal = SyncJournal(temp_repo)
+        journal.begin(SyncResumeState())
+        journal.record_progress(SyncPhase.FETCHING, cursor_before_timestamp=100, current_page=1)
+        journal.commit()
+        size = temp_repo.resolve_path(SYNC_JOURNAL_FILE).stat().st_size
+
+        for _ in range(10):
+            journal.record_progress(SyncPhase.FETCHING, cursor_before_timestamp=100, current_page=1)
+        journal.commit()
+
+        assert temp_repo.resolve_path(SYNC_JOURNAL_FILE).stat().st_size == size
+
+    def test_progress_events_scale_with_cursor_advances(self, temp_repo, monkeypatch):
+        """Per-activity FETCHING/PROCESSING callbacks add no events; cursors and resume phases do."""
+        import resilio.core.sync_journal as sync_journal
+
+        fsyncs = []
+        monkeypatch.setattr(sync_journal.os, "fsync", lambda fd: fsyncs.append(fd))
+
+        def run(pages: int, per_page: int) -> list[str]:
+            temp_repo.resolve_path(SYNC_JOURNAL_FILE).unlink(missing_ok=True)
+            fsyncs.clear()
+            journal = SyncJournal(temp_repo)
+            journal.begin(SyncResumeState())
+            for page in range(1, pages + 1):
+                before = 2_000_000 - page
+                if journal.record_progress(SyncPhase.FETCHING, cursor_before_timestamp=before, current_page=page):
+                    journal.commit()
+                for n in range(per_page):
+                    for phase in (SyncPhase.PROCESSING, SyncPhase.FETCHING):
+                        if journal.record_progress(
+                            phase, cursor_before_timestamp=before, current_page=page,
+                            current_month="2025-12", activities_listed=page * per_page + n,
+                        ):
+                            journal.commit()
+            if journal.record_progress(SyncPhase.METRICS, cursor_before_timestamp=before):
+                journal.commit()
+            return [json.loads(line)["event"] for line in temp_repo.resolve_path(SYNC_JOURNAL_FILE).read_text().splitlines()]
+
+        small = run(pages=3, per_page=5)
+        small_fsyncs = len(fsyncs)
+        large = run(pages=3, per_page=200)
+
+        assert large == small == ["start", "cursor", "cursor", "cursor", "phase"]
+        assert len(fsyncs) == small_fsyncs == 4
+        assert replay_sync_journal(temp_repo).activities_listed == 2 * 200 + 199  # Listed count as of the last cursor
+
+    def test_new_run_resets_counters(self, temp_repo):
+        """A start event begins a new run with zero counters."""
+        _backfill_journal(temp_repo).commit()
+        journal = SyncJournal(temp_repo)
+        journal.begin(SyncResumeState())
+        journal.commit()
+
+        state = replay_sync_journal(temp_repo)
+        assert state.activities_imported == 0
+        assert state.backfill_in_progress is False
+
+
+class TestSyncJournalCompaction:
+    """Tests for finish()."""
+
+    def test_done_removes_journal(self, temp_repo):
+        """A completed sync leaves no journal."""
+        journal = _backfill_journal(temp_repo)
+        journal.commit()
+
+        journal.finish(SyncReport(phase=SyncPhase.DONE))
+
+        assert temp_repo.file_exists(SYNC_JOURNAL_FILE) is False
+
+    def test_pause_compacts_to_snapshot(self, temp_repo):
+        """A paused sync leaves one snapshot line with the report counters."""
+        journal = _backfill_journal(temp_repo)
+        journal.commit()
+
+        journal.finish(
+            SyncReport(phase=SyncPhase.PAUSED_RATE_LIMIT, activities_imported=2, activities_skipped=5),
+            SyncResumeState(backfill_in_progress=True, target_start_date=date(2025, 2, 12), resume_before_timestamp=42),
+        )
+
+        lines = temp_repo.resolve_path(SYNC_JOURNAL_FILE).read_text().splitlines()
+        assert len(lines) == 1
+        state = replay_sync_journal(temp_repo)
+        assert state.phase == SyncPhase.PAUSED_RATE_LIMIT
+        assert state.activities_skipped == 5
+        assert state.cursor_before_timestamp == 42
+
+
+class TestResumeFromJournal:
+    """Tests for the journal overlay in read_resume_state."""
+
+    def test_crash_resumes_from_journal_cursor(self, temp_repo):
+        """After a crash, the committed cursor beats the older history."""
+        write_training_history(
+            temp_repo,
+            {
+                "backfill_in_progress": True,
+                "target_start_date": "2025-02-12",
+                "resume_before_timestamp": 1737000000,
+                "last_progress_at": "2026-01-01T00:00:00+00:00",
+            },
+        )
+        _backfill_journal(temp_repo).commit()  # No finish(): the process died
+
+        state = read_resume_state(temp_repo)
+
+        assert state.backfill_in_progress is True
+        assert state.resume_before_timestamp == 1736500000
+
+    def test_journal_older_than_history_ignored(self, temp_repo):
+        """A stale journal does not resurrect a finished backfill."""
+        _backfill_journal(temp_repo).commit()
+        write_training_history(
+            temp_repo,
+            {
+                "backfill_in_progress": False,
+                "last_progress_at": datetime.now(timezone.utc).replace(year=2100).isoformat(),
+            },
+        )
+
+        state = read_resume_state(temp_repo)
+
+        assert state.backfill_in_progress is False
+        assert state.resume_before_timestamp is None
+
+    def test_torn_line_ignored(self, temp_repo):
+        """A partially written last event is skipped."""
+        _backfill_journal(temp_repo).commit()
+        with open(temp_repo.resolve_path(SYNC_JOURNAL_FILE), "a") as f:
+            f.write(json.dumps({"event": "cursor", "before": 1})[:10])
+
+        assert replay_sync_journal(temp_repo).cursor_before_timestamp == 1736500000
@@ -0,0 +1,55 @@
+"""
+Unit tests for text search helpers.
+
+Tests tokenization, the light stemmer, BM25 scoring and snippets.
+"""
+
+import pytest
+
+from resilio.core.text_search import bm25_term_score, snippet, stem, tokenize
+
+
+class TestTextSearch:
+    """Tests for tokenize/stem/bm25_term_score/snippet."""
+
+    def test_tokenize_folds_case_and_accents(self):
+        """Tokens are lowercase and unaccented; apostrophes stay inside words."""
+        assert tokenize("Genou DOULOUREUX, didn't run_5k!") == ["genou", "douloureux", "didn't", "run", "5k"]
+        assert tokenize(None) == []
+
+    @pytest.mark.parametrize(
+        "word,expected",
+        [
+            ("knees", "knee"),
+            ("hurting", "hurt"),
+            ("hurts", "hurt"),
+            ("running", "run"),
+            ("injuries", "injury"),
+            ("soreness", "sore"),
+            ("painful", "pain"),
+            ("painfully", "pain"),
+            ("stress", "stress"),
+            ("calf", "calf"),
+        ],
+    )
+    def test_stem(self, word, expected):
+        """The stemmer strips common English suffixes only."""
+        assert stem(word) == expected
+
+    def test_bm25_prefers_frequent_terms_in_short_docs(self):
+        """More occurrences and shorter documents score higher."""
+        base = bm25_term_score(1, 2, 10, 20, 20.0)
+
+        assert bm25_term_score(3, 2, 10, 20, 20.0) > base
+        assert bm25_term_score(1, 2, 10, 5, 20.0) > base
+        assert bm25_term_score(0, 2, 10, 20, 20.0) == 0.0
+
+    def test_snippet_centers_on_first_keyword(self):
+        """Snippets keep ~50 chars around the earliest match, with ellipses."""
+        text = "x" * 80 + " Ankle rolled on the trail " + "y" * 80
+
+        excerpt = snippet(text, ["ankle", "trail"])
+
+        assert excerpt.startswith("...") and excerpt.endswith("...")
+        assert "Ankle rolled" in excerpt
+        assert snippet("Short note", ["knee"]) == "Short note"
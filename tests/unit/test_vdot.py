@@ -450,6 +450,7 @@ class TestVDOTEstimationRaceHistoryFallback:
         """Mock RepositoryIO to return a dummy easy run (not a quality workout)."""
         from unittest.mock import Mock
         from datetime import date, datetime, timedelta
+        from resilio.core.activity_summary import ActivitySummary
         from resilio.schemas.activity import DataQuality, NormalizedActivity, SportType, SurfaceType
 
         activity_date = date.today() - timedelta(days=days_ago)
@@ -472,14 +473,21 @@ class TestVDOTEstimationRaceHistoryFallback:
             updated_at=datetime.now(),
         )
 
-        # Mock RepositoryIO.read_yaml to return our dummy activity
+        # Mock RepositoryIO (and its activity index) to return our dummy activity
         mock_repo = Mock()
         mock_repo.read_yaml.return_value = dummy_activity
+        mock_index = mock_repo.activity_index.return_value
+        mock_index.query.return_value = [Mock(sport_type="run", date=activity_date)]
 
         def mock_repo_init(*args, **kwargs):
             return mock_repo
 
+        def mock_summarize_entries(repo, entries, details_since=None):
+            return [ActivitySummary.from_activity(dummy_activity) for _ in entries]
+
         monkeypatch.setattr("resilio.core.repository.RepositoryIO", mock_repo_init)
+        monkeypatch.setattr("resilio.core.activity_summary.summarize_entries", mock_summarize_entries)
+        return mock_repo
 
     def test_fallback_recent_race_no_decay(self, tmp_path, monkeypatch):
         """Test VDOT estimation fallback with recent race (<3 months) - no decay."""
@@ -516,7 +524,7 @@ class TestVDOTEstimationRaceHistoryFallback:
         monkeypatch.setattr("resilio.api.profile.get_profile", mock_get_profile)
 
         # Execute
-        result = estimate_current_vdot(lookback_days=28)
+        result = estimate_current_vdot(lookback_days=28, use_cache=False)
 
         # Verify
         assert isinstance(result, VDOTEstimate)
@@ -560,7 +568,7 @@ class TestVDOTEstimationRaceHistoryFallback:
         monkeypatch.setattr("resilio.api.profile.get_profile", mock_get_profile)
 
         # Execute
-        result = estimate_current_vdot(lookback_days=28)
+        result = estimate_current_vdot(lookback_days=28, use_cache=False)
 
         # Verify
         assert isinstance(result, VDOTEstimate)
@@ -605,7 +613,7 @@ class TestVDOTEstimationRaceHistoryFallback:
         monkeypatch.setattr("resilio.api.profile.get_profile", mock_get_profile)
 
         # Execute
-        result = estimate_current_vdot(lookback_days=28)
+        result = estimate_current_vdot(lookback_days=28, use_cache=False)
 
         # Verify
         assert isinstance(result, VDOTEstimate)
@@ -654,7 +662,7 @@ class TestVDOTEstimationRaceHistoryFallback:
         monkeypatch.setattr("resilio.api.profile.get_profile", mock_get_profile)
 
         # Execute
-        result = estimate_current_vdot(lookback_days=28)
+        result = estimate_current_vdot(lookback_days=28, use_cache=False)
 
         # Verify - should use the 5K PB (more recent, VDOT 42)
         assert isinstance(result, VDOTEstimate)
@@ -687,7 +695,7 @@ class TestVDOTEstimationRaceHistoryFallback:
         monkeypatch.setattr("resilio.api.profile.get_profile", mock_get_profile)
 
         # Execute
-        result = estimate_current_vdot(lookback_days=28)
+        result = estimate_current_vdot(lookback_days=28, use_cache=False)
 
         # Verify
         assert isinstance(result, VDOTError)
@@ -728,10 +736,51 @@ class TestVDOTEstimationRaceHistoryFallback:
         monkeypatch.setattr("resilio.api.profile.get_profile", mock_get_profile)
 
         # Execute
-        result = estimate_current_vdot(lookback_days=28)
+        result = estimate_current_vdot(lookback_days=28, use_cache=False)
 
         # Verify - should clamp to minimum of 30
         assert isinstance(result, VDOTEstimate)
         # 32 * 0.85 (15% decay) = 27.2, but should be clamped to 30
         assert result.estimated_vdot >= 30
         assert result.estimated_vdot <= 85
+
+    def test_default_call_is_cached(self, tmp_path, monkeypatch):
+        """Without use_cache=False a repeated estimate is served from the cache."""
+        from resilio.api.vdot import estimate_current_vdot
+        from resilio.core import activity_summary
+        from resilio.schemas.profile import PBEntry
+        from resilio.schemas.vdot import VDOTEstimate
+        from datetime import date, timedelta
+        from unittest.mock import Mock
+
+        mock_repo = self._mock_repository_with_easy_run(monkeypatch, days_ago=5)
+        mock_repo.repo_root = tmp_path
+        mock_repo.resolve_path.return_value = tmp_path / "vdot_estimate_cache.json"
+        mock_repo.activity_index.return_value.store_id = "store"
+        mock_repo.activity_index.return_value.version = 1
+        mock_repo.metrics_store.return_value.read_range.return_value.to_records.return_value = [
+            {"date": (date.today() - timedelta(days=1)).isoformat(), "ctl": 44.0}
+        ]
+
+        summarize_calls = []
+        summarize_entries = activity_summary.summarize_entries
+
+        def counting_summarize_entries(*args, **kwargs):
+            summarize_calls.append(args)
+            return summarize_entries(*args, **kwargs)
+
+        monkeypatch.setattr("resilio.core.activity_summary.summarize_entries", counting_summarize_entries)
+
+        mock_profile = Mock()
+        mock_profile.personal_bests = {
+            "10k": PBEntry(time="42:30", date=(date.today() - timedelta(days=60)).isoformat(), vdot=45.0)
+        }
+        monkeypatch.setattr("resilio.api.profile.get_profile", lambda: mock_profile)
+
+        first = estimate_current_vdot(lookback_days=28)
+        second = estimate_current_vdot(lookback_days=28)
+
+        assert isinstance(first, VDOTEstimate) and first.cache == "miss"
+        assert isinstance(second, VDOTEstimate) and second.cache == "hit"
+        assert second.estimated_vdot == first.estimated_vdot == 45
+        assert len(summarize_calls) == 1
@@ -8,7 +8,9 @@ import pytest
 from datetime import date, datetime, timedelta
 
 from resilio.core.vdot.continuity import (
+    bucket_runs_by_week,
     detect_training_breaks,
+    group_by_training_week,
     calculate_vdot_decay,
     _calculate_short_break_decay,
     _calculate_long_break_decay,
@@ -112,6 +114,34 @@ class TestBreakDetection:
         assert result.longest_break_days <= 21  # At most 3 weeks
 
 
+class TestWeekBucketing:
+    """Tests for per-week grouping and run counts."""
+
+    def test_group_by_training_week(self):
+        """Every week in range is present, activities under their Monday."""
+        runs = [create_run(date(2026, 1, 6)), create_run(date(2026, 1, 20)), create_run(date(2026, 1, 22))]
+
+        weeks = group_by_training_week(runs, date(2026, 1, 6), date(2026, 1, 25))
+
+        assert list(weeks) == [date(2026, 1, 5), date(2026, 1, 12), date(2026, 1, 19)]
+        assert [len(week) for week in weeks.values()] == [1, 0, 2]
+
+    def test_bucket_runs_skips_other_sports_and_out_of_range(self):
+        """Only runs inside [start, end] are counted."""
+        activities = [
+            create_run(date(2026, 1, 4)),  # Before start
+            create_run(date(2026, 1, 6)),
+            create_run(date(2026, 1, 7), sport_type="cycle"),
+            create_run(date(2026, 1, 20), sport_type="trail_run"),
+            create_run(date(2026, 1, 26)),  # After end
+        ]
+
+        weeks = bucket_runs_by_week(activities, date(2026, 1, 5), date(2026, 1, 25))
+
+        assert weeks.counts == [1, 0, 1]
+        assert weeks.inactive_runs() == [(1, 1)]
+
+
 class TestDecayCalculations:
     """Tests for decay percentage calculations."""
 
@@ -0,0 +1,197 @@
+"""
+Unit tests for the persisted VDOT estimate cache (core/vdot/estimate_cache.py)
+and its use by estimate_current_vdot().
+"""
+
+from datetime import date, timedelta
+
+from resilio.api.vdot import VDOTError, estimate_current_vdot
+from resilio.core.paths import athlete_profile_path, vdot_estimate_cache_path
+from resilio.core.repository import RepositoryIO
+from resilio.core.vdot.estimate_cache import VDOTEstimateCache, estimate_fingerprint
+from resilio.schemas.profile import (
+    AthleteProfile,
+    ConflictPolicy,
+    Goal,
+    GoalType,
+    PBEntry,
+    RunningPriority,
+    TrainingConstraints,
+)
+from resilio.schemas.vdot import VDOTEstimate
+from tests.factories import make_activity, make_metrics, save_activity, save_metrics
+
+
+def _fingerprint(**overrides) -> str:
+    inputs = dict(
+        store_id="store",
+        store_version=3,
+        personal_bests={"10k": PBEntry(time="42:30", date="2026-01-10", vdot=48.0)},
+        max_hr=190,
+        metrics_date=date(2026, 2, 28),
+        ctl=44.0,
+        lookback_days=28,
+        today=date(2026, 3, 1),
+    )
+    inputs.update(overrides)
+    return estimate_fingerprint(**inputs)
+
+
+def _save_run(repo: RepositoryIO, activity_id: str, days_ago: int) -> None:
+    day = date.today() - timedelta(days=days_ago)
+    save_activity(
+        repo,
+        make_activity(
+            activity_id,
+            day,
+            source="manual",
+            name="Easy run",
+            duration_minutes=40,
+            duration_seconds=2400,
+            distance_km=8.0,
+        ),
+    )
+
+
+def _save_profile(repo: RepositoryIO, pb_vdot: float = 48.0) -> None:
+    profile = AthleteProfile(
+        name="Test Athlete",
+        created_at="2026-01-01",
+        constraints=TrainingConstraints(min_run_days_per_week=3, max_run_days_per_week=5),
+        running_priority=RunningPriority.PRIMARY,
+        conflict_policy=ConflictPolicy.RUNNING_GOAL_WINS,
+        goal=Goal(type=GoalType.GENERAL_FITNESS),
+        personal_bests={
+            "10k": PBEntry(time="42:30", date=(date.today() - timedelta(days=30)).isoformat(), vdot=pb_vdot)
+        },
+    )
+    assert repo.write_yaml(athlete_profile_path(), profile) is None
+
+
+class TestEstimateFingerprint:
+    """Tests for estimate_fingerprint."""
+
+    def test_stable(self):
+        """Equal inputs give equal fingerprints."""
+        assert _fingerprint() == _fingerprint()
+
+    def test_every_input_matters(self):
+        """Changing any single input changes the fingerprint."""
+        base = _fingerprint()
+        assert _fingerprint(store_id="rebuilt") != base
+        assert _fingerprint(store_version=4) != base
+        assert _fingerprint(personal_bests={}) != base
+        assert _fingerprint(max_hr=None) != base
+        assert _fingerprint(metrics_date=None) != base
+        assert _fingerprint(ctl=44.5) != base
+        assert _fingerprint(lookback_days=90) != base
+        assert _fingerprint(today=date(2026, 3, 2)) != base
+
+    def test_models_and_dicts_agree(self):
+        """Personal bests hash by value, whether models or plain dicts."""
+        as_dicts = {"10k": {"time": "42:30", "date": "2026-01-10", "vdot": 48.0}}
+        assert _fingerprint(personal_bests=as_dicts) == _fingerprint()
+
+
+class TestVDOTEstimateCache:
+    """Tests for the on-disk cache file."""
+
+    def test_round_trip_and_counters(self, tmp_path):
+        """Stored entries are hits, unknown fingerprints misses."""
+        cache = VDOTEstimateCache(tmp_path / "cache.json")
+        assert cache.get("a") is None
+        cache.put("a", {"estimated_vdot": 48})
+
+        assert VDOTEstimateCache(tmp_path / "cache.json").get("a") == {"estimated_vdot": 48}
+        assert (cache.hits, cache.misses) == (0, 1)
+
+    def test_keeps_most_recent_entries(self, tmp_path):
+        """Only max_entries fingerprints are kept, newest first."""
+        cache = VDOTEstimateCache(tmp_path / "cache.json", max_entries=2)
+        for key in ("a", "b", "c"):
+            cache.put(key, {"key": key})
+        assert cache.get("a") is None
+        assert cache.get("c") == {"key": "c"}
+
+    def test_unreadable_file_is_empty(self, tmp_path):
+        """A corrupt cache file is a miss, and is replaced on the next put."""
+        path = tmp_path / "cache.json"
+        path.write_text("{not json")
+        cache = VDOTEstimateCache(path)
+        assert cache.get("a") is None
+        cache.put("a", {"estimated_vdot": 48})
+        assert cache.get("a") == {"estimated_vdot": 48}
+
+
+class TestCachedEstimate:
+    """Tests for estimate_current_vdot() through the cache."""
+
+    def test_hit_after_miss(self, temp_repo):
+        """A repeated call with unchanged inputs is served from the cache."""
+        _save_run(temp_repo, "r1", days_ago=3)
+        _save_profile(temp_repo)
+
+        first = estimate_current_vdot()
+        second = estimate_current_vdot()
+
+        assert isinstance(first, VDOTEstimate) and first.cache == "miss"
+        assert second.cache == "hit"
+        assert second.model_dump(exclude={"cache"}) == first.model_dump(exclude={"cache"})
+
+    def test_new_activity_invalidates(self, temp_repo):
+        """Synced activities bump the store version and force a recompute."""
+        _save_run(temp_repo, "r1", days_ago=3)
+        _save_profile(temp_repo)
+        estimate_current_vdot()
+
+        _save_run(temp_repo, "r2", days_ago=1)
+        assert estimate_current_vdot().cache == "miss"
+
+    def test_personal_best_invalidates(self, temp_repo):
+        """A changed personal best forces a recompute."""
+        _save_run(temp_repo, "r1", days_ago=3)
+        _save_profile(temp_repo, pb_vdot=48.0)
+        estimate_current_vdot()
+
+        _save_profile(temp_repo, pb_vdot=50.0)
+        result = estimate_current_vdot()
+        assert (result.cache, result.estimated_vdot) == ("miss", 50)
+
+    def test_recomputed_metrics_invalidate(self, temp_repo):
+        """A changed stored CTL forces a recompute, with no activity change."""
+        yesterday = date.today() - timedelta(days=1)
+        _save_run(temp_repo, "r1", days_ago=3)
+        _save_profile(temp_repo)
+        save_metrics(temp_repo, make_metrics(yesterday, ctl=40.0))
+        estimate_current_vdot()
+        assert estimate_current_vdot().cache == "hit"
+
+        save_metrics(temp_repo, make_metrics(yesterday, ctl=42.0))
+        assert estimate_current_vdot().cache == "miss"
+
+        save_metrics(temp_repo, make_metrics(date.today(), ctl=42.5))
+        assert estimate_current_vdot().cache == "miss"
+
+    def test_lookback_is_part_of_the_key(self, temp_repo):
+        """Different lookback windows are cached side by side."""
+        _save_run(temp_repo, "r1", days_ago=3)
+        _save_profile(temp_repo)
+        estimate_current_vdot(lookback_days=28)
+
+        assert estimate_current_vdot(lookback_days=90).cache == "miss"
+        assert estimate_current_vdot(lookback_days=28).cache == "hit"
+
+    def test_bypass(self, temp_repo):
+        """use_cache=False recomputes and leaves the cache untouched."""
+        _save_run(temp_repo, "r1", days_ago=3)
+        _save_profile(temp_repo)
+
+        assert estimate_current_vdot(use_cache=False).cache == "bypass"
+        assert not temp_repo.resolve_path(vdot_estimate_cache_path()).exists()
+
+    def test_errors_are_not_cached(self, temp_repo):
+        """Failures are recomputed on every call."""
+        _save_run(temp_repo, "r1", days_ago=3)
+
+        assert isinstance(estimate_current_vdot(), VDOTError)
+        assert not temp_repo.resolve_path(vdot_estimate_cache_path()).exists()
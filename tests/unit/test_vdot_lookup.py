@@ -0,0 +1,133 @@
+"""
+Unit tests for VDOT lookup - Precomputed columns with bisect search.
+
+The lookups must agree with a straight scan of VDOT_TABLE.
+"""
+
+import pytest
+
+from resilio.core.vdot.lookup import (
+    PACE_ZONE_COLUMNS,
+    RACE_TIME_COLUMNS,
+    pace_range_for_vdot,
+    race_time_for_vdot,
+    vdot_for_pace,
+    vdot_from_race_time,
+    vdots_for_paces,
+)
+from resilio.core.vdot.tables import VDOT_TABLE, get_nearest_vdot_values
+from resilio.schemas.vdot import RaceDistance
+
+
+def _scan_vdot_for_pace(pace, min_field, max_field):
+    """Reference: first table row whose range (±5s) contains the pace."""
+    for entry in VDOT_TABLE:
+        if getattr(entry, min_field) - 5 <= pace <= getattr(entry, max_field) + 5:
+            return entry.vdot
+    return None
+
+
+class TestPrecomputedColumns:
+    """Tests for the column arrays built at import."""
+
+    def test_race_time_columns_sorted_ascending(self):
+        """Race times are stored fastest first for bisect."""
+        for column in RACE_TIME_COLUMNS.values():
+            assert list(column.times) == sorted(column.times)
+            assert list(column.vdots) == sorted(column.vdots, reverse=True)
+
+    def test_untabulated_distance_has_no_column(self):
+        """15K has no times in the table, so it gets no column."""
+        assert RaceDistance.FIFTEEN_K not in RACE_TIME_COLUMNS
+
+    def test_all_pace_zones_present(self):
+        """Every training zone is precomputed."""
+        assert set(PACE_ZONE_COLUMNS) == {"easy", "marathon", "threshold", "interval", "repetition"}
+
+
+class TestNearestVdotValues:
+    """Tests for the bisect-based bracketing."""
+
+    @pytest.mark.parametrize(
+        "vdot,expected",
+        [(29, (30, 35)), (30, (30, 35)), (40, (35, 40)), (47.5, (45, 48)), (85, (80, 85)), (90, (80, 85))],
+    )
+    def test_brackets(self, vdot, expected):
+        """Brackets match the documented table neighbours, clamped at the ends."""
+        assert get_nearest_vdot_values(vdot) == expected
+
+
+class TestForwardLookup:
+    """Tests for VDOT -> race time / pace."""
+
+    def test_table_rows_are_exact(self):
+        """Tabulated VDOTs return the table values."""
+        for entry in VDOT_TABLE:
+            assert race_time_for_vdot(RaceDistance.FIVE_K, entry.vdot) == entry.five_k_seconds
+            assert pace_range_for_vdot("threshold", entry.vdot) == (
+                entry.threshold_min_sec_per_km,
+                entry.threshold_max_sec_per_km,
+            )
+
+    def test_interpolates_between_rows(self):
+        """VDOT 47 lies between the 45 and 48 rows."""
+        time_47 = race_time_for_vdot(RaceDistance.TEN_K, 47)
+        assert 2262 < time_47 < 2436
+
+    def test_untabulated_distance_returns_none(self):
+        """No 15K prediction without 15K table times."""
+        assert race_time_for_vdot(RaceDistance.FIFTEEN_K, 50) is None
+
+    def test_unknown_zone_raises(self):
+        """Unknown zone names are rejected."""
+        with pytest.raises(ValueError):
+            pace_range_for_vdot("tempo", 50)
+
+
+class TestInverseLookup:
+    """Tests for race time / pace -> VDOT."""
+
+    def test_race_time_on_table_row(self):
+        """A tabulated time maps to its VDOT."""
+        assert vdot_from_race_time(RaceDistance.FIVE_K, 1356) == pytest.approx(40)
+
+    def test_race_time_is_fractional(self):
+        """Times between rows give fractional VDOT."""
+        vdot = vdot_from_race_time(RaceDistance.FIVE_K, 1300)
+        assert 40 < vdot < 45
+        assert vdot != int(vdot)
+
+    def test_untabulated_distance_raises(self):
+        """No inverse lookup without table times."""
+        with pytest.raises(ValueError):
+            vdot_from_race_time(RaceDistance.FIFTEEN_K, 3600)
+
+    @pytest.mark.parametrize(
+        "zone,min_field,max_field",
+        [
+            ("easy", "easy_min_sec_per_km", "easy_max_sec_per_km"),
+            ("threshold", "threshold_min_sec_per_km", "threshold_max_sec_per_km"),
+            ("interval", "interval_min_sec_per_km", "interval_max_sec_per_km"),
+        ],
+    )
+    def test_pace_matches_table_scan(self, zone, min_field, max_field):
+        """Bisect finds the same VDOT as scanning the table, for every pace."""
+        for pace in range(100, 560):
+            assert vdot_for_pace(pace, zone) == _scan_vdot_for_pace(pace, min_field, max_field)
+
+    def test_unknown_zone_returns_none(self):
+        """Unknown zones have no VDOT."""
+        assert vdot_for_pace(300, "tempo") is None
+
+
+class TestBatchLookup:
+    """Tests for vdots_for_paces."""
+
+    def test_matches_single_lookups_in_order(self):
+        """Batch results equal per-pace lookups, in input order."""
+        paces = [300, 250, 300, 999, 180, 250]
+        assert vdots_for_paces(paces, "threshold") == [vdot_for_pace(p, "threshold") for p in paces]
+
+    def test_empty_input(self):
+        """No paces, no VDOTs."""
+        assert vdots_for_paces([], "easy") == []
@@ -15,6 +15,7 @@ from resilio.core.vdot.pace_analysis import (
     find_vdot_from_easy_pace,
     analyze_recent_paces,
 )
+from resilio.core.vdot.tables import VDOT_TABLE
 from resilio.schemas.activity import NormalizedActivity
 
 
@@ -187,6 +188,37 @@ class TestVDOTInference:
 
         assert vdot is None
 
+    @pytest.mark.parametrize("zone_type", ["marathon", "repetition"])
+    def test_find_vdot_unsupported_table_zone(self, zone_type):
+        """Zones outside easy/threshold/interval return None even if tabulated."""
+        assert find_vdot_from_pace(150, zone_type) is None
+        assert find_vdot_from_pace(300, zone_type) is None
+
+    @pytest.mark.parametrize(
+        "zone_type", ["easy", "marathon", "threshold", "interval", "repetition", "invalid_zone"]
+    )
+    def test_find_vdot_matches_table_scan(self, zone_type):
+        """Lookup should match a linear scan of VDOT_TABLE for every pace."""
+        fields = {
+            "threshold": ("threshold_min_sec_per_km", "threshold_max_sec_per_km"),
+            "interval": ("interval_min_sec_per_km", "interval_max_sec_per_km"),
+            "easy": ("easy_min_sec_per_km", "easy_max_sec_per_km"),
+        }.get(zone_type)
+
+        for pace in range(150, 600):
+            expected = None
+            if fields is not None:
+                min_field, max_field = fields
+                expected = next(
+                    (
+                        entry.vdot
+                        for entry in VDOT_TABLE
+                        if getattr(entry, min_field) - 5 <= pace <= getattr(entry, max_field) + 5
+                    ),
+                    None,
+                )
+            assert find_vdot_from_pace(pace, zone_type) == expected, pace
+
 
 class TestRecentPaceAnalysis:
     """Tests for complete pace analysis workflow."""
@@ -25,6 +25,7 @@ from resilio.core.workflows import (
 from resilio.core.repository import RepositoryIO
 from resilio.core.paths import current_plan_path
 from resilio.schemas.plan import MasterPlan
+from resilio.schemas.config import StravaSettings
 from resilio.schemas.profile import ConflictPolicy, Goal, GoalType, TrainingConstraints
 from resilio.schemas.sync import SyncPhase
 
@@ -52,6 +53,7 @@ def mock_config():
     config.secrets = Mock()
     config.secrets.strava = Mock()
     config.secrets.strava.access_token = "mock_token"
+    config.settings.strava = StravaSettings()
     return config
 
 
@@ -239,6 +241,7 @@ class TestRunSyncWorkflow:
         mock_profile.return_value = []
 
         config = Mock()
+        config.settings.strava = StravaSettings()
         result = run_sync_workflow(mock_repo, config)
 
         assert result.phase == SyncPhase.DONE
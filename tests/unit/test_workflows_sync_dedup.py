@@ -88,7 +88,7 @@ def test_sync_workflow_skips_existing_strava_id(temp_repo, monkeypatch):
     config = _make_config()
 
     monkeypatch.setattr(workflows, "_fetch_and_update_athlete_profile", lambda *_: None)
-    monkeypatch.setattr(workflows, "recompute_all_metrics", lambda *args, **kwargs: {"metrics_computed": 0})
+    monkeypatch.setattr(workflows, "update_metrics_incremental", lambda *args, **kwargs: {"metrics_computed": 0})
 
     class StubGenerator:
         def __iter__(self):